@@ -1,7 +1,11 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Response
 from fastapi.middleware.cors import CORSMiddleware
 import os
 from dotenv import load_dotenv
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from infrastructure.db.postgres import engine
+from infrastructure.metrics.recommendation_metrics import instrument_engine
 
 from modules.auth.adapter.input.web.auth_router import router as auth_router
 from modules.finder_request.adapter.input.web.router.finder_request_router import router as finder_request_router
@@ -56,6 +60,14 @@ app.include_router(api_router)
 
 app.include_router(house_analysis_router)
 
+# 추천 파이프라인 단계별 지표를 Prometheus 텍스트 형식으로 노출합니다.
+instrument_engine(engine)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 if __name__ == "__main__":
     import uvicorn
     host = os.getenv("APP_HOST")
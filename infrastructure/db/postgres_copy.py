@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import io
+import json
+import numbers
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Sequence, TypeVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import ARRAY, JSON, Table, text
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_NULL = "\\N"
+
+
+def _format_scalar(value: Any, tz) -> str:
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        number = float(value)
+        if number != number:
+            return "NaN"
+        if number in (float("inf"), float("-inf")):
+            return "Infinity" if number > 0 else "-Infinity"
+        # repr는 가장 짧은 왕복 표현이라 float8로 그대로 복원된다.
+        return float.__repr__(number)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            # ORM 경로는 aware datetime을 timestamptz로 보내 세션 TimeZone 기준으로
+            # timestamp에 넣는다. COPY는 오프셋을 무시하므로 여기서 같은 변환을 한다.
+            value = value.astimezone(tz).replace(tzinfo=None)
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_array_element(value: Any, tz) -> str:
+    if value is None:
+        return "NULL"
+    element = _format_scalar(value, tz)
+    return '"' + element.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def format_copy_value(value: Any, column_type=None, tz=timezone.utc) -> str:
+    """값 하나를 COPY text 형식 필드로 바꾼다. None은 \\N."""
+    if value is None:
+        return _NULL
+    if isinstance(column_type, JSON):
+        field = json.dumps(value)
+    elif isinstance(column_type, ARRAY) or isinstance(value, (list, tuple)):
+        field = "{" + ",".join(_format_array_element(item, tz) for item in value) + "}"
+    else:
+        field = _format_scalar(value, tz)
+    return field.translate(_COPY_ESCAPES)
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterable[List[T]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class PostgresCopyWriter:
+    """ORM 테이블에 COPY FROM STDIN으로 행을 쓰는 append 전용 writer.
+
+    행은 chunk_size씩 메모리 버퍼에 text 형식으로 직렬화해 보내고, 청크마다
+    커밋한다. 중간에 실패하면 이미 커밋된 청크는 남고 실패한 청크만 롤백된다.
+    컬럼 이름은 dialect 규칙으로 인용하므로 한글 컬럼도 ORM이 만든 이름 그대로 쓴다.
+    psycopg2 커서(copy_expert)가 필요하다.
+
+    id_column을 주면 청크마다 시퀀스에서 ID를 받아 첫 컬럼으로 함께 쓰고,
+    콜백에는 (id, item) 쌍을 넘긴다. COPY에는 RETURNING이 없기 때문이다.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        columns: Sequence[str],
+        chunk_size: int = 50_000,
+        id_column: str | None = None,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.table = table
+        self.id_column = id_column
+        self.columns = ([id_column] if id_column else []) + list(columns)
+        self.chunk_size = chunk_size
+        self._types = [table.c[column].type for column in self.columns]
+
+    def copy_sql(self, session: Session) -> str:
+        preparer = session.get_bind().dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(column) for column in self.columns)
+        return f"COPY {preparer.format_table(self.table)} ({columns}) FROM STDIN"
+
+    def format_row(self, row: Sequence[Any], tz=timezone.utc) -> str:
+        return (
+            "\t".join(
+                format_copy_value(value, column_type, tz)
+                for value, column_type in zip(row, self._types)
+            )
+            + "\n"
+        )
+
+    def write(
+        self,
+        session: Session,
+        items: Iterable[T],
+        to_row: Callable[[T], Sequence[Any]],
+        on_chunk: Callable[[List[Any]], None] | None = None,
+        before_commit: Callable[[Session, List[Any]], None] | None = None,
+    ) -> int:
+        """items를 청크 단위로 COPY하고 청크마다 커밋한다. 쓴 행 수를 돌려준다.
+
+        before_commit은 COPY 뒤 같은 트랜잭션 안에서, on_chunk는 커밋 뒤에 부른다.
+        """
+        sql = self.copy_sql(session)
+        tz = None
+        written = 0
+        for chunk in _chunks(items, self.chunk_size):
+            if tz is None:
+                tz = session_time_zone(session)
+            try:
+                if self.id_column:
+                    ids = reserve_ids(session, self.table, self.id_column, len(chunk))
+                    chunk = list(zip(ids, chunk))
+                    rows = ((item_id, *to_row(item)) for item_id, item in chunk)
+                else:
+                    rows = (to_row(item) for item in chunk)
+                buffer = io.StringIO()
+                for row in rows:
+                    buffer.write(self.format_row(row, tz))
+                buffer.seek(0)
+                cursor = session.connection().connection.cursor()
+                try:
+                    cursor.copy_expert(sql, buffer)
+                finally:
+                    cursor.close()
+                if before_commit:
+                    before_commit(session, chunk)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            written += len(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+        return written
+
+
+def reserve_ids(session: Session, table: Table, column: str, count: int) -> List[int]:
+    """serial/identity 컬럼의 시퀀스에서 ID를 count개 미리 받는다.
+
+    COPY는 RETURNING이 없으므로 생성 ID가 필요한 테이블은 ID를 먼저 받아 함께 쓴다.
+    """
+    if count <= 0:
+        return []
+    rows = session.execute(
+        text(
+            "SELECT nextval(pg_get_serial_sequence(:table, :column)) "
+            "FROM generate_series(1, :count)"
+        ),
+        {"table": table.fullname, "column": column, "count": count},
+    )
+    return [int(row[0]) for row in rows]
+
+
+def session_time_zone(session: Session):
+    """세션 TimeZone 설정. IANA 이름이 아니면 현재 UTC 오프셋으로 대신한다."""
+    name = session.execute(text("SELECT current_setting('TimeZone')")).scalar()
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        seconds = session.execute(
+            text("SELECT EXTRACT(TIMEZONE FROM now())")
+        ).scalar()
+        return timezone(timedelta(seconds=int(seconds or 0)))
@@ -0,0 +1,90 @@
+"""추천 파이프라인 단계별 지연/처리량 지표 (Prometheus)."""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+
+STAGE_FILTER_CANDIDATES = "filter_candidates"
+STAGE_FETCH_SCORE_MAP = "fetch_score_map"
+STAGE_HYDRATION = "hydration"
+STAGE_AI_EXPLANATION = "ai_explanation"
+STAGE_SAVE_RESULT_SERIALIZATION = "save_result_serialization"
+
+RECOMMEND_STAGE_SECONDS = Histogram(
+    "recommend_stage_duration_seconds",
+    "추천 파이프라인 단계별 소요 시간(초)",
+    ["stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+RECOMMEND_CANDIDATES_IN = Counter(
+    "recommend_candidates_in_total",
+    "추천 파이프라인에 입력된 후보 매물 수",
+)
+RECOMMEND_RECOMMENDED_OUT = Counter(
+    "recommend_recommended_out_total",
+    "추천 결과로 반환된 매물 수",
+)
+RECOMMEND_DB_QUERIES = Counter(
+    "recommend_db_queries_total",
+    "추천 작업 중 실행된 DB 쿼리 수",
+)
+RECOMMEND_JOB_DB_QUERIES = Histogram(
+    "recommend_job_db_queries",
+    "추천 작업 1건당 실행된 DB 쿼리 수",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+# 현재 실행 중인 작업의 쿼리 카운터. 작업 밖에서는 None이다.
+_job_query_count: ContextVar[list[int] | None] = ContextVar(
+    "recommend_job_query_count", default=None
+)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """블록 실행 시간을 단계 히스토그램에 기록한다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        RECOMMEND_STAGE_SECONDS.labels(stage=stage).observe(
+            time.perf_counter() - started
+        )
+
+
+def record_pipeline_counts(candidates_in: int, recommended_out: int) -> None:
+    """입력 후보 수와 추천 결과 수를 누적한다."""
+    RECOMMEND_CANDIDATES_IN.inc(candidates_in)
+    RECOMMEND_RECOMMENDED_OUT.inc(recommended_out)
+
+
+@contextmanager
+def track_job_queries() -> Iterator[None]:
+    """블록 안에서 실행된 쿼리 수를 작업 단위로 기록한다."""
+    counter = [0]
+    token = _job_query_count.set(counter)
+    try:
+        yield
+    finally:
+        _job_query_count.reset(token)
+        RECOMMEND_JOB_DB_QUERIES.observe(counter[0])
+
+
+def instrument_engine(engine) -> None:
+    """엔진에 쿼리 카운터 리스너를 한 번만 등록한다."""
+    if event.contains(engine, "before_cursor_execute", _count_query):
+        return
+    event.listen(engine, "before_cursor_execute", _count_query)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _job_query_count.get()
+    if counter is None:
+        return
+    counter[0] += 1
+    RECOMMEND_DB_QUERIES.inc()
@@ -1,4 +1,5 @@
 from fastapi import Depends
+from infrastructure.db.dependencies import get_redis
 from infrastructure.db.postgres import get_db_session
 from infrastructure.external.embedding_agent import OpenAIEmbeddingAgent
 from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
@@ -10,6 +11,9 @@ from modules.finder_request.application.usecase.view_finder_requests_usecase imp
 from modules.finder_request.application.usecase.get_finder_request_detail_usecase import GetFinderRequestDetailUseCase
 from modules.finder_request.application.usecase.edit_finder_request_usecase import EditFinderRequestUseCase
 from modules.finder_request.application.usecase.delete_finder_request_usecase import DeleteFinderRequestUseCase
+from modules.recommendations.adapter.output.redis_recommendation_result_cache import (
+    RedisRecommendationResultCache,
+)
 
 
 def get_finder_request_repository(db_session_factory=Depends(get_db_session)):
@@ -27,6 +31,11 @@ def get_embedding_agent():
     return OpenAIEmbeddingAgent()
 
 
+def get_recommendation_result_cache():
+    """추천 결과 캐시 인스턴스 생성"""
+    return RedisRecommendationResultCache(get_redis())
+
+
 def get_create_finder_request_usecase(
     repository: FinderRequestRepository = Depends(get_finder_request_repository),
     embedding_repository: FinderRequestEmbeddingRepository = Depends(
@@ -65,9 +74,14 @@ def get_edit_finder_request_usecase(
         get_finder_request_embedding_repository
     ),
     embedder: OpenAIEmbeddingAgent = Depends(get_embedding_agent),
+    recommendation_cache: RedisRecommendationResultCache = Depends(
+        get_recommendation_result_cache
+    ),
 ) -> EditFinderRequestUseCase:
     """EditFinderRequest UseCase 인스턴스 생성"""
-    return EditFinderRequestUseCase(repository, embedding_repository, embedder)
+    return EditFinderRequestUseCase(
+        repository, embedding_repository, embedder, recommendation_cache
+    )
 
 
 def get_delete_finder_request_usecase(
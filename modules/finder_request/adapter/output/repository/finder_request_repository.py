@@ -105,6 +105,23 @@ class FinderRequestRepository(FinderRequestRepositoryPort):
             updated_at=model.updated_at
         )
     
+    def find_by_ids(self, finder_request_ids: List[int]) -> List[FinderRequest]:
+        """
+        ID 목록으로 요구서 일괄 조회 (없는 ID는 결과에서 빠짐)
+
+        Args:
+            finder_request_ids: 요구서 ID 목록
+
+        Returns:
+            요구서 도메인 모델 리스트
+        """
+        if not finder_request_ids:
+            return []
+        models = self.db.query(FinderRequestModel).filter(
+            FinderRequestModel.finder_request_id.in_(list(finder_request_ids))
+        ).all()
+        return [self._to_domain(model) for model in models]
+
     def find_by_user_id(self, abang_user_id: int) -> List[FinderRequest]:
         """
         사용자 ID로 요구서 목록 조회 (모든 status 포함)
@@ -35,6 +35,19 @@ class FinderRequestRepositoryPort(ABC):
         """
         pass
     
+    def find_by_ids(self, finder_request_ids: List[int]) -> List[FinderRequest]:
+        """
+        ID 목록으로 요구서 일괄 조회 (없는 ID는 결과에서 빠짐)
+
+        Args:
+            finder_request_ids: 요구서 ID 목록
+
+        Returns:
+            요구서 도메인 모델 리스트
+        """
+        found = (self.find_by_id(finder_request_id) for finder_request_id in finder_request_ids)
+        return [finder_request for finder_request in found if finder_request]
+
     @abstractmethod
     def find_by_user_id(self, abang_user_id: int) -> List[FinderRequest]:
         """
@@ -16,6 +16,9 @@ from modules.finder_request.application.port.finder_request_repository_port impo
     FinderRequestRepositoryPort,
 )
 from modules.finder_request.domain.finder_request import FinderRequest
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
 
 
 class EditFinderRequestUseCase:
@@ -28,10 +31,12 @@ class EditFinderRequestUseCase:
         finder_request_repository: FinderRequestRepositoryPort,
         embedding_repository: FinderRequestEmbeddingPort | None = None,
         embedder=None,
+        recommendation_cache: RecommendationResultCachePort | None = None,
     ):
         self.finder_request_repository = finder_request_repository
         self.embedding_repository = embedding_repository
         self.embedder = embedder
+        self.recommendation_cache = recommendation_cache
     
     def execute(
         self,
@@ -109,6 +114,7 @@ class EditFinderRequestUseCase:
             return None
 
         self._upsert_embedding(updated)
+        self._invalidate_recommendation_cache(updated.finder_request_id)
         
         # DTO로 변환하여 반환
         return FinderRequestDTO(
@@ -145,6 +151,13 @@ class EditFinderRequestUseCase:
             )
 
 
+    def _invalidate_recommendation_cache(self, finder_request_id: int) -> None:
+        """요구서가 바뀌면 이전 추천 결과 캐시를 무효화한다."""
+        if not self.recommendation_cache:
+            return
+        self.recommendation_cache.invalidate_finder_request(finder_request_id)
+
+
 def _run_async(coro):
     """동기 컨텍스트에서 코루틴을 실행한다."""
     try:
@@ -4,6 +4,8 @@ from modules.house_platform.application.usecase.create_house_platform_usecase im
 from modules.house_platform.application.usecase.get_house_platform_usecase import GetHousePlatformUseCase
 from modules.house_platform.application.usecase.update_house_platform_usecase import UpdateHousePlatformUseCase
 from modules.house_platform.application.usecase.delete_house_platform_usecase import DeleteHousePlatformUseCase
+from modules.recommendations.application.factory.recommend_student_house_factory import get_house_card_cache
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import DirtyHouseRepository
 
 # Repository Singleton
 _house_platform_repo = None
@@ -11,7 +13,11 @@ _house_platform_repo = None
 def get_house_platform_repository():
     global _house_platform_repo
     if _house_platform_repo is None:
-        _house_platform_repo = HousePlatformRepository(SessionLocal)
+        _house_platform_repo = HousePlatformRepository(
+            SessionLocal,
+            dirty_house_tracker=DirtyHouseRepository(SessionLocal),
+            card_cache=get_house_card_cache(),
+        )
     return _house_platform_repo
 
 # UseCase Dependencies
@@ -33,7 +39,10 @@ def get_get_house_platform_usecase(
     return GetHousePlatformUseCase(repo, message_repo, user_repo)
 
 def get_update_house_platform_usecase() -> UpdateHousePlatformUseCase:
-    return UpdateHousePlatformUseCase(get_house_platform_repository())
+    return UpdateHousePlatformUseCase(
+        get_house_platform_repository(),
+        card_cache=get_house_card_cache(),
+    )
 
 def get_delete_house_platform_usecase() -> DeleteHousePlatformUseCase:
     return DeleteHousePlatformUseCase(get_house_platform_repository())
@@ -31,6 +31,11 @@ class HousePlatformRepositoryPort(ABC):
         """ID로 도메인 객체를 조회한다."""
         raise NotImplementedError
 
+    def find_by_ids(self, house_platform_ids: Sequence[int]) -> List[HousePlatform]:
+        """ID 목록으로 도메인 객체를 한 번에 조회한다."""
+        houses = [self.find_by_id(house_platform_id) for house_platform_id in house_platform_ids]
+        return [house for house in houses if house]
+
     @abstractmethod
     def find_all_by_user_id(self, abang_user_id: int) -> List[HousePlatform]:
         """사용자 ID로 모든 매물을 조회한다."""
@@ -70,9 +75,31 @@ class HousePlatformRepositoryPort(ABC):
         """기존 저장 데이터를 번들 형태로 조회한다."""
         raise NotImplementedError
 
+    def fetch_bundles_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> dict[int, HousePlatformUpsertBundle]:
+        """여러 매물을 번들 형태로 조회한다. 없는 매물은 빠진다."""
+        bundles = {}
+        for house_platform_id in house_platform_ids:
+            bundle = self.fetch_bundle_by_id(house_platform_id)
+            if bundle:
+                bundles[house_platform_id] = bundle
+        return bundles
+
     @abstractmethod
     def fetch_location_by_id(
         self, house_platform_id: int
     ) -> HousePlatformLocation | None:
         """매물 경위도 정보를 단건 조회한다."""
         raise NotImplementedError
+
+    def fetch_locations_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[HousePlatformLocation]:
+        """매물 경위도 정보를 여러 건 조회한다. 위치가 없는 매물은 빠진다."""
+        locations = []
+        for house_platform_id in house_platform_ids:
+            location = self.fetch_location_by_id(house_platform_id)
+            if location:
+                locations.append(location)
+        return locations
@@ -27,6 +27,9 @@ from modules.house_platform.application.port_out.zigbang_fetch_port import (
 from modules.house_platform.domain.value_object.house_platform_domain import (
     HousePlatformDomainType,
 )
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
 
 
 class MonitorHousePlatformService(MonitorHousePlatformPort):
@@ -36,9 +39,11 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
         self,
         fetch_port: ZigbangFetchPort,
         repository_port: HousePlatformRepositoryPort,
+        card_cache: HouseCardInvalidationPort | None = None,
     ):
         self.fetch_port = fetch_port
         self.repository_port = repository_port
+        self.card_cache = card_cache
         self.adapter = ZigbangAdapter(fetch_port)
 
     def execute(
@@ -55,6 +60,7 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
         skipped = 0
         banned = 0
         errors: list[str] = []
+        updated_ids: list[int] = []
 
         for target in targets:
             checked += 1
@@ -92,9 +98,14 @@ class MonitorHousePlatformService(MonitorHousePlatformPort):
             try:
                 self.repository_port.upsert_batch([bundle])
                 updated += 1
+                updated_ids.append(target.house_platform_id)
             except Exception as exc:  # noqa: BLE001
                 errors.append(f"업데이트 실패 {target.rgst_no}: {exc}")
 
+        if self.card_cache and updated_ids:
+            # 변경된 매물의 추천 카드 캐시를 한 번에 비운다.
+            self.card_cache.invalidate_houses(updated_ids)
+
         return MonitorHousePlatformResult(
             checked=checked,
             updated=updated,
@@ -2,10 +2,16 @@ from typing import Optional
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.house_platform.application.dto.house_platform_dto import HousePlatformUpdateRequest
 from modules.house_platform.domain.house_platform import HousePlatform
+from shared.application.port_out.house_card_invalidation_port import HouseCardInvalidationPort
 
 class UpdateHousePlatformUseCase:
-    def __init__(self, repository: HousePlatformRepositoryPort):
+    def __init__(
+        self,
+        repository: HousePlatformRepositoryPort,
+        card_cache: Optional[HouseCardInvalidationPort] = None,
+    ):
         self.repository = repository
+        self.card_cache = card_cache
 
     def execute(self, user_id: int, house_platform_id: int, request: HousePlatformUpdateRequest) -> Optional[HousePlatform]:
         existing_house = self.repository.find_by_id(house_platform_id)
@@ -40,4 +46,8 @@ class UpdateHousePlatformUseCase:
         if request.dong_nm is not None: existing_house.dong_nm = request.dong_nm
         if request.snapshot_id is not None: existing_house.snapshot_id = request.snapshot_id
         
-        return self.repository.save(existing_house)
+        saved = self.repository.save(existing_house)
+        if self.card_cache:
+            # 매물 정보가 바뀌었으므로 추천 카드 캐시를 비운다.
+            self.card_cache.invalidate_houses([house_platform_id])
+        return saved
@@ -3,6 +3,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Integer,
     Numeric,
     String,
@@ -69,3 +70,14 @@ class HousePlatformORM(Base):
     image_urls = Column(Text, nullable=True, comment="이미지 URL 목록")
     gu_nm = Column(String(10), nullable=True, comment="구 이름")
     dong_nm = Column(String(10), nullable=True, comment="동 이름")
+
+    __table_args__ = (
+        # 선호 지역 필터: pnu_cd 앞자리가 시군구(5자리)/법정동(10자리) 코드다.
+        Index("ix_house_platform_sigungu_cd", func.substr(pnu_cd, 1, 5)),
+        Index("ix_house_platform_legal_dong_cd", func.substr(pnu_cd, 1, 10)),
+        # pnu_cd가 없는 매물은 구/동 이름으로 비교한다.
+        Index("ix_house_platform_gu_nm", gu_nm),
+        Index("ix_house_platform_dong_nm", dong_nm),
+        # 후보 스냅샷 증분 갱신(updated_at >= 워터마크)용.
+        Index("ix_house_platform_updated_at", updated_at),
+    )
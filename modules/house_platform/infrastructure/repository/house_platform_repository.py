@@ -37,13 +37,29 @@ from modules.house_platform.infrastructure.orm.house_platform_options_orm import
     HousePlatformOptionORM,
 )
 from modules.house_platform.infrastructure.orm.house_platform_orm import HousePlatformORM
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
 
 
 class HousePlatformRepository(HousePlatformRepositoryPort):
     """house_platform 및 부속 테이블 저장소 구현체."""
 
-    def __init__(self, session_factory=None):
+    # 위치 IN 조회 한 번에 넣을 매물 수.
+    _LOCATION_BATCH_SIZE = 5000
+
+    def __init__(
+        self,
+        session_factory=None,
+        dirty_house_tracker: DirtyHousePort | None = None,
+        card_cache: HouseCardInvalidationPort | None = None,
+    ):
         self._session_factory = session_factory or get_db_session
+        self._dirty_house_tracker = dirty_house_tracker
+        self._card_cache = card_cache
 
     def _to_domain(self, orm: HousePlatformORM) -> HousePlatform:
         return HousePlatform(
@@ -167,6 +183,24 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             else:
                 session.close()
 
+    def find_by_ids(self, house_platform_ids: Sequence[int]) -> List[HousePlatform]:
+        """ID 목록으로 도메인 객체를 한 번에 조회한다."""
+        if not house_platform_ids:
+            return []
+        session, generator = open_session(self._session_factory)
+        try:
+            orms = (
+                session.query(HousePlatformORM)
+                .filter(HousePlatformORM.house_platform_id.in_(list(house_platform_ids)))
+                .all()
+            )
+            return [self._to_domain(orm) for orm in orms]
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
     def find_all_by_user_id(self, abang_user_id: int) -> List[HousePlatform]:
         """사용자 ID로 모든 매물을 조회한다."""
         session, generator = open_session(self._session_factory)
@@ -218,6 +252,10 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
         """매물/관리비/옵션을 묶어 업서트한다."""
         session, generator = open_session(self._session_factory)
         stored = 0
+        # 신규 매물이나 snapshot_id가 바뀐 매물은 점수를 다시 계산해야 한다.
+        changed_ids: list[int] = []
+        # 기존 매물은 가격/옵션/주소가 바뀌었을 수 있으므로 캐시된 카드를 비운다.
+        updated_ids: list[int] = []
         try:
             for bundle in bundles:
                 payload = self._to_house_platform_payload(bundle.house_platform)
@@ -230,8 +268,12 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                     .one_or_none()
                 )
                 if existing:
+                    snapshot_id = payload.get("snapshot_id")
+                    if snapshot_id is not None and snapshot_id != existing.snapshot_id:
+                        changed_ids.append(existing.house_platform_id)
                     self._apply_house_platform_updates(existing, payload)
                     house_platform_id = existing.house_platform_id
+                    updated_ids.append(house_platform_id)
                 else:
                     payload = self._drop_none(payload)
                     payload.pop("house_platform_id", None)
@@ -241,6 +283,7 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                     session.add(obj)
                     session.flush()
                     house_platform_id = obj.house_platform_id
+                    changed_ids.append(house_platform_id)
 
                 if bundle.management:
                     self._upsert_management(
@@ -251,7 +294,14 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
                         session, house_platform_id, bundle.options
                     )
                 stored += 1
+            if self._dirty_house_tracker and changed_ids:
+                # 변경과 같은 트랜잭션에 표시해야 커밋 직후 장애에도 재계산이 빠지지 않는다.
+                self._dirty_house_tracker.mark_dirty(
+                    changed_ids, "house_platform", session=session
+                )
             session.commit()
+            if self._card_cache and updated_ids:
+                self._card_cache.invalidate_houses(updated_ids)
             return stored
         except Exception:
             session.rollback()
@@ -380,6 +430,51 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             else:
                 session.close()
 
+    def fetch_bundles_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> dict[int, HousePlatformUpsertBundle]:
+        """여러 매물의 번들을 테이블별 IN 조회 한 번씩으로 읽는다. 없는 매물은 빠진다."""
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return {}
+        session, generator = open_session(self._session_factory)
+        try:
+            houses = (
+                session.query(HousePlatformORM)
+                .filter(HousePlatformORM.house_platform_id.in_(ids))
+                .all()
+            )
+            found = [house.house_platform_id for house in houses]
+            managements = {
+                row.house_platform_id: row
+                for row in session.query(HousePlatformManagementORM)
+                .filter(HousePlatformManagementORM.house_platform_id.in_(found))
+                .all()
+            } if found else {}
+            options = {
+                row.house_platform_id: row
+                for row in session.query(HousePlatformOptionORM)
+                .filter(HousePlatformOptionORM.house_platform_id.in_(found))
+                .all()
+            } if found else {}
+            bundles = {}
+            for house in houses:
+                management = managements.get(house.house_platform_id)
+                option = options.get(house.house_platform_id)
+                bundles[house.house_platform_id] = HousePlatformUpsertBundle(
+                    house_platform=self._to_house_platform_model(house),
+                    management=self._to_management_model(management)
+                    if management
+                    else None,
+                    options=self._to_options_model(option) if option else None,
+                )
+            return bundles
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
     def fetch_location_by_id(
         self, house_platform_id: int
     ) -> HousePlatformLocation | None:
@@ -395,25 +490,62 @@ class HousePlatformRepository(HousePlatformRepositoryPort):
             )
             if not row:
                 return None
-            lat_lng = row[1] or {}
-            lat = lat_lng.get("lat")
-            lng = lat_lng.get("lng")
-            try:
-                if lat is None or lng is None:
-                    return None
-                return HousePlatformLocation(
-                    house_platform_id=int(row[0]),
-                    lat=float(lat),
-                    lng=float(lng),
+            return self._to_location(row[0], row[1])
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def fetch_locations_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[HousePlatformLocation]:
+        """매물 경위도 정보를 IN 조회로 묶어 읽는다. 위치가 없는 매물은 빠진다."""
+        ids = list(dict.fromkeys(house_platform_ids))
+        if not ids:
+            return []
+        session, generator = open_session(self._session_factory)
+        try:
+            locations: List[HousePlatformLocation] = []
+            for start in range(0, len(ids), self._LOCATION_BATCH_SIZE):
+                rows = (
+                    session.query(
+                        HousePlatformORM.house_platform_id, HousePlatformORM.lat_lng
+                    )
+                    .filter(
+                        HousePlatformORM.house_platform_id.in_(
+                            ids[start:start + self._LOCATION_BATCH_SIZE]
+                        )
+                    )
+                    .all()
                 )
-            except (TypeError, ValueError):
-                return None
+                for house_platform_id, lat_lng in rows:
+                    location = self._to_location(house_platform_id, lat_lng)
+                    if location:
+                        locations.append(location)
+            return locations
         finally:
             if generator:
                 generator.close()
             else:
                 session.close()
 
+    @staticmethod
+    def _to_location(house_platform_id, lat_lng) -> HousePlatformLocation | None:
+        lat_lng = lat_lng or {}
+        lat = lat_lng.get("lat")
+        lng = lat_lng.get("lng")
+        try:
+            if lat is None or lng is None:
+                return None
+            return HousePlatformLocation(
+                house_platform_id=int(house_platform_id),
+                lat=float(lat),
+                lng=float(lng),
+            )
+        except (TypeError, ValueError):
+            return None
+
     def _to_house_platform_payload(self, model: HousePlatformUpsertModel) -> dict:
         """DTO를 ORM 저장용 dict로 변환한다."""
         data = asdict(model)
@@ -4,12 +4,19 @@ import os
 from dotenv import load_dotenv
 import pika
 import traceback
+from prometheus_client import start_http_server
 from modules.mq.application.usecase.process_search_house_usecase import ProcessSearchHouseUseCase
 
 print("[consumer] file loaded")
 
-from infrastructure.db.postgres import get_db_session
-from modules.recommendations.application.usecase.recommend_student_house import RecommendStudentHouseUseCase
+from infrastructure.db.dependencies import get_redis
+from infrastructure.db.postgres import engine, get_db_session
+from infrastructure.metrics.recommendation_metrics import instrument_engine
+from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
+from modules.mq.adapter.output.repository.redis_search_house_event_stream import RedisSearchHouseEventStream
+from modules.recommendations.adapter.output.redis_recommendation_result_cache import RedisRecommendationResultCache
+from modules.recommendations.application.usecase.cached_recommend_student_house import CachedRecommendStudentHouseUseCase
+from modules.recommendations.application.factory.recommend_student_house_factory import get_recommend_student_house_usecase
 
 
 load_dotenv()
@@ -19,6 +26,16 @@ AMQP_PORT = int(os.getenv("AMQP_PORT", "5672"))
 AMQP_USER = os.getenv("AMQP_USER")
 AMQP_PASSWORD = os.getenv("AMQP_PASSWORD")
 
+RECOMMEND_CACHE_TTL_SECONDS = int(os.getenv("RECOMMEND_CACHE_TTL_SECONDS", "600"))
+# 추천 작업 1건의 시간 예산(초). 초과하면 부가 단계를 건너뛴 부분 결과를 반환한다.
+RECOMMEND_DEADLINE_SECONDS = (
+    float(os.getenv("RECOMMEND_DEADLINE_SECONDS"))
+    if os.getenv("RECOMMEND_DEADLINE_SECONDS")
+    else None
+)
+# 별도 프로세스로 실행할 때 지표를 노출할 포트 (미설정 시 노출하지 않음)
+CONSUMER_METRICS_PORT = os.getenv("CONSUMER_METRICS_PORT")
+
 QUEUE_NAME = "search.house.request"
 EXCHANGE_NAME = "recommend.exchange"
 ROUTING_KEY = "recommend.house"
@@ -46,6 +63,11 @@ def connect_with_retry(host, user, password, retry=20, delay=2):
 
 
 def start_search_house_consumer():
+    instrument_engine(engine)
+    if CONSUMER_METRICS_PORT:
+        start_http_server(int(CONSUMER_METRICS_PORT))
+        print(f"[consumer] metrics exposed on :{CONSUMER_METRICS_PORT}")
+
     connection = connect_with_retry(
         AMQP_HOST,
         AMQP_USER,
@@ -91,10 +113,21 @@ def start_search_house_consumer():
         db = next(get_db_session())
 
         try:
-            ai_agent = RecommendStudentHouseUseCase()
-
-            # Process UseCase에 주입
-            process_usecase = ProcessSearchHouseUseCase(db, ai_agent)
+            # 동일 조건의 추천 결과는 캐시에서 재사용한다.
+            ai_agent = CachedRecommendStudentHouseUseCase(
+                get_recommend_student_house_usecase(),
+                RedisRecommendationResultCache(get_redis()),
+                FinderRequestRepository(db),
+                ttl_seconds=RECOMMEND_CACHE_TTL_SECONDS,
+            )
+
+            # Process UseCase에 주입 (추천 카드는 만들어지는 대로 스트림에 발행)
+            process_usecase = ProcessSearchHouseUseCase(
+                db,
+                ai_agent,
+                event_stream=RedisSearchHouseEventStream(get_redis()),
+                deadline_seconds=RECOMMEND_DEADLINE_SECONDS,
+            )
 
             print("[consumer][callback] running process_usecase...")
             process_usecase.execute(search_house_id)
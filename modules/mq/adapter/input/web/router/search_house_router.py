@@ -13,7 +13,10 @@ Inbound Adapter (Web)
 7. db.close()
 """
 
-from fastapi import APIRouter, Depends
+import json
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from infrastructure.db.postgres import get_db_session
@@ -25,6 +28,13 @@ from fastapi import HTTPException
 from modules.mq.application.usecase.get_search_house_status_usecase import (
     GetSearchHouseStatusUseCase,
 )
+from modules.mq.application.usecase.stream_search_house_events_usecase import (
+    StreamSearchHouseEventsUseCase,
+)
+from modules.mq.adapter.output.repository.redis_search_house_event_stream import (
+    RedisSearchHouseEventStream,
+)
+from infrastructure.db.dependencies import get_redis
 
 
 import os
@@ -80,4 +90,42 @@ def get_search_house_status(
     if result is None:
         raise HTTPException(status_code=404, detail="search_house not found")
 
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get("/search_house/{search_house_id}/stream")
+def stream_search_house(
+    search_house_id: int,
+    format: str = Query("sse", pattern="^(sse|ndjson)$"),
+    db: Session = Depends(get_db_session),
+):
+    """
+    Streaming API
+    - summary 이벤트 후 추천 카드(item)를 만들어지는 대로 전달
+    - format=sse: text/event-stream, format=ndjson: 줄 단위 JSON
+    - done/error/timeout 이벤트로 종료 (timeout이면 polling API로 이어서 조회)
+    """
+    usecase = StreamSearchHouseEventsUseCase(
+        db, RedisSearchHouseEventStream(get_redis())
+    )
+    events = usecase.execute(search_house_id)
+
+    if events is None:
+        raise HTTPException(status_code=404, detail="search_house not found")
+
+    if format == "ndjson":
+        body = (
+            json.dumps({"id": event_id, "event": event, "data": data}, default=str) + "\n"
+            for event_id, event, data in events
+        )
+        return StreamingResponse(body, media_type="application/x-ndjson")
+
+    body = (
+        f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        for event_id, event, data in events
+    )
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,59 @@
+"""
+Outbound Adapter (Redis Streams)
+- worker가 추천 항목을 만드는 즉시 search_house:{id}:events 스트림에 추가
+- API는 XREAD로 이어 읽어 SSE/NDJSON으로 전달
+"""
+import json
+from typing import Any
+
+from modules.mq.application.port.search_house_event_stream_port import (
+    SearchHouseEventStreamPort,
+)
+
+
+class RedisSearchHouseEventStream(SearchHouseEventStreamPort):
+    STREAM_KEY = "search_house:{search_house_id}:events"
+
+    def __init__(self, redis_client, ttl_seconds: int = 3600, maxlen: int = 1000):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.maxlen = maxlen
+
+    def publish(self, search_house_id: int, event: str, data: dict[str, Any]) -> None:
+        key = self.STREAM_KEY.format(search_house_id=search_house_id)
+        pipe = self.redis.pipeline()
+        pipe.xadd(
+            key,
+            {"event": event, "data": json.dumps(data, default=str)},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        # 폴링 결과(result_json)가 원본이므로 스트림은 일정 시간 뒤 정리한다.
+        pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+
+    def read(
+        self,
+        search_house_id: int,
+        last_event_id: str,
+        block_ms: int,
+    ) -> list[tuple[str, str, dict[str, Any]]]:
+        key = self.STREAM_KEY.format(search_house_id=search_house_id)
+        response = self.redis.xread({key: last_event_id}, block=block_ms)
+        events = []
+        for _stream, entries in response or []:
+            for event_id, fields in entries:
+                events.append(
+                    (
+                        _decode(event_id),
+                        _decode(fields.get(b"event", fields.get("event"))),
+                        json.loads(_decode(fields.get(b"data", fields.get("data")))),
+                    )
+                )
+        return events
+
+
+def _decode(value) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
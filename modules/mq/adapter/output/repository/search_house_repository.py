@@ -7,6 +7,10 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func, update
 from infrastructure.orm.search_house import SearchHouse
+from infrastructure.metrics.recommendation_metrics import (
+    STAGE_SAVE_RESULT_SERIALIZATION,
+    observe_stage,
+)
 import json
 
 
@@ -68,7 +72,8 @@ class SearchHouseRepository:
         result_dict = result.dict() if hasattr(result, "dict") else result
 
         # datetime ISO 변환을 위해 ensure_ascii + default=str 사용
-        result_json = json.dumps(result_dict, default=str)
+        with observe_stage(STAGE_SAVE_RESULT_SERIALIZATION):
+            result_json = json.dumps(result_dict, default=str)
 
         self.db.execute(
             update(SearchHouse)
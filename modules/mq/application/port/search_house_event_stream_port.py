@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class SearchHouseEventStreamPort(ABC):
+    """
+    Outbound Port
+    - search_house 작업의 진행 이벤트(summary/item/done/error)를 주고받는 계약
+    """
+
+    @abstractmethod
+    def publish(self, search_house_id: int, event: str, data: dict[str, Any]) -> None:
+        """작업 이벤트를 스트림에 추가한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(
+        self,
+        search_house_id: int,
+        last_event_id: str,
+        block_ms: int,
+    ) -> list[tuple[str, str, dict[str, Any]]]:
+        """last_event_id 이후 이벤트를 (event_id, event, data) 목록으로 읽는다."""
+        raise NotImplementedError
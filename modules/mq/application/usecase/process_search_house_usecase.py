@@ -1,8 +1,13 @@
 from sqlalchemy.orm import Session
 from modules.mq.adapter.output.repository.search_house_repository import SearchHouseRepository
 from modules.finder_request.adapter.output.repository.finder_request_repository import FinderRequestRepository
-from modules.recommendations.application.dto.recommendation_dto import RecommendStudentHouseCommand
+from modules.mq.application.port.search_house_event_stream_port import SearchHouseEventStreamPort
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseCommand,
+    RecommendStudentHouseResult,
+)
 from dataclasses import asdict
+from infrastructure.metrics.recommendation_metrics import track_job_queries
 
 
 class ProcessSearchHouseUseCase:
@@ -11,13 +16,30 @@ class ProcessSearchHouseUseCase:
     AI 에이전트를 실행하고 결과를 DB에 반영하는 핵심 유즈케이스
     """
 
-    def __init__(self, db: Session, ai_agent):
+    # 스트림 종료 이벤트
+    EVENT_DONE = "done"
+    EVENT_ERROR = "error"
+
+    def __init__(
+        self,
+        db: Session,
+        ai_agent,
+        event_stream: SearchHouseEventStreamPort | None = None,
+        deadline_seconds: float | None = None,
+    ):
         self.db = db
         self.search_house_repo = SearchHouseRepository(db)
         self.finder_request_repo = FinderRequestRepository(db)
         self.ai_agent = ai_agent
+        self.event_stream = event_stream
+        self.deadline_seconds = deadline_seconds
 
     def execute(self, search_house_id: int):
+        # 작업 1건당 실행된 쿼리 수를 지표로 남긴다.
+        with track_job_queries():
+            self._execute(search_house_id)
+
+    def _execute(self, search_house_id: int):
         try:
             updated = self.search_house_repo.mark_processing(search_house_id)
             if not updated:
@@ -29,14 +51,40 @@ class ProcessSearchHouseUseCase:
             # UseCase 실행
             command = RecommendStudentHouseCommand(
                 finder_request_id=finder_request.finder_request_id,
-                candidate_house_platform_ids=None
+                candidate_house_platform_ids=None,
+                deadline_seconds=self.deadline_seconds,
             )
 
-            result = asdict(self.ai_agent.execute(command))
+            if self.event_stream:
+                result = asdict(self._execute_streaming(search_house_id, command))
+            else:
+                result = asdict(self.ai_agent.execute(command))
 
+            # 폴링 경로를 위해 전체 결과는 그대로 저장한다.
             self.search_house_repo.save_result(search_house_id, result)
             self.search_house_repo.mark_completed(search_house_id)
+            self._publish(search_house_id, self.EVENT_DONE, {"status": "COMPLETED"})
 
         except Exception:
             self.search_house_repo.mark_failed(search_house_id)
-            raise
\ No newline at end of file
+            self._publish(search_house_id, self.EVENT_ERROR, {"status": "FAILED"})
+            raise
+
+    def _execute_streaming(
+        self, search_house_id: int, command: RecommendStudentHouseCommand
+    ) -> RecommendStudentHouseResult:
+        """항목이 만들어지는 대로 이벤트를 내보내고 전체 결과로 모은다."""
+        events = []
+        for event in self.ai_agent.execute_stream(command):
+            events.append(event)
+            self._publish(search_house_id, event.event, event.data)
+        return RecommendStudentHouseResult.from_stream_events(events)
+
+    def _publish(self, search_house_id: int, event: str, data: dict) -> None:
+        if not self.event_stream:
+            return
+        try:
+            self.event_stream.publish(search_house_id, event, data)
+        except Exception as e:
+            # 스트림 전송 실패가 작업 실패로 이어지지 않도록 한다.
+            print(f"[WARN][process_search_house] event publish failed: {e}")
\ No newline at end of file
@@ -0,0 +1,74 @@
+import json
+import time
+from typing import Iterator
+
+from modules.mq.adapter.output.repository.search_house_repository import (
+    SearchHouseRepository,
+)
+from modules.mq.application.port.search_house_event_stream_port import (
+    SearchHouseEventStreamPort,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseResult,
+)
+
+# 종료 이벤트를 받으면 스트림을 닫는다.
+TERMINAL_EVENTS = ("done", "error")
+
+
+class StreamSearchHouseEventsUseCase:
+    """
+    Streaming 전용 유즈케이스
+    - worker가 만든 summary/item 이벤트를 이어 읽어 전달
+    - 이미 끝난 job은 result_json으로 같은 순서의 이벤트를 재생
+    - 폴링 API(GetSearchHouseStatusUseCase)는 그대로 유지
+    """
+
+    def __init__(
+        self,
+        db_session,
+        event_stream: SearchHouseEventStreamPort,
+        block_ms: int = 5000,
+        timeout_seconds: float = 120.0,
+    ):
+        self.repo = SearchHouseRepository(db_session)
+        self.event_stream = event_stream
+        self.block_ms = block_ms
+        self.timeout_seconds = timeout_seconds
+
+    def execute(self, search_house_id: int) -> Iterator[tuple[str, str, dict]] | None:
+        """
+        (event_id, event, data) 이터레이터를 반환한다.
+        DB 조회는 여기서 끝내고, 이터레이터는 스트림만 읽는다.
+        """
+        entity = self.repo.get_by_id(search_house_id)
+        if entity is None:
+            return None
+
+        if entity.status in ("COMPLETED", "FAILED"):
+            return self._replay(entity.status, entity.result_json)
+        return self._follow(search_house_id)
+
+    @staticmethod
+    def _replay(status: str, result_json: str | None) -> Iterator[tuple[str, str, dict]]:
+        if status == "COMPLETED" and result_json:
+            result = RecommendStudentHouseResult(**json.loads(result_json))
+            for index, event in enumerate(result.to_stream_events()):
+                yield str(index), event.event, event.data
+            yield "done", "done", {"status": status}
+            return
+        yield "error", "error", {"status": status}
+
+    def _follow(self, search_house_id: int) -> Iterator[tuple[str, str, dict]]:
+        last_event_id = "0"
+        deadline = time.monotonic() + self.timeout_seconds
+        while time.monotonic() < deadline:
+            for event_id, event, data in self.event_stream.read(
+                search_house_id, last_event_id, self.block_ms
+            ):
+                last_event_id = event_id
+                yield event_id, event, data
+                if event in TERMINAL_EVENTS:
+                    return
+        # 시간 안에 끝나지 않으면 클라이언트는 폴링 API로 이어간다.
+        yield last_event_id, "timeout", {"status": "PROCESSING"}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# 한 INSERT 문에 넣을 포인터 수(바인드 파라미터 한도 안쪽).
+_UPSERT_BATCH_SIZE = 5000
+
+
+def _order_key(row: dict) -> tuple:
+    # 이력 조회(ORDER BY calculated_at DESC, id DESC)와 같은 순서. PostgreSQL의
+    # DESC는 NULL을 먼저 두므로 calculated_at이 없는 행을 가장 새롭게 본다.
+    calculated_at = row["calculated_at"]
+    if calculated_at is None:
+        return (1, datetime.min, row["observation_id"])
+    if calculated_at.tzinfo is not None:
+        calculated_at = calculated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (0, calculated_at, row["observation_id"])
+
+
+def _dialect_insert(session: Session):
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
+
+
+def upsert_latest_pointers(
+    session: Session,
+    pointer_orm,
+    key_columns: Sequence[str],
+    rows: Iterable[dict],
+) -> None:
+    """최신 관측치 포인터를 갱신한다. 커밋은 관측치를 쓴 호출자가 한다.
+
+    rows는 key_columns + observation_id + calculated_at 딕셔너리다. 같은 키가 여러 번
+    오면 가장 새로운 행만 쓰고, 이미 저장된 포인터보다 새로울 때만 덮어쓴다.
+    """
+    newest: dict[tuple, dict] = {}
+    for row in rows:
+        key = tuple(row[column] for column in key_columns)
+        current = newest.get(key)
+        if current is None or _order_key(row) > _order_key(current):
+            newest[key] = row
+    if not newest:
+        return
+
+    insert = _dialect_insert(session)
+    table = pointer_orm.__table__
+    values = list(newest.values())
+    for start in range(0, len(values), _UPSERT_BATCH_SIZE):
+        stmt = insert(table).values(values[start:start + _UPSERT_BATCH_SIZE])
+        excluded = stmt.excluded
+        current = table.c
+        is_newer = or_(
+            and_(
+                excluded.calculated_at.is_(None),
+                or_(
+                    current.calculated_at.isnot(None),
+                    excluded.observation_id > current.observation_id,
+                ),
+            ),
+            and_(
+                current.calculated_at.isnot(None),
+                excluded.calculated_at.isnot(None),
+                or_(
+                    excluded.calculated_at > current.calculated_at,
+                    and_(
+                        excluded.calculated_at == current.calculated_at,
+                        excluded.observation_id > current.observation_id,
+                    ),
+                ),
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                "observation_id": excluded.observation_id,
+                "calculated_at": excluded.calculated_at,
+            },
+            where=is_newer,
+        )
+        session.execute(stmt)
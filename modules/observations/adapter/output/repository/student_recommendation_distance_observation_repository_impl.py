@@ -1,44 +1,186 @@
 from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, Iterable, List, Optional, Sequence
 
+from infrastructure.db.postgres_copy import PostgresCopyWriter
+from modules.observations.adapter.output.repository.latest_observation_pointer import (
+    upsert_latest_pointers,
+)
 from modules.observations.application.port.distance_observation_repository_port import DistanceObservationRepositoryPort
 from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
-from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import \
-    StudentRecommendationDistanceObservationORM
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+    StudentRecommendationLatestDistanceObservationORM,
+)
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
 
 
 class StudentRecommendationDistanceObservationRepository(DistanceObservationRepositoryPort):
-    def __init__(self, db_session: Session):
+    # save_bulk/copy_bulk가 같이 쓰는 컬럼 순서(_to_row와 맞춘다).
+    _COLUMNS = (
+        "house_id",
+        "recommendation_observation_id",
+        "university_id",
+        "학교까지_분",
+        "거리_백분위",
+        "거리_버킷",
+        "거리_비선형_점수",
+        "calculated_at",
+    )
+
+    def __init__(
+        self,
+        db_session: Session,
+        dirty_house_tracker: Optional[DirtyHousePort] = None,
+        copy_chunk_size: int = 50_000,
+        card_cache: Optional[HouseCardInvalidationPort] = None,
+    ):
         self.db_session = db_session
+        # 새 관측치가 쌓인 매물은 점수 재계산 대상으로 표시한다.
+        self.dirty_house_tracker = dirty_house_tracker
+        # 커밋된 관측치가 바뀐 매물의 추천 카드를 비운다.
+        self.card_cache = card_cache
+        self.copy_writer = PostgresCopyWriter(
+            StudentRecommendationDistanceObservationORM.__table__,
+            self._COLUMNS,
+            chunk_size=copy_chunk_size,
+            id_column="id",
+        )
 
     def save_bulk(self, distances: list[DistanceFeatureObservation]):
         if not distances:
             return
 
-        # ORM 객체 -> dict 변환
-        values = [
-            {
-                "house_id": d.house_platform_id,
-                "recommendation_observation_id": d.recommendation_observation_id,
-                "university_id": d.university_id,
-                "학교까지_분": d.학교까지_분,
-                "거리_백분위": d.거리_백분위,
-                "거리_버킷": d.거리_버킷,
-                "거리_비선형_점수": d.거리_비선형_점수,
-                "calculated_at": d.calculated_at,
-            }
-            for d in distances
-        ]
+        # 도메인 -> dict 변환
+        values = [dict(zip(self._COLUMNS, self._to_row(d))) for d in distances]
 
-        stmt = insert(StudentRecommendationDistanceObservationORM).values(values)
-        self.db_session.execute(stmt)
+        stmt = insert(StudentRecommendationDistanceObservationORM).returning(
+            StudentRecommendationDistanceObservationORM.id,
+            sort_by_parameter_order=True,
+        )
+        ids = self.db_session.scalars(stmt, values).all()
+        self._before_commit(self.db_session, list(zip(ids, distances)))
         self.db_session.commit()
+        self._invalidate_cards([d.house_platform_id for d in distances])
+
+    def copy_bulk(self, distances: Iterable[DistanceFeatureObservation]) -> int:
+        """COPY FROM STDIN으로 청크마다 한 트랜잭션씩 저장한다."""
+        return self.copy_writer.write(
+            self.db_session,
+            distances,
+            self._to_row,
+            on_chunk=lambda chunk: self._invalidate_cards(
+                [d.house_platform_id for _, d in chunk]
+            ),
+            before_commit=self._before_commit,
+        )
+
+    def _before_commit(
+        self, session: Session, saved: Sequence[tuple[int, DistanceFeatureObservation]]
+    ) -> None:
+        """관측치와 같은 트랜잭션에서 최신 포인터와 dirty 표시를 쓴다."""
+        self._update_latest(session, saved)
+        if self.dirty_house_tracker:
+            self.dirty_house_tracker.mark_dirty(
+                [d.house_platform_id for _, d in saved],
+                "distance_observation",
+                session=session,
+            )
+
+    def _invalidate_cards(self, house_platform_ids: List[int]) -> None:
+        if self.card_cache and house_platform_ids:
+            self.card_cache.invalidate_houses(sorted(set(house_platform_ids)))
+
+    @staticmethod
+    def _update_latest(
+        session: Session, saved: Sequence[tuple[int, DistanceFeatureObservation]]
+    ) -> None:
+        upsert_latest_pointers(
+            session,
+            StudentRecommendationLatestDistanceObservationORM,
+            ("house_id", "university_id"),
+            (
+                {
+                    "house_id": d.house_platform_id,
+                    "university_id": d.university_id,
+                    "observation_id": observation_id,
+                    "calculated_at": d.calculated_at,
+                }
+                for observation_id, d in saved
+            ),
+        )
+
+    @staticmethod
+    def _to_row(d: DistanceFeatureObservation) -> tuple:
+        return (
+            d.house_platform_id,
+            d.recommendation_observation_id,
+            d.university_id,
+            d.학교까지_분,
+            d.거리_백분위,
+            d.거리_버킷,
+            d.거리_비선형_점수,
+            d.calculated_at,
+        )
 
     def get_bulk_by_house_platform_id(self, house_platform_id: int) -> List[DistanceFeatureObservation]:
         """매물 ID 기준으로 대학별 최신 거리 관측치를 조회한다."""
+        return self.get_bulk_by_house_platform_ids([house_platform_id])[house_platform_id]
+
+    def get_bulk_by_house_platform_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, List[DistanceFeatureObservation]]:
+        """매물 ID 목록 기준으로 매물/대학별 최신 거리 관측치를 한 번에 조회한다.
+
+        최신 포인터로 이력 PK를 바로 찾고, 포인터가 없는 매물(포인터 도입 전 이력)만
+        이력 전체를 훑는 window 쿼리로 찾는다.
+        """
+        if not house_platform_ids:
+            return {}
+        orms = self._latest_by_pointer(house_platform_ids)
+        pointed = {o.house_id for o in orms}
+        missing = [
+            house_platform_id
+            for house_platform_id in dict.fromkeys(house_platform_ids)
+            if house_platform_id not in pointed
+        ]
+        if missing:
+            orms.extend(self._latest_by_window(missing))
+
+        result: Dict[int, List[DistanceFeatureObservation]] = {
+            house_platform_id: [] for house_platform_id in house_platform_ids
+        }
+        for o in sorted(orms, key=lambda o: o.id):
+            result.setdefault(o.house_id, []).append(self._to_domain(o))
+        return result
+
+    def _latest_by_pointer(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[StudentRecommendationDistanceObservationORM]:
+        pointer = StudentRecommendationLatestDistanceObservationORM
+        return (
+            self.db_session.query(StudentRecommendationDistanceObservationORM)
+            .join(
+                pointer,
+                StudentRecommendationDistanceObservationORM.id == pointer.observation_id,
+            )
+            .filter(pointer.house_id.in_(list(house_platform_ids)))
+            .all()
+        )
+
+    def _latest_by_window(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[StudentRecommendationDistanceObservationORM]:
         row_number = func.row_number().over(
-            partition_by=StudentRecommendationDistanceObservationORM.university_id,
+            partition_by=(
+                StudentRecommendationDistanceObservationORM.house_id,
+                StudentRecommendationDistanceObservationORM.university_id,
+            ),
             order_by=(
                 StudentRecommendationDistanceObservationORM.calculated_at.desc(),
                 StudentRecommendationDistanceObservationORM.id.desc(),
@@ -50,11 +192,13 @@ class StudentRecommendationDistanceObservationRepository(DistanceObservationRepo
                 row_number,
             )
             .filter(
-                StudentRecommendationDistanceObservationORM.house_id == house_platform_id
+                StudentRecommendationDistanceObservationORM.house_id.in_(
+                    list(house_platform_ids)
+                )
             )
             .subquery()
         )
-        orms = (
+        return (
             self.db_session.query(StudentRecommendationDistanceObservationORM)
             .join(
                 latest_ids_subq,
@@ -64,17 +208,16 @@ class StudentRecommendationDistanceObservationRepository(DistanceObservationRepo
             .all()
         )
 
-        return [
-            DistanceFeatureObservation(
-                id=o.id,
-                house_platform_id=o.house_id,
-                recommendation_observation_id=o.recommendation_observation_id,
-                university_id=o.university_id,
-                학교까지_분=o.학교까지_분,
-                거리_백분위=o.거리_백분위,
-                거리_버킷=o.거리_버킷,
-                거리_비선형_점수=o.거리_비선형_점수,
-                calculated_at=o.calculated_at,
-            )
-            for o in orms
-        ]
+    @staticmethod
+    def _to_domain(o: StudentRecommendationDistanceObservationORM) -> DistanceFeatureObservation:
+        return DistanceFeatureObservation(
+            id=o.id,
+            house_platform_id=o.house_id,
+            recommendation_observation_id=o.recommendation_observation_id,
+            university_id=o.university_id,
+            학교까지_분=o.학교까지_분,
+            거리_백분위=o.거리_백분위,
+            거리_버킷=o.거리_버킷,
+            거리_비선형_점수=o.거리_비선형_점수,
+            calculated_at=o.calculated_at,
+        )
@@ -1,5 +1,12 @@
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Sequence
+
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+
+from infrastructure.db.postgres_copy import PostgresCopyWriter
+from modules.observations.adapter.output.repository.latest_observation_pointer import (
+    upsert_latest_pointers,
+)
 from modules.observations.domain.model.student_recommendation_feature_observation import (
     StudentRecommendationFeatureObservation,
     ObservationMetadata,
@@ -9,32 +16,127 @@ from modules.observations.domain.model.student_recommendation_feature_observatio
     ObservationNotes,
 )
 from modules.observations.infrastructure.orm.student_recommendation_feature_observations_orm import (
-    StudentRecommendationFeatureObservationORM
+    StudentRecommendationFeatureObservationORM,
+    StudentRecommendationLatestFeatureObservationORM,
 )
 from modules.observations.application.port.observation_repository_port import ObservationRepositoryPort
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
 
 
 class StudentRecommendationFeatureObservationRepository(ObservationRepositoryPort):
-    def __init__(self, db_session_factory):
+    # copy_bulk 컬럼 순서(_to_row와 맞춘다). id는 writer가 시퀀스에서 받아 앞에 붙인다.
+    _COLUMNS = (
+        "house_platform_id",
+        "snapshot_id",
+        "risk_event_count",
+        "risk_event_types",
+        "risk_probability_est",
+        "risk_severity_score",
+        "risk_nonlinear_penalty",
+        "essential_option_coverage",
+        "convenience_score",
+        "observation_notes",
+        "observation_version",
+        "source_data_version",
+        "calculated_at",
+    )
+
+    def __init__(
+        self,
+        db_session_factory,
+        dirty_house_tracker: Optional[DirtyHousePort] = None,
+        copy_chunk_size: int = 50_000,
+        card_cache: Optional[HouseCardInvalidationPort] = None,
+    ):
         self.db_session_factory = db_session_factory
+        # 새 관측치가 쌓인 매물은 점수 재계산 대상으로 표시한다.
+        self.dirty_house_tracker = dirty_house_tracker
+        # 커밋된 관측치가 바뀐 매물의 추천 카드를 비운다.
+        self.card_cache = card_cache
+        self.copy_writer = PostgresCopyWriter(
+            StudentRecommendationFeatureObservationORM.__table__,
+            self._COLUMNS,
+            chunk_size=copy_chunk_size,
+            id_column="id",
+        )
 
     def find_latest_by_house_id(
         self, house_id: int
     ) -> Optional[StudentRecommendationFeatureObservation]:
+        return self.find_latest_by_house_ids([house_id]).get(house_id)
+
+    def find_latest_by_house_ids(
+        self, house_ids: Sequence[int]
+    ) -> Dict[int, StudentRecommendationFeatureObservation]:
+        """매물별 최신 관측치를 조회한다.
+
+        최신 포인터로 이력 PK를 바로 찾고, 포인터가 없는 매물만 window 쿼리로 찾는다.
+        """
+        if not house_ids:
+            return {}
         db: Session = self.db_session_factory()
         try:
-            orm = (
+            pointer = StudentRecommendationLatestFeatureObservationORM
+            orms = (
                 db.query(StudentRecommendationFeatureObservationORM)
-                .filter(
-                    StudentRecommendationFeatureObservationORM.house_platform_id == house_id
+                .join(
+                    pointer,
+                    StudentRecommendationFeatureObservationORM.id == pointer.observation_id,
                 )
-                .order_by(StudentRecommendationFeatureObservationORM.calculated_at.desc())
-                .first()
+                .filter(pointer.house_platform_id.in_(list(house_ids)))
+                .all()
             )
-            return self._to_domain(orm) if orm else None
+            result = {orm.house_platform_id: self._to_domain(orm) for orm in orms}
+            missing = [
+                house_id for house_id in dict.fromkeys(house_ids) if house_id not in result
+            ]
+            if missing:
+                result.update(
+                    (orm.house_platform_id, self._to_domain(orm))
+                    for orm in self._latest_by_window(db, missing)
+                )
+            return result
         finally:
             db.close()
 
+    @staticmethod
+    def _latest_by_window(
+        db: Session, house_ids: Sequence[int]
+    ) -> List[StudentRecommendationFeatureObservationORM]:
+        row_number = func.row_number().over(
+            partition_by=StudentRecommendationFeatureObservationORM.house_platform_id,
+            order_by=(
+                StudentRecommendationFeatureObservationORM.calculated_at.desc(),
+                StudentRecommendationFeatureObservationORM.id.desc(),
+            ),
+        ).label("rn")
+        latest_ids_subq = (
+            db.query(
+                StudentRecommendationFeatureObservationORM.id.label("id"),
+                row_number,
+            )
+            .filter(
+                StudentRecommendationFeatureObservationORM.house_platform_id.in_(
+                    list(house_ids)
+                )
+            )
+            .subquery()
+        )
+        return (
+            db.query(StudentRecommendationFeatureObservationORM)
+            .join(
+                latest_ids_subq,
+                StudentRecommendationFeatureObservationORM.id == latest_ids_subq.c.id,
+            )
+            .filter(latest_ids_subq.c.rn == 1)
+            .all()
+        )
+
     def find_history(
         self, house_id: int
     ) -> List[StudentRecommendationFeatureObservation]:
@@ -83,12 +185,93 @@ class StudentRecommendationFeatureObservationRepository(ObservationRepositoryPor
             db.add(orm)
             db.flush()  # PK 생성
             observation.id = orm.id  # Domain에 반영
+            self._before_commit(db, [(orm.id, orm)])
             db.commit()
+            self._invalidate_cards([observation.house_platform_id])
             return observation
 
         finally:
             db.close()
 
+    def copy_bulk(
+        self, observations: Iterable[StudentRecommendationFeatureObservation]
+    ) -> int:
+        """COPY FROM STDIN으로 청크마다 한 트랜잭션씩 저장한다.
+
+        COPY는 생성 ID를 돌려주지 않으므로 writer가 시퀀스에서 ID를 먼저 받아 함께 쓰고,
+        청크가 커밋되면 각 관측치의 id를 채운다.
+        """
+        observations = list(observations)
+        if not observations:
+            return 0
+        db: Session = self.db_session_factory()
+        try:
+            return self.copy_writer.write(
+                db,
+                observations,
+                self._to_row,
+                on_chunk=self._on_copied,
+                before_commit=self._before_commit,
+            )
+        finally:
+            db.close()
+
+    def _on_copied(self, chunk) -> None:
+        for observation_id, observation in chunk:
+            observation.id = observation_id
+        self._invalidate_cards(
+            [observation.house_platform_id for _, observation in chunk]
+        )
+
+    def _invalidate_cards(self, house_platform_ids: List[int]) -> None:
+        if self.card_cache and house_platform_ids:
+            self.card_cache.invalidate_houses(sorted(set(house_platform_ids)))
+
+    def _before_commit(self, session: Session, saved) -> None:
+        """관측치와 같은 트랜잭션에서 최신 포인터와 dirty 표시를 쓴다."""
+        self._update_latest(session, saved)
+        if self.dirty_house_tracker:
+            self.dirty_house_tracker.mark_dirty(
+                [observation.house_platform_id for _, observation in saved],
+                "feature_observation",
+                session=session,
+            )
+
+    @staticmethod
+    def _update_latest(session: Session, saved) -> None:
+        """(관측치 ID, 관측치) 쌍으로 매물별 최신 포인터를 갱신한다."""
+        upsert_latest_pointers(
+            session,
+            StudentRecommendationLatestFeatureObservationORM,
+            ("house_platform_id",),
+            (
+                {
+                    "house_platform_id": observation.house_platform_id,
+                    "observation_id": observation_id,
+                    "calculated_at": observation.calculated_at,
+                }
+                for observation_id, observation in saved
+            ),
+        )
+
+    @staticmethod
+    def _to_row(observation: StudentRecommendationFeatureObservation) -> tuple:
+        return (
+            observation.house_platform_id,
+            observation.snapshot_id,
+            observation.위험_관측치.위험_사건_개수,
+            observation.위험_관측치.위험_사건_유형,
+            observation.위험_관측치.위험_확률_추정,
+            observation.위험_관측치.위험_심각도_점수,
+            observation.위험_관측치.위험_비선형_패널티,
+            observation.편의_관측치.필수_옵션_커버리지,
+            observation.편의_관측치.편의_점수,
+            observation.관측_메모.notes,
+            observation.메타데이터.관측치_버전,
+            observation.메타데이터.원본_데이터_버전,
+            observation.calculated_at,
+        )
+
     @staticmethod
     def _to_domain(
             orm: StudentRecommendationFeatureObservationORM
@@ -1,33 +1,82 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
+from infrastructure.db.postgres_copy import PostgresCopyWriter
+from modules.observations.adapter.output.repository.latest_observation_pointer import (
+    upsert_latest_pointers,
+)
 from modules.observations.application.port.price_observation_repository_port import PriceObservationRepositoryPort
 from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
-from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import \
-    StudentRecommendationPriceObservationsORM
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationLatestPriceObservationORM,
+    StudentRecommendationPriceObservationsORM,
+)
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
 
 
 class StudentRecommendationPriceObservationRepository(PriceObservationRepositoryPort):
-    def __init__(self, session: Session):
+    # save_bulk/copy_bulk 컬럼 순서(_to_row와 맞춘다).
+    _COLUMNS = (
+        "house_platform_id",
+        "recommendation_observation_id",
+        "가격_백분위",
+        "가격_z점수",
+        "예상_입주비용",
+        "월_비용_추정",
+        "가격_부담_비선형",
+        "calculated_at",
+    )
+
+    def __init__(
+        self,
+        session: Session,
+        dirty_house_tracker: Optional[DirtyHousePort] = None,
+        copy_chunk_size: int = 50_000,
+        card_cache: Optional[HouseCardInvalidationPort] = None,
+    ):
         self.session = session
+        # 새 관측치가 쌓인 매물은 점수 재계산 대상으로 표시한다.
+        self.dirty_house_tracker = dirty_house_tracker
+        # 커밋된 관측치가 바뀐 매물의 추천 카드를 비운다.
+        self.card_cache = card_cache
+        self.copy_writer = PostgresCopyWriter(
+            StudentRecommendationPriceObservationsORM.__table__,
+            self._COLUMNS,
+            chunk_size=copy_chunk_size,
+            id_column="id",
+        )
 
     def save_bulk(self, observations: List[PriceFeatureObservation]) -> None:
         """여러 PriceFeatureObservation을 DB에 저장"""
-        orm_objects = [
-            StudentRecommendationPriceObservationsORM(
-                house_platform_id=o.house_platform_id,
-                recommendation_observation_id=o.recommendation_observation_id,
-                가격_백분위=o.가격_백분위,
-                가격_z점수=o.가격_z점수,
-                예상_입주비용=o.예상_입주비용,
-                월_비용_추정=o.월_비용_추정,
-                가격_부담_비선형=o.가격_부담_비선형,
-                calculated_at=o.calculated_at,
-            )
-            for o in observations
-        ]
-        self.session.bulk_save_objects(orm_objects)
+        if not observations:
+            return
+        values = [dict(zip(self._COLUMNS, self._to_row(o))) for o in observations]
+        stmt = insert(StudentRecommendationPriceObservationsORM).returning(
+            StudentRecommendationPriceObservationsORM.id,
+            sort_by_parameter_order=True,
+        )
+        ids = self.session.scalars(stmt, values).all()
+        self._before_commit(self.session, list(zip(ids, observations)))
         self.session.commit()
+        self._invalidate_cards([o.house_platform_id for o in observations])
+
+    def copy_bulk(self, observations: Iterable[PriceFeatureObservation]) -> int:
+        """COPY FROM STDIN으로 청크마다 한 트랜잭션씩 저장한다."""
+        return self.copy_writer.write(
+            self.session,
+            observations,
+            self._to_row,
+            on_chunk=lambda chunk: self._invalidate_cards(
+                [o.house_platform_id for _, o in chunk]
+            ),
+            before_commit=self._before_commit,
+        )
 
     def save(self, observation: PriceFeatureObservation) -> PriceFeatureObservation:
         """단일 PriceFeatureObservation 저장 및 PK 반환"""
@@ -42,7 +91,10 @@ class StudentRecommendationPriceObservationRepository(PriceObservationRepository
             calculated_at=observation.calculated_at,
         )
         self.session.add(orm_obj)
+        self.session.flush()
+        self._before_commit(self.session, [(orm_obj.id, orm_obj)])
         self.session.commit()
+        self._invalidate_cards([observation.house_platform_id])
 
         # frozen dataclass이므로 새 객체를 만들어 반환
         return PriceFeatureObservation(
@@ -59,14 +111,123 @@ class StudentRecommendationPriceObservationRepository(PriceObservationRepository
 
     def get_by_house_platform_id(self, house_platform_id: int) -> Optional[PriceFeatureObservation]:
         """매물 ID로 PriceFeatureObservation 조회 (최신)"""
-        orm = self.session.query(StudentRecommendationPriceObservationsORM) \
-            .filter(StudentRecommendationPriceObservationsORM.house_platform_id == house_platform_id) \
-            .order_by(StudentRecommendationPriceObservationsORM.calculated_at.desc()) \
-            .first()
+        return self.get_latest_by_house_platform_ids([house_platform_id]).get(
+            house_platform_id
+        )
+
+    def get_latest_by_house_platform_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, PriceFeatureObservation]:
+        """매물 ID 목록으로 최신 PriceFeatureObservation을 한 번에 조회
+
+        최신 포인터로 이력 PK를 바로 찾고, 포인터가 없는 매물만 window 쿼리로 찾는다.
+        """
+        if not house_platform_ids:
+            return {}
+        pointer = StudentRecommendationLatestPriceObservationORM
+        orms = (
+            self.session.query(StudentRecommendationPriceObservationsORM)
+            .join(
+                pointer,
+                StudentRecommendationPriceObservationsORM.id == pointer.observation_id,
+            )
+            .filter(pointer.house_platform_id.in_(list(house_platform_ids)))
+            .all()
+        )
+        result = {orm.house_platform_id: self._to_domain(orm) for orm in orms}
+        missing = [
+            house_platform_id
+            for house_platform_id in dict.fromkeys(house_platform_ids)
+            if house_platform_id not in result
+        ]
+        if missing:
+            result.update(
+                (orm.house_platform_id, self._to_domain(orm))
+                for orm in self._latest_by_window(missing)
+            )
+        return result
+
+    def _latest_by_window(
+        self, house_platform_ids: Sequence[int]
+    ) -> List[StudentRecommendationPriceObservationsORM]:
+        row_number = func.row_number().over(
+            partition_by=StudentRecommendationPriceObservationsORM.house_platform_id,
+            order_by=(
+                StudentRecommendationPriceObservationsORM.calculated_at.desc(),
+                StudentRecommendationPriceObservationsORM.id.desc(),
+            ),
+        ).label("rn")
+        latest_ids_subq = (
+            self.session.query(
+                StudentRecommendationPriceObservationsORM.id.label("id"),
+                row_number,
+            )
+            .filter(
+                StudentRecommendationPriceObservationsORM.house_platform_id.in_(
+                    list(house_platform_ids)
+                )
+            )
+            .subquery()
+        )
+        return (
+            self.session.query(StudentRecommendationPriceObservationsORM)
+            .join(
+                latest_ids_subq,
+                StudentRecommendationPriceObservationsORM.id == latest_ids_subq.c.id,
+            )
+            .filter(latest_ids_subq.c.rn == 1)
+            .all()
+        )
 
-        if not orm:
-            return None
+    @staticmethod
+    def _update_latest(
+        session: Session, saved: Sequence[tuple[int, PriceFeatureObservation]]
+    ) -> None:
+        upsert_latest_pointers(
+            session,
+            StudentRecommendationLatestPriceObservationORM,
+            ("house_platform_id",),
+            (
+                {
+                    "house_platform_id": o.house_platform_id,
+                    "observation_id": observation_id,
+                    "calculated_at": o.calculated_at,
+                }
+                for observation_id, o in saved
+            ),
+        )
+
+    def _invalidate_cards(self, house_platform_ids: List[int]) -> None:
+        if self.card_cache and house_platform_ids:
+            self.card_cache.invalidate_houses(sorted(set(house_platform_ids)))
+
+    def _before_commit(
+        self, session: Session, saved: Sequence[tuple[int, PriceFeatureObservation]]
+    ) -> None:
+        """관측치와 같은 트랜잭션에서 최신 포인터와 dirty 표시를 쓴다."""
+        self._update_latest(session, saved)
+        if self.dirty_house_tracker and saved:
+            self.dirty_house_tracker.mark_dirty(
+                [o.house_platform_id for _, o in saved],
+                "price_observation",
+                session=session,
+            )
+
+    @staticmethod
+    def _to_row(o: PriceFeatureObservation) -> tuple:
+        return (
+            o.house_platform_id,
+            o.recommendation_observation_id,
+            o.가격_백분위,
+            o.가격_z점수,
+            o.예상_입주비용,
+            o.월_비용_추정,
+            o.가격_부담_비선형,
+            o.calculated_at,
+        )
 
+    @staticmethod
+    def _to_domain(orm: StudentRecommendationPriceObservationsORM) -> PriceFeatureObservation:
         return PriceFeatureObservation(
             id=orm.id,
             house_platform_id=orm.house_platform_id,
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence
+
+# 관측치 생성 단계. batch는 청크 전체가 워커에서 예외로 끝난 경우다.
+FULL_OBSERVATION_STAGES = ("feature", "price", "distance", "batch")
+
+
+@dataclass
+class GenerateFullObservationBatchCommand:
+    """여러 매물의 feature -> price -> distance 관측치를 청크 단위로 만드는 요청."""
+
+    house_platform_ids: Sequence[int]
+    # 가격 백분위/z-score 코호트. 워커마다 한 번만 전달한다.
+    house_prices: Mapping[int, int]
+    chunk_size: int = 500
+    # None이면 CPU 수만큼, 1 이하이면 현재 프로세스에서 순서대로 실행한다.
+    max_workers: int | None = None
+
+
+@dataclass
+class FullObservationFailure:
+    """한 매물의 단계별 실패."""
+
+    house_platform_id: int
+    stage: str
+    error: str
+
+
+@dataclass
+class FullObservationBatchResult:
+    """배치 관측치 생성 결과. 실패는 중단하지 않고 단계별로 모은다."""
+
+    processed_house_ids: List[int] = field(default_factory=list)
+    failures: List[FullObservationFailure] = field(default_factory=list)
+
+    @property
+    def processed_count(self) -> int:
+        return len(self.processed_house_ids)
+
+    @property
+    def failed_count(self) -> int:
+        return len({failure.house_platform_id for failure in self.failures})
+
+    def add_failure(self, house_platform_id: int, stage: str, error) -> None:
+        self.failures.append(
+            FullObservationFailure(
+                house_platform_id=house_platform_id, stage=stage, error=str(error)
+            )
+        )
+
+    def merge(self, other: "FullObservationBatchResult") -> None:
+        self.processed_house_ids.extend(other.processed_house_ids)
+        self.failures.extend(other.failures)
+
+    def failures_by_stage(self) -> Dict[str, List[FullObservationFailure]]:
+        grouped: Dict[str, List[FullObservationFailure]] = {}
+        for failure in self.failures:
+            grouped.setdefault(failure.stage, []).append(failure)
+        return grouped
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Sequence
+
+import numpy as np
+
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.university.application.dto.university_location_dto import (
+    UniversityLocationDTO,
+)
+
+EARTH_RADIUS_KM = 6371
+WALKING_SPEED_KMH = 5
+
+# 거리_버킷 경계(분). 경계값은 위 구간으로 올라간다(minutes < 10 -> 0_10분).
+DISTANCE_BUCKET_EDGES = np.array([10.0, 20.0, 30.0, 40.0])
+DISTANCE_BUCKET_LABELS = ("0_10분", "10_20분", "20_30분", "30_40분", "40분_이상")
+
+
+def _pair_minutes(dlat: float, dlon: float, cos_product: float) -> float:
+    """하버사인 도보 분. 관측치 값이 그대로 유지되도록 스칼라 libm 연산을 쓴다."""
+    a = math.sin(dlat / 2) ** 2 + cos_product * math.sin(dlon / 2) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    km = EARTH_RADIUS_KM * c
+    return (km / WALKING_SPEED_KMH) * 60
+
+
+_pair_minutes_ufunc = np.frompyfunc(_pair_minutes, 3, 1)
+
+
+def _libm_cos_radians(degrees: np.ndarray) -> np.ndarray:
+    return np.fromiter(
+        (math.cos(math.radians(value)) for value in degrees.tolist()),
+        dtype=np.float64,
+        count=degrees.shape[0],
+    )
+
+
+@dataclass(frozen=True)
+class DistanceObservationBlock:
+    """매물 청크 x 대학 거리 관측치 행렬. 열 순서는 엔진의 대학 순서와 같다."""
+
+    house_platform_ids: np.ndarray
+    minutes: np.ndarray
+    percentile: np.ndarray
+    bucket_index: np.ndarray
+    nonlinear_score: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.house_platform_ids.shape[0])
+
+
+class DistanceObservationEngine:
+    """매물 x 대학 거리 관측치를 청크 단위 행렬로 계산한다.
+
+    기본은 전부 NumPy 브로드캐스팅으로 계산한다. NumPy의 arctan2/제곱은 libm과
+    마지막 자리가 가끔 달라 건별 계산과 1ulp 수준(상대 오차 1e-12 이내) 차이가
+    날 수 있다. exact=True면 매물-대학 쌍의 하버사인 삼각함수만 libm 스칼라로
+    평가해 기존 건별 계산과 비트 단위로 같은 값을 내지만 몇 배 느리다.
+    백분위/버킷/비선형 점수는 두 경우 모두 행렬 연산이다.
+    """
+
+    def __init__(
+        self,
+        universities: Sequence[UniversityLocationDTO],
+        chunk_size: int = 512,
+        exact: bool = False,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.universities = list(universities)
+        self.chunk_size = chunk_size
+        self.exact = exact
+        self.university_ids = np.array(
+            [university.university_location_id for university in self.universities],
+            dtype=np.int64,
+        )
+        self._lat = np.array(
+            [university.lat for university in self.universities], dtype=np.float64
+        )
+        self._lng = np.array(
+            [university.lng for university in self.universities], dtype=np.float64
+        )
+        self._cos_lat = self._cos_radians(self._lat)
+
+    @property
+    def university_count(self) -> int:
+        return int(self.university_ids.shape[0])
+
+    def iter_blocks(
+        self,
+        house_platform_ids: Sequence[int],
+        lats: Sequence[float],
+        lngs: Sequence[float],
+    ) -> Iterator[DistanceObservationBlock]:
+        """매물 목록을 chunk_size씩 잘라 블록을 만든다."""
+        ids = np.asarray(house_platform_ids, dtype=np.int64)
+        lat_values = np.asarray(lats, dtype=np.float64)
+        lng_values = np.asarray(lngs, dtype=np.float64)
+        for start in range(0, ids.shape[0], self.chunk_size):
+            end = start + self.chunk_size
+            yield self.compute_block(
+                ids[start:end], lat_values[start:end], lng_values[start:end]
+            )
+
+    def compute_block(
+        self,
+        house_platform_ids: Sequence[int],
+        lats: Sequence[float],
+        lngs: Sequence[float],
+    ) -> DistanceObservationBlock:
+        minutes = self.minutes(lats, lngs)
+        return DistanceObservationBlock(
+            house_platform_ids=np.asarray(house_platform_ids, dtype=np.int64),
+            minutes=minutes,
+            percentile=self.percentile(minutes),
+            bucket_index=self.bucket_index(minutes),
+            nonlinear_score=self.nonlinear_score(minutes),
+        )
+
+    def minutes(self, lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+        """(매물 수, 대학 수) 도보 분 행렬."""
+        house_lat = np.asarray(lats, dtype=np.float64)
+        house_lng = np.asarray(lngs, dtype=np.float64)
+        # radians(a - b)는 원소별 연산이라 NumPy와 libm 결과가 같다.
+        dlat = np.radians(self._lat[None, :] - house_lat[:, None])
+        dlon = np.radians(self._lng[None, :] - house_lng[:, None])
+        cos_product = self._cos_radians(house_lat)[:, None] * self._cos_lat[None, :]
+        if self.exact:
+            return _pair_minutes_ufunc(dlat, dlon, cos_product).astype(np.float64)
+        a = np.sin(dlat / 2) ** 2 + cos_product * np.sin(dlon / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return (EARTH_RADIUS_KM * c / WALKING_SPEED_KMH) * 60
+
+    @staticmethod
+    def percentile(minutes: np.ndarray) -> np.ndarray:
+        """행마다 자기 이하인 대학 비율(sum(row <= m) / n)."""
+        count = minutes.shape[1]
+        if count == 0:
+            return np.empty_like(minutes)
+        order = np.argsort(minutes, axis=1, kind="stable")
+        ordered = np.take_along_axis(minutes, order, axis=1)
+        # 정렬된 행에서 각 위치의 "이하 개수"는 같은 값 묶음의 마지막 위치 + 1이다.
+        group_end = np.ones(minutes.shape, dtype=bool)
+        group_end[:, :-1] = ordered[:, 1:] != ordered[:, :-1]
+        positions = np.where(group_end, np.arange(1, count + 1), count)
+        ranks = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1]
+        counts = np.empty(minutes.shape, dtype=np.int64)
+        np.put_along_axis(counts, order, ranks, axis=1)
+        return counts / count
+
+    @staticmethod
+    def bucket_index(minutes: np.ndarray) -> np.ndarray:
+        """DISTANCE_BUCKET_LABELS 위치."""
+        return np.searchsorted(DISTANCE_BUCKET_EDGES, minutes, side="right").astype(
+            np.int8
+        )
+
+    @staticmethod
+    def nonlinear_score(minutes: np.ndarray) -> np.ndarray:
+        return np.select(
+            [minutes <= 20, minutes <= 30, minutes <= 40],
+            [
+                np.maximum(0.0, 1 - 0.01 * minutes),
+                np.maximum(0.0, 0.8 - 0.02 * (minutes - 20)),
+                np.maximum(0.0, 0.6 - 0.03 * (minutes - 30)),
+            ],
+            default=0.3,
+        )
+
+    def to_observations(
+        self,
+        block: DistanceObservationBlock,
+        recommendation_observation_ids: Sequence[int],
+        calculated_at: datetime,
+    ) -> List[DistanceFeatureObservation]:
+        """블록을 매물 순서, 매물 안에서는 대학 순서의 관측치 행으로 펼친다."""
+        university_ids = self.university_ids.tolist()
+        observations: List[DistanceFeatureObservation] = []
+        for row, (house_platform_id, recommendation_observation_id) in enumerate(
+            zip(block.house_platform_ids.tolist(), recommendation_observation_ids)
+        ):
+            for university_id, minutes, percentile, bucket, score in zip(
+                university_ids,
+                block.minutes[row].tolist(),
+                block.percentile[row].tolist(),
+                block.bucket_index[row].tolist(),
+                block.nonlinear_score[row].tolist(),
+            ):
+                observations.append(
+                    DistanceFeatureObservation(
+                        id=None,
+                        house_platform_id=house_platform_id,
+                        recommendation_observation_id=recommendation_observation_id,
+                        university_id=university_id,
+                        학교까지_분=minutes,
+                        거리_백분위=percentile,
+                        거리_버킷=DISTANCE_BUCKET_LABELS[bucket],
+                        거리_비선형_점수=score,
+                        calculated_at=calculated_at,
+                    )
+                )
+        return observations
+
+    def _cos_radians(self, degrees: np.ndarray) -> np.ndarray:
+        if self.exact:
+            return _libm_cos_radians(degrees)
+        return np.cos(np.radians(degrees))
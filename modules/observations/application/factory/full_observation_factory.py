@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+from infrastructure.db.postgres import SessionLocal, engine
+from infrastructure.db.session_helper import open_session
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import (
+    StudentRecommendationFeatureObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.application.dto.full_observation_batch_dto import (
+    FullObservationBatchResult,
+)
+from modules.observations.application.factory.price_cohort_stats import (
+    PriceCohortStats,
+)
+from modules.observations.application.usecase.generate_distance_observation_usecase import (
+    GenerateDistanceObservationUseCase,
+)
+from modules.observations.application.usecase.generate_full_observation_usecase import (
+    GenerateFullObservationUseCase,
+)
+from modules.observations.application.usecase.generate_price_observation_usecase import (
+    GeneratePriceObservationUseCase,
+)
+from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import (
+    GenerateStudentRecommendationFeatureObservationUseCase,
+)
+from modules.observations.application.usecase.parallel_generate_full_observation import (
+    ParallelGenerateFullObservationService,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import (
+    DirtyHouseRepository,
+)
+from modules.university.adapter.output.university_repository import (
+    UniversityRepository,
+)
+
+# 워커 프로세스마다 한 번 만드는 가격 코호트.
+_worker_house_prices: dict[int, int] = {}
+_worker_cohort_stats: PriceCohortStats | None = None
+
+
+def build_full_observation_usecase(
+    session,
+    house_prices: dict[int, int],
+    session_factory=SessionLocal,
+    cohort_stats: PriceCohortStats | None = None,
+    card_cache: HouseCardInvalidationPort | None = None,
+) -> GenerateFullObservationUseCase:
+    """DB 저장소를 조립한 전체 관측치 생성 유스케이스를 만든다. session은 호출자가 닫는다.
+
+    card_cache를 주면 관측치 저장소가 커밋마다 해당 매물의 추천 카드를 비운다.
+    """
+    dirty_house_repo = DirtyHouseRepository(session_factory)
+    house_repo = HousePlatformRepository(session_factory)
+    return GenerateFullObservationUseCase(
+        student_feature_uc=GenerateStudentRecommendationFeatureObservationUseCase(
+            observation_repo=StudentRecommendationFeatureObservationRepository(
+                session_factory,
+                dirty_house_tracker=dirty_house_repo,
+                card_cache=card_cache,
+            ),
+            distance_usecase=None,
+            house_repo=house_repo,
+        ),
+        price_uc=GeneratePriceObservationUseCase(
+            price_repo=StudentRecommendationPriceObservationRepository(
+                session, dirty_house_tracker=dirty_house_repo, card_cache=card_cache
+            ),
+            house_prices=house_prices,
+            cohort_stats=cohort_stats,
+        ),
+        distance_uc=GenerateDistanceObservationUseCase(
+            distance_repo=StudentRecommendationDistanceObservationRepository(
+                session, dirty_house_tracker=dirty_house_repo, card_cache=card_cache
+            ),
+            house_repo=house_repo,
+            university_repo=UniversityRepository(session_factory),
+        ),
+    )
+
+
+def init_full_observation_worker(house_prices: Mapping[int, int]) -> None:
+    """워커 DB 풀을 비우고 가격 코호트 통계를 한 번 만든다."""
+    global _worker_house_prices, _worker_cohort_stats
+    engine.dispose(close=False)
+    _worker_house_prices = dict(house_prices)
+    _worker_cohort_stats = PriceCohortStats.from_prices(_worker_house_prices)
+
+
+def run_full_observation_chunk(house_ids: Sequence[int]) -> FullObservationBatchResult:
+    """워커 프로세스에서 매물 청크 1개를 처리한다(프로세스 풀에서 pickle 가능한 최상위 함수)."""
+    session, generator = open_session(SessionLocal)
+    try:
+        usecase = build_full_observation_usecase(
+            session, _worker_house_prices, cohort_stats=_worker_cohort_stats
+        )
+        return usecase.execute_batch(house_ids, chunk_size=max(len(house_ids), 1))
+    finally:
+        if generator:
+            generator.close()
+        else:
+            session.close()
+
+
+def build_parallel_full_observation_service(
+    card_cache: HouseCardInvalidationPort | None = None,
+) -> ParallelGenerateFullObservationService:
+    """프로세스 풀로 청크를 실행하는 전체 관측치 생성 서비스를 만든다."""
+    return ParallelGenerateFullObservationService(
+        chunk_runner=run_full_observation_chunk,
+        worker_initializer=init_full_observation_worker,
+        card_cache=card_cache,
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from heapq import merge as heap_merge
+from typing import Dict, Mapping
+
+import numpy as np
+
+
+@dataclass
+class WelfordMoments:
+    """건수/평균/편차제곱합(M2) 누적기. 한 건 추가·삭제와 병합(Chan)을 지원한다."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    def merge(self, other: "WelfordMoments") -> "WelfordMoments":
+        if not other.count:
+            return WelfordMoments(self.count, self.mean, self.m2)
+        if not self.count:
+            return WelfordMoments(other.count, other.mean, other.m2)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return WelfordMoments(
+            count,
+            self.mean + delta * other.count / count,
+            self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def std(self) -> float:
+        """모표준편차(np.std 기본 ddof=0과 같은 정의)."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+class PriceCohortStats:
+    """매물 가격 코호트의 평균/표준편차/백분위.
+
+    한 번의 실행에서 전체 가격으로 한 번만 만들고, 매물마다 백분위는 정렬 배열
+    이분 탐색(O(log N)), z-score는 보관한 평균/표준편차로 계산한다.
+    from_prices 직후 값은 np.mean/np.std/np.sum(arr <= p)와 비트 단위로 같다.
+
+    일부 매물만 바뀌면 upsert/remove로 반영한다. 평균/분산은 Welford로 O(1),
+    정렬 배열은 이분 탐색으로 위치를 찾아 한 칸 삽입·삭제한다. 증분 갱신 뒤의
+    평균/표준편차는 전체 재계산과 마지막 자리 반올림이 다를 수 있다.
+    merge는 다른 프로세스가 만든 통계를 정렬 병합과 Chan 공식으로 합친다.
+    """
+
+    def __init__(self):
+        self._prices: Dict[int, int] = {}
+        self._sorted: list[int] = []
+        self._moments = WelfordMoments()
+        # 전체 재계산 값. 증분 갱신이 일어나면 Welford 값으로 넘어간다.
+        self._exact: tuple[float, float] | None = None
+
+    @classmethod
+    def from_prices(cls, house_prices: Mapping[int, int]) -> "PriceCohortStats":
+        stats = cls()
+        stats._prices = dict(house_prices)
+        values = np.array(list(stats._prices.values()))
+        if values.size:
+            mean = float(np.mean(values))
+            variance = float(np.var(values))
+            stats._sorted = np.sort(values).tolist()
+            stats._moments = WelfordMoments(int(values.size), mean, variance * values.size)
+            stats._exact = (mean, float(np.std(values)))
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __contains__(self, house_platform_id: int) -> bool:
+        return house_platform_id in self._prices
+
+    def price_of(self, house_platform_id: int) -> int:
+        return self._prices[house_platform_id]
+
+    @property
+    def mean(self) -> float:
+        return self._exact[0] if self._exact else self._moments.mean
+
+    @property
+    def std(self) -> float:
+        return self._exact[1] if self._exact else self._moments.std
+
+    def percentile(self, price: int) -> float:
+        """코호트에서 price 이하인 매물 비율."""
+        if not self._sorted:
+            raise ValueError("price cohort is empty")
+        return bisect_right(self._sorted, price) / len(self._sorted)
+
+    def zscore(self, price: int) -> float:
+        std = self.std
+        return float((price - self.mean) / std) if std > 0 else 0.0
+
+    def upsert(self, house_platform_id: int, price: int) -> None:
+        """매물 가격을 추가하거나 바꾼다."""
+        previous = self._prices.get(house_platform_id)
+        if previous == price:
+            return
+        if previous is not None:
+            self._discard(previous)
+        self._prices[house_platform_id] = price
+        insort(self._sorted, price)
+        self._moments.add(price)
+        self._exact = None
+
+    def remove(self, house_platform_id: int) -> None:
+        previous = self._prices.pop(house_platform_id, None)
+        if previous is None:
+            return
+        self._discard(previous)
+        self._exact = None
+
+    def merge(self, other: "PriceCohortStats") -> "PriceCohortStats":
+        """서로 다른 매물 집합의 통계를 합친다. 겹치는 매물이 있으면 ValueError."""
+        if self._prices.keys() & other._prices.keys():
+            raise ValueError("cohorts to merge must not share houses")
+        merged = PriceCohortStats()
+        merged._prices = {**self._prices, **other._prices}
+        merged._sorted = list(heap_merge(self._sorted, other._sorted))
+        merged._moments = self._moments.merge(other._moments)
+        return merged
+
+    def _discard(self, price: int) -> None:
+        index = bisect_left(self._sorted, price)
+        del self._sorted[index]
+        self._moments.remove(price)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, List, Sequence
 
 from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
 
@@ -11,7 +11,23 @@ class DistanceObservationRepositoryPort(ABC):
         """매물 단위로 대학별 거리 observation bulk 저장"""
         pass
 
+    def copy_bulk(self, distances: Iterable[DistanceFeatureObservation]) -> int:
+        """대량 관측치를 청크 단위로 저장하고 저장 건수를 돌려준다. 기본은 save_bulk 한 번."""
+        distances = list(distances)
+        if distances:
+            self.save_bulk(distances)
+        return len(distances)
+
     @abstractmethod
     def get_bulk_by_house_platform_id(self, house_platform_id: int) -> List[DistanceFeatureObservation]:
         """매물 ID로 거리 관측치 목록 조회"""
         pass
+
+    def get_bulk_by_house_platform_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, List[DistanceFeatureObservation]]:
+        """매물 ID 목록으로 대학별 최신 거리 관측치를 한 번에 조회"""
+        return {
+            house_platform_id: self.get_bulk_by_house_platform_id(house_platform_id)
+            for house_platform_id in house_platform_ids
+        }
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Sequence
 from modules.observations.domain.model.student_recommendation_feature_observation import StudentRecommendationFeatureObservation
 
 class ObservationRepositoryPort(ABC):
@@ -21,3 +21,25 @@ class ObservationRepositoryPort(ABC):
         self, house_id: int
     ) -> List[StudentRecommendationFeatureObservation]:
         pass
+
+    def find_latest_by_house_ids(
+        self, house_ids: Sequence[int]
+    ) -> Dict[int, StudentRecommendationFeatureObservation]:
+        result = {}
+        for house_id in house_ids:
+            observation = self.find_latest_by_house_id(house_id)
+            if observation:
+                result[house_id] = observation
+        return result
+
+    def copy_bulk(
+        self, observations: Iterable[StudentRecommendationFeatureObservation]
+    ) -> int:
+        """대량 관측치를 저장하고 저장 건수를 돌려준다. 저장 후 각 관측치의 id가 채워진다."""
+        count = 0
+        for observation in observations:
+            saved = self.save(observation)
+            if saved is not None and observation.id is None:
+                observation.id = saved.id
+            count += 1
+        return count
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
 
@@ -9,6 +9,13 @@ class PriceObservationRepositoryPort(ABC):
     def save_bulk(self, observations: List[PriceFeatureObservation]) -> None:
         """여러 PriceFeatureObservation을 DB에 저장"""
 
+    def copy_bulk(self, observations: Iterable[PriceFeatureObservation]) -> int:
+        """대량 관측치를 청크 단위로 저장하고 저장 건수를 돌려준다. 기본은 save_bulk 한 번."""
+        observations = list(observations)
+        if observations:
+            self.save_bulk(observations)
+        return len(observations)
+
     @abstractmethod
     def save(self, observation: PriceFeatureObservation) -> PriceFeatureObservation:
         """단일 PriceFeatureObservation 저장 및 PK 반환"""
@@ -16,3 +23,14 @@ class PriceObservationRepositoryPort(ABC):
     @abstractmethod
     def get_by_house_platform_id(self, house_platform_id: int) -> Optional[PriceFeatureObservation]:
         """매물 ID로 PriceFeatureObservation 조회 (최신)"""
+
+    def get_latest_by_house_platform_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Dict[int, PriceFeatureObservation]:
+        """매물 ID 목록으로 최신 PriceFeatureObservation을 한 번에 조회"""
+        result = {}
+        for house_platform_id in house_platform_ids:
+            observation = self.get_by_house_platform_id(house_platform_id)
+            if observation:
+                result[house_platform_id] = observation
+        return result
@@ -1,10 +1,10 @@
 from datetime import datetime, timezone
-from math import radians, sin, atan2, sqrt, cos
-from typing import List
-import numpy as np
+from typing import List, Mapping, Sequence, Tuple
+
+from modules.house_platform.application.dto.house_platform_location_dto import HousePlatformLocation
+from modules.observations.application.factory.distance_observation_engine import DistanceObservationEngine
 from modules.observations.application.port.distance_observation_repository_port import DistanceObservationRepositoryPort
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
-from modules.observations.domain.model.distance_feature_observation import DistanceFeatureObservation
 from modules.university.application.port.university_repository_port import UniversityRepositoryPort
 
 
@@ -15,10 +15,15 @@ class GenerateDistanceObservationUseCase:
         distance_repo: DistanceObservationRepositoryPort,
         house_repo: HousePlatformRepositoryPort,
         university_repo: UniversityRepositoryPort,
+        chunk_size: int = 512,
+        exact: bool = False,
     ):
         self.distance_repo = distance_repo
         self.house_repo = house_repo
         self.university_repo = university_repo
+        self.chunk_size = chunk_size
+        # True면 건별 계산과 비트 단위로 같은 libm 경로를 쓴다(DistanceObservationEngine 참고).
+        self.exact = exact
 
     def execute(self, recommendation_observation_id: int, house_id: int) -> None:
         # House 정보
@@ -27,76 +32,68 @@ class GenerateDistanceObservationUseCase:
             raise ValueError(f"House {house_id} missing location")
 
         house = bundle.house_platform
-        universities = self.university_repo.get_university_locations()
-
-        # 모든 대학까지 시간 계산
-        all_minutes = [
-            self._calc_minutes(house.lat_lng, uni.lat, uni.lng)
-            for uni in universities
-        ]
+        engine = self._engine()
 
-        observations: List[DistanceFeatureObservation] = []
-
-        for uni, minutes in zip(universities, all_minutes):
-            observations.append(
-                DistanceFeatureObservation(
-                    id=None,
-                    house_platform_id=house_id,
-                    recommendation_observation_id=recommendation_observation_id,
-                    university_id=uni.university_location_id,
-                    학교까지_분=minutes,
-                    거리_백분위=self._calc_percentile(minutes, all_minutes),
-                    거리_버킷=self._calc_bucket(minutes),
-                    거리_비선형_점수=self._calc_nonlinear_score(minutes),
-                    calculated_at=datetime.now(timezone.utc),
-                )
-            )
+        # 모든 대학까지 시간/백분위/버킷/점수를 한 행으로 계산
+        block = engine.compute_block(
+            [house_id], [house.lat_lng["lat"]], [house.lat_lng["lng"]]
+        )
+        observations = engine.to_observations(
+            block, [recommendation_observation_id], datetime.now(timezone.utc)
+        )
 
         # Repository 저장
         self.distance_repo.save_bulk(observations)
 
-    # ---------- 계산 로직 ----------
-    def _calc_minutes(self, house_latlng: dict, uni_lat: float, uni_lng: float) -> float:
-        lat1, lon1 = house_latlng["lat"], house_latlng["lng"]
-        lat2, lon2 = uni_lat, uni_lng
-
-        R = 6371  # 지구 반지름 km
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
-
-        a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        km = R * c
-
-        return (km / 5) * 60  # 도보 5km/h 가정
-
-    def _calc_percentile(self, minutes: float, all_minutes: List[float]) -> float:
-        arr = np.array(all_minutes)
-        return float(np.sum(arr <= minutes) / len(arr))
-
-    def _calc_bucket(self, minutes: float) -> str:
-        if minutes < 10:
-            return "0_10분"
-
-        if minutes < 20:
-            return "10_20분"
-
-        if minutes < 30:
-            return "20_30분"
-
-        if minutes < 40:
-            return "30_40분"
-
-        return "40분_이상"
-
-    def _calc_nonlinear_score(self, minutes: float) -> float:
-        if minutes <= 20:
-            return max(0.0, 1 - 0.01 * minutes)
-
-        if minutes <= 30:
-            return max(0.0, 0.8 - 0.02 * (minutes - 20))
-
-        if minutes <= 40:
-            return max(0.0, 0.6 - 0.03 * (minutes - 30))
-
-        return 0.3
+    def execute_batch(
+        self,
+        targets: Sequence[Tuple[int, int]],
+        locations: Mapping[int, HousePlatformLocation] | None = None,
+    ) -> List[int]:
+        """(recommendation_observation_id, house_id) 목록의 거리 관측치를 청크 단위로 만든다.
+
+        대학 위치와 매물 위치는 한 번씩만 읽고(locations를 주면 매물 위치는 읽지 않는다),
+        chunk_size 매물마다 copy_bulk 한 번으로 저장한다.
+        위치가 없는 매물은 건너뛰고 그 ID 목록을 돌려준다.
+        """
+        if locations is None:
+            house_ids = [house_id for _, house_id in targets]
+            locations = {
+                location.house_platform_id: location
+                for location in self.house_repo.fetch_locations_by_ids(house_ids)
+            }
+        engine = self._engine()
+
+        skipped: List[int] = []
+        ids: List[int] = []
+        recommendation_ids: List[int] = []
+        lats: List[float] = []
+        lngs: List[float] = []
+        for recommendation_observation_id, house_id in targets:
+            location = locations.get(house_id)
+            if location is None:
+                skipped.append(house_id)
+                continue
+            ids.append(house_id)
+            recommendation_ids.append(recommendation_observation_id)
+            lats.append(location.lat)
+            lngs.append(location.lng)
+
+        offset = 0
+        for block in engine.iter_blocks(ids, lats, lngs):
+            observations = engine.to_observations(
+                block,
+                recommendation_ids[offset:offset + len(block)],
+                datetime.now(timezone.utc),
+            )
+            offset += len(block)
+            if observations:
+                self.distance_repo.copy_bulk(observations)
+        return skipped
+
+    def _engine(self) -> DistanceObservationEngine:
+        return DistanceObservationEngine(
+            self.university_repo.get_university_locations(),
+            chunk_size=self.chunk_size,
+            exact=self.exact,
+        )
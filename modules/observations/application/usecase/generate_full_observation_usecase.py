@@ -1,8 +1,17 @@
+from itertools import islice
+from typing import Dict, Iterable, List
+
+from modules.house_platform.application.dto.house_platform_location_dto import HousePlatformLocation
+from modules.observations.application.dto.full_observation_batch_dto import FullObservationBatchResult
 from modules.observations.application.usecase.generate_distance_observation_usecase import \
     GenerateDistanceObservationUseCase
 from modules.observations.application.usecase.generate_price_observation_usecase import GeneratePriceObservationUseCase
 from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import \
     GenerateStudentRecommendationFeatureObservationUseCase
+from modules.observations.domain.model.student_recommendation_feature_observation import \
+    StudentRecommendationFeatureObservation
+
+DEFAULT_BATCH_CHUNK_SIZE = 500
 
 
 class GenerateFullObservationUseCase:
@@ -13,6 +22,7 @@ class GenerateFullObservationUseCase:
         price_uc: GeneratePriceObservationUseCase,
         distance_uc: GenerateDistanceObservationUseCase,
     ):
+        # 추천 카드 캐시 무효화는 관측치 저장소가 커밋마다 한다.
         self.student_feature_uc = student_feature_uc
         self.price_uc = price_uc
         self.distance_uc = distance_uc
@@ -34,3 +44,99 @@ class GenerateFullObservationUseCase:
         )
 
         return student_feature
+
+    def execute_batch(
+        self, house_ids: Iterable[int], chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE
+    ) -> FullObservationBatchResult:
+        """여러 매물의 관측치를 청크 단위로 만든다.
+
+        청크마다 번들을 한 번에 읽고 feature -> price -> distance 단계를 청크 전체에
+        적용한다. 저장은 단계별 유스케이스의 배치 저장(저장소 copy_bulk) 한 번이다.
+        한 매물의 실패는 단계별 실패 목록에 남기고 나머지 매물은 계속 처리한다.
+        feature가 없으면 뒤 단계는 건너뛴다.
+        """
+        result = FullObservationBatchResult()
+        iterator = iter(house_ids)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return result
+            self._execute_chunk(chunk, result)
+
+    def _execute_chunk(self, house_ids: List[int], result: FullObservationBatchResult) -> None:
+        failed_before = len(result.failures)
+        bundles = self.student_feature_uc.fetch_bundles(house_ids)
+
+        # 1. 학생 추천 Feature 생성
+        features = self._save_features(house_ids, bundles, result)
+
+        # 2. PriceObservation 생성
+        prices = []
+        for feature in features:
+            try:
+                prices.append(
+                    self.price_uc.build_observation(
+                        recommendation_observation_id=feature.id,
+                        house_platform_id=feature.house_platform_id,
+                    )
+                )
+            except Exception as exc:
+                result.add_failure(feature.house_platform_id, "price", exc)
+        try:
+            if prices:
+                self.price_uc.save_batch(prices)
+        except Exception as exc:
+            for price in prices:
+                result.add_failure(price.house_platform_id, "price", exc)
+
+        # 3. DistanceObservation 생성
+        targets = [(feature.id, feature.house_platform_id) for feature in features]
+        locations = {
+            house_id: location
+            for house_id, location in (
+                (house_id, self._location(house_id, bundles.get(house_id)))
+                for _, house_id in targets
+            )
+            if location
+        }
+        try:
+            for house_id in self.distance_uc.execute_batch(targets, locations=locations):
+                result.add_failure(house_id, "distance", f"House {house_id} missing location")
+        except Exception as exc:
+            for _, house_id in targets:
+                result.add_failure(house_id, "distance", exc)
+
+        failed = {failure.house_platform_id for failure in result.failures[failed_before:]}
+        result.processed_house_ids.extend(
+            house_id for house_id in house_ids if house_id not in failed
+        )
+
+    def _save_features(
+        self, house_ids: List[int], bundles: Dict, result: FullObservationBatchResult
+    ) -> List[StudentRecommendationFeatureObservation]:
+        features = []
+        for house_id in house_ids:
+            try:
+                features.append(self.student_feature_uc.build(house_id, bundles.get(house_id)))
+            except Exception as exc:
+                result.add_failure(house_id, "feature", exc)
+        try:
+            self.student_feature_uc.save_batch(features)
+        except Exception as exc:
+            # 커밋된 청크의 관측치만 id가 채워져 있다.
+            for feature in features:
+                if feature.id is None:
+                    result.add_failure(feature.house_platform_id, "feature", exc)
+        return [feature for feature in features if feature.id is not None]
+
+    @staticmethod
+    def _location(house_id: int, bundle) -> HousePlatformLocation | None:
+        lat_lng = getattr(getattr(bundle, "house_platform", None), "lat_lng", None) or {}
+        try:
+            return HousePlatformLocation(
+                house_platform_id=house_id,
+                lat=float(lat_lng["lat"]),
+                lng=float(lat_lng["lng"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
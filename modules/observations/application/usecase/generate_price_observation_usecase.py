@@ -1,8 +1,7 @@
 from datetime import datetime, timezone
-from typing import Dict
-
-import numpy as np
+from typing import Dict, Iterable, List, Mapping
 
+from modules.observations.application.factory.price_cohort_stats import PriceCohortStats
 from modules.observations.application.port.price_observation_repository_port import PriceObservationRepositoryPort
 from modules.observations.domain.model.price_feature_observation import PriceFeatureObservation
 
@@ -11,27 +10,64 @@ class GeneratePriceObservationUseCase:
     """
     house_platform_id 단위로 PriceFeatureObservation 생성
     - 가격 백분위, z-score, 예상 입주비용, 월 비용 추정, 비선형 가격 부담 계산
+    - 코호트 평균/표준편차/정렬 배열은 처음 한 번만 만들고 매물마다 재사용한다.
     """
 
-    def __init__(self, price_repo: PriceObservationRepositoryPort, house_prices: Dict[int, int]):
+    def __init__(
+        self,
+        price_repo: PriceObservationRepositoryPort,
+        house_prices: Dict[int, int],
+        cohort_stats: PriceCohortStats | None = None,
+    ):
         """
         house_prices: dict[house_platform_id -> 가격 데이터]
+        생성 뒤 가격이 바뀌면 house_prices를 직접 고치지 말고 update_prices로 반영한다.
+        cohort_stats: 같은 house_prices로 이미 만든 통계(워커 프로세스 재사용용)
         """
         self.price_repo = price_repo
         self.house_prices = house_prices
+        self._cohort_stats = cohort_stats
+
+    @property
+    def cohort_stats(self) -> PriceCohortStats:
+        if self._cohort_stats is None:
+            self._cohort_stats = PriceCohortStats.from_prices(self.house_prices)
+        return self._cohort_stats
+
+    def update_prices(
+        self, changed: Mapping[int, int], removed: Iterable[int] = ()
+    ) -> None:
+        """일부 매물의 가격 변경/삭제를 전체 재계산 없이 코호트 통계에 반영한다."""
+        stats = self.cohort_stats
+        for house_platform_id, price in changed.items():
+            self.house_prices[house_platform_id] = price
+            stats.upsert(house_platform_id, price)
+        for house_platform_id in removed:
+            self.house_prices.pop(house_platform_id, None)
+            stats.remove(house_platform_id)
 
     def execute(self, recommendation_observation_id: int, house_platform_id: int) -> PriceFeatureObservation:
+        observation = self.build_observation(recommendation_observation_id, house_platform_id)
+        self.price_repo.save(observation)
+        return observation
+
+    def save_batch(self, observations: List[PriceFeatureObservation]) -> int:
+        """build_observation으로 만든 관측치를 대량 저장한다(배치 실행용)."""
+        return self.price_repo.copy_bulk(observations)
+
+    def build_observation(
+        self, recommendation_observation_id: int, house_platform_id: int
+    ) -> PriceFeatureObservation:
+        """저장 전 관측치를 만든다(배치 실행용)."""
         if house_platform_id not in self.house_prices:
             raise ValueError(f"House {house_platform_id} has no price data")
 
         price = self.house_prices[house_platform_id]
-        all_prices = np.array(list(self.house_prices.values()))
+        stats = self.cohort_stats
 
         # ---------- 백분위 & z-score ----------
-        price_percentile = float(np.sum(all_prices <= price) / len(all_prices))
-        mean = float(np.mean(all_prices))
-        std = float(np.std(all_prices))
-        price_zscore = float((price - mean) / std) if std > 0 else 0.0
+        price_percentile = stats.percentile(price)
+        price_zscore = stats.zscore(price)
         # TODO: zscore 범위 정책이 확정되면 보정 방식을 조정한다.
         # price_zscore = max(-10.0, min(10.0, price_zscore))
 
@@ -61,6 +97,4 @@ class GeneratePriceObservationUseCase:
             가격_부담_비선형=nonlinear_price_burden,
             calculated_at=datetime.now(timezone.utc),
         )
-
-        self.price_repo.save(observation)
         return observation
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 from modules.house_platform.application.port_out.house_platform_repository_port import HousePlatformRepositoryPort
 from modules.observations.application.assembler.observation_raw_assembler import ObservationRawAssembler
@@ -25,7 +26,30 @@ class GenerateStudentRecommendationFeatureObservationUseCase:
         self.house_repo = house_repo
 
     def execute(self, house_id: int):
-        bundle = self.house_repo.fetch_bundle_by_id(house_id)
+        feature = self.build(house_id, self.house_repo.fetch_bundle_by_id(house_id))
+
+        # 저장 & PK 확보
+        saved_feature = self.observation_repo.save(feature)
+
+        # Distance 생성 (Orchestrator에서 None 처리 가능)
+        if self.distance_usecase:
+            self.distance_usecase.execute(
+                recommendation_observation_id=saved_feature.id,
+                house_id=house_id,
+            )
+
+        return saved_feature
+
+    def fetch_bundles(self, house_ids: List[int]) -> Dict[int, Any]:
+        """매물 번들을 한 번에 읽는다(배치 실행용)."""
+        return self.house_repo.fetch_bundles_by_ids(house_ids)
+
+    def save_batch(self, features: List[StudentRecommendationFeatureObservation]) -> int:
+        """관측치를 대량 저장한다. 저장된 관측치는 id가 채워진다(배치 실행용)."""
+        return self.observation_repo.copy_bulk(features)
+
+    def build(self, house_id: int, bundle) -> StudentRecommendationFeatureObservation:
+        """이미 읽은 번들로 저장 전 관측치를 만든다(배치 실행용)."""
         if not bundle or not bundle.house_platform:
             raise HouseNotFoundError(house_id)
 
@@ -56,15 +80,4 @@ class GenerateStudentRecommendationFeatureObservationUseCase:
             메타데이터=metadata,
             calculated_at=datetime.now(timezone.utc),
         )
-
-        # 저장 & PK 확보
-        saved_feature = self.observation_repo.save(feature)
-
-        # Distance 생성 (Orchestrator에서 None 처리 가능)
-        if self.distance_usecase:
-            self.distance_usecase.execute(
-                recommendation_observation_id=saved_feature.id,
-                house_id=house_id,
-            )
-
-        return saved_feature
+        return feature
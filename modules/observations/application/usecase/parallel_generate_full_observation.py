@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Mapping, Sequence
+
+from modules.observations.application.dto.full_observation_batch_dto import (
+    FullObservationBatchResult,
+    GenerateFullObservationBatchCommand,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
+
+# 매물 ID 청크 하나의 관측치를 만든다. 프로세스 풀에서 실행하려면 모듈 최상위 함수처럼
+# pickle 가능해야 한다.
+ChunkRunner = Callable[[Sequence[int]], FullObservationBatchResult]
+# 워커마다 한 번 가격 코호트(house_prices)를 받아 준비한다.
+WorkerInitializer = Callable[[Mapping[int, int]], None]
+
+
+class ParallelGenerateFullObservationService:
+    """매물 ID를 청크로 나눠 프로세스 풀에서 관측치를 만들고 결과를 합친다.
+
+    가격 코호트는 청크마다 보내지 않고 워커 초기화 때 한 번만 넘긴다.
+    청크 하나가 예외로 끝나면 그 청크 매물을 batch 단계 실패로 남기고 계속한다.
+    """
+
+    def __init__(
+        self,
+        chunk_runner: ChunkRunner,
+        worker_initializer: WorkerInitializer,
+        card_cache: HouseCardInvalidationPort | None = None,
+    ):
+        self.chunk_runner = chunk_runner
+        self.worker_initializer = worker_initializer
+        self.card_cache = card_cache
+
+    def execute(
+        self, command: GenerateFullObservationBatchCommand
+    ) -> FullObservationBatchResult:
+        house_ids = list(command.house_platform_ids)
+        chunk_size = max(command.chunk_size, 1)
+        chunks = [
+            house_ids[start:start + chunk_size]
+            for start in range(0, len(house_ids), chunk_size)
+        ]
+
+        result = FullObservationBatchResult()
+        for chunk, chunk_result, error in self._run_chunks(chunks, command):
+            if error is not None:
+                for house_id in chunk:
+                    result.add_failure(house_id, "batch", error)
+                continue
+            result.merge(chunk_result)
+            if self.card_cache:
+                # 워커는 캐시를 모르므로 관측치가 바뀌었을 수 있는 청크 전체를 비운다.
+                self.card_cache.invalidate_houses(chunk)
+        return result
+
+    def _run_chunks(
+        self,
+        chunks: List[List[int]],
+        command: GenerateFullObservationBatchCommand,
+    ) -> Iterator[tuple[List[int], FullObservationBatchResult | None, Exception | None]]:
+        """청크를 실행하고 (청크, 결과, 오류)를 내보낸다. 한 청크의 실패가 다른 청크를 막지 않는다."""
+        if not chunks:
+            return
+        max_workers = command.max_workers
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 1:
+            self.worker_initializer(command.house_prices)
+            for chunk in chunks:
+                try:
+                    yield chunk, self.chunk_runner(chunk), None
+                except Exception as exc:
+                    yield chunk, None, exc
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(chunks)),
+            initializer=self.worker_initializer,
+            initargs=(dict(command.house_prices),),
+        ) as executor:
+            futures = {
+                executor.submit(self.chunk_runner, chunk): chunk for chunk in chunks
+            }
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as exc:
+                    yield futures[future], None, exc
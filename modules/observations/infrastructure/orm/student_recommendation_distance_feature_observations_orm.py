@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Float, String, DateTime
+from sqlalchemy import Column, BigInteger, Float, Index, String, DateTime
 from sqlalchemy.orm import declarative_base
 from datetime import datetime, timezone
 
@@ -23,3 +23,31 @@ class StudentRecommendationDistanceObservationORM(Base):
     거리_비선형_점수 = Column(Float, nullable=False)
 
     calculated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    # 매물/대학별 최신 관측치 1건 조회(ORDER BY calculated_at DESC, id DESC LIMIT 1)용.
+    __table_args__ = (
+        Index(
+            "ix_distance_observations_house_university_latest",
+            house_id,
+            university_id,
+            calculated_at.desc(),
+            id.desc(),
+        ),
+        # 후보 스냅샷 증분 갱신(calculated_at >= 워터마크)용.
+        Index("ix_distance_observations_calculated_at", calculated_at),
+    )
+
+
+class StudentRecommendationLatestDistanceObservationORM(Base):
+    """매물/대학별 최신 거리 관측치 포인터.
+
+    관측치 저장과 같은 트랜잭션에서 (calculated_at, id)가 더 새로울 때만 갱신한다.
+    최신 조회는 이력 크기와 무관하게 PK 조회 + 이력 PK 조인이다.
+    """
+
+    __tablename__ = "student_recommendation_latest_distance_observations"
+
+    house_id = Column(BigInteger, primary_key=True)
+    university_id = Column(BigInteger, primary_key=True)
+    observation_id = Column(BigInteger, nullable=False)
+    calculated_at = Column(DateTime, nullable=True)
@@ -31,3 +31,13 @@ class StudentRecommendationFeatureObservationORM(Base):
 
     # 생성/계산 시간
     calculated_at = Column(DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))
+
+
+class StudentRecommendationLatestFeatureObservationORM(Base):
+    """매물별 최신 feature 관측치 포인터. 관측치 저장과 같은 트랜잭션에서 갱신한다."""
+
+    __tablename__ = "student_recommendation_latest_feature_observations"
+
+    house_platform_id = Column(BigInteger, primary_key=True)
+    observation_id = Column(BigInteger, nullable=False)
+    calculated_at = Column(DateTime, nullable=True)
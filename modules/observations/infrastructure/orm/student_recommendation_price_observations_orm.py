@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Float, Integer, DateTime
+from sqlalchemy import Column, BigInteger, Float, Index, Integer, DateTime
 from sqlalchemy.orm import declarative_base
 from datetime import datetime, timezone
 
@@ -23,3 +23,25 @@ class StudentRecommendationPriceObservationsORM(Base):
 
     # ---------- 계산 시각 ----------
     calculated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    # 매물별 최신 관측치 1건 조회(ORDER BY calculated_at DESC, id DESC LIMIT 1)용.
+    __table_args__ = (
+        Index(
+            "ix_price_observations_house_latest",
+            house_platform_id,
+            calculated_at.desc(),
+            id.desc(),
+        ),
+        # 후보 스냅샷 증분 갱신(calculated_at >= 워터마크)용.
+        Index("ix_price_observations_calculated_at", calculated_at),
+    )
+
+
+class StudentRecommendationLatestPriceObservationORM(Base):
+    """매물별 최신 가격 관측치 포인터. 관측치 저장과 같은 트랜잭션에서 갱신한다."""
+
+    __tablename__ = "student_recommendation_latest_price_observations"
+
+    house_platform_id = Column(BigInteger, primary_key=True)
+    observation_id = Column(BigInteger, nullable=False)
+    calculated_at = Column(DateTime, nullable=True)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Sequence
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    HouseCard,
+    HouseCardKey,
+)
+from modules.recommendations.application.port_out.house_card_cache_port import (
+    HouseCardCachePort,
+)
+
+
+class LruHouseCardCache(HouseCardCachePort):
+    """프로세스 내 LRU 카드 캐시.
+
+    다른 프로세스의 무효화는 전달되지 않으므로 짧은 TTL로 오래된 카드를 제한한다.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[HouseCardKey, tuple[float, HouseCard]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def get_many(self, keys: Sequence[HouseCardKey]) -> dict[HouseCardKey, HouseCard]:
+        now = time.monotonic()
+        found: dict[HouseCardKey, HouseCard] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, card = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = card
+        return found
+
+    def save_many(self, cards: dict[HouseCardKey, HouseCard]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key, card in cards.items():
+                self._entries[key] = (expires_at, card)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_houses(self, house_platform_ids: Sequence[int]) -> None:
+        targets = set(house_platform_ids)
+        if not targets:
+            return
+        with self._lock:
+            for key in [
+                key for key in self._entries if key.house_platform_id in targets
+            ]:
+                del self._entries[key]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from typing import Sequence
+
+from redis.exceptions import RedisError
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    HouseCard,
+    HouseCardKey,
+)
+from modules.recommendations.application.port_out.house_card_cache_port import (
+    HouseCardCachePort,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisHouseCardCache(HouseCardCachePort):
+    """Redis 기반 매물 카드 캐시.
+
+    매물별 해시 하나에 (snapshot_id, observation_version, scope) 필드로 저장해
+    매물 단위 무효화를 DEL 한 번으로 처리한다.
+    캐시 장애는 미스로 처리한다.
+    """
+
+    HOUSE_KEY = "recommend:card:{house_platform_id}"
+
+    def __init__(self, redis_client, ttl_seconds: int = 86_400):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: Sequence[HouseCardKey]) -> dict[HouseCardKey, HouseCard]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipeline.hget(self._house_key(key), self._field(key))
+            values = pipeline.execute()
+        except RedisError as exc:
+            logger.warning("house card cache unavailable: %s", exc)
+            return {}
+        found: dict[HouseCardKey, HouseCard] = {}
+        for key, value in zip(keys, values):
+            if not value:
+                continue
+            if isinstance(value, (bytes, bytearray)):
+                value = value.decode()
+            found[key] = HouseCard(**json.loads(value))
+        return found
+
+    def save_many(self, cards: dict[HouseCardKey, HouseCard]) -> None:
+        if not cards:
+            return
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for key, card in cards.items():
+                house_key = self._house_key(key)
+                pipeline.hset(
+                    house_key,
+                    self._field(key),
+                    json.dumps(asdict(card), ensure_ascii=False, default=str),
+                )
+                pipeline.expire(house_key, self.ttl_seconds)
+            pipeline.execute()
+        except RedisError as exc:
+            logger.warning("house card cache unavailable: %s", exc)
+
+    def invalidate_houses(self, house_platform_ids: Sequence[int]) -> None:
+        house_keys = [
+            self.HOUSE_KEY.format(house_platform_id=house_platform_id)
+            for house_platform_id in dict.fromkeys(house_platform_ids)
+        ]
+        if not house_keys:
+            return
+        try:
+            self.redis.delete(*house_keys)
+        except RedisError as exc:
+            logger.warning("house card cache unavailable: %s", exc)
+
+    def _house_key(self, key: HouseCardKey) -> str:
+        return self.HOUSE_KEY.format(house_platform_id=key.house_platform_id)
+
+    @staticmethod
+    def _field(key: HouseCardKey) -> str:
+        return json.dumps(
+            [key.snapshot_id, key.observation_version, key.scope],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisRecommendationResultCache(RecommendationResultCachePort):
+    """Redis 기반 추천 결과 캐시.
+
+    캐시 장애는 추천 작업 실패로 이어지지 않도록 미스로 처리한다.
+    """
+
+    WATERMARK_KEY = "recommend:watermark"
+    GENERATION_KEY = "recommend:finder:{finder_request_id}:generation"
+    RESULT_KEY = "recommend:result:{cache_key}"
+    LOCK_KEY = "recommend:lock:{cache_key}"
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def get_versions(self, finder_request_id: int) -> tuple[str, str]:
+        try:
+            watermark, generation = self.redis.mget(
+                self.WATERMARK_KEY,
+                self.GENERATION_KEY.format(finder_request_id=finder_request_id),
+            )
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+            return "0", "0"
+        return _decode(watermark) or "0", _decode(generation) or "0"
+
+    def get_result(self, cache_key: str) -> dict[str, Any] | None:
+        try:
+            data = self.redis.get(self.RESULT_KEY.format(cache_key=cache_key))
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+            return None
+        if not data:
+            return None
+        return json.loads(_decode(data))
+
+    def save_result(
+        self, cache_key: str, payload: dict[str, Any], ttl_seconds: int
+    ) -> None:
+        try:
+            self.redis.set(
+                self.RESULT_KEY.format(cache_key=cache_key),
+                json.dumps(payload, ensure_ascii=False, default=str),
+                ex=ttl_seconds,
+            )
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+
+    def acquire_lock(self, cache_key: str, ttl_seconds: int) -> bool:
+        try:
+            return bool(
+                self.redis.set(
+                    self.LOCK_KEY.format(cache_key=cache_key),
+                    "1",
+                    nx=True,
+                    ex=ttl_seconds,
+                )
+            )
+        except RedisError as exc:
+            # 캐시 장애 시에는 대기하지 않고 직접 계산한다.
+            logger.warning("recommendation cache unavailable: %s", exc)
+            return True
+
+    def release_lock(self, cache_key: str) -> None:
+        try:
+            self.redis.delete(self.LOCK_KEY.format(cache_key=cache_key))
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+
+    def invalidate_finder_request(self, finder_request_id: int) -> None:
+        try:
+            self.redis.incr(
+                self.GENERATION_KEY.format(finder_request_id=finder_request_id)
+            )
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+
+    def bump_watermark(self) -> None:
+        try:
+            self.redis.incr(self.WATERMARK_KEY)
+        except RedisError as exc:
+            logger.warning("recommendation cache unavailable: %s", exc)
+
+
+def _decode(value) -> str | None:
+    if value is None:
+        return None
+    return value.decode() if isinstance(value, (bytes, bytearray)) else str(value)
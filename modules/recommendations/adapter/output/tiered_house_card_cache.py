@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    HouseCard,
+    HouseCardKey,
+)
+from modules.recommendations.application.port_out.house_card_cache_port import (
+    HouseCardCachePort,
+)
+
+
+class TieredHouseCardCache(HouseCardCachePort):
+    """프로세스 내 캐시(1차)와 공유 캐시(2차)를 묶는다.
+
+    2차에서 찾은 카드는 1차로 올려 다음 조회부터 네트워크를 타지 않는다.
+    """
+
+    def __init__(self, local: HouseCardCachePort, remote: HouseCardCachePort):
+        self.local = local
+        self.remote = remote
+
+    def get_many(self, keys: Sequence[HouseCardKey]) -> dict[HouseCardKey, HouseCard]:
+        found = self.local.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            remote_found = self.remote.get_many(missing)
+            if remote_found:
+                self.local.save_many(remote_found)
+                found.update(remote_found)
+        return found
+
+    def save_many(self, cards: dict[HouseCardKey, HouseCard]) -> None:
+        self.remote.save_many(cards)
+        self.local.save_many(cards)
+
+    def invalidate_houses(self, house_platform_ids: Sequence[int]) -> None:
+        self.remote.invalidate_houses(house_platform_ids)
+        self.local.invalidate_houses(house_platform_ids)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
+
+# 스트리밍 이벤트 종류. 종료 이벤트(done/error)는 전송 계층에서 붙인다.
+STREAM_EVENT_SUMMARY = "summary"
+STREAM_EVENT_ITEM = "item"
 
 
 @dataclass(frozen=True)
@@ -11,6 +15,49 @@ class RecommendStudentHouseCommand:
 
     finder_request_id: int
     candidate_house_platform_ids: list[int] | None = None
+    # 작업 시간 예산(초). 초과 시 선택 단계를 건너뛴 부분 결과를 반환한다.
+    deadline_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class RecommendStudentHouseBatchCommand:
+    """여러 요구서의 추천을 한 번에 계산하는 커맨드."""
+
+    finder_request_ids: list[int]
+    deadline_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class RecommendationStreamEvent:
+    """추천 결과 스트리밍 이벤트 (summary 1건 후 item N건)."""
+
+    event: str
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class HouseCardKey:
+    """매물 카드 캐시 키.
+
+    scope는 거리 관측치 선택에 쓰인 대학교 ID 목록(정렬 후 콤마 연결)이다.
+    """
+
+    house_platform_id: int
+    snapshot_id: str | None
+    observation_version: str | None
+    scope: str = ""
+
+
+@dataclass
+class HouseCard:
+    """추천 항목 중 매물/관측치로만 결정되는 부분(raw, observation_summary)."""
+
+    house_platform_id: int
+    raw: dict[str, Any]
+    observation_summary: dict[str, Any] | None
+    # 점수/관측 버전 불일치 판단용 (risk/option 관측치 기준)
+    has_feature_observation: bool = False
+    feature_observation_version: str | None = None
 
 
 @dataclass(frozen=True)
@@ -34,6 +81,63 @@ class RecommendStudentHouseResult:
     recommended_top_k: list[dict[str, Any]]
     rejected_top_k: list[dict[str, Any]]
 
+    def summary_event(self) -> RecommendationStreamEvent:
+        """항목을 제외한 머리 정보를 summary 이벤트로 만든다."""
+        return RecommendationStreamEvent(
+            event=STREAM_EVENT_SUMMARY,
+            data={
+                "finder_request_id": self.finder_request_id,
+                "generated_at": self.generated_at,
+                "status": self.status,
+                "detail": self.detail,
+                "query_context": self.query_context,
+                "summary": self.summary,
+            },
+        )
+
+    def to_stream_events(self) -> list[RecommendationStreamEvent]:
+        """완성된 결과를 스트리밍 이벤트 순서로 풀어낸다."""
+        return [
+            self.summary_event(),
+            *(
+                RecommendationStreamEvent(event=STREAM_EVENT_ITEM, data=item)
+                for item in self.recommended_top_k + self.rejected_top_k
+            ),
+        ]
+
+    @classmethod
+    def from_stream_events(
+        cls, events: Iterable[RecommendationStreamEvent]
+    ) -> "RecommendStudentHouseResult":
+        """스트리밍 이벤트를 다시 결과 DTO로 모은다."""
+        header: dict[str, Any] | None = None
+        recommended: list[dict[str, Any]] = []
+        rejected: list[dict[str, Any]] = []
+        for event in events:
+            if event.event == STREAM_EVENT_SUMMARY:
+                header = event.data
+            elif event.event == STREAM_EVENT_ITEM:
+                if event.data.get("decision_status") == "RECOMMENDED":
+                    recommended.append(event.data)
+                else:
+                    rejected.append(event.data)
+        if header is None:
+            raise ValueError("summary 이벤트가 없습니다.")
+        return cls(
+            **header,
+            recommended_top_k=recommended,
+            rejected_top_k=rejected,
+        )
+
+
+@dataclass
+class RecommendStudentHouseBatchResult:
+    """요구서별 추천 결과 묶음 (요청 순서 유지)."""
+
+    results: list[RecommendStudentHouseResult] = field(default_factory=list)
+    # 존재하지 않아 계산하지 못한 요구서 ID
+    missing_finder_request_ids: list[int] = field(default_factory=list)
+
 
 @dataclass(frozen=True)
 class RecommendStudentHouseMockResponse:
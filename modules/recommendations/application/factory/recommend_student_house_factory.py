@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+from threading import Lock
+
+from infrastructure.db.dependencies import get_redis
+from infrastructure.db.postgres import SessionLocal
+from modules.recommendations.adapter.output.lru_house_card_cache import (
+    LruHouseCardCache,
+)
+from modules.recommendations.adapter.output.redis_house_card_cache import (
+    RedisHouseCardCache,
+)
+from modules.recommendations.adapter.output.tiered_house_card_cache import (
+    TieredHouseCardCache,
+)
+from modules.recommendations.application.port_out.house_card_cache_port import (
+    HouseCardCachePort,
+)
+from modules.recommendations.application.usecase.recommend_student_house import (
+    RecommendStudentHouseUseCase,
+)
+from modules.student_house_decision_policy.application.usecase.refresh_candidate_snapshot import (
+    RefreshCandidateSnapshotService,
+)
+from modules.student_house_decision_policy.infrastructure.repository.candidate_snapshot_source_repository import (
+    CandidateSnapshotSourceRepository,
+)
+
+HOUSE_CARD_LRU_SIZE = int(os.getenv("HOUSE_CARD_LRU_SIZE", "10000"))
+HOUSE_CARD_LRU_TTL_SECONDS = float(os.getenv("HOUSE_CARD_LRU_TTL_SECONDS", "60"))
+HOUSE_CARD_REDIS_TTL_SECONDS = int(os.getenv("HOUSE_CARD_REDIS_TTL_SECONDS", "86400"))
+# 후보 스냅샷은 매물 100만 건에 약 100MB를 쓰므로 명시적으로 켠다.
+CANDIDATE_SNAPSHOT_ENABLED = os.getenv("CANDIDATE_SNAPSHOT_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+CANDIDATE_SNAPSHOT_MAX_AGE_SECONDS = float(
+    os.getenv("CANDIDATE_SNAPSHOT_MAX_AGE_SECONDS", "30")
+)
+
+_usecase_lock = Lock()
+_usecase_instance: RecommendStudentHouseUseCase | None = None
+_card_cache_lock = Lock()
+_card_cache_instance: HouseCardCachePort | None = None
+_candidate_snapshot_lock = Lock()
+_candidate_snapshot_instance: RefreshCandidateSnapshotService | None = None
+
+
+def get_house_card_cache() -> HouseCardCachePort:
+    """프로세스 전역에서 공유하는 매물 카드 캐시 (LRU 1차 + Redis 2차)."""
+    global _card_cache_instance
+    if _card_cache_instance is None:
+        with _card_cache_lock:
+            if _card_cache_instance is None:
+                _card_cache_instance = TieredHouseCardCache(
+                    local=LruHouseCardCache(
+                        maxsize=HOUSE_CARD_LRU_SIZE,
+                        ttl_seconds=HOUSE_CARD_LRU_TTL_SECONDS,
+                    ),
+                    remote=RedisHouseCardCache(
+                        get_redis(), ttl_seconds=HOUSE_CARD_REDIS_TTL_SECONDS
+                    ),
+                )
+    return _card_cache_instance
+
+
+def get_candidate_snapshot_service() -> RefreshCandidateSnapshotService:
+    """프로세스 전역에서 공유하는 후보 스냅샷 (워터마크 기반 증분 갱신)."""
+    global _candidate_snapshot_instance
+    if _candidate_snapshot_instance is None:
+        with _candidate_snapshot_lock:
+            if _candidate_snapshot_instance is None:
+                _candidate_snapshot_instance = RefreshCandidateSnapshotService(
+                    CandidateSnapshotSourceRepository(SessionLocal),
+                    max_age_seconds=CANDIDATE_SNAPSHOT_MAX_AGE_SECONDS,
+                )
+    return _candidate_snapshot_instance
+
+
+def build_recommend_student_house_usecase(
+    session_factory=SessionLocal,
+    card_cache: HouseCardCachePort | None = None,
+    candidate_snapshot_service: RefreshCandidateSnapshotService | None = None,
+) -> RecommendStudentHouseUseCase:
+    """세션 팩토리 기반 의존성을 한 번 조립한 추천 유스케이스를 만든다."""
+    return RecommendStudentHouseUseCase(
+        session_factory=session_factory,
+        card_cache=card_cache,
+        candidate_snapshot_service=candidate_snapshot_service,
+    )
+
+
+def get_recommend_student_house_usecase() -> RecommendStudentHouseUseCase:
+    """프로세스 전역에서 공유하는 추천 유스케이스 (스레드 안전 싱글톤)."""
+    global _usecase_instance
+    if _usecase_instance is None:
+        with _usecase_lock:
+            if _usecase_instance is None:
+                _usecase_instance = build_recommend_student_house_usecase(
+                    card_cache=get_house_card_cache(),
+                    candidate_snapshot_service=(
+                        get_candidate_snapshot_service()
+                        if CANDIDATE_SNAPSHOT_ENABLED
+                        else None
+                    ),
+                )
+    return _usecase_instance
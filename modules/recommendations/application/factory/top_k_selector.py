@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class BoundedTopK(Generic[T]):
+    """점수 상위 k개만 힙으로 유지한다.
+
+    동점이면 먼저 들어온 항목이 앞선다 (sorted(..., reverse=True)와 같은 순서).
+    """
+
+    def __init__(self, k: int):
+        self.k = max(k, 0)
+        self.count = 0
+        self._heap: list[tuple[float, int, T]] = []
+        self._sequence = count()
+
+    def push(self, score: float, item: T) -> None:
+        self.count += 1
+        if self.k == 0:
+            return
+        # 최소 힙이므로 동점에서는 나중에 들어온 항목이 먼저 밀려나게 순번을 뒤집는다.
+        entry = (score, -next(self._sequence), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> list[T]:
+        """점수 내림차순(동점은 입력 순서)으로 정렬된 상위 항목."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+
+@dataclass
+class TopKSplit:
+    """threshold 기준으로 나눈 추천/제외 상위 K와 전체 건수."""
+
+    recommended_top: list[Any] = field(default_factory=list)
+    rejected_top: list[Any] = field(default_factory=list)
+    recommended_count: int = 0
+    rejected_count: int = 0
+
+
+def split_top_k(
+    ranked: Iterable[tuple[int, Any, float]], threshold: float, top_k: int
+) -> TopKSplit:
+    """(매물 ID, 점수 객체, 총점) 스트림을 한 번 훑어 추천/제외 상위 K를 고른다.
+
+    전체 목록을 만들거나 정렬하지 않으므로 메모리는 O(top_k)다.
+    """
+    recommended: BoundedTopK[tuple[int, Any, float]] = BoundedTopK(top_k)
+    rejected: BoundedTopK[tuple[int, Any, float]] = BoundedTopK(top_k)
+    for item in ranked:
+        if item[2] >= threshold:
+            recommended.push(item[2], item)
+        else:
+            rejected.push(item[2], item)
+    return TopKSplit(
+        recommended_top=recommended.items(),
+        rejected_top=rejected.items(),
+        recommended_count=recommended.count,
+        rejected_count=rejected.count,
+    )
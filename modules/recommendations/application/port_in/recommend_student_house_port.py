@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendationStreamEvent,
+    RecommendStudentHouseBatchCommand,
+    RecommendStudentHouseBatchResult,
     RecommendStudentHouseCommand,
     RecommendStudentHouseResult,
 )
@@ -17,3 +21,31 @@ class RecommendStudentHousePort(ABC):
     ) -> RecommendStudentHouseResult:
         """추천 결과를 생성한다."""
         raise NotImplementedError
+
+    def execute_stream(
+        self, command: RecommendStudentHouseCommand
+    ) -> Iterator[RecommendationStreamEvent]:
+        """summary 이벤트 후 랭킹 항목을 하나씩 내보낸다.
+
+        기본 구현은 전체 결과를 만든 뒤 이벤트로 풀어낸다.
+        """
+        yield from self.execute(command).to_stream_events()
+
+    def execute_batch(
+        self, command: RecommendStudentHouseBatchCommand
+    ) -> RecommendStudentHouseBatchResult:
+        """여러 요구서의 추천 결과를 한 번에 만든다.
+
+        기본 구현은 요구서마다 execute를 호출한다.
+        """
+        return RecommendStudentHouseBatchResult(
+            results=[
+                self.execute(
+                    RecommendStudentHouseCommand(
+                        finder_request_id=finder_request_id,
+                        deadline_seconds=command.deadline_seconds,
+                    )
+                )
+                for finder_request_id in dict.fromkeys(command.finder_request_ids)
+            ]
+        )
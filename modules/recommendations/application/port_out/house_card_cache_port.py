@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import Sequence
+
+from modules.recommendations.application.dto.recommendation_dto import (
+    HouseCard,
+    HouseCardKey,
+)
+from shared.application.port_out.house_card_invalidation_port import (
+    HouseCardInvalidationPort,
+)
+
+
+class HouseCardCachePort(HouseCardInvalidationPort):
+    """매물 카드 캐시 포트. 무효화(invalidate_houses)는 상위 포트에 있다."""
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[HouseCardKey]) -> dict[HouseCardKey, HouseCard]:
+        """여러 카드를 한 번에 조회한다. 없는 키는 결과에서 빠진다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, cards: dict[HouseCardKey, HouseCard]) -> None:
+        """여러 카드를 한 번에 저장한다."""
+        raise NotImplementedError
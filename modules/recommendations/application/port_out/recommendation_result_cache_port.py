@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class RecommendationResultCachePort(ABC):
+    """추천 결과 캐시 포트."""
+
+    @abstractmethod
+    def get_versions(self, finder_request_id: int) -> tuple[str, str]:
+        """데이터 워터마크와 요청서 세대 값을 함께 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_result(self, cache_key: str) -> dict[str, Any] | None:
+        """캐시된 추천 결과를 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_result(
+        self, cache_key: str, payload: dict[str, Any], ttl_seconds: int
+    ) -> None:
+        """추천 결과를 TTL과 함께 저장한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def acquire_lock(self, cache_key: str, ttl_seconds: int) -> bool:
+        """동일 키 계산 권한을 선점한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_lock(self, cache_key: str) -> None:
+        """계산 권한을 반납한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_finder_request(self, finder_request_id: int) -> None:
+        """요청서 단위로 캐시를 무효화한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump_watermark(self) -> None:
+        """점수 갱신 등 데이터 변경 시 전체 캐시를 무효화한다."""
+        raise NotImplementedError
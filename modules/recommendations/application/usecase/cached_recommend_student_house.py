@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import asdict
+from typing import Any, Iterator
+
+from modules.finder_request.application.port.finder_request_repository_port import (
+    FinderRequestRepositoryPort,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendationStreamEvent,
+    RecommendStudentHouseBatchCommand,
+    RecommendStudentHouseBatchResult,
+    RecommendStudentHouseCommand,
+    RecommendStudentHouseResult,
+)
+from modules.recommendations.application.port_in.recommend_student_house_port import (
+    RecommendStudentHousePort,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+# 추천 결과에 영향을 주는 finder_request 필드 목록.
+CACHE_KEY_REQUEST_FIELDS = (
+    "preferred_region",
+    "price_type",
+    "max_deposit",
+    "max_rent",
+    "house_type",
+    "additional_condition",
+    "university_name",
+    "roomcount",
+    "bathroomcount",
+    "is_near",
+    "aircon_yn",
+    "washer_yn",
+    "fridge_yn",
+    "max_building_age",
+)
+
+
+class CachedRecommendStudentHouseUseCase(RecommendStudentHousePort):
+    """추천 결과를 캐시하고 동일 요청의 동시 계산을 한 번으로 묶는다.
+
+    캐시 키는 요청 조건, 정책, 데이터 워터마크로 구성한다.
+    """
+
+    def __init__(
+        self,
+        recommend_usecase: RecommendStudentHousePort,
+        cache: RecommendationResultCachePort,
+        finder_request_repo: FinderRequestRepositoryPort,
+        policy: DecisionPolicyConfig | None = None,
+        ttl_seconds: int = 600,
+        lock_ttl_seconds: int = 120,
+        wait_timeout_seconds: float = 60.0,
+        poll_interval_seconds: float = 0.05,
+    ):
+        self.recommend_usecase = recommend_usecase
+        self.cache = cache
+        self.finder_request_repo = finder_request_repo
+        self.policy = (
+            policy
+            or getattr(recommend_usecase, "policy", None)
+            or DecisionPolicyConfig()
+        )
+        self.ttl_seconds = ttl_seconds
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+
+    def execute(
+        self, command: RecommendStudentHouseCommand
+    ) -> RecommendStudentHouseResult:
+        """캐시된 결과가 있으면 반환하고, 없으면 계산 후 저장한다."""
+        request = self.finder_request_repo.find_by_id(command.finder_request_id)
+        if request is None:
+            return self.recommend_usecase.execute(command)
+
+        watermark, generation = self.cache.get_versions(
+            command.finder_request_id
+        )
+        cache_key = build_recommendation_cache_key(
+            command, request, self.policy, watermark, generation
+        )
+
+        cached = self.cache.get_result(cache_key)
+        if cached is not None:
+            return RecommendStudentHouseResult(**cached)
+
+        acquired = self.cache.acquire_lock(cache_key, self.lock_ttl_seconds)
+        if not acquired:
+            # 다른 작업이 계산 중이면 결과가 저장될 때까지 기다린다.
+            cached = self._wait_for_result(cache_key)
+            if cached is not None:
+                return RecommendStudentHouseResult(**cached)
+
+        try:
+            if acquired:
+                # 잠금 대기 중 다른 작업이 저장했을 수 있으므로 한 번 더 확인한다.
+                cached = self.cache.get_result(cache_key)
+                if cached is not None:
+                    return RecommendStudentHouseResult(**cached)
+            result = self.recommend_usecase.execute(command)
+            if _is_cacheable(result):
+                self.cache.save_result(
+                    cache_key, asdict(result), self.ttl_seconds
+                )
+            return result
+        finally:
+            if acquired:
+                self.cache.release_lock(cache_key)
+
+    def execute_stream(
+        self, command: RecommendStudentHouseCommand
+    ) -> Iterator[RecommendationStreamEvent]:
+        """캐시 적중 시 저장된 결과를 이벤트로 재생하고, 아니면 스트리밍 후 저장한다."""
+        request = self.finder_request_repo.find_by_id(command.finder_request_id)
+        if request is None:
+            yield from self.recommend_usecase.execute_stream(command)
+            return
+
+        watermark, generation = self.cache.get_versions(
+            command.finder_request_id
+        )
+        cache_key = build_recommendation_cache_key(
+            command, request, self.policy, watermark, generation
+        )
+
+        cached = self.cache.get_result(cache_key)
+        if cached is None and not self.cache.acquire_lock(
+            cache_key, self.lock_ttl_seconds
+        ):
+            cached = self._wait_for_result(cache_key)
+            if cached is None:
+                yield from self.recommend_usecase.execute_stream(command)
+                return
+        if cached is not None:
+            yield from RecommendStudentHouseResult(**cached).to_stream_events()
+            return
+
+        try:
+            events = []
+            for event in self.recommend_usecase.execute_stream(command):
+                events.append(event)
+                yield event
+            result = RecommendStudentHouseResult.from_stream_events(events)
+            if _is_cacheable(result):
+                self.cache.save_result(
+                    cache_key, asdict(result), self.ttl_seconds
+                )
+        finally:
+            self.cache.release_lock(cache_key)
+
+    def execute_batch(
+        self, command: RecommendStudentHouseBatchCommand
+    ) -> RecommendStudentHouseBatchResult:
+        """캐시에 없는 요구서만 묶어 계산하고 결과를 저장한다 (야간 예열 용도).
+
+        배치는 잠금을 잡지 않는다. 동시에 계산된 같은 결과는 마지막 저장이 남는다.
+        """
+        finder_request_ids = list(dict.fromkeys(command.finder_request_ids))
+        results: dict[int, RecommendStudentHouseResult] = {}
+        cache_keys: dict[int, str] = {}
+        requests = self.finder_request_repo.find_by_ids(finder_request_ids)
+        for request in requests:
+            finder_request_id = request.finder_request_id
+            watermark, generation = self.cache.get_versions(finder_request_id)
+            cache_key = build_recommendation_cache_key(
+                RecommendStudentHouseCommand(finder_request_id=finder_request_id),
+                request,
+                self.policy,
+                watermark,
+                generation,
+            )
+            cached = self.cache.get_result(cache_key)
+            if cached is not None:
+                results[finder_request_id] = RecommendStudentHouseResult(**cached)
+            else:
+                cache_keys[finder_request_id] = cache_key
+
+        missing_ids: list[int] = []
+        misses = [
+            finder_request_id
+            for finder_request_id in finder_request_ids
+            if finder_request_id not in results
+        ]
+        if misses:
+            computed = self.recommend_usecase.execute_batch(
+                RecommendStudentHouseBatchCommand(
+                    finder_request_ids=misses,
+                    deadline_seconds=command.deadline_seconds,
+                )
+            )
+            missing_ids = computed.missing_finder_request_ids
+            for result in computed.results:
+                results[result.finder_request_id] = result
+                cache_key = cache_keys.get(result.finder_request_id)
+                if cache_key and _is_cacheable(result):
+                    self.cache.save_result(
+                        cache_key, asdict(result), self.ttl_seconds
+                    )
+
+        return RecommendStudentHouseBatchResult(
+            results=[
+                results[finder_request_id]
+                for finder_request_id in finder_request_ids
+                if finder_request_id in results
+            ],
+            missing_finder_request_ids=missing_ids,
+        )
+
+    def _wait_for_result(self, cache_key: str) -> dict[str, Any] | None:
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval_seconds)
+            cached = self.cache.get_result(cache_key)
+            if cached is not None:
+                return cached
+        return None
+
+
+def _is_cacheable(result: RecommendStudentHouseResult) -> bool:
+    """성공했고 시간 예산 초과로 잘리지 않은 결과만 캐시한다."""
+    if result.status != "SUCCESS":
+        return False
+    return not (result.summary or {}).get("deadline_exceeded")
+
+
+def build_recommendation_cache_key(
+    command: RecommendStudentHouseCommand,
+    request,
+    policy: DecisionPolicyConfig,
+    watermark: str,
+    generation: str,
+) -> str:
+    """요청 조건/정책/워터마크를 정규화해 캐시 키를 만든다."""
+    candidates = command.candidate_house_platform_ids
+    payload = {
+        "constraints": {
+            field: getattr(request, field, None)
+            for field in CACHE_KEY_REQUEST_FIELDS
+        },
+        "candidates": list(candidates) if candidates is not None else None,
+        "policy": asdict(policy),
+        "watermark": watermark,
+        "generation": generation,
+    }
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{command.finder_request_id}:{digest}"
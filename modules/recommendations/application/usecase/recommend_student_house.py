@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from modules.finder_request.application.port.finder_request_repository_port import (
     FinderRequestRepositoryPort,
@@ -11,12 +13,24 @@ from modules.house_platform.application.port_out.house_platform_repository_port
     HousePlatformRepositoryPort,
 )
 from modules.recommendations.application.dto.recommendation_dto import (
+    STREAM_EVENT_ITEM,
+    HouseCard,
+    HouseCardKey,
+    RecommendationStreamEvent,
+    RecommendStudentHouseBatchCommand,
+    RecommendStudentHouseBatchResult,
     RecommendStudentHouseCommand,
     RecommendStudentHouseResult,
 )
+from modules.recommendations.application.factory.top_k_selector import (
+    split_top_k,
+)
 from modules.recommendations.application.port_in.recommend_student_house_port import (
     RecommendStudentHousePort,
 )
+from modules.recommendations.application.port_out.house_card_cache_port import (
+    HouseCardCachePort,
+)
 from modules.ai_explanation.application.usecase.explain_finder_usecase import (
     ExplainFinderUseCase,
 )
@@ -28,6 +42,14 @@ from modules.ai_explanation.application.dto.finder_explanation_dto import (
     UserConstraintsInput,
 )
 from infrastructure.db.postgres import SessionLocal
+from infrastructure.metrics.recommendation_metrics import (
+    STAGE_AI_EXPLANATION,
+    STAGE_FETCH_SCORE_MAP,
+    STAGE_FILTER_CANDIDATES,
+    STAGE_HYDRATION,
+    observe_stage,
+    record_pipeline_counts,
+)
 from infrastructure.db.session_helper import open_session
 from modules.decision_context_signal_builder.application.usecase.build_decision_context_signal_usecase import (
     BuildDecisionContextSignalUseCase,
@@ -50,6 +72,9 @@ from modules.observations.adapter.output.repository.student_recommendtation_pric
 from modules.student_house_decision_policy.application.usecase.filter_candidate import (
     FilterCandidateService,
 )
+from modules.student_house_decision_policy.application.usecase.refresh_candidate_snapshot import (
+    RefreshCandidateSnapshotService,
+)
 from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
     HousePlatformCandidateRepository,
 )
@@ -61,6 +86,7 @@ from modules.university.adapter.output.university_repository import (
 )
 from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
     FilterCandidateCommand,
+    FilterCandidateResult,
 )
 from modules.student_house_decision_policy.application.port_in.filter_candidate_port import (
     FilterCandidatePort,
@@ -85,8 +111,99 @@ from modules.university.application.port.university_repository_port import (
 )
 
 
+@dataclass
+class _RankedCandidates:
+    """점수 기준으로 나눈 추천/제외 후보."""
+
+    request: Any
+    candidates: list[int]
+    score_map: dict[int, Any]
+    recommended_count: int
+    rejected_count: int
+    recommended_top: list[tuple[int, Any, float]]
+    rejected_top: list[tuple[int, Any, float]]
+    # 필터 단계에서 얻은 매물 스냅샷 ID (후보를 직접 받은 경우 비어 있다)
+    snapshot_ids: dict[int, str | None] = field(default_factory=dict)
+
+
+class _JobBudget:
+    """작업 시간 예산과 예산 초과로 건너뛴 단계를 기록한다."""
+
+    # 예산 초과 시 건너뛸 수 있는 선택 단계
+    STAGE_CONTEXT_SIGNAL = "context_signal"
+    STAGE_REJECTED_TOP_K = "rejected_top_k"
+    STAGE_AI_EXPLANATION = "ai_explanation"
+
+    def __init__(self, deadline_seconds: float | None = None):
+        self.deadline_seconds = deadline_seconds
+        self._started_at = time.monotonic()
+        self.skipped_stages: list[str] = []
+
+    def expired(self) -> bool:
+        if self.deadline_seconds is None:
+            return False
+        return time.monotonic() - self._started_at >= self.deadline_seconds
+
+    def skip(self, stage: str) -> bool:
+        """예산이 소진됐으면 단계를 건너뛴 것으로 기록하고 True를 반환한다."""
+        if not self.expired():
+            return False
+        if stage not in self.skipped_stages:
+            self.skipped_stages.append(stage)
+        return True
+
+    def to_summary(self) -> dict[str, Any]:
+        """예산 초과 시 summary에 붙일 경고 정보를 만든다."""
+        if not self.skipped_stages:
+            return {}
+        return {
+            "deadline_exceeded": True,
+            "deadline_seconds": self.deadline_seconds,
+            "skipped_stages": list(self.skipped_stages),
+        }
+
+
+class _MemoizedUniversityRepository:
+    """배치 실행 동안 대학교 위치 목록을 한 번만 조회한다."""
+
+    def __init__(self, repo: UniversityRepositoryPort):
+        self._repo = repo
+        self._locations = None
+
+    def get_university_locations(self):
+        if self._locations is None:
+            self._locations = self._repo.get_university_locations()
+        return self._locations
+
+
+@dataclass(frozen=True)
+class RecommendationContext:
+    """추천 1회 실행 동안 사용하는 저장소/하위 유스케이스 묶음."""
+
+    finder_request_repo: FinderRequestRepositoryPort
+    house_platform_repo: HousePlatformRepositoryPort
+    observation_repo: Any
+    score_repo: StudentHouseScorePort
+    price_observation_repo: PriceObservationRepositoryPort
+    distance_observation_repo: DistanceObservationRepositoryPort
+    university_repo: UniversityRepositoryPort | None
+    filter_usecase: FilterCandidatePort
+    build_context_signal_usecase: Any
+    explain_usecase: ExplainFinderUseCase | None
+    budget: _JobBudget = field(default_factory=_JobBudget)
+
+
 class RecommendStudentHouseUseCase(RecommendStudentHousePort):
-    """학생 매물 추천 결과를 종합한다."""
+    """학생 매물 추천 결과를 종합한다.
+
+    생성 이후 인스턴스 상태를 바꾸지 않으므로 여러 스레드가 공유할 수 있다.
+    세션에 묶이는 저장소만 실행마다 RecommendationContext로 만든다.
+    """
+
+    # 매물 단위 조회 훅을 재정의하는 하위 클래스는 False로 둔다.
+    bulk_hydration = True
+    # 스트리밍 모드에서 한 번에 조회/조립하는 항목 수
+    stream_chunk_size = 5
 
     def __init__(
         self,
@@ -102,24 +219,51 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         explain_usecase: ExplainFinderUseCase | None = None,
         policy: DecisionPolicyConfig | None = None,
         session_factory=SessionLocal,
+        card_cache: HouseCardCachePort | None = None,
+        candidate_snapshot_service: RefreshCandidateSnapshotService | None = None,
     ):
-        # 인자가 없으면 execute에서 기본 구현체를 조립한다.
-        # TODO: 의존성 조립을 별도 팩토리로 분리한다.
+        # 세션 팩토리 기반 저장소는 생성 시 한 번만 조립한다.
+        # 세션 객체가 필요한 저장소(요구서/가격/거리)는 None이면 실행마다 만든다.
         self.finder_request_repo = finder_request_repo
-        self.house_platform_repo = house_platform_repo
-        self.observation_repo = observation_repo
-        self.score_repo = score_repo
         self.price_observation_repo = price_observation_repo
         self.distance_observation_repo = distance_observation_repo
-        self.university_repo = university_repo
         self.filter_usecase = filter_usecase
-        self.build_context_signal_usecase = build_context_signal_usecase
-        self.explain_usecase = explain_usecase
+        self.observation_repo = (
+            observation_repo
+            or StudentRecommendationFeatureObservationRepository(session_factory)
+        )
+        self.score_repo = score_repo or StudentHouseScoreRepository(
+            session_factory
+        )
+        self.house_platform_repo = house_platform_repo or HousePlatformRepository(
+            session_factory
+        )
+        self.university_repo = university_repo or UniversityRepository(
+            session_factory
+        )
+        self.build_context_signal_usecase = (
+            build_context_signal_usecase
+            or BuildDecisionContextSignalUseCase(
+                observation_repo=self.observation_repo
+            )
+        )
+        self.explain_usecase = explain_usecase or ExplainFinderUseCase()
         self.policy = policy or DecisionPolicyConfig()
+        self.card_cache = card_cache
+        # 설정되면 후보 선별을 프로세스 내 스냅샷으로 먼저 시도한다.
+        self.candidate_snapshot_service = candidate_snapshot_service
         self._session_factory = session_factory
+        self._candidate_repo = (
+            None
+            if filter_usecase
+            else HousePlatformCandidateRepository(session_factory)
+        )
 
-    def execute(self, command: RecommendStudentHouseCommand) -> RecommendStudentHouseResult:
-        """추천 결과를 생성한다."""
+    @contextmanager
+    def open_context(
+        self, deadline_seconds: float | None = None
+    ) -> Iterator[RecommendationContext]:
+        """실행 단위 컨텍스트를 만들고 종료 시 세션을 정리한다."""
         session = None
         generator = None
         needs_session = (
@@ -130,200 +274,461 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         if needs_session:
             session, generator = open_session(self._session_factory)
 
-        runtime_finder_repo = self.finder_request_repo or FinderRequestRepository(
-            session
-        )
-        runtime_price_repo = (
-            self.price_observation_repo
-            or StudentRecommendationPriceObservationRepository(session)
-        )
-        runtime_distance_repo = (
-            self.distance_observation_repo
-            or StudentRecommendationDistanceObservationRepository(session)
-        )
-        runtime_observation_repo = (
-            self.observation_repo
-            or StudentRecommendationFeatureObservationRepository(
-                self._session_factory
+        try:
+            finder_repo = self.finder_request_repo or FinderRequestRepository(
+                session
             )
+            price_repo = (
+                self.price_observation_repo
+                or StudentRecommendationPriceObservationRepository(session)
+            )
+            distance_repo = (
+                self.distance_observation_repo
+                or StudentRecommendationDistanceObservationRepository(session)
+            )
+            filter_usecase = self.filter_usecase or FilterCandidateService(
+                finder_request_repo=finder_repo,
+                house_platform_repo=self._candidate_repo,
+                price_observation_repo=price_repo,
+                distance_observation_repo=distance_repo,
+                university_repo=self.university_repo,
+                candidate_snapshot=(
+                    self.candidate_snapshot_service.current_snapshot()
+                    if self.candidate_snapshot_service
+                    else None
+                ),
+            )
+            yield RecommendationContext(
+                finder_request_repo=finder_repo,
+                house_platform_repo=self.house_platform_repo,
+                observation_repo=self.observation_repo,
+                score_repo=self.score_repo,
+                price_observation_repo=price_repo,
+                distance_observation_repo=distance_repo,
+                university_repo=self.university_repo,
+                filter_usecase=filter_usecase,
+                build_context_signal_usecase=self.build_context_signal_usecase,
+                explain_usecase=self.explain_usecase,
+                budget=_JobBudget(deadline_seconds),
+            )
+        finally:
+            if generator:
+                generator.close()
+            elif session is not None:
+                session.close()
+
+    def execute(self, command: RecommendStudentHouseCommand) -> RecommendStudentHouseResult:
+        """추천 결과를 생성한다."""
+        with self.open_context(command.deadline_seconds) as ctx:
+            return self._execute(ctx, command)
+
+    def execute_stream(
+        self, command: RecommendStudentHouseCommand
+    ) -> Iterator[RecommendationStreamEvent]:
+        """summary 이벤트를 먼저 보내고 항목은 조립되는 대로 내보낸다.
+
+        시간 예산을 넘겨 단계를 건너뛰면 마지막에 갱신된 summary를 한 번 더 보낸다.
+        """
+        with self.open_context(command.deadline_seconds) as ctx:
+            ranked = self._rank(ctx, command)
+            record_pipeline_counts(
+                candidates_in=len(ranked.candidates),
+                recommended_out=len(ranked.recommended_top),
+            )
+            yield self._build_result(command, ranked, ctx.budget).summary_event()
+
+            policy = self.policy
+            chunk_size = max(self.stream_chunk_size, 1)
+            for decision_status, items in (
+                ("RECOMMENDED", ranked.recommended_top),
+                ("REJECTED", ranked.rejected_top),
+            ):
+                if decision_status == "REJECTED" and ctx.budget.skip(
+                    _JobBudget.STAGE_REJECTED_TOP_K
+                ):
+                    break
+                for offset in range(0, len(items), chunk_size):
+                    # 첫 카드가 빨리 나가도록 작은 묶음 단위로 조회한다.
+                    chunk = items[offset : offset + chunk_size]
+                    with observe_stage(STAGE_HYDRATION):
+                        hydrated = self._hydrate_ranked_items(
+                            ctx,
+                            [item[0] for item in chunk],
+                            ranked.request,
+                            score_map=ranked.score_map,
+                            snapshot_ids=ranked.snapshot_ids,
+                        )
+                    for item in self._build_ranked_items(
+                        ctx,
+                        chunk,
+                        ranked.request,
+                        policy,
+                        decision_status=decision_status,
+                        hydrated=hydrated,
+                        start_rank=offset + 1,
+                    ):
+                        yield RecommendationStreamEvent(
+                            event=STREAM_EVENT_ITEM, data=item
+                        )
+
+            if ctx.budget.skipped_stages:
+                yield self._build_result(command, ranked, ctx.budget).summary_event()
+
+    def _execute(
+        self, ctx: RecommendationContext, command: RecommendStudentHouseCommand
+    ) -> RecommendStudentHouseResult:
+        ranked = self._rank(ctx, command)
+
+        # 시간 예산이 소진됐으면 제외 목록은 조회/조립하지 않는다.
+        rejected_top = (
+            []
+            if ctx.budget.skip(_JobBudget.STAGE_REJECTED_TOP_K)
+            else ranked.rejected_top
         )
-        runtime_score_repo = self.score_repo or StudentHouseScoreRepository(
-            self._session_factory
-        )
-        runtime_house_platform_repo = (
-            self.house_platform_repo
-            or HousePlatformRepository(self._session_factory)
-        )
-        runtime_university_repo = (
-            self.university_repo
-            or UniversityRepository(self._session_factory)
+
+        # 상위 K개 항목의 매물/관측치는 종류별로 한 번에 조회한다.
+        with observe_stage(STAGE_HYDRATION):
+            hydrated = self._hydrate_ranked_items(
+                ctx,
+                [item[0] for item in ranked.recommended_top + rejected_top],
+                ranked.request,
+                score_map=ranked.score_map,
+                snapshot_ids=ranked.snapshot_ids,
+            )
+        return self._assemble_result(ctx, command, ranked, hydrated, rejected_top)
+
+    def execute_batch(
+        self, command: RecommendStudentHouseBatchCommand
+    ) -> RecommendStudentHouseBatchResult:
+        """여러 요구서의 추천을 후보 풀/점수 1회 적재로 계산한다."""
+        with self.open_context(command.deadline_seconds) as ctx:
+            return self._execute_batch(ctx, command)
+
+    def _execute_batch(
+        self,
+        ctx: RecommendationContext,
+        command: RecommendStudentHouseBatchCommand,
+    ) -> RecommendStudentHouseBatchResult:
+        finder_request_ids = list(dict.fromkeys(command.finder_request_ids))
+        if ctx.university_repo is not None:
+            # 대학교 위치는 배치 동안 한 번만 읽는다.
+            ctx = replace(
+                ctx, university_repo=_MemoizedUniversityRepository(ctx.university_repo)
+            )
+        requests = self._find_requests(ctx, finder_request_ids)
+        missing_ids = [
+            finder_request_id
+            for finder_request_id in finder_request_ids
+            if finder_request_id not in requests
+        ]
+        request_ids = [
+            finder_request_id
+            for finder_request_id in finder_request_ids
+            if finder_request_id in requests
+        ]
+
+        # 1) 후보 풀을 한 번 적재하고 요구서별 조건은 메모리에서 평가한다.
+        with observe_stage(STAGE_FILTER_CANDIDATES):
+            filter_results = self._filter_batch(
+                ctx, [requests[finder_request_id] for finder_request_id in request_ids]
+            )
+        candidates_by_request = {
+            finder_request_id: [
+                candidate.house_platform_id
+                for candidate in filter_results[finder_request_id].candidates
+            ]
+            for finder_request_id in request_ids
+        }
+        snapshot_ids = {
+            candidate.house_platform_id: candidate.snapshot_id
+            for result in filter_results.values()
+            for candidate in result.candidates
+        }
+        all_candidates = list(snapshot_ids)
+
+        if (
+            ctx.build_context_signal_usecase
+            and all_candidates
+            and not ctx.budget.skip(_JobBudget.STAGE_CONTEXT_SIGNAL)
+        ):
+            ctx.build_context_signal_usecase.execute_with_candidates(
+                all_candidates
+            )
+
+        # 2) 점수는 모든 요구서 후보의 합집합으로 한 번 조회한다.
+        with observe_stage(STAGE_FETCH_SCORE_MAP):
+            score_map = self._fetch_score_map(ctx, all_candidates, self.policy)
+        ranked_by_request = {
+            finder_request_id: self._rank_candidates(
+                requests[finder_request_id],
+                candidates_by_request[finder_request_id],
+                score_map,
+                snapshot_ids,
+            )
+            for finder_request_id in request_ids
+        }
+
+        # 3) 상위 K 매물 카드는 대학교(거리 관측치 선택 기준)별로 한 번에 조립한다.
+        include_rejected = not ctx.budget.skip(_JobBudget.STAGE_REJECTED_TOP_K)
+        groups: dict[str, list[int]] = {}
+        for finder_request_id in request_ids:
+            university_key = (requests[finder_request_id].university_name or "").strip()
+            groups.setdefault(university_key, []).append(finder_request_id)
+        hydrated_by_request: dict[int, dict[int, HouseCard]] = {}
+        for group_request_ids in groups.values():
+            house_platform_ids = [
+                item[0]
+                for finder_request_id in group_request_ids
+                for item in self._top_items(
+                    ranked_by_request[finder_request_id], include_rejected
+                )
+            ]
+            with observe_stage(STAGE_HYDRATION):
+                hydrated = self._hydrate_ranked_items(
+                    ctx,
+                    house_platform_ids,
+                    requests[group_request_ids[0]],
+                    score_map=score_map,
+                    snapshot_ids=snapshot_ids,
+                )
+            for finder_request_id in group_request_ids:
+                hydrated_by_request[finder_request_id] = hydrated
+
+        results = []
+        for finder_request_id in request_ids:
+            ranked = ranked_by_request[finder_request_id]
+            results.append(
+                self._assemble_result(
+                    ctx,
+                    RecommendStudentHouseCommand(
+                        finder_request_id=finder_request_id,
+                        deadline_seconds=command.deadline_seconds,
+                    ),
+                    ranked,
+                    hydrated_by_request[finder_request_id],
+                    ranked.rejected_top if include_rejected else [],
+                )
+            )
+        return RecommendStudentHouseBatchResult(
+            results=results,
+            missing_finder_request_ids=missing_ids,
         )
-        runtime_filter_usecase = self.filter_usecase or FilterCandidateService(
-            finder_request_repo=runtime_finder_repo,
-            house_platform_repo=HousePlatformCandidateRepository(
-                self._session_factory
-            ),
-            price_observation_repo=runtime_price_repo,
-            distance_observation_repo=runtime_distance_repo,
-            university_repo=runtime_university_repo,
+
+    @staticmethod
+    def _find_requests(
+        ctx: RecommendationContext, finder_request_ids: list[int]
+    ) -> dict[int, Any]:
+        if hasattr(ctx.finder_request_repo, "find_by_ids"):
+            found = ctx.finder_request_repo.find_by_ids(finder_request_ids)
+        else:
+            found = [
+                ctx.finder_request_repo.find_by_id(finder_request_id)
+                for finder_request_id in finder_request_ids
+            ]
+        return {
+            request.finder_request_id: request for request in found if request
+        }
+
+    def _filter_batch(
+        self, ctx: RecommendationContext, requests: list
+    ) -> dict[int, FilterCandidateResult]:
+        """후보 풀을 지원하면 한 번 적재해 공유하고, 아니면 요구서별로 필터링한다."""
+        if not requests:
+            return {}
+        try:
+            pool = ctx.filter_usecase.load_candidate_pool(
+                include_distance=any(
+                    request.university_name and request.is_near
+                    for request in requests
+                )
+            )
+        except NotImplementedError:
+            pool = None
+        if pool is None:
+            return {
+                request.finder_request_id: ctx.filter_usecase.execute(
+                    FilterCandidateCommand(finder_request_id=request.finder_request_id)
+                )
+                for request in requests
+            }
+        return {
+            request.finder_request_id: ctx.filter_usecase.filter_from_pool(
+                request, pool
+            )
+            for request in requests
+        }
+
+    @staticmethod
+    def _top_items(
+        ranked: _RankedCandidates, include_rejected: bool
+    ) -> list[tuple[int, Any, float]]:
+        if include_rejected:
+            return ranked.recommended_top + ranked.rejected_top
+        return list(ranked.recommended_top)
+
+    def _assemble_result(
+        self,
+        ctx: RecommendationContext,
+        command: RecommendStudentHouseCommand,
+        ranked: _RankedCandidates,
+        hydrated: dict[int, HouseCard],
+        rejected_top: list[tuple[int, Any, float]],
+    ) -> RecommendStudentHouseResult:
+        """조립된 매물 카드로 추천/제외 항목을 채운 결과를 만든다."""
+        policy = self.policy
+        record_pipeline_counts(
+            candidates_in=len(ranked.candidates),
+            recommended_out=len(ranked.recommended_top),
         )
-        runtime_explain_usecase = (
-            self.explain_usecase or ExplainFinderUseCase()
+
+        recommended_items = self._build_ranked_items(
+            ctx,
+            ranked.recommended_top,
+            ranked.request,
+            policy,
+            decision_status="RECOMMENDED",
+            hydrated=hydrated,
         )
-        runtime_context_signal_usecase = (
-            self.build_context_signal_usecase
-            or BuildDecisionContextSignalUseCase(
-                observation_repo=runtime_observation_repo
-            )
+        rejected_items = self._build_ranked_items(
+            ctx,
+            rejected_top,
+            ranked.request,
+            policy,
+            decision_status="REJECTED",
+            hydrated=hydrated,
         )
+        result = self._build_result(command, ranked, ctx.budget)
+        result.recommended_top_k = recommended_items
+        result.rejected_top_k = rejected_items
+        return result
 
+    def _rank(
+        self, ctx: RecommendationContext, command: RecommendStudentHouseCommand
+    ) -> _RankedCandidates:
+        """후보를 선별하고 점수 기준으로 추천/제외 상위 K를 나눈다."""
         # finder_request는 상위 흐름에서 존재를 보장한다.
-        request = runtime_finder_repo.find_by_id(command.finder_request_id)
-
-        previous = (
-            self.finder_request_repo,
-            self.house_platform_repo,
-            self.observation_repo,
-            self.score_repo,
-            self.price_observation_repo,
-            self.distance_observation_repo,
-            self.university_repo,
-            self.filter_usecase,
-            self.build_context_signal_usecase,
-            self.explain_usecase,
-        )
-        self.finder_request_repo = runtime_finder_repo
-        self.house_platform_repo = runtime_house_platform_repo
-        self.observation_repo = runtime_observation_repo
-        self.score_repo = runtime_score_repo
-        self.price_observation_repo = runtime_price_repo
-        self.distance_observation_repo = runtime_distance_repo
-        self.university_repo = runtime_university_repo
-        self.filter_usecase = runtime_filter_usecase
-        self.build_context_signal_usecase = runtime_context_signal_usecase
-        self.explain_usecase = runtime_explain_usecase
+        request = ctx.finder_request_repo.find_by_id(command.finder_request_id)
 
-        try:
-            candidates = command.candidate_house_platform_ids
-            if candidates is None:
-                filter_result = self.filter_usecase.execute(
+        candidates = command.candidate_house_platform_ids
+        snapshot_ids: dict[int, str | None] = {}
+        if candidates is None:
+            with observe_stage(STAGE_FILTER_CANDIDATES):
+                filter_result = ctx.filter_usecase.execute(
                     FilterCandidateCommand(
                         finder_request_id=command.finder_request_id
                     )
                 )
-                candidates = [
-                    candidate.house_platform_id
-                    for candidate in filter_result.candidates
-                ]
-
-            if self.build_context_signal_usecase and candidates:
-                self.build_context_signal_usecase.execute_with_candidates(
-                    candidates
-                )
+            candidates = [
+                candidate.house_platform_id
+                for candidate in filter_result.candidates
+            ]
+            snapshot_ids = {
+                candidate.house_platform_id: candidate.snapshot_id
+                for candidate in filter_result.candidates
+            }
 
-            policy = self.policy
+        if (
+            ctx.build_context_signal_usecase
+            and candidates
+            and not ctx.budget.skip(_JobBudget.STAGE_CONTEXT_SIGNAL)
+        ):
+            ctx.build_context_signal_usecase.execute_with_candidates(
+                candidates
+            )
+
+        with observe_stage(STAGE_FETCH_SCORE_MAP):
             score_map = self._fetch_score_map(
+                ctx,
                 candidates,
-                policy,
+                self.policy,
             )
-            ranked = [
-                (
-                    house_platform_id,
-                    score_map.get(house_platform_id),
-                    self._resolve_base_score(
-                        score_map.get(house_platform_id)
-                    ),
-                )
-                for house_platform_id in candidates
-            ]
+        return self._rank_candidates(request, candidates, score_map, snapshot_ids)
 
-            recommended = [
-                item
-                for item in ranked
-                if item[2] >= policy.threshold_base_total
-            ]
-            rejected = [
-                item
-                for item in ranked
-                if item[2] < policy.threshold_base_total
-            ]
+    def _rank_candidates(
+        self,
+        request,
+        candidates: list[int],
+        score_map: dict[int, Any],
+        snapshot_ids: dict[int, str | None],
+    ) -> _RankedCandidates:
+        """조회된 점수로 후보를 추천/제외 상위 K로 나눈다."""
+        policy = self.policy
+        # 후보 전체를 목록/정렬로 만들지 않고 한 번 훑으며 상위 K만 유지한다.
+        split = split_top_k(
+            self._iter_scored_candidates(candidates, score_map),
+            threshold=policy.threshold_base_total,
+            top_k=policy.top_k,
+        )
 
-            recommended.sort(key=lambda item: item[2], reverse=True)
-            rejected.sort(key=lambda item: item[2], reverse=True)
-
-            recommended_top = recommended[: policy.top_k]
-            rejected_top = rejected[: policy.top_k]
-
-            # 정상 응답은 SUCCESS + detail None으로 기록한다.
-            # TODO: 실패 수집 로직 활성화 시 FAILED + detail 채움으로 전환한다.
-            status = "SUCCESS"
-            detail = None
-            # TODO: 추천 로직이 안정화되면 실패 상세를 활성화한다.
-            # detail = self._collect_failure_detail(
-            #     candidates=candidates,
-            #     score_map=score_map,
-            # )
-            # if detail:
-            #     status = "FAILED"
-
-            result = RecommendStudentHouseResult(
-                finder_request_id=command.finder_request_id,
-                generated_at=datetime.now(timezone.utc).isoformat(),
-                status=status,
-                detail=detail,
-                query_context=self._build_query_context(request, policy),
-                summary=self._build_summary(
-                    total_candidates=len(candidates),
-                    recommended_count=len(recommended),
-                    rejected_count=len(rejected),
-                    top_k=policy.top_k,
-                ),
-                recommended_top_k=self._build_ranked_items(
-                    recommended_top,
-                    request,
-                    policy,
-                    decision_status="RECOMMENDED",
-                ),
-                rejected_top_k=self._build_ranked_items(
-                    rejected_top,
-                    request,
-                    policy,
-                    decision_status="REJECTED",
-                ),
-            )
-            return result
-        finally:
-            (
-                self.finder_request_repo,
-                self.house_platform_repo,
-                self.observation_repo,
-                self.score_repo,
-                self.price_observation_repo,
-                self.distance_observation_repo,
-                self.university_repo,
-                self.filter_usecase,
-                self.build_context_signal_usecase,
-                self.explain_usecase,
-            ) = previous
-            if generator:
-                generator.close()
-            elif session is not None:
-                session.close()
+        return _RankedCandidates(
+            request=request,
+            candidates=candidates,
+            score_map=score_map,
+            recommended_count=split.recommended_count,
+            rejected_count=split.rejected_count,
+            recommended_top=split.recommended_top,
+            rejected_top=split.rejected_top,
+            snapshot_ids=snapshot_ids,
+        )
+
+    def _build_result(
+        self,
+        command: RecommendStudentHouseCommand,
+        ranked: _RankedCandidates,
+        budget: _JobBudget,
+    ) -> RecommendStudentHouseResult:
+        """랭킹 항목을 제외한 결과 머리 정보를 만든다."""
+        policy = self.policy
+
+        # 정상 응답은 SUCCESS + detail None으로 기록한다.
+        # TODO: 실패 수집 로직 활성화 시 FAILED + detail 채움으로 전환한다.
+        status = "SUCCESS"
+        detail = None
+        # TODO: 추천 로직이 안정화되면 실패 상세를 활성화한다.
+        # detail = self._collect_failure_detail(
+        #     ctx,
+        #     candidates=ranked.candidates,
+        #     score_map=ranked.score_map,
+        # )
+        # if detail:
+        #     status = "FAILED"
+
+        summary = self._build_summary(
+            total_candidates=len(ranked.candidates),
+            recommended_count=ranked.recommended_count,
+            rejected_count=ranked.rejected_count,
+            top_k=policy.top_k,
+        )
+        # 시간 예산 초과로 건너뛴 단계가 있으면 부분 결과임을 표시한다.
+        summary.update(budget.to_summary())
+
+        return RecommendStudentHouseResult(
+            finder_request_id=command.finder_request_id,
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            status=status,
+            detail=detail,
+            query_context=self._build_query_context(ranked.request, policy),
+            summary=summary,
+            recommended_top_k=[],
+            rejected_top_k=[],
+        )
 
     def _fetch_score_map(
         self,
+        ctx: RecommendationContext,
         house_platform_ids: list[int],
         policy: DecisionPolicyConfig,
     ) -> dict[int, Any]:
         if not house_platform_ids:
             return {}
-        scores = self.score_repo.fetch_by_house_platform_ids(
+        scores = ctx.score_repo.fetch_by_house_platform_ids(
             house_platform_ids, policy_version=policy.policy_version
         )
         return {score.house_platform_id: score for score in scores}
 
     def _collect_failure_detail(
         self,
+        ctx: RecommendationContext,
         candidates: list[int],
         score_map: dict[int, Any],
     ) -> dict[str, Any] | None:
@@ -355,26 +760,14 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
         missing_observations: list[int] = []
         snapshot_mismatches: list[int] = []
+        hydrated = self._hydrate_ranked_items(ctx, candidates, None)
         for candidate_id in candidates:
-            raw = self._build_raw(candidate_id)
-            feature_observation = self._fetch_feature_observation(
-                candidate_id
-            )
-            price_observation = self._fetch_price_observation(
-                candidate_id
-            )
-            distance_observation = self._select_distance_observation(
-                self._fetch_distance_observations(candidate_id),
-                None,
-            )
-            if (
-                not feature_observation
-                or not price_observation
-                or not distance_observation
-            ):
+            card = hydrated[candidate_id]
+            # 관측치 중 하나라도 없으면 observation_summary가 비어 있다.
+            if card.observation_summary is None:
                 missing_observations.append(candidate_id)
                 continue
-            snapshot_id = raw.get("snapshot_id")
+            snapshot_id = card.raw.get("snapshot_id")
             # TODO: snapshot_id 불일치 처리 정책을 확정한 뒤 활성화한다.
             # if (
             #     snapshot_id
@@ -401,6 +794,15 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
         return {"failures": failures} if failures else None
 
+    @classmethod
+    def _iter_scored_candidates(
+        cls, candidates: Iterable[int], score_map: dict[int, Any]
+    ) -> Iterator[tuple[int, Any, float]]:
+        """(매물 ID, 점수 객체, 총점)을 후보 순서대로 하나씩 만든다."""
+        for house_platform_id in candidates:
+            score = score_map.get(house_platform_id)
+            yield house_platform_id, score, cls._resolve_base_score(score)
+
     @staticmethod
     def _resolve_base_score(score) -> float:
         if score is None:
@@ -424,41 +826,30 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
     def _build_ranked_items(
         self,
+        ctx: RecommendationContext,
         ranked_items: list[tuple[Any, Any, float]],
         request,
         policy: DecisionPolicyConfig,
         decision_status: str,
+        hydrated: dict[int, HouseCard] | None = None,
+        start_rank: int = 1,
     ) -> list[dict[str, Any]]:
+        if hydrated is None:
+            hydrated = self._hydrate_ranked_items(
+                ctx, [item[0] for item in ranked_items], request
+            )
         results = []
         for index, (house_platform_id, score, _) in enumerate(
-            ranked_items, start=1
+            ranked_items, start=start_rank
         ):
-            raw = self._build_raw(house_platform_id)
-            feature_observation = self._fetch_feature_observation(
-                house_platform_id
-            )
-            price_observation = self._fetch_price_observation(
-                house_platform_id
-            )
-            distance_observations = self._fetch_distance_observations(
-                house_platform_id
-            )
-            distance_observation = self._select_distance_observation(
-                distance_observations, request
-            )
-            observation_summary = self._build_observation_summary(
-                feature_observation,
-                price_observation,
-                distance_observation,
-                raw.get("snapshot_id"),
-            )
+            card = hydrated[house_platform_id]
+            raw = card.raw
+            observation_summary = card.observation_summary
             explanation = self._build_ai_explanation(
-                request, observation_summary
+                ctx, request, observation_summary
             )
             score_breakdown = self._build_score_breakdown(score, policy)
-            version_mismatch = self._has_version_mismatch(
-                score, feature_observation
-            )
+            version_mismatch = self._has_version_mismatch(score, card)
             if version_mismatch:
                 # TODO: 관측 버전/점수 버전 불일치 처리 정책을 확정한다.
                 score_breakdown = None
@@ -520,45 +911,221 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             results.append(item)
         return results
 
-    def _build_raw(self, house_platform_id: int) -> dict[str, Any]:
+    def _hydrate_ranked_items(
+        self,
+        ctx: RecommendationContext,
+        house_platform_ids: list[int],
+        request,
+        score_map: dict[int, Any] | None = None,
+        snapshot_ids: dict[int, str | None] | None = None,
+    ) -> dict[int, HouseCard]:
+        """매물 카드를 캐시에서 한 번에 찾고, 없는 매물만 조회해 조립한다."""
+        unique_ids = list(dict.fromkeys(house_platform_ids))
+        if not unique_ids:
+            return {}
+        university_ids = self._resolve_request_university_ids(ctx, request)
+
+        keys: dict[int, HouseCardKey] = {}
+        cards: dict[int, HouseCard] = {}
+        if self.card_cache is not None:
+            keys = self._build_card_keys(
+                unique_ids, score_map or {}, snapshot_ids or {}, university_ids
+            )
+            cached = self.card_cache.get_many(list(keys.values()))
+            cards = {
+                house_platform_id: cached[key]
+                for house_platform_id, key in keys.items()
+                if key in cached
+            }
+
+        missing = [
+            house_platform_id
+            for house_platform_id in unique_ids
+            if house_platform_id not in cards
+        ]
+        if missing:
+            built = self._build_cards(ctx, missing, request, university_ids)
+            cards.update(built)
+            if keys:
+                self.card_cache.save_many(
+                    {
+                        keys[house_platform_id]: built[house_platform_id]
+                        for house_platform_id in missing
+                    }
+                )
+        return cards
+
+    @staticmethod
+    def _build_card_keys(
+        house_platform_ids: list[int],
+        score_map: dict[int, Any],
+        snapshot_ids: dict[int, str | None],
+        university_ids: list[int],
+    ) -> dict[int, HouseCardKey]:
+        # 거리 관측치는 요청 대학교에 따라 달라지므로 키 범위에 포함한다.
+        scope = ",".join(str(university_id) for university_id in sorted(university_ids))
+        return {
+            house_platform_id: HouseCardKey(
+                house_platform_id=house_platform_id,
+                snapshot_id=snapshot_ids.get(house_platform_id),
+                observation_version=getattr(
+                    score_map.get(house_platform_id), "observation_version", None
+                ),
+                scope=scope,
+            )
+            for house_platform_id in house_platform_ids
+        }
+
+    def _build_cards(
+        self,
+        ctx: RecommendationContext,
+        house_platform_ids: list[int],
+        request,
+        university_ids: list[int],
+    ) -> dict[int, HouseCard]:
+        """매물/관측치를 종류별로 한 번에 조회해 메모리에서 카드로 조립한다."""
+        raw_map = self._build_raw_map(ctx, house_platform_ids)
+        feature_map = self._fetch_feature_observation_map(ctx, house_platform_ids)
+        price_map = self._fetch_price_observation_map(ctx, house_platform_ids)
+        distance_map = self._fetch_distance_observation_map(ctx, house_platform_ids)
+        cards = {}
+        for house_platform_id in house_platform_ids:
+            raw = raw_map.get(house_platform_id) or {}
+            feature_observation = feature_map.get(house_platform_id)
+            distance_observation = self._select_distance_observation(
+                ctx,
+                distance_map.get(house_platform_id) or [],
+                request,
+                university_ids=university_ids,
+            )
+            cards[house_platform_id] = HouseCard(
+                house_platform_id=house_platform_id,
+                raw=raw,
+                observation_summary=self._build_observation_summary(
+                    feature_observation,
+                    price_map.get(house_platform_id),
+                    distance_observation,
+                    raw.get("snapshot_id"),
+                ),
+                has_feature_observation=bool(feature_observation),
+                feature_observation_version=feature_observation.메타데이터.관측치_버전
+                if feature_observation
+                else None,
+            )
+        return cards
+
+    def _supports_bulk(self, repo, method_name: str) -> bool:
+        return self.bulk_hydration and hasattr(repo, method_name)
+
+    def _build_raw_map(
+        self, ctx: RecommendationContext, house_platform_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        if not self._supports_bulk(ctx.house_platform_repo, "find_by_ids"):
+            return {
+                house_platform_id: self._build_raw(ctx, house_platform_id)
+                for house_platform_id in house_platform_ids
+            }
+        houses = ctx.house_platform_repo.find_by_ids(house_platform_ids)
+        return {
+            house.house_platform_id: self._to_raw(house) for house in houses
+        }
+
+    def _fetch_feature_observation_map(
+        self, ctx: RecommendationContext, house_platform_ids: list[int]
+    ) -> dict[int, Any]:
+        if not self._supports_bulk(ctx.observation_repo, "find_latest_by_house_ids"):
+            return {
+                house_platform_id: self._fetch_feature_observation(ctx, house_platform_id)
+                for house_platform_id in house_platform_ids
+            }
+        return ctx.observation_repo.find_latest_by_house_ids(house_platform_ids)
+
+    def _fetch_price_observation_map(
+        self, ctx: RecommendationContext, house_platform_ids: list[int]
+    ) -> dict[int, Any]:
+        if not self._supports_bulk(
+            ctx.price_observation_repo, "get_latest_by_house_platform_ids"
+        ):
+            return {
+                house_platform_id: self._fetch_price_observation(ctx, house_platform_id)
+                for house_platform_id in house_platform_ids
+            }
+        return ctx.price_observation_repo.get_latest_by_house_platform_ids(
+            house_platform_ids
+        )
+
+    def _fetch_distance_observation_map(
+        self, ctx: RecommendationContext, house_platform_ids: list[int]
+    ) -> dict[int, list]:
+        if not self._supports_bulk(
+            ctx.distance_observation_repo, "get_bulk_by_house_platform_ids"
+        ):
+            return {
+                house_platform_id: self._fetch_distance_observations(ctx, house_platform_id)
+                for house_platform_id in house_platform_ids
+            }
+        return ctx.distance_observation_repo.get_bulk_by_house_platform_ids(
+            house_platform_ids
+        )
+
+    def _build_raw(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ) -> dict[str, Any]:
         """house_platform 도메인 객체를 dict로 변환한다."""
-        house = self.house_platform_repo.find_by_id(house_platform_id)
+        return self._to_raw(ctx.house_platform_repo.find_by_id(house_platform_id))
+
+    @staticmethod
+    def _to_raw(house) -> dict[str, Any]:
         if not house:
             return {}
         raw = asdict(house)
         raw.pop("crawled_at", None)
         return raw
 
-    def _fetch_feature_observation(self, house_platform_id: int):
+    def _fetch_feature_observation(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         """risk/option 관측 저장소를 조회한다."""
-        if not hasattr(self.observation_repo, "find_latest_by_house_id"):
+        if not hasattr(ctx.observation_repo, "find_latest_by_house_id"):
             raise AttributeError("관측 저장소가 없습니다.")
-        return self.observation_repo.find_latest_by_house_id(
+        return ctx.observation_repo.find_latest_by_house_id(
             house_platform_id
         )
 
-    def _fetch_price_observation(self, house_platform_id: int):
+    def _fetch_price_observation(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         """가격 관측 저장소를 조회한다."""
-        if not self.price_observation_repo:
+        if not ctx.price_observation_repo:
             raise AttributeError("가격 관측 저장소가 없습니다.")
-        return self.price_observation_repo.get_by_house_platform_id(
+        return ctx.price_observation_repo.get_by_house_platform_id(
             house_platform_id
         )
 
-    def _fetch_distance_observations(self, house_platform_id: int):
+    def _fetch_distance_observations(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         """거리 관측 저장소를 조회한다."""
-        if not self.distance_observation_repo:
+        if not ctx.distance_observation_repo:
             raise AttributeError("거리 관측 저장소가 없습니다.")
-        return self.distance_observation_repo.get_bulk_by_house_platform_id(
+        return ctx.distance_observation_repo.get_bulk_by_house_platform_id(
             house_platform_id
         )
 
-    def _select_distance_observation(self, distances: list, request):
+    def _select_distance_observation(
+        self,
+        ctx: RecommendationContext,
+        distances: list,
+        request,
+        university_ids: list[int] | None = None,
+    ):
         """대학교 기준으로 거리 관측치를 선택한다."""
         if not distances:
             return None
 
-        matched = self._find_distance_by_university(distances, request)
+        matched = self._find_distance_by_university(
+            ctx, distances, request, university_ids
+        )
         if matched:
             return DistanceObservationFeatures(
                 학교까지_분=matched.학교까지_분,
@@ -569,14 +1136,17 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
 
         return self._average_latest_distance(distances)
 
-    def _find_distance_by_university(self, distances: list, request):
-        if not request or not request.university_name:
-            return None
-        if not self.university_repo:
-            return None
-
-        target_ids = self._resolve_university_ids(
-            request.university_name
+    def _find_distance_by_university(
+        self,
+        ctx: RecommendationContext,
+        distances: list,
+        request,
+        university_ids: list[int] | None = None,
+    ):
+        target_ids = (
+            university_ids
+            if university_ids is not None
+            else self._resolve_request_university_ids(ctx, request)
         )
         if not target_ids:
             return None
@@ -591,11 +1161,22 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         # 동일 학교가 여러 개면 가장 가까운 거리값을 사용한다.
         return min(matched, key=lambda item: item.학교까지_분)
 
-    def _resolve_university_ids(self, university_name: str) -> list[int]:
+    def _resolve_request_university_ids(
+        self, ctx: RecommendationContext, request
+    ) -> list[int]:
+        if not request or not request.university_name:
+            return []
+        if not ctx.university_repo:
+            return []
+        return self._resolve_university_ids(ctx, request.university_name)
+
+    def _resolve_university_ids(
+        self, ctx: RecommendationContext, university_name: str
+    ) -> list[int]:
         normalized = (university_name or "").strip()
         if not normalized:
             return []
-        locations = self.university_repo.get_university_locations()
+        locations = ctx.university_repo.get_university_locations()
         return [
             location.university_location_id
             for location in locations
@@ -722,13 +1303,10 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
         }
 
     @staticmethod
-    def _has_version_mismatch(score, observation) -> bool:
-        if not score or not observation:
+    def _has_version_mismatch(score, card: HouseCard | None) -> bool:
+        if not score or not card or not card.has_feature_observation:
             return False
-        return (
-            score.observation_version
-            != observation.메타데이터.관측치_버전
-        )
+        return score.observation_version != card.feature_observation_version
 
     @staticmethod
     def _build_warnings(
@@ -781,11 +1359,15 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             },
         }
 
-    def _build_ai_explanation(self, request, observation_summary):
+    def _build_ai_explanation(
+        self, ctx: RecommendationContext, request, observation_summary
+    ):
         """AI 설명을 생성한다."""
         if not request or not observation_summary:
             return None
-        if not self.explain_usecase:
+        if not ctx.explain_usecase:
+            return None
+        if ctx.budget.skip(_JobBudget.STAGE_AI_EXPLANATION):
             return None
 
         constraints = UserConstraintsInput(
@@ -805,7 +1387,8 @@ class RecommendStudentHouseUseCase(RecommendStudentHousePort):
             user_constraints=constraints,
             observation_summary=summary_input,
         )
-        result = self.explain_usecase.execute(explanation_input)
+        with observe_stage(STAGE_AI_EXPLANATION):
+            result = ctx.explain_usecase.execute(explanation_input)
         return {
             "recommended_reasons": [
                 self._to_reason_dict(item)
@@ -31,6 +31,7 @@ from modules.recommendations.application.dto.recommendation_dto import (
     RecommendStudentHouseMockResponse,
 )
 from modules.recommendations.application.usecase.recommend_student_house import (
+    RecommendationContext,
     RecommendStudentHouseUseCase,
 )
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
@@ -44,6 +45,9 @@ from modules.student_house_decision_policy.domain.value_object.decision_policy_c
 class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
     """추천 임시 응답을 생성한다."""
 
+    # 후보 기반 대체값을 채우기 위해 매물 단위 조회 훅을 사용한다.
+    bulk_hydration = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._candidate_map: dict[int, Any] = {}
@@ -52,8 +56,16 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
         self, command: RecommendStudentHouseMockCommand
     ) -> RecommendStudentHouseMockResponse:
         """후보 기반으로 임시 추천 응답을 생성한다."""
+        with self.open_context() as ctx:
+            return self._execute_mock(ctx, command)
+
+    def _execute_mock(
+        self,
+        ctx: RecommendationContext,
+        command: RecommendStudentHouseMockCommand,
+    ) -> RecommendStudentHouseMockResponse:
         policy = self.policy
-        request = self.finder_request_repo.find_by_id(
+        request = ctx.finder_request_repo.find_by_id(
             command.finder_request_id
         )
         query_context = (
@@ -87,6 +99,7 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
         ]
 
         recommended_items = self._build_ranked_items(
+            ctx,
             self._build_rank_seed(
                 recommended_candidates, base_score=80.0
             ),
@@ -95,6 +108,7 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
             decision_status="RECOMMENDED",
         )
         rejected_items = self._build_ranked_items(
+            ctx,
             self._build_rank_seed(
                 rejected_candidates, base_score=40.0
             ),
@@ -141,8 +155,10 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
             policy_version=self.policy.policy_version,
         )
 
-    def _build_raw(self, house_platform_id: int) -> dict[str, Any]:
-        raw = super()._build_raw(house_platform_id)
+    def _build_raw(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ) -> dict[str, Any]:
+        raw = super()._build_raw(ctx, house_platform_id)
         if raw:
             return raw
         candidate = self._candidate_map.get(house_platform_id)
@@ -181,10 +197,12 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
         raw.pop("crawled_at", None)
         return raw
 
-    def _fetch_feature_observation(self, house_platform_id: int):
+    def _fetch_feature_observation(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         try:
             observation = super()._fetch_feature_observation(
-                house_platform_id
+                ctx, house_platform_id
             )
         except AttributeError:
             observation = None
@@ -220,7 +238,9 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
             calculated_at=datetime.now(timezone.utc),
         )
 
-    def _fetch_price_observation(self, house_platform_id: int):
+    def _fetch_price_observation(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         candidate = self._candidate_map.get(house_platform_id)
         monthly_rent = candidate.monthly_rent if candidate else 0
         manage_cost = candidate.manage_cost if candidate else 0
@@ -238,7 +258,9 @@ class RecommendStudentHouseMockService(RecommendStudentHouseUseCase):
             가격_부담_비선형=0.5,
         )
 
-    def _fetch_distance_observations(self, house_platform_id: int):
+    def _fetch_distance_observations(
+        self, ctx: RecommendationContext, house_platform_id: int
+    ):
         return [
             DistanceFeatureObservation(
                 id=1,
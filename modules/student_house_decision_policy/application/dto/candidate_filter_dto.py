@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Sequence
+from typing import Any, Sequence
 
 
 @dataclass
@@ -11,6 +11,22 @@ class FilterCandidateCommand:
     finder_request_id: int
 
 
+@dataclass(frozen=True)
+class RegionFilter:
+    """legal_dong.csv로 정규화한 선호 지역 조건.
+
+    pnu_cd가 있는 매물은 앞 5자리(시군구)/10자리(법정동) 코드로 비교하고,
+    없는 매물은 gu_nm/dong_nm 이름으로 비교한다. 사전에 없는 항목은
+    address_tokens로 주소 문자열을 비교한다. 항목 중 하나라도 맞으면 통과한다.
+    """
+
+    sigungu_codes: frozenset[str] = frozenset()
+    legal_dong_codes: frozenset[str] = frozenset()
+    gu_names: frozenset[str] = frozenset()
+    dong_names: frozenset[str] = frozenset()
+    address_tokens: tuple[str, ...] = ()
+
+
 @dataclass
 class FilterCandidateCriteria:
     """후보 선별 기준."""
@@ -24,6 +40,10 @@ class FilterCandidateCriteria:
     additional_condition: str | None = None
     university_name: str | None = None
     is_near: bool = False
+    # preferred_region을 사전으로 정규화한 결과. None이면 주소 문자열로 비교한다.
+    region_filter: RegionFilter | None = None
+    # 모두 갖춰야 하는 옵션 속성(option_bitmap_index.OPTION_ATTRIBUTES).
+    required_options: frozenset[str] = frozenset()
 
 
 @dataclass
@@ -35,6 +55,29 @@ class FilterCandidate:
     deposit: int | None
     monthly_rent: int | None
     manage_cost: int | None
+    # 후보 풀을 메모리에서 필터링할 때만 채운다.
+    sales_type: str | None = None
+    address: str | None = None
+    pnu_cd: str | None = None
+    gu_nm: str | None = None
+    dong_nm: str | None = None
+    # options 비트(option_bitmap_index.OPTION_BITS). 후보 풀에서만 채운다.
+    option_bits: int | None = None
+
+
+@dataclass
+class CandidatePool:
+    """여러 요구서가 공유하는 후보 풀과 관측치.
+
+    price_observations는 매물별 최신 가격 관측치,
+    distance_observations는 매물별 대학교 최신 거리 관측치 목록이다.
+    """
+
+    candidates: Sequence[FilterCandidate] = field(default_factory=list)
+    price_observations: dict[int, Any] = field(default_factory=dict)
+    distance_observations: dict[int, list] = field(default_factory=dict)
+    # 대학교 이름 -> university_location_id (이름당 첫 번째 위치)
+    university_ids: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
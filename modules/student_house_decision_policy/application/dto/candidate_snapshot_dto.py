@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class CandidateSnapshotWatermark:
+    """후보 스냅샷이 반영한 변경 시각.
+
+    매물은 updated_at, 가격/거리 관측치는 calculated_at 기준이다.
+    None이면 해당 테이블이 비어 있었다는 뜻이다.
+    """
+
+    house_updated_at: datetime | None = None
+    price_calculated_at: datetime | None = None
+    distance_calculated_at: datetime | None = None
+
+
+@dataclass
+class CandidateSnapshotHouse:
+    """스냅샷에 적재할 매물 한 건. 금지 매물은 스냅샷에서 제거한다."""
+
+    house_platform_id: int
+    snapshot_id: str | None
+    deposit: int | None
+    monthly_rent: int | None
+    manage_cost: int | None
+    sales_type: str | None = None
+    pnu_cd: str | None = None
+    gu_nm: str | None = None
+    dong_nm: str | None = None
+    lat: float | None = None
+    lng: float | None = None
+    built_in: Sequence[str] = field(default_factory=tuple)
+    near_univ: bool | None = None
+    near_transport: bool | None = None
+    near_mart: bool | None = None
+    has_elevator: bool | None = None
+    can_park: bool | None = None
+    is_banned: bool | None = None
+
+
+@dataclass
+class CandidateSnapshotPrice:
+    """매물별 최신 가격 관측치."""
+
+    house_platform_id: int
+    estimated_move_in_cost: int
+    monthly_cost_est: int
+
+
+@dataclass
+class CandidateSnapshotDistance:
+    """매물-대학별 최신 거리 관측치."""
+
+    house_platform_id: int
+    university_id: int
+    minutes_to_school: float
+
+
+@dataclass
+class RefreshCandidateSnapshotCommand:
+    """후보 스냅샷 갱신 요청. full_reload면 워터마크를 무시하고 다시 적재한다."""
+
+    full_reload: bool = False
+
+
+@dataclass
+class RefreshCandidateSnapshotResult:
+    """후보 스냅샷 갱신 결과."""
+
+    full_reload: bool
+    upserted_count: int
+    removed_count: int
+    price_count: int
+    distance_count: int
+    total_count: int
+    nbytes: int
+    watermark: CandidateSnapshotWatermark
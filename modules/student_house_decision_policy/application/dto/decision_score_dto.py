@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Sequence
 
 from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
     DecisionPolicyConfig,
@@ -13,6 +14,42 @@ class RefreshStudentHouseScoreCommand:
 
     observation_version: str | None = None
     policy: DecisionPolicyConfig | None = None
+    # 지정하면 관측치를 한 번 읽어 모든 정책의 점수를 함께 계산한다(policy보다 우선).
+    policies: Sequence[DecisionPolicyConfig] | None = None
+    # True면 dirty set에 표시된 매물만 다시 계산하고 성공한 매물은 표시를 지운다.
+    dirty_only: bool = False
+
+
+@dataclass
+class ParallelRefreshStudentHouseScoreCommand:
+    """house_platform_id 구간 샤드로 나눠 점수를 병렬 갱신하는 요청.
+
+    같은 run_id로 다시 실행하면 완료된 샤드는 건너뛰고 나머지 샤드는
+    마지막 체크포인트 이후부터 이어서 처리한다.
+    """
+
+    run_id: str
+    observation_version: str | None = None
+    policy: DecisionPolicyConfig | None = None
+    policies: Sequence[DecisionPolicyConfig] | None = None
+    shard_count: int = 4
+    chunk_size: int = 1000
+    # None이면 샤드 수만큼, 1 이하이면 현재 프로세스에서 순서대로 실행한다.
+    max_workers: int | None = None
+
+
+@dataclass
+class RefreshShardCheckpoint:
+    """샤드 1개의 점수 갱신 진행 상황. 구간은 [start_id, end_id)이다."""
+
+    run_id: str
+    shard_index: int
+    start_id: int
+    end_id: int
+    last_house_platform_id: int | None = None
+    processed_count: int = 0
+    failed_count: int = 0
+    completed: bool = False
 
 
 @dataclass
@@ -77,12 +114,33 @@ class StudentHouseScoreSummary:
     policy_version: str | None
 
 
+@dataclass(frozen=True)
+class StudentHouseScoreCursor:
+    """점수 순위 keyset 페이지 커서. 직전 페이지 마지막 행의 정렬 키다."""
+
+    base_total_score: float
+    house_platform_id: int
+
+
+@dataclass
+class StudentHouseScorePage:
+    """점수 순위 한 페이지. 다음 페이지가 없으면 next_cursor는 None이다."""
+
+    items: list[StudentHouseScoreSummary]
+    next_cursor: StudentHouseScoreCursor | None
+
+
 @dataclass
 class RefreshStudentHouseScoreResult:
-    """스코어 갱신 결과."""
+    """스코어 갱신 결과.
+
+    여러 정책을 함께 계산하면 policy_version은 첫 정책이고 전체 목록은
+    policy_versions에 담긴다. 모든 정책 점수를 저장한 매물만 처리 건수에 센다.
+    """
 
     observation_version: str
     policy_version: str
     total_observations: int
     processed_count: int
     failed_count: int
+    policy_versions: list[str] = field(default_factory=list)
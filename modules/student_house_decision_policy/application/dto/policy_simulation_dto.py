@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+@dataclass
+class SimulatePolicyRankingCommand:
+    """정책 변형별 재랭킹(what-if) 요청.
+
+    저장된 세부 점수(price/option/risk/distance)를 그대로 쓰므로
+    총점 가중치, threshold_base_total, top_k 변경만 반영된다.
+    house_platform_ids가 없으면 기준 정책 버전의 완료된 점수 전체가 후보다.
+    candidate_limit을 주면 house_platform_id 내림차순으로 그만큼만 쓰고
+    결과의 truncated로 알린다(기준 정책 점수로 자르지 않는다).
+    """
+
+    policies: Sequence[DecisionPolicyConfig]
+    baseline_policy: DecisionPolicyConfig | None = None
+    house_platform_ids: Sequence[int] | None = None
+    candidate_limit: int | None = None
+
+
+@dataclass
+class PolicyVariantRanking:
+    """정책 변형 1개의 재랭킹 결과."""
+
+    policy_version: str
+    weights: dict[str, float]
+    threshold_base_total: float
+    recommended_count: int
+    top_k_house_platform_ids: list[int] = field(default_factory=list)
+    top_k_scores: list[float] = field(default_factory=list)
+    overlap_with_baseline: float = 0.0
+    jaccard_with_baseline: float = 0.0
+
+
+@dataclass
+class SimulatePolicyRankingResult:
+    """what-if 재랭킹 결과."""
+
+    candidate_count: int
+    baseline: PolicyVariantRanking
+    variants: list[PolicyVariantRanking]
+    # variants 순서 기준 top-k 집합 간 Jaccard 유사도 행렬
+    pairwise_jaccard: list[list[float]]
+    # candidate_limit 때문에 후보 일부를 읽지 않았으면 True
+    truncated: bool = False
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidate,
+    FilterCandidateCriteria,
+    RegionFilter,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    OPTION_BITS,
+)
+
+
+def extract_region_token(preferred_region: str | None) -> str | None:
+    """선호 지역 문자열에서 첫 번째 구 정보를 추출한다."""
+    if not preferred_region:
+        return None
+    tokens = [
+        token.strip()
+        for token in preferred_region.replace(",", " ").split()
+        if token.strip()
+    ]
+    if not tokens:
+        return None
+    for token in tokens:
+        if token.endswith("구"):
+            return token
+    return tokens[0]
+
+
+def matches_base_criteria(
+    candidate: FilterCandidate, criteria: FilterCandidateCriteria
+) -> bool:
+    """후보 조회 SQL(price_type/선호 지역 조건)과 같은 판정을 메모리에서 한다."""
+    sales_type = (candidate.sales_type or "").lower()
+    is_jeonse = "전세" in sales_type
+    is_monthly = "월세" in sales_type
+
+    if criteria.price_type:
+        price_key = criteria.price_type.upper()
+        if price_key == "JEONSE" and not is_jeonse:
+            return False
+        if price_key == "MONTHLY" and (
+            not is_monthly or candidate.monthly_rent is None
+        ):
+            return False
+        if price_key == "MIXED" and not (
+            is_jeonse or (is_monthly and candidate.monthly_rent is not None)
+        ):
+            return False
+
+    if criteria.required_options:
+        required = 0
+        for attribute in criteria.required_options:
+            required |= OPTION_BITS[attribute]
+        if (candidate.option_bits or 0) & required != required:
+            return False
+
+    if criteria.region_filter is not None:
+        return matches_region_filter(candidate, criteria.region_filter)
+    region_token = extract_region_token(criteria.preferred_region)
+    if region_token and region_token.lower() not in (candidate.address or "").lower():
+        return False
+    return True
+
+
+def matches_region_filter(candidate: FilterCandidate, region: RegionFilter) -> bool:
+    """후보 조회 SQL의 지역 코드 조건과 같은 판정을 메모리에서 한다."""
+    if candidate.pnu_cd is not None:
+        if (
+            candidate.pnu_cd[:5] in region.sigungu_codes
+            or candidate.pnu_cd[:10] in region.legal_dong_codes
+        ):
+            return True
+    elif candidate.gu_nm in region.gu_names or candidate.dong_nm in region.dong_names:
+        return True
+    address = (candidate.address or "").lower()
+    return any(token.lower() in address for token in region.address_tokens)
@@ -0,0 +1,584 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidate,
+    FilterCandidateCriteria,
+    RegionFilter,
+)
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    CandidateSnapshotDistance,
+    CandidateSnapshotHouse,
+    CandidateSnapshotPrice,
+    CandidateSnapshotWatermark,
+)
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    extract_region_token,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    OptionBitmapIndex,
+    option_bits,
+)
+
+# int32 열의 NULL 표시값.
+_NULL_INT32 = np.iinfo(np.int32).min
+_MAX_INT32 = np.iinfo(np.int32).max
+# 구/동 이름 사전 코드는 int16으로 둔다(전국 구/동 이름 수보다 충분히 크다).
+_MAX_NAME_CODE = np.iinfo(np.int16).max
+
+# flags 비트.
+FLAG_JEONSE = 1
+FLAG_MONTHLY = 2
+FLAG_HAS_PNU = 4
+FLAG_HAS_PRICE = 8
+# snapshot_id가 소문자 64자리 hex라 digest 열로 복원할 수 있다.
+FLAG_HEX_SNAPSHOT = 16
+
+
+@dataclass(frozen=True)
+class CandidateColumns:
+    """house_platform_id 오름차순으로 정렬한 후보 열 묶음.
+
+    행 하나가 약 82바이트라 100만 건이 약 80MB다. 값이 없는 정수는
+    int32 최솟값, 좌표는 NaN, 구/동 코드와 법정동 코드는 -1로 둔다.
+    """
+
+    house_platform_id: np.ndarray  # int64
+    snapshot_digest: np.ndarray  # V32 (sha256)
+    deposit: np.ndarray  # int32
+    monthly_rent: np.ndarray  # int32
+    manage_cost: np.ndarray  # int32
+    flags: np.ndarray  # uint8
+    options: np.ndarray  # uint8 (option_bitmap_index.OPTION_ATTRIBUTES 비트)
+    legal_dong_cd: np.ndarray  # int64 (pnu_cd 앞 10자리)
+    gu_code: np.ndarray  # int16
+    dong_code: np.ndarray  # int16
+    lat: np.ndarray  # float32
+    lng: np.ndarray  # float32
+    estimated_move_in_cost: np.ndarray  # int32 (최신 가격 관측치)
+    monthly_cost_est: np.ndarray  # int32 (최신 가격 관측치)
+
+    @classmethod
+    def empty(cls) -> "CandidateColumns":
+        return cls(
+            **{
+                field.name: np.empty(0, dtype=dtype)
+                for field, dtype in zip(dataclasses.fields(cls), _COLUMN_DTYPES)
+            }
+        )
+
+    def __len__(self) -> int:
+        return int(self.house_platform_id.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, field.name).nbytes for field in dataclasses.fields(self))
+
+    def take(self, indexer) -> "CandidateColumns":
+        return CandidateColumns(
+            **{
+                field.name: getattr(self, field.name)[indexer]
+                for field in dataclasses.fields(self)
+            }
+        )
+
+    def concat(self, other: "CandidateColumns") -> "CandidateColumns":
+        return CandidateColumns(
+            **{
+                field.name: np.concatenate(
+                    (getattr(self, field.name), getattr(other, field.name))
+                )
+                for field in dataclasses.fields(self)
+            }
+        )
+
+
+_COLUMN_DTYPES = (
+    np.int64,
+    np.dtype("V32"),
+    np.int32,
+    np.int32,
+    np.int32,
+    np.uint8,
+    np.uint8,
+    np.int64,
+    np.int16,
+    np.int16,
+    np.float32,
+    np.float32,
+    np.int32,
+    np.int32,
+)
+
+
+@dataclass(frozen=True)
+class _DistanceColumn:
+    """대학 하나의 최신 통학 시간. house_platform_id 오름차순."""
+
+    house_platform_id: np.ndarray  # int64
+    # SQL(double precision)과 같은 경계 판정을 위해 float64로 둔다.
+    minutes_to_school: np.ndarray  # float64
+
+    @property
+    def nbytes(self) -> int:
+        return self.house_platform_id.nbytes + self.minutes_to_school.nbytes
+
+
+@dataclass(frozen=True)
+class _SnapshotState:
+    columns: CandidateColumns
+    # columns.options에서 만든 옵션 비트셋. 행이 바뀌면 다시 만든다.
+    option_index: OptionBitmapIndex
+    distances: dict[int, _DistanceColumn]
+    # hex가 아닌 snapshot_id(house_platform_id -> 원문).
+    raw_snapshot_ids: dict[int, str]
+    watermark: CandidateSnapshotWatermark | None
+
+
+def _empty_state() -> _SnapshotState:
+    columns = CandidateColumns.empty()
+    return _SnapshotState(
+        columns=columns,
+        option_index=OptionBitmapIndex.from_option_bits(columns.options),
+        distances={},
+        raw_snapshot_ids={},
+        watermark=None,
+    )
+
+
+class CandidateSnapshot:
+    """노출 가능한 매물과 최신 관측치를 NumPy 열로 들고 있는 프로세스 내 스냅샷.
+
+    fetch_candidates_within_budget 쿼리와 같은 조건을 불리언 마스크로 평가한다.
+    갱신은 새 열 묶음을 만든 뒤 참조 하나를 바꿔 끼우므로, 조회 중인 요청은
+    잠금 없이 일관된 상태를 본다. 쓰기끼리는 잠금으로 직렬화한다.
+    """
+
+    def __init__(self):
+        self._state = _empty_state()
+        self._write_lock = threading.Lock()
+        # 구/동 이름 사전은 추가만 하므로 조회 측이 잠금 없이 읽어도 된다.
+        self._gu_codes: dict[str, int] = {}
+        self._dong_codes: dict[str, int] = {}
+
+    @property
+    def watermark(self) -> CandidateSnapshotWatermark | None:
+        """마지막으로 반영한 워터마크. None이면 아직 적재하지 않은 상태다."""
+        return self._state.watermark
+
+    @property
+    def is_ready(self) -> bool:
+        return self._state.watermark is not None
+
+    def __len__(self) -> int:
+        return len(self._state.columns)
+
+    @property
+    def nbytes(self) -> int:
+        state = self._state
+        return (
+            state.columns.nbytes
+            + state.option_index.nbytes
+            + sum(column.nbytes for column in state.distances.values())
+        )
+
+    def house_platform_ids(self) -> np.ndarray:
+        return self._state.columns.house_platform_id
+
+    def reset(self) -> None:
+        """전체 재적재 전에 비운다. 적재가 끝날 때까지 조회는 DB로 돌아간다."""
+        with self._write_lock:
+            self._state = _empty_state()
+
+    def apply(
+        self,
+        houses: Iterable[CandidateSnapshotHouse] = (),
+        prices: Iterable[CandidateSnapshotPrice] = (),
+        distances: Iterable[CandidateSnapshotDistance] = (),
+        watermark: CandidateSnapshotWatermark | None = None,
+        deleted_ids: Iterable[int] = (),
+    ) -> tuple[int, int]:
+        """변경분을 반영하고 (upsert 수, 제거 수)를 돌려준다.
+
+        금지 매물과 deleted_ids(DB에서 지워진 매물)는 제거하고 나머지는 덮어쓴다. 가격/거리는 같은 배치의 매물을
+        반영한 뒤 스냅샷에 있는 매물에만 적용한다. 같은 변경을 두 번 반영해도
+        결과가 같다. watermark를 주면 반영 완료로 표시한다.
+        """
+        with self._write_lock:
+            state = self._state
+            columns = state.columns
+            raw_snapshot_ids = state.raw_snapshot_ids
+
+            latest: dict[int, CandidateSnapshotHouse] = {}
+            for house in houses:
+                latest[int(house.house_platform_id)] = house
+            removed_ids = np.union1d(
+                np.fromiter(
+                    (house_id for house_id, house in latest.items() if house.is_banned),
+                    dtype=np.int64,
+                ),
+                np.fromiter(
+                    (int(house_id) for house_id in deleted_ids if house_id not in latest),
+                    dtype=np.int64,
+                ),
+            )
+            upserts = [house for house in latest.values() if not house.is_banned]
+            upsert_ids = np.fromiter(
+                (house.house_platform_id for house in upserts),
+                dtype=np.int64,
+                count=len(upserts),
+            )
+
+            removed_count = 0
+            if removed_ids.size or upserts:
+                batch = self._build_columns(upserts)
+                # 덮어쓰는 매물의 가격 관측치는 유지한다.
+                position, exists = _locate(columns.house_platform_id, upsert_ids)
+                if exists.any():
+                    kept = position[exists]
+                    batch.estimated_move_in_cost[exists] = (
+                        columns.estimated_move_in_cost[kept]
+                    )
+                    batch.monthly_cost_est[exists] = columns.monthly_cost_est[kept]
+                    batch.flags[exists] |= columns.flags[kept] & FLAG_HAS_PRICE
+                dropped = np.isin(
+                    columns.house_platform_id,
+                    np.concatenate((removed_ids, upsert_ids)),
+                )
+                removed_count = int(
+                    np.isin(columns.house_platform_id, removed_ids).sum()
+                )
+                merged = columns.take(~dropped).concat(batch)
+                columns = merged.take(
+                    np.argsort(merged.house_platform_id, kind="stable")
+                )
+                raw_snapshot_ids = self._merge_raw_snapshot_ids(
+                    raw_snapshot_ids, removed_ids, upserts
+                )
+
+            option_index = state.option_index
+            if columns is not state.columns:
+                option_index = OptionBitmapIndex.from_option_bits(columns.options)
+            columns = self._apply_prices(columns, prices)
+            distance_columns = self._apply_distances(
+                state.distances, distances, removed_ids
+            )
+            self._state = _SnapshotState(
+                columns=columns,
+                option_index=option_index,
+                distances=distance_columns,
+                raw_snapshot_ids=raw_snapshot_ids,
+                watermark=watermark or state.watermark,
+            )
+            return len(upserts), removed_count
+
+    def filter(
+        self,
+        criteria: FilterCandidateCriteria,
+        near_university_id: int | None = None,
+        max_commute_minutes: float | None = None,
+    ) -> list[FilterCandidate] | None:
+        """fetch_candidates_within_budget와 같은 조건으로 후보를 ID 순으로 고른다.
+
+        스냅샷으로 판정할 수 없는 조건(주소 문자열 비교가 필요한 선호 지역)이거나
+        아직 적재하지 않았으면 None을 돌려주고 호출 측이 DB로 조회한다.
+        """
+        state = self._state
+        if state.watermark is None:
+            return None
+        region = criteria.region_filter
+        if region is not None and region.address_tokens:
+            return None
+        if region is None and extract_region_token(criteria.preferred_region):
+            return None
+
+        columns = state.columns
+        mask = (columns.flags & FLAG_HAS_PRICE) != 0
+        if criteria.max_deposit_limit is not None:
+            mask &= columns.estimated_move_in_cost <= _clip_int32(
+                criteria.max_deposit_limit
+            )
+        if criteria.max_rent_limit is not None:
+            mask &= columns.monthly_cost_est <= _clip_int32(criteria.max_rent_limit)
+        mask &= self._price_type_mask(columns, criteria.price_type)
+        if criteria.required_options:
+            mask &= state.option_index.mask(criteria.required_options)
+        if region is not None:
+            mask &= self._region_mask(columns, region)
+        if near_university_id is not None:
+            mask &= self._distance_mask(
+                columns,
+                state.distances.get(int(near_university_id)),
+                max_commute_minutes,
+            )
+        return [
+            self._to_candidate(state, int(index)) for index in np.flatnonzero(mask)
+        ]
+
+    def _build_columns(self, houses: list[CandidateSnapshotHouse]) -> CandidateColumns:
+        count = len(houses)
+        flags = np.zeros(count, dtype=np.uint8)
+        options = np.zeros(count, dtype=np.uint8)
+        legal_dong_cd = np.full(count, -1, dtype=np.int64)
+        digest = np.zeros(count, dtype=np.dtype("V32"))
+        for index, house in enumerate(houses):
+            sales_type = (house.sales_type or "").lower()
+            flag = 0
+            if "전세" in sales_type:
+                flag |= FLAG_JEONSE
+            if "월세" in sales_type:
+                flag |= FLAG_MONTHLY
+            if house.pnu_cd is not None:
+                flag |= FLAG_HAS_PNU
+                code = house.pnu_cd[:10]
+                if len(code) == 10 and code.isdigit():
+                    legal_dong_cd[index] = int(code)
+            snapshot_bytes = _hex_digest(house.snapshot_id)
+            if snapshot_bytes is not None:
+                flag |= FLAG_HEX_SNAPSHOT
+                digest[index] = snapshot_bytes
+            flags[index] = flag
+            options[index] = option_bits(
+                house.built_in,
+                near_univ=house.near_univ,
+                near_transport=house.near_transport,
+                near_mart=house.near_mart,
+                has_elevator=house.has_elevator,
+                can_park=house.can_park,
+            )
+        return CandidateColumns(
+            house_platform_id=np.fromiter(
+                (house.house_platform_id for house in houses), np.int64, count
+            ),
+            snapshot_digest=digest,
+            deposit=_int32_column(house.deposit for house in houses),
+            monthly_rent=_int32_column(house.monthly_rent for house in houses),
+            manage_cost=_int32_column(house.manage_cost for house in houses),
+            flags=flags,
+            options=options,
+            legal_dong_cd=legal_dong_cd,
+            gu_code=self._name_codes(self._gu_codes, (house.gu_nm for house in houses)),
+            dong_code=self._name_codes(
+                self._dong_codes, (house.dong_nm for house in houses)
+            ),
+            lat=_float32_column(house.lat for house in houses),
+            lng=_float32_column(house.lng for house in houses),
+            estimated_move_in_cost=np.full(count, _NULL_INT32, dtype=np.int32),
+            monthly_cost_est=np.full(count, _NULL_INT32, dtype=np.int32),
+        )
+
+    @staticmethod
+    def _name_codes(codes: dict[str, int], names: Iterable[str | None]) -> np.ndarray:
+        values = []
+        for name in names:
+            if name is None:
+                values.append(-1)
+                continue
+            code = codes.get(name)
+            if code is None:
+                code = len(codes)
+                if code > _MAX_NAME_CODE:
+                    raise ValueError("구/동 이름 사전이 int16 범위를 넘었습니다.")
+                codes[name] = code
+            values.append(code)
+        return np.array(values, dtype=np.int16)
+
+    @staticmethod
+    def _merge_raw_snapshot_ids(
+        raw_snapshot_ids: dict[int, str],
+        removed_ids: np.ndarray,
+        upserts: list[CandidateSnapshotHouse],
+    ) -> dict[int, str]:
+        changed_ids = set(removed_ids.tolist()) | {
+            int(house.house_platform_id) for house in upserts
+        }
+        additions = {
+            int(house.house_platform_id): house.snapshot_id
+            for house in upserts
+            if house.snapshot_id is not None and _hex_digest(house.snapshot_id) is None
+        }
+        if not additions and not changed_ids.intersection(raw_snapshot_ids):
+            return raw_snapshot_ids
+        merged = {
+            house_id: snapshot_id
+            for house_id, snapshot_id in raw_snapshot_ids.items()
+            if house_id not in changed_ids
+        }
+        merged.update(additions)
+        return merged
+
+    @staticmethod
+    def _apply_prices(
+        columns: CandidateColumns, prices: Iterable[CandidateSnapshotPrice]
+    ) -> CandidateColumns:
+        latest = {int(price.house_platform_id): price for price in prices}
+        if not latest:
+            return columns
+        ids = np.fromiter(latest, dtype=np.int64, count=len(latest))
+        position, exists = _locate(columns.house_platform_id, ids)
+        if not exists.any():
+            return columns
+        rows = [latest[house_id] for house_id in ids[exists].tolist()]
+        kept = position[exists]
+        move_in = columns.estimated_move_in_cost.copy()
+        monthly = columns.monthly_cost_est.copy()
+        flags = columns.flags.copy()
+        move_in[kept] = _int32_column(row.estimated_move_in_cost for row in rows)
+        monthly[kept] = _int32_column(row.monthly_cost_est for row in rows)
+        flags[kept] |= FLAG_HAS_PRICE
+        return dataclasses.replace(
+            columns,
+            estimated_move_in_cost=move_in,
+            monthly_cost_est=monthly,
+            flags=flags,
+        )
+
+    @staticmethod
+    def _apply_distances(
+        current: dict[int, _DistanceColumn],
+        distances: Iterable[CandidateSnapshotDistance],
+        removed_ids: np.ndarray,
+    ) -> dict[int, _DistanceColumn]:
+        by_university: dict[int, dict[int, float]] = {}
+        for distance in distances:
+            by_university.setdefault(int(distance.university_id), {})[
+                int(distance.house_platform_id)
+            ] = float(distance.minutes_to_school)
+        if not by_university and not removed_ids.size:
+            return current
+        merged = dict(current)
+        for university_id in set(merged) | set(by_university):
+            column = merged.get(university_id)
+            updates = by_university.get(university_id, {})
+            ids = np.fromiter(updates, dtype=np.int64, count=len(updates))
+            minutes = np.fromiter(updates.values(), dtype=np.float64, count=len(updates))
+            if column is not None:
+                keep = ~np.isin(
+                    column.house_platform_id, np.concatenate((ids, removed_ids))
+                )
+                if keep.all() and not ids.size:
+                    continue
+                ids = np.concatenate((column.house_platform_id[keep], ids))
+                minutes = np.concatenate((column.minutes_to_school[keep], minutes))
+            order = np.argsort(ids, kind="stable")
+            merged[university_id] = _DistanceColumn(
+                house_platform_id=ids[order], minutes_to_school=minutes[order]
+            )
+        return merged
+
+    @staticmethod
+    def _price_type_mask(columns: CandidateColumns, price_type: str | None):
+        """_apply_price_type_filters와 같은 판정."""
+        if not price_type:
+            return True
+        is_jeonse = (columns.flags & FLAG_JEONSE) != 0
+        is_monthly = (columns.flags & FLAG_MONTHLY) != 0
+        has_rent = columns.monthly_rent != _NULL_INT32
+        price_key = price_type.upper()
+        if price_key == "JEONSE":
+            return is_jeonse
+        if price_key == "MONTHLY":
+            return is_monthly & has_rent
+        if price_key == "MIXED":
+            return is_jeonse | (is_monthly & has_rent)
+        return True
+
+    def _region_mask(self, columns: CandidateColumns, region: RegionFilter):
+        """_region_clause와 같은 판정. pnu_cd가 있으면 코드, 없으면 구/동 이름으로 비교한다."""
+        sigungu_codes = [int(code) for code in region.sigungu_codes if code.isdigit()]
+        legal_dong_codes = [
+            int(code) for code in region.legal_dong_codes if code.isdigit()
+        ]
+        code_match = np.isin(columns.legal_dong_cd, legal_dong_codes)
+        if sigungu_codes:
+            has_code = columns.legal_dong_cd >= 0
+            code_match |= has_code & np.isin(
+                columns.legal_dong_cd // 100000, sigungu_codes
+            )
+        gu_codes = [self._gu_codes[name] for name in region.gu_names if name in self._gu_codes]
+        dong_codes = [
+            self._dong_codes[name] for name in region.dong_names if name in self._dong_codes
+        ]
+        name_match = np.isin(columns.gu_code, gu_codes) | np.isin(
+            columns.dong_code, dong_codes
+        )
+        has_pnu = (columns.flags & FLAG_HAS_PNU) != 0
+        return np.where(has_pnu, code_match, name_match)
+
+    @staticmethod
+    def _distance_mask(
+        columns: CandidateColumns,
+        distance: _DistanceColumn | None,
+        max_commute_minutes: float | None,
+    ):
+        mask = np.zeros(len(columns), dtype=bool)
+        if distance is None:
+            return mask
+        ids = distance.house_platform_id
+        if max_commute_minutes is not None:
+            ids = ids[distance.minutes_to_school <= max_commute_minutes]
+        position, exists = _locate(columns.house_platform_id, ids)
+        mask[position[exists]] = True
+        return mask
+
+    @staticmethod
+    def _to_candidate(state: _SnapshotState, index: int) -> FilterCandidate:
+        columns = state.columns
+        house_platform_id = int(columns.house_platform_id[index])
+        if columns.flags[index] & FLAG_HEX_SNAPSHOT:
+            snapshot_id = columns.snapshot_digest[index].tobytes().hex()
+        else:
+            snapshot_id = state.raw_snapshot_ids.get(house_platform_id)
+        return FilterCandidate(
+            house_platform_id=house_platform_id,
+            snapshot_id=snapshot_id,
+            deposit=_nullable_int(columns.deposit[index]),
+            monthly_rent=_nullable_int(columns.monthly_rent[index]),
+            manage_cost=_nullable_int(columns.manage_cost[index]),
+        )
+
+
+def _locate(sorted_ids: np.ndarray, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """정렬된 sorted_ids에서 ids 위치와 존재 여부를 찾는다."""
+    position = np.searchsorted(sorted_ids, ids)
+    exists = position < sorted_ids.shape[0]
+    exists[exists] = sorted_ids[position[exists]] == ids[exists]
+    return position, exists
+
+
+def _hex_digest(snapshot_id: str | None) -> bytes | None:
+    """sha256 hex snapshot_id를 32바이트로 바꾼다. 원문으로 되돌릴 수 없으면 None."""
+    if snapshot_id is None or len(snapshot_id) != 64:
+        return None
+    try:
+        digest = bytes.fromhex(snapshot_id)
+    except ValueError:
+        return None
+    return digest if digest.hex() == snapshot_id else None
+
+
+def _int32_column(values: Iterable[int | None]) -> np.ndarray:
+    return np.array(
+        [_NULL_INT32 if value is None else _clip_int32(value) for value in values],
+        dtype=np.int32,
+    )
+
+
+def _float32_column(values: Iterable[float | None]) -> np.ndarray:
+    return np.array(
+        [np.nan if value is None else value for value in values], dtype=np.float32
+    )
+
+
+def _clip_int32(value) -> int:
+    return max(_NULL_INT32 + 1, min(_MAX_INT32, int(value)))
+
+
+def _nullable_int(value) -> int | None:
+    return None if value == _NULL_INT32 else int(value)
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
     ObservationScoreSource,
     StudentHouseScoreRecord,
@@ -8,6 +14,81 @@ from modules.student_house_decision_policy.domain.value_object.decision_policy_c
     DecisionPolicyConfig,
 )
 
+# 배치 계산에 쓰는 ObservationScoreSource의 수치 필드.
+_SOURCE_COLUMNS = (
+    "price_percentile",
+    "price_zscore",
+    "price_burden_nonlinear",
+    "essential_option_coverage",
+    "convenience_score",
+    "risk_probability_est",
+    "risk_severity_score",
+    "risk_nonlinear_penalty",
+    "distance_to_school_min",
+    "distance_percentile",
+    "distance_nonlinear_score",
+)
+
+# Python 3.12부터 float sum()은 Neumaier 보정 합산을 사용한다.
+# 배치 경로도 같은 합산 방식을 따라야 스칼라 경로와 반올림 결과가 같다.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+# 10배 값의 소수부가 0.5에서 이 범위 안이면 정확한 반올림 경로로 다시 계산한다.
+_ROUND_TIE_TOLERANCE = 1e-6
+
+
+@dataclass
+class ObservationScoreColumns:
+    """관측 지표를 열 단위 배열로 담는다. 값이 없으면 NaN이다."""
+
+    house_platform_ids: np.ndarray
+    price_percentile: np.ndarray
+    price_zscore: np.ndarray
+    price_burden_nonlinear: np.ndarray
+    essential_option_coverage: np.ndarray
+    convenience_score: np.ndarray
+    risk_probability_est: np.ndarray
+    risk_severity_score: np.ndarray
+    risk_nonlinear_penalty: np.ndarray
+    distance_to_school_min: np.ndarray
+    distance_percentile: np.ndarray
+    distance_nonlinear_score: np.ndarray
+
+    @classmethod
+    def from_sources(
+        cls, sources: Sequence[ObservationScoreSource]
+    ) -> "ObservationScoreColumns":
+        columns = {
+            field: np.array(
+                [
+                    np.nan if getattr(source, field) is None else getattr(source, field)
+                    for source in sources
+                ],
+                dtype=np.float64,
+            )
+            for field in _SOURCE_COLUMNS
+        }
+        return cls(
+            house_platform_ids=np.array(
+                [source.house_platform_id for source in sources], dtype=np.int64
+            ),
+            **columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.house_platform_ids)
+
+
+@dataclass
+class DecisionScoreBatch:
+    """배치 계산 결과. 세부 점수가 없으면(None) NaN이다."""
+
+    price_score: np.ndarray
+    option_score: np.ndarray
+    risk_score: np.ndarray
+    distance_score: np.ndarray
+    base_total_score: np.ndarray
+    is_student_recommended: np.ndarray
+
 
 class DecisionScoreCalculator:
     """관측 지표를 기반으로 점수를 계산한다."""
@@ -66,6 +147,136 @@ class DecisionScoreCalculator:
             policy_version=policy_version,
         )
 
+    def calculate_many(
+        self,
+        sources: Sequence[ObservationScoreSource],
+        observation_version: str,
+        policy_version: str,
+        columns: ObservationScoreColumns | None = None,
+    ) -> list[StudentHouseScoreRecord]:
+        """calculate_batch 결과를 calculate와 같은 레코드 목록으로 변환한다.
+
+        여러 정책을 같은 관측치로 계산할 때는 sources로 만든 columns를 넘겨
+        열 변환을 한 번만 한다.
+        """
+        if columns is None:
+            columns = ObservationScoreColumns.from_sources(sources)
+        batch = self.calculate_batch(columns)
+        price_scores = _to_optional_list(batch.price_score)
+        option_scores = _to_optional_list(batch.option_score)
+        risk_scores = _to_optional_list(batch.risk_score)
+        distance_scores = _to_optional_list(batch.distance_score)
+        total_scores = batch.base_total_score.tolist()
+        recommended = batch.is_student_recommended.tolist()
+        return [
+            StudentHouseScoreRecord(
+                house_platform_id=source.house_platform_id,
+                snapshot_id=source.snapshot_id,
+                price_score=price_scores[index],
+                option_score=option_scores[index],
+                risk_score=risk_scores[index],
+                distance_score=distance_scores[index],
+                base_total_score=total_scores[index],
+                is_student_recommended=recommended[index],
+                observation_version=observation_version,
+                policy_version=policy_version,
+            )
+            for index, source in enumerate(sources)
+        ]
+
+    def calculate_batch(self, columns: ObservationScoreColumns) -> DecisionScoreBatch:
+        """열 배열 전체를 한 번에 점수로 환산한다.
+
+        NaN은 스칼라 경로의 None과 같게 다룬다. 거리 percentile/비선형 점수의
+        NaN은 0으로 보고, 통학 시간이 NaN이면 시간 점수를 제외한다.
+        반올림과 합산 순서는 calculate와 동일해 결과가 정확히 같다.
+        """
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+            price_score = self._calculate_price_score_batch(columns)
+            option_score = self._calculate_option_score_batch(columns)
+            risk_score = self._calculate_risk_score_batch(columns)
+            distance_score = self._calculate_distance_score_batch(columns)
+        base_total_score = self.combine_total_score_batch(
+            price_score, risk_score, option_score, distance_score
+        )
+        return DecisionScoreBatch(
+            price_score=price_score,
+            option_score=option_score,
+            risk_score=risk_score,
+            distance_score=distance_score,
+            base_total_score=base_total_score,
+            is_student_recommended=base_total_score >= self.policy.threshold_base_total,
+        )
+
+    def _calculate_price_score_batch(
+        self, columns: ObservationScoreColumns
+    ) -> np.ndarray:
+        return _weighted_average_batch(
+            (
+                (_inverse_ratio_batch(columns.price_percentile), self._price_weights[0]),
+                (
+                    _zscore_to_score_batch(
+                        columns.price_zscore,
+                        self.policy.zscore_min,
+                        self.policy.zscore_max,
+                    ),
+                    self._price_weights[1],
+                ),
+                (
+                    _inverse_ratio_batch(columns.price_burden_nonlinear),
+                    self._price_weights[2],
+                ),
+            )
+        )
+
+    def _calculate_option_score_batch(
+        self, columns: ObservationScoreColumns
+    ) -> np.ndarray:
+        return _weighted_average_batch(
+            (
+                (
+                    _ratio_to_score_batch(columns.essential_option_coverage),
+                    self._option_weights[0],
+                ),
+                (_ratio_to_score_batch(columns.convenience_score), self._option_weights[1]),
+            )
+        )
+
+    def _calculate_risk_score_batch(
+        self, columns: ObservationScoreColumns
+    ) -> np.ndarray:
+        return _weighted_average_batch(
+            (
+                (_inverse_ratio_batch(columns.risk_probability_est), self._risk_weights[0]),
+                (_inverse_ratio_batch(columns.risk_severity_score), self._risk_weights[1]),
+                (
+                    _inverse_ratio_batch(columns.risk_nonlinear_penalty),
+                    self._risk_weights[2],
+                ),
+            )
+        )
+
+    def _calculate_distance_score_batch(
+        self, columns: ObservationScoreColumns
+    ) -> np.ndarray:
+        # 스칼라 경로의 _clamp01(None)/_ratio_to_score(None)처럼 NaN은 0으로 본다.
+        percentile = np.nan_to_num(columns.distance_percentile, nan=0.0)
+        nonlinear = _ratio_to_score_batch(columns.distance_nonlinear_score)
+        return _weighted_average_batch(
+            (
+                (
+                    _distance_time_to_score_batch(
+                        columns.distance_to_school_min,
+                        self.policy.distance_full_score_min,
+                        self.policy.distance_zero_score_min,
+                    ),
+                    self._distance_weights[0],
+                ),
+                (_inverse_ratio_batch(percentile), self._distance_weights[1]),
+                (np.where(np.isnan(nonlinear), 0.0, nonlinear), self._distance_weights[2]),
+            )
+        )
+
     def _calculate_price_score(
         self, source: ObservationScoreSource
     ) -> float | None:
@@ -172,6 +383,25 @@ class DecisionScoreCalculator:
             )
         )
 
+    def combine_total_score_batch(
+        self,
+        price_score: np.ndarray,
+        risk_score: np.ndarray,
+        option_score: np.ndarray,
+        distance_score: np.ndarray,
+    ) -> np.ndarray:
+        """_combine_total_score의 배열 버전. NaN 항목은 제외하고 결과가 정확히 같다."""
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+            total = _weighted_average_batch(
+                (
+                    (price_score, self._total_weights[0]),
+                    (risk_score, self._total_weights[1]),
+                    (option_score, self._total_weights[2]),
+                    (distance_score, self._total_weights[3]),
+                )
+            )
+        return np.where(np.isnan(total), 0.0, total)
+
     def _combine_total_score(
         self,
         price_score: float | None,
@@ -264,3 +494,122 @@ def _clamp_score(value: float | None) -> float:
     if value is None:
         return 0.0
     return max(0.0, min(100.0, round(float(value), 1)))
+
+
+def _to_optional_list(values: np.ndarray) -> list[float | None]:
+    return [None if value != value else value for value in values.tolist()]
+
+
+def _inverse_ratio_batch(values: np.ndarray) -> np.ndarray:
+    """(1 - clamp01(v)) * 100. NaN은 그대로 둔다."""
+    return (1.0 - np.maximum(0.0, np.minimum(1.0, values))) * 100.0
+
+
+def _ratio_to_score_batch(values: np.ndarray) -> np.ndarray:
+    normalized = np.where(values > 1.0, values / 100.0, values)
+    return _clamp_score_batch(normalized * 100.0)
+
+
+def _zscore_to_score_batch(
+    zscores: np.ndarray, min_z: float, max_z: float
+) -> np.ndarray:
+    if min_z >= max_z:
+        return np.where(np.isnan(zscores), np.nan, 50.0)
+    clamped = np.maximum(min_z, np.minimum(max_z, zscores))
+    return _clamp_score_batch((max_z - clamped) / (max_z - min_z) * 100.0)
+
+
+def _distance_time_to_score_batch(
+    distance_min: np.ndarray,
+    full_score_min: float,
+    zero_score_min: float,
+) -> np.ndarray:
+    ratio = (distance_min - full_score_min) / max(zero_score_min - full_score_min, 1.0)
+    score = _clamp_score_batch(100.0 - (ratio * 100.0))
+    score = np.where(distance_min >= zero_score_min, 0.0, score)
+    return np.where(distance_min <= full_score_min, 100.0, score)
+
+
+def _weighted_average_batch(
+    items: tuple[tuple[np.ndarray, float], ...]
+) -> np.ndarray:
+    """NaN 항목은 제외하고 _weighted_average와 같은 순서로 가중 평균을 계산한다."""
+    totals = []
+    weights = []
+    for values, weight in items:
+        present = ~np.isnan(values)
+        term = values * weight
+        term[~present] = 0.0
+        totals.append(term)
+        weights.append(present * weight)
+    total_weight = _sum_batch(weights)
+    average = _clamp_score_batch(_sum_batch(totals) / total_weight)
+    average[total_weight <= 0] = np.nan
+    return average
+
+
+def _sum_batch(terms: list[np.ndarray]) -> np.ndarray:
+    """내장 sum()과 같은 방식(순차 합 또는 Neumaier 보정 합)으로 더한다.
+
+    제외된 항목은 0.0으로 들어오며 어느 방식에서도 결과를 바꾸지 않는다.
+    """
+    if not _COMPENSATED_SUM:
+        total = np.zeros_like(terms[0])
+        for term in terms:
+            total += term
+        return total
+    total = np.zeros_like(terms[0])
+    compensation = np.zeros_like(total)
+    for term in terms:
+        partial = total + term
+        compensation += np.where(
+            np.abs(total) >= np.abs(term),
+            (total - partial) + term,
+            (term - partial) + total,
+        )
+        total = partial
+    finite = np.isfinite(compensation)
+    total[finite] += compensation[finite]
+    return total
+
+
+def _clamp_score_batch(values: np.ndarray) -> np.ndarray:
+    return np.maximum(0.0, np.minimum(100.0, _round1_batch(values)))
+
+
+def _round1_batch(values: np.ndarray) -> np.ndarray:
+    """round(value, 1)과 같은 결과를 내는 벡터 반올림.
+
+    np.round는 10배 값을 먼저 반올림해 경계값(예: 0.15)에서 결과가 달라질 수
+    있다. 10배 값의 소수부가 0.5 근처인 원소만 골라 정확한 경로로 다시 계산한다.
+    """
+    scaled = values * 10.0
+    rounded = np.rint(scaled)
+    distance = np.subtract(scaled, rounded, out=scaled)
+    np.abs(distance, out=distance)
+    distance -= 0.5
+    np.abs(distance, out=distance)
+    near_half = distance < _ROUND_TIE_TOLERANCE
+    rounded /= 10.0
+    indexes = np.flatnonzero(near_half)
+    if indexes.size:
+        rounded[indexes] = _round1_exact(values[indexes])
+    return rounded
+
+
+def _round1_exact(values: np.ndarray) -> np.ndarray:
+    """8x + 2x를 오차 없는 합(TwoSum)으로 계산해 10x의 정확한 값으로 반올림한다.
+
+    소수부가 정확히 0.5일 때만 짝수 쪽으로 올린다(round와 동일).
+    """
+    eight = values * 8.0
+    two = values * 2.0
+    scaled = eight + two
+    residual_two = scaled - eight
+    error = (eight - (scaled - residual_two)) + (two - residual_two)
+    floor = np.floor(scaled)
+    half_diff = (scaled - floor) - 0.5
+    tie = half_diff == 0.0
+    round_up = (half_diff > 0.0) | (tie & (error > 0.0))
+    round_up |= tie & (error == 0.0) & (np.fmod(floor, 2.0) != 0.0)
+    return (floor + round_up) / 10.0
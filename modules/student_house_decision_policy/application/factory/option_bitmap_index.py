@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from typing import Iterable
+
+import numpy as np
+
+# 후보 스냅샷 options 열의 비트 순서. 8개라 uint8 한 칸에 들어간다.
+OPTION_ATTRIBUTES = (
+    "aircon",
+    "fridge",
+    "washer",
+    "near_univ",
+    "near_transport",
+    "near_mart",
+    "elevator",
+    "parking",
+)
+OPTION_BITS = {name: 1 << index for index, name in enumerate(OPTION_ATTRIBUTES)}
+
+# house_platform_options.built_in 항목(ZigbangAdapter._extract_built_in) -> 속성.
+BUILT_IN_OPTIONS = {"에어컨": "aircon", "냉장고": "fridge", "세탁기": "washer"}
+
+# finder_request Y/N 필드 -> 속성.
+REQUEST_OPTION_FIELDS = {
+    "aircon_yn": "aircon",
+    "washer_yn": "washer",
+    "fridge_yn": "fridge",
+}
+
+
+def required_options_from_request(request) -> frozenset[str]:
+    """요구서의 Y/N 옵션 필드를 필수 속성 집합으로 바꾼다."""
+    return frozenset(
+        attribute
+        for field, attribute in REQUEST_OPTION_FIELDS.items()
+        if getattr(request, field, "N") == "Y"
+    )
+
+
+def parse_built_in(value: str | None) -> tuple[str, ...]:
+    """house_platform_options.built_in JSON 문자열을 항목 목록으로 바꾼다."""
+    if not value:
+        return ()
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return ()
+    if not isinstance(parsed, list):
+        return ()
+    return tuple(str(item) for item in parsed)
+
+
+def option_bits(
+    built_in: Iterable[str] = (),
+    near_univ: bool | None = None,
+    near_transport: bool | None = None,
+    near_mart: bool | None = None,
+    has_elevator: bool | None = None,
+    can_park: bool | None = None,
+) -> int:
+    """매물 한 건의 옵션 값을 options 비트로 접는다. None은 없음으로 본다."""
+    bits = 0
+    for name in built_in or ():
+        attribute = BUILT_IN_OPTIONS.get(name)
+        if attribute:
+            bits |= OPTION_BITS[attribute]
+    for attribute, value in (
+        ("near_univ", near_univ),
+        ("near_transport", near_transport),
+        ("near_mart", near_mart),
+        ("elevator", has_elevator),
+        ("parking", can_park),
+    ):
+        if value:
+            bits |= OPTION_BITS[attribute]
+    return bits
+
+
+class OptionBitmapIndex:
+    """옵션 속성별 행 비트셋.
+
+    스냅샷 행 위치를 비트 하나로 보는 비트셋을 속성마다 np.packbits로 압축해
+    둔다(100만 행에 속성당 125KB). 여러 속성 조건은 비트셋 AND 한 번으로 판정하므로
+    후보 수만큼 비교하지 않는다. 스냅샷 행이 바뀔 때마다 options 열에서 다시 만든다.
+    """
+
+    def __init__(self, bitsets: dict[str, np.ndarray], size: int):
+        self._bitsets = bitsets
+        self.size = size
+
+    @classmethod
+    def from_option_bits(cls, options: np.ndarray) -> "OptionBitmapIndex":
+        return cls(
+            {
+                attribute: np.packbits((options & bit) != 0)
+                for attribute, bit in OPTION_BITS.items()
+            },
+            int(options.shape[0]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(bitset.nbytes for bitset in self._bitsets.values())
+
+    def count(self, attribute: str) -> int:
+        return int(np.unpackbits(self._bitset(attribute), count=self.size).sum())
+
+    def mask(self, attributes: Iterable[str]) -> np.ndarray:
+        """모든 속성을 갖춘 행의 불리언 마스크. 속성이 없으면 전부 True."""
+        bitsets = [self._bitset(attribute) for attribute in attributes]
+        if not bitsets:
+            return np.ones(self.size, dtype=bool)
+        packed = bitsets[0]
+        for bitset in bitsets[1:]:
+            packed = packed & bitset
+        return np.unpackbits(packed, count=self.size).astype(bool)
+
+    def _bitset(self, attribute: str) -> np.ndarray:
+        try:
+            return self._bitsets[attribute]
+        except KeyError:
+            raise ValueError(f"지원하지 않는 옵션 속성입니다: {attribute}") from None
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreSummary,
+)
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+# DecisionScoreCalculator.combine_total_score_batch 인자 순서.
+_SUB_SCORE_FIELDS = ("price_score", "risk_score", "option_score", "distance_score")
+
+
+@dataclass
+class PolicyRanking:
+    """정책 변형 1개의 상위 K 결과."""
+
+    house_platform_ids: np.ndarray
+    scores: np.ndarray
+    recommended_count: int
+
+
+class PolicyWhatIfRanker:
+    """세부 점수 행렬을 한 번 만들고 여러 정책을 한 번에 재랭킹한다."""
+
+    def __init__(self, scores: Sequence[StudentHouseScoreSummary]):
+        self.house_platform_ids, self.sub_scores = sub_score_matrix(scores)
+
+    @classmethod
+    def from_columns(
+        cls, house_platform_ids: np.ndarray, sub_scores: np.ndarray
+    ) -> "PolicyWhatIfRanker":
+        """이미 만든 ID 배열과 (후보 수, 4) 세부 점수 행렬로 만든다."""
+        ranker = cls.__new__(cls)
+        ranker.house_platform_ids = np.asarray(house_platform_ids, dtype=np.int64)
+        ranker.sub_scores = np.asarray(sub_scores, dtype=np.float64).reshape(
+            len(ranker.house_platform_ids), len(_SUB_SCORE_FIELDS)
+        )
+        return ranker
+
+    def total_scores(self, policies: Sequence[DecisionPolicyConfig]) -> np.ndarray:
+        """정책별 총점 행렬 (후보 수, 정책 수)을 계산한다.
+
+        총점은 DecisionScoreCalculator의 배치 경로로 계산해 round(x, 1) 반올림과
+        합산 순서까지 점수 계산기와 정확히 같다.
+        """
+        totals = np.empty((len(self.house_platform_ids), len(policies)))
+        columns = self.sub_scores.T
+        for index, policy in enumerate(policies):
+            totals[:, index] = DecisionScoreCalculator(
+                policy
+            ).combine_total_score_batch(*columns)
+        return totals
+
+    def rank(self, policies: Sequence[DecisionPolicyConfig]) -> list[PolicyRanking]:
+        """정책별 threshold 이상 후보를 총점 내림차순으로 top_k 만큼 고른다."""
+        if not policies:
+            return []
+        totals = self.total_scores(policies)
+        thresholds = np.array(
+            [policy.threshold_base_total for policy in policies], dtype=np.float64
+        )
+        eligible = totals >= thresholds[np.newaxis, :]
+        recommended_counts = eligible.sum(axis=0)
+
+        # 총점은 소수 첫째 자리로 반올림돼 있으므로 정수 키로 바꿀 수 있다.
+        # 동점은 후보 입력 순서를 유지하도록(추천 유스케이스의 안정 정렬과 동일)
+        # 앞선 후보일수록 큰 보조 키를 더해 키를 유일하게 만든다.
+        size = len(self.house_platform_ids)
+        tie_breaker = np.arange(size - 1, -1, -1, dtype=np.int64)[:, np.newaxis]
+        keys = np.rint(totals * 10).astype(np.int64) * size + tie_breaker
+        keys = np.where(eligible, keys, -1)
+
+        # 전체 정렬 대신 최대 top_k 만큼만 부분 선택한 뒤 그 안에서 정렬한다.
+        max_k = min(max(policy.top_k for policy in policies), size)
+        if max_k <= 0:
+            order = np.zeros((0, len(policies)), dtype=np.int64)
+        else:
+            selected = np.argpartition(-keys, max_k - 1, axis=0)[:max_k]
+            selected_keys = np.take_along_axis(keys, selected, axis=0)
+            order = np.take_along_axis(
+                selected, np.argsort(-selected_keys, axis=0), axis=0
+            )
+
+        rankings = []
+        for index, policy in enumerate(policies):
+            count = int(min(policy.top_k, recommended_counts[index], max_k))
+            top = order[:count, index]
+            rankings.append(
+                PolicyRanking(
+                    house_platform_ids=self.house_platform_ids[top],
+                    scores=totals[top, index],
+                    recommended_count=int(recommended_counts[index]),
+                )
+            )
+        return rankings
+
+
+def sub_score_matrix(
+    scores: Sequence[StudentHouseScoreSummary],
+) -> tuple[np.ndarray, np.ndarray]:
+    """점수 요약을 (후보 수,) ID 배열과 (후보 수, 4) 세부 점수 행렬로 바꾼다.
+
+    값이 없으면 NaN으로 두고 총점 계산에서 제외한다.
+    """
+    house_platform_ids = np.array(
+        [score.house_platform_id for score in scores], dtype=np.int64
+    )
+    sub_scores = np.array(
+        [
+            [
+                np.nan if getattr(score, field) is None else getattr(score, field)
+                for field in _SUB_SCORE_FIELDS
+            ]
+            for score in scores
+        ],
+        dtype=np.float64,
+    ).reshape(len(scores), len(_SUB_SCORE_FIELDS))
+    return house_platform_ids, sub_scores
+
+
+def pairwise_jaccard(rankings: Sequence[PolicyRanking]) -> np.ndarray:
+    """top-k 집합 간 Jaccard 유사도 행렬을 계산한다."""
+    if not rankings:
+        return np.zeros((0, 0))
+    universe = np.unique(
+        np.concatenate([ranking.house_platform_ids for ranking in rankings])
+    )
+    membership = np.array(
+        [np.isin(universe, ranking.house_platform_ids) for ranking in rankings],
+        dtype=np.float64,
+    ).reshape(len(rankings), len(universe))
+    intersection = membership @ membership.T
+    sizes = membership.sum(axis=1)
+    union = sizes[:, np.newaxis] + sizes[np.newaxis, :] - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 둘 다 비어 있으면 같은 결과로 본다.
+        return np.where(union > 0, intersection / union, 1.0)
+
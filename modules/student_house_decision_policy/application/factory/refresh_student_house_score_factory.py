@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from infrastructure.db.postgres import SessionLocal, engine
+from infrastructure.db.session_helper import open_session
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import (
+    StudentRecommendationFeatureObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    RefreshShardCheckpoint,
+    RefreshStudentHouseScoreCommand,
+)
+from modules.student_house_decision_policy.application.usecase.parallel_refresh_student_house_score import (
+    ParallelRefreshStudentHouseScoreService,
+)
+from modules.student_house_decision_policy.application.usecase.refresh_student_house_score import (
+    DEFAULT_CHUNK_SIZE,
+    RefreshStudentHouseScoreService,
+)
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import (
+    DirtyHouseRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.refresh_checkpoint_repository import (
+    RefreshCheckpointRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
+    StudentHouseScoreRepository,
+)
+from modules.university.adapter.output.university_repository import (
+    UniversityRepository,
+)
+
+
+def build_refresh_student_house_score_service(
+    session,
+    session_factory=SessionLocal,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    recommendation_cache: RecommendationResultCachePort | None = None,
+) -> RefreshStudentHouseScoreService:
+    """DB 저장소를 조립한 점수 갱신 서비스를 만든다. session은 호출자가 닫는다."""
+    return RefreshStudentHouseScoreService(
+        house_platform_repo=HousePlatformCandidateRepository(session_factory),
+        feature_observation_repo=StudentRecommendationFeatureObservationRepository(
+            session_factory
+        ),
+        price_observation_repo=StudentRecommendationPriceObservationRepository(
+            session
+        ),
+        distance_observation_repo=StudentRecommendationDistanceObservationRepository(
+            session
+        ),
+        university_repo=UniversityRepository(session_factory),
+        student_house_repo=StudentHouseScoreRepository(session_factory),
+        recommendation_cache=recommendation_cache,
+        chunk_size=chunk_size,
+        dirty_house_repo=DirtyHouseRepository(session_factory),
+    )
+
+
+def run_refresh_shard(
+    command: RefreshStudentHouseScoreCommand,
+    checkpoint: RefreshShardCheckpoint,
+    chunk_size: int,
+) -> RefreshShardCheckpoint:
+    """워커 프로세스에서 샤드 1개를 처리한다(프로세스 풀에서 pickle 가능한 최상위 함수)."""
+    session, generator = open_session(SessionLocal)
+    try:
+        service = build_refresh_student_house_score_service(
+            session, chunk_size=chunk_size
+        )
+        return service.refresh_shard(
+            command, checkpoint, RefreshCheckpointRepository(SessionLocal)
+        )
+    finally:
+        if generator:
+            generator.close()
+        else:
+            session.close()
+
+
+def init_refresh_worker() -> None:
+    """fork된 워커가 부모 프로세스의 DB 연결을 공유하지 않도록 풀을 비운다."""
+    engine.dispose(close=False)
+
+
+def build_parallel_refresh_student_house_score_service(
+    recommendation_cache: RecommendationResultCachePort | None = None,
+) -> ParallelRefreshStudentHouseScoreService:
+    """프로세스 풀로 샤드를 실행하는 병렬 점수 갱신 서비스를 만든다."""
+    return ParallelRefreshStudentHouseScoreService(
+        house_platform_repo=HousePlatformCandidateRepository(SessionLocal),
+        checkpoint_repo=RefreshCheckpointRepository(SessionLocal),
+        shard_runner=run_refresh_shard,
+        recommendation_cache=recommendation_cache,
+        worker_initializer=init_refresh_worker,
+    )
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import csv
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    RegionFilter,
+)
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    extract_region_token,
+)
+
+# 시/도 약칭 -> legal_dong.csv 표기.
+_SIDO_ALIASES = {
+    "서울시": "서울특별시",
+    "부산시": "부산광역시",
+    "대구시": "대구광역시",
+    "인천시": "인천광역시",
+    "광주시": "광주광역시",
+    "대전시": "대전광역시",
+    "울산시": "울산광역시",
+    "세종시": "세종특별자치시",
+    "제주도": "제주특별자치도",
+}
+
+
+class RegionDictionary:
+    """legal_dong.csv 기반 선호 지역 사전.
+
+    선호 지역 문자열을 시군구 코드(5자리)/법정동 코드(10자리)로 정규화한다.
+    매물의 pnu_cd 앞자리가 곧 법정동 코드이므로 코드 비교로 지역을 판정한다.
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, str]]):
+        """rows는 폐지되지 않은 (법정동코드, 법정동명) 목록이다."""
+        self._sigungu_by_name: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        self._dong_by_name: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        self._sigungu_codes_by_prefix: dict[str, set[str]] = defaultdict(set)
+        self._dong_codes_by_prefix: dict[str, set[str]] = defaultdict(set)
+        sigungu_names: dict[str, str] = {}
+        for code, name in rows:
+            if len(code) != 10 or code[2:] == "00000000":
+                # 시/도 단위는 범위가 넓어 주소 문자열 비교로 둔다.
+                continue
+            short_name = name.split()[-1]
+            if code[5:] == "00000":
+                self._sigungu_by_name[short_name].append((code[:5], name))
+                sigungu_names[code[:5]] = name
+            else:
+                self._dong_by_name[short_name].append((code, name))
+                # 읍/면/동 코드로 하위 리까지 묶는다.
+                self._dong_codes_by_prefix[code[:8]].add(code)
+        # 일반구가 있는 시(예: 수원시)는 하위 구 코드까지 묶는다.
+        for code, name in sigungu_names.items():
+            self._sigungu_codes_by_prefix[name].add(code)
+            parent = name.rsplit(" ", 1)[0]
+            if parent != name:
+                self._sigungu_codes_by_prefix[parent].add(code)
+        self._sigungu_names = sigungu_names
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> "RegionDictionary":
+        with csv_path.open("r", encoding="cp949") as file:
+            reader = csv.reader(file)
+            header = next(reader, None) or []
+            code_idx = _index_of(header, "법정동코드", 0)
+            name_idx = _index_of(header, "법정동명", 1)
+            active_idx = _index_of(header, "폐지여부", None)
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                if active_idx is not None and row[active_idx].strip() != "존재":
+                    continue
+                try:
+                    code = row[code_idx].strip()
+                    name = row[name_idx].strip()
+                except IndexError:
+                    continue
+                if code and name:
+                    rows.append((code, name))
+        return cls(rows)
+
+    def resolve(self, preferred_region: str | None) -> RegionFilter | None:
+        """쉼표로 구분된 선호 지역을 코드 필터로 바꾼다.
+
+        각 항목은 마지막 토큰(구/시/군 또는 동/읍/면/리)으로 찾고 앞 토큰으로
+        상위 지역을 좁힌다. 사전에서 찾지 못한 항목은 기존처럼 주소 문자열로 비교한다.
+        """
+        if not preferred_region:
+            return None
+        sigungu_codes: set[str] = set()
+        legal_dong_codes: set[str] = set()
+        gu_names: set[str] = set()
+        dong_names: set[str] = set()
+        address_tokens: list[str] = []
+        for entry in preferred_region.split(","):
+            tokens = entry.split()
+            if not tokens:
+                continue
+            last, parents = tokens[-1], tokens[:-1]
+            sigungu_matches = _filter_by_parents(
+                self._sigungu_by_name.get(last, []), parents
+            )
+            dong_matches = _filter_by_parents(self._dong_by_name.get(last, []), parents)
+            if sigungu_matches:
+                for code, name in sigungu_matches:
+                    sigungu_codes.update(self._sigungu_codes_by_prefix[name])
+                    gu_names.update(
+                        self._sigungu_names[child].split()[-1]
+                        for child in self._sigungu_codes_by_prefix[name]
+                    )
+            elif dong_matches:
+                for code, _ in dong_matches:
+                    legal_dong_codes.update(
+                        self._dong_codes_by_prefix[code[:8]]
+                        if code[8:] == "00"
+                        else {code}
+                    )
+                dong_names.add(last)
+            else:
+                token = extract_region_token(entry)
+                if token:
+                    address_tokens.append(token)
+        if not (sigungu_codes or legal_dong_codes or address_tokens):
+            return None
+        return RegionFilter(
+            sigungu_codes=frozenset(sigungu_codes),
+            legal_dong_codes=frozenset(legal_dong_codes),
+            gu_names=frozenset(gu_names),
+            dong_names=frozenset(dong_names),
+            address_tokens=tuple(address_tokens),
+        )
+
+
+@lru_cache(maxsize=1)
+def load_region_dictionary() -> RegionDictionary | None:
+    """프로젝트 루트의 legal_dong.csv를 한 번만 읽는다. 파일이 없으면 None."""
+    current = Path(__file__).resolve()
+    for parent in current.parents:
+        csv_path = parent / "legal_dong.csv"
+        if csv_path.exists():
+            return RegionDictionary.from_csv(csv_path)
+    return None
+
+
+def _filter_by_parents(
+    matches: list[tuple[str, str]], parents: list[str]
+) -> list[tuple[str, str]]:
+    """앞 토큰(시/도, 시/군/구)이 모두 지역명에 포함된 후보만 남긴다."""
+    if not parents:
+        return matches
+    filtered = []
+    for code, name in matches:
+        name_tokens = name.split()[:-1]
+        if all(
+            any(
+                name_token == parent
+                or name_token.startswith(parent)
+                or _SIDO_ALIASES.get(parent) == name_token
+                for name_token in name_tokens
+            )
+            for parent in parents
+        ):
+            filtered.append((code, name))
+    return filtered
+
+
+def _index_of(header: list[str], name: str, default: int | None) -> int | None:
+    try:
+        return header.index(name)
+    except ValueError:
+        return default
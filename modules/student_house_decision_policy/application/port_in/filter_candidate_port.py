@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    CandidatePool,
     FilterCandidateCommand,
     FilterCandidateResult,
 )
@@ -15,3 +16,11 @@ class FilterCandidatePort(ABC):
     def execute(self, command: FilterCandidateCommand) -> FilterCandidateResult:
         """조건을 기준으로 후보를 선별한다."""
         raise NotImplementedError
+
+    def load_candidate_pool(self, include_distance: bool = True) -> CandidatePool:
+        """여러 요구서가 공유할 후보 풀과 관측치를 한 번에 적재한다."""
+        raise NotImplementedError
+
+    def filter_from_pool(self, request, pool: CandidatePool) -> FilterCandidateResult:
+        """미리 적재한 후보 풀에서 요구서 조건으로 후보를 선별한다."""
+        raise NotImplementedError
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ParallelRefreshStudentHouseScoreCommand,
+    RefreshStudentHouseScoreResult,
+)
+
+
+class ParallelRefreshStudentHouseScorePort(ABC):
+    """샤드 병렬 점수 갱신 입력 포트."""
+
+    @abstractmethod
+    def execute(
+        self, command: ParallelRefreshStudentHouseScoreCommand
+    ) -> RefreshStudentHouseScoreResult:
+        """샤드별로 점수를 갱신하고 전체 결과를 합쳐 반환한다."""
+        raise NotImplementedError
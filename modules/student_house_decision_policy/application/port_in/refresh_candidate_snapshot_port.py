@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    RefreshCandidateSnapshotCommand,
+    RefreshCandidateSnapshotResult,
+)
+
+
+class RefreshCandidateSnapshotPort(ABC):
+    """후보 스냅샷 갱신 입력 포트."""
+
+    @abstractmethod
+    def execute(
+        self, command: RefreshCandidateSnapshotCommand
+    ) -> RefreshCandidateSnapshotResult:
+        """워터마크 이후 변경분을 후보 스냅샷에 반영한다."""
+        raise NotImplementedError
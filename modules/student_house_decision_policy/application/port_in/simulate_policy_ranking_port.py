@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from modules.student_house_decision_policy.application.dto.policy_simulation_dto import (
+    SimulatePolicyRankingCommand,
+    SimulatePolicyRankingResult,
+)
+
+
+class SimulatePolicyRankingPort(ABC):
+    """정책 what-if 재랭킹 입력 포트."""
+
+    @abstractmethod
+    def execute(
+        self, command: SimulatePolicyRankingCommand
+    ) -> SimulatePolicyRankingResult:
+        """저장된 점수로 정책 변형별 상위 K를 계산한다."""
+        raise NotImplementedError
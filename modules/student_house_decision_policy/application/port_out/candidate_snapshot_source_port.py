@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    CandidateSnapshotDistance,
+    CandidateSnapshotHouse,
+    CandidateSnapshotPrice,
+    CandidateSnapshotWatermark,
+)
+
+
+class CandidateSnapshotSourcePort(ABC):
+    """후보 스냅샷 적재 원본 Port."""
+
+    @abstractmethod
+    def fetch_watermark(self) -> CandidateSnapshotWatermark:
+        """매물/가격/거리 테이블의 현재 최대 변경 시각을 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_houses(
+        self,
+        changed_since: datetime | None,
+        after_id: int | None,
+        limit: int,
+    ) -> Sequence[CandidateSnapshotHouse]:
+        """changed_since 이후 변경된 매물을 ID 순으로 limit건 조회한다.
+
+        changed_since가 None이면 전체 매물을 조회한다. 금지 매물도 포함해
+        스냅샷에서 제거할 수 있게 한다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_house_ids(self) -> Sequence[int]:
+        """DB에 남아 있는 전체 매물 ID를 조회한다. 삭제된 매물을 찾는 데 쓴다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_price_changed_ids(
+        self, changed_since: datetime | None
+    ) -> Sequence[int]:
+        """changed_since 이후 가격 관측치가 계산된 매물 ID를 조회한다. None이면 전체."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_distance_changed_ids(
+        self, changed_since: datetime | None
+    ) -> Sequence[int]:
+        """changed_since 이후 거리 관측치가 계산된 매물 ID를 조회한다. None이면 전체."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_latest_prices(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[CandidateSnapshotPrice]:
+        """매물별 최신 가격 관측치를 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_latest_distances(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[CandidateSnapshotDistance]:
+        """매물-대학별 최신 거리 관측치를 조회한다."""
+        raise NotImplementedError
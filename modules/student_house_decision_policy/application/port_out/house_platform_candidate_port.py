@@ -18,3 +18,83 @@ class HousePlatformCandidateReadPort(ABC):
     ) -> Sequence[FilterCandidate]:
         """조건에 맞는 후보를 조회한다."""
         raise NotImplementedError
+
+    def fetch_candidates_within_budget(
+        self,
+        criteria: FilterCandidateCriteria,
+        near_university_id: int | None = None,
+        max_commute_minutes: float | None = None,
+    ) -> Sequence[FilterCandidate]:
+        """기본 조건에 최신 가격 관측치 예산과 대학 통학 시간 조건까지 적용해 한 번에 조회한다.
+
+        예산은 최신 가격 관측치의 예상 입주비용/월 비용 추정으로 비교하고, 관측치가
+        없으면 제외한다. near_university_id를 주면 그 대학의 최신 거리 관측치가
+        max_commute_minutes 이하인 매물만 남긴다. 지원하지 않는 저장소는
+        NotImplementedError를 던지고 호출 측이 관측 저장소로 직접 거른다.
+        """
+        raise NotImplementedError
+
+    def fetch_candidate_pool(
+        self, limit: int | None = None
+    ) -> Sequence[FilterCandidate]:
+        """요구서 조건 없이 전체 후보(sales_type/address 포함)를 조회한다."""
+        raise NotImplementedError
+
+    def fetch_candidates_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[FilterCandidate]:
+        """매물 ID 목록 중 노출 가능한 후보만 조회한다."""
+        ids = set(house_platform_ids)
+        return [
+            candidate
+            for candidate in self.fetch_candidates(
+                FilterCandidateCriteria(
+                    max_deposit_limit=None,
+                    max_rent_limit=None,
+                    budget_margin_ratio=0.0,
+                ),
+                limit=None,
+            )
+            if candidate.house_platform_id in ids
+        ]
+
+    def fetch_candidate_id_bounds(self) -> tuple[int, int] | None:
+        """노출 가능한 후보의 최소/최대 house_platform_id를 조회한다."""
+        ids = [
+            candidate.house_platform_id
+            for candidate in self.fetch_candidates(
+                FilterCandidateCriteria(
+                    max_deposit_limit=None,
+                    max_rent_limit=None,
+                    budget_margin_ratio=0.0,
+                ),
+                limit=None,
+            )
+        ]
+        if not ids:
+            return None
+        return min(ids), max(ids)
+
+    def fetch_candidates_in_range(
+        self,
+        start_id: int,
+        end_id: int,
+        after_id: int | None = None,
+    ) -> Sequence[FilterCandidate]:
+        """[start_id, end_id) 구간 후보를 ID 순으로 조회한다. after_id 이후만 반환한다."""
+        lower = start_id if after_id is None else max(start_id, after_id + 1)
+        return sorted(
+            (
+                candidate
+                for candidate in self.fetch_candidates(
+                    FilterCandidateCriteria(
+                        max_deposit_limit=None,
+                        max_rent_limit=None,
+                        budget_margin_ratio=0.0,
+                    ),
+                    limit=None,
+                )
+                if lower <= candidate.house_platform_id < end_id
+            ),
+            key=lambda candidate: candidate.house_platform_id,
+        )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    RefreshShardCheckpoint,
+)
+
+
+class RefreshCheckpointPort(ABC):
+    """샤드별 점수 갱신 체크포인트 저장/조회 포트."""
+
+    @abstractmethod
+    def load(self, run_id: str) -> Sequence[RefreshShardCheckpoint]:
+        """실행 ID의 샤드 체크포인트를 shard_index 순으로 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, checkpoint: RefreshShardCheckpoint) -> None:
+        """샤드 체크포인트를 저장(업서트)한다."""
+        raise NotImplementedError
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreCursor,
+    StudentHouseScorePage,
     StudentHouseScoreQuery,
     StudentHouseScoreRecord,
     StudentHouseScoreSummary,
@@ -11,7 +13,11 @@ from modules.student_house_decision_policy.application.dto.decision_score_dto im
 
 
 class StudentHouseScorePort(ABC):
-    """student_house 점수 저장/조회 포트."""
+    """student_house 점수 저장/조회 포트.
+
+    점수는 (house_platform_id, policy_version) 단위로 저장된다.
+    policy_version을 생략하면 기본 정책 버전을 사용한다.
+    """
 
     @abstractmethod
     def upsert_score(self, score: StudentHouseScoreRecord) -> int:
@@ -19,10 +25,30 @@ class StudentHouseScorePort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def mark_failed(self, house_platform_id: int, reason: str) -> None:
+    def mark_failed(
+        self,
+        house_platform_id: int,
+        reason: str,
+        policy_version: str | None = None,
+    ) -> None:
         """점수 계산 실패 상태를 기록한다."""
         raise NotImplementedError
 
+    def upsert_scores(self, scores: Sequence[StudentHouseScoreRecord]) -> int:
+        """점수 레코드 여러 건을 한 번에 업서트하고 반영 건수를 반환한다."""
+        for score in scores:
+            self.upsert_score(score)
+        return len(scores)
+
+    def mark_failed_many(
+        self,
+        failures: Mapping[int, str],
+        policy_version: str | None = None,
+    ) -> None:
+        """매물별 실패 사유를 한 번에 기록한다."""
+        for house_platform_id, reason in failures.items():
+            self.mark_failed(house_platform_id, reason, policy_version)
+
     @abstractmethod
     def fetch_top_k(
         self, query: StudentHouseScoreQuery
@@ -30,11 +56,35 @@ class StudentHouseScorePort(ABC):
         """추천 후보 상위 K를 조회한다."""
         raise NotImplementedError
 
+    def fetch_top_k_page(
+        self,
+        query: StudentHouseScoreQuery,
+        after: StudentHouseScoreCursor | None = None,
+    ) -> StudentHouseScorePage:
+        """점수 내림차순(동점은 house_platform_id 내림차순) 순위를 keyset 방식으로 한 페이지 조회한다.
+
+        query.limit이 페이지 크기이고, after를 넘기면 그 행 다음부터 이어서 읽는다.
+        """
+        raise NotImplementedError
+
+    def fetch_completed_page_by_id(
+        self,
+        policy_version: str | None,
+        after_house_platform_id: int | None,
+        limit: int,
+    ) -> Sequence[StudentHouseScoreSummary]:
+        """한 정책 버전의 완료된 점수를 house_platform_id 내림차순 keyset 방식으로 limit건 읽는다.
+
+        after_house_platform_id를 넘기면 그보다 작은 ID부터 이어서 읽는다.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def fetch_by_house_platform_ids(
         self,
         house_platform_ids: Sequence[int],
         policy_version: str | None = None,
+        completed_only: bool = False,
     ) -> Sequence[StudentHouseScoreSummary]:
-        """매물 ID 목록으로 점수 요약을 조회한다."""
+        """매물 ID 목록으로 점수 요약을 조회한다. completed_only면 실패 행을 뺀다."""
         raise NotImplementedError
@@ -12,10 +12,24 @@ from modules.observations.application.port.price_observation_repository_port imp
     PriceObservationRepositoryPort,
 )
 from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    CandidatePool,
     FilterCandidateCommand,
     FilterCandidateCriteria,
     FilterCandidateResult,
 )
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    matches_base_criteria,
+)
+from modules.student_house_decision_policy.application.factory.candidate_snapshot import (
+    CandidateSnapshot,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    required_options_from_request,
+)
+from modules.student_house_decision_policy.application.factory.region_dictionary import (
+    RegionDictionary,
+    load_region_dictionary,
+)
 from modules.student_house_decision_policy.application.port_in.filter_candidate_port import (
     FilterCandidatePort,
 )
@@ -30,6 +44,10 @@ from modules.university.application.port.university_repository_port import (
 )
 
 
+# 가까운 매물로 보는 통학 시간 상한(분). 임시 기준.
+NEAR_UNIVERSITY_MAX_MINUTES = 30.0
+
+
 class FilterCandidateService(FilterCandidatePort):
     """finder_request 조건으로 후보 매물을 선별한다.
 
@@ -44,6 +62,8 @@ class FilterCandidateService(FilterCandidatePort):
         distance_observation_repo: DistanceObservationRepositoryPort,
         university_repo: UniversityRepositoryPort,
         policy: BudgetFilterPolicy | None = None,
+        region_dictionary: RegionDictionary | None = None,
+        candidate_snapshot: CandidateSnapshot | None = None,
     ):
         self.finder_request_repo = finder_request_repo
         self.house_platform_repo = house_platform_repo
@@ -51,12 +71,106 @@ class FilterCandidateService(FilterCandidatePort):
         self.distance_observation_repo = distance_observation_repo
         self.university_repo = university_repo
         self.policy = policy or BudgetFilterPolicy()
+        # legal_dong.csv가 없으면 선호 지역을 주소 문자열로 비교한다.
+        self.region_dictionary = region_dictionary or load_region_dictionary()
+        # 프로세스 내 후보 스냅샷. 판정할 수 없는 조건이면 저장소 쿼리로 돌아간다.
+        self.candidate_snapshot = candidate_snapshot
 
     def execute(self, command: FilterCandidateCommand) -> FilterCandidateResult:
         """finder_request 기준으로 후보를 조회한다."""
         request = self.finder_request_repo.find_by_id(
             command.finder_request_id
         )
+        rejected = self._reject_without_criteria(command.finder_request_id, request)
+        if rejected:
+            return rejected
+        criteria = self._build_criteria(request)
+
+        candidates = self._fetch_filtered_candidates(criteria)
+
+        # TODO: 리스크 허용 조건이 준비되면 후보를 추가 필터링한다.
+        # TODO: additional_condition 파싱 규칙이 확정되면 필터 조건에 반영한다.
+        # TODO: max_building_age는 건축물대장 사용승인일이 후보에 연결되면 반영한다.
+
+        return FilterCandidateResult(
+            finder_request_id=command.finder_request_id,
+            criteria=criteria,
+            candidates=candidates,
+            message=None,
+        )
+
+    def load_candidate_pool(self, include_distance: bool = True) -> CandidatePool:
+        """후보 전체와 가격/거리 관측치, 대학교 위치를 한 번씩만 조회한다."""
+        candidates = list(self.house_platform_repo.fetch_candidate_pool())
+        house_platform_ids = [
+            candidate.house_platform_id for candidate in candidates
+        ]
+        if not house_platform_ids:
+            return CandidatePool()
+
+        university_ids: dict[str, int] = {}
+        distance_observations: dict[int, list] = {}
+        if include_distance:
+            for location in self.university_repo.get_university_locations():
+                university_ids.setdefault(
+                    location.university_name, location.university_location_id
+                )
+            distance_observations = (
+                self.distance_observation_repo.get_bulk_by_house_platform_ids(
+                    house_platform_ids
+                )
+            )
+        return CandidatePool(
+            candidates=candidates,
+            price_observations=self.price_observation_repo.get_latest_by_house_platform_ids(
+                house_platform_ids
+            ),
+            distance_observations=distance_observations,
+            university_ids=university_ids,
+        )
+
+    def filter_from_pool(self, request, pool: CandidatePool) -> FilterCandidateResult:
+        """적재된 후보 풀에서 execute와 같은 조건으로 후보를 선별한다.
+
+        여러 요구서를 한 번에 처리할 때 후보/관측치를 다시 조회하지 않는다.
+        """
+        rejected = self._reject_without_criteria(request.finder_request_id, request)
+        if rejected:
+            return rejected
+        criteria = self._build_criteria(request)
+
+        target_uni_id = None
+        if criteria.university_name and criteria.is_near:
+            target_uni_id = pool.university_ids.get(criteria.university_name)
+
+        candidates = [
+            candidate
+            for candidate in pool.candidates
+            if matches_base_criteria(candidate, criteria)
+            and self._within_price_budget(
+                criteria,
+                pool.price_observations.get(candidate.house_platform_id),
+            )
+            and (
+                target_uni_id is None
+                or self._is_near_university(
+                    pool.distance_observations.get(candidate.house_platform_id)
+                    or [],
+                    target_uni_id,
+                )
+            )
+        ]
+        return FilterCandidateResult(
+            finder_request_id=request.finder_request_id,
+            criteria=criteria,
+            candidates=candidates,
+            message=None,
+        )
+
+    def _reject_without_criteria(
+        self, finder_request_id: int, request
+    ) -> FilterCandidateResult | None:
+        """요구서가 없거나 예산 조건이 없으면 빈 결과를 만든다."""
         if not request:
             criteria = FilterCandidateCriteria(
                 max_deposit_limit=None,
@@ -64,47 +178,78 @@ class FilterCandidateService(FilterCandidatePort):
                 budget_margin_ratio=self.policy.budget_margin_ratio,
             )
             return FilterCandidateResult(
-                finder_request_id=command.finder_request_id,
+                finder_request_id=finder_request_id,
                 criteria=criteria,
                 candidates=[],
                 message="finder_request가 존재하지 않습니다.",
             )
 
-        max_deposit_limit = self.policy.clamp_budget(request.max_deposit)
-        max_rent_limit = self.policy.clamp_budget(request.max_rent)
-        criteria = FilterCandidateCriteria(
-            max_deposit_limit=max_deposit_limit,
-            max_rent_limit=max_rent_limit,
+        criteria = self._build_criteria(request)
+        if criteria.max_deposit_limit is None and criteria.max_rent_limit is None:
+            return FilterCandidateResult(
+                finder_request_id=finder_request_id,
+                criteria=criteria,
+                candidates=[],
+                message="예산 조건이 없어 후보를 선별할 수 없습니다.",
+            )
+        return None
+
+    def _build_criteria(self, request) -> FilterCandidateCriteria:
+        return FilterCandidateCriteria(
+            max_deposit_limit=self.policy.clamp_budget(request.max_deposit),
+            max_rent_limit=self.policy.clamp_budget(request.max_rent),
             budget_margin_ratio=self.policy.budget_margin_ratio,
             price_type=request.price_type,
             preferred_region=request.preferred_region,
+            region_filter=(
+                self.region_dictionary.resolve(request.preferred_region)
+                if self.region_dictionary
+                else None
+            ),
             house_type=request.house_type,
             additional_condition=request.additional_condition,
             university_name=request.university_name,
             is_near=request.is_near,
+            required_options=required_options_from_request(request),
         )
 
-        if max_deposit_limit is None and max_rent_limit is None:
-            return FilterCandidateResult(
-                finder_request_id=command.finder_request_id,
-                criteria=criteria,
-                candidates=[],
-                message="예산 조건이 없어 후보를 선별할 수 없습니다.",
+    def _fetch_filtered_candidates(
+        self, criteria: FilterCandidateCriteria
+    ) -> list:
+        """기본/가격/거리 조건을 스냅샷 마스크나 저장소 쿼리 하나로 적용하고, 둘 다 안 되면 단계별로 거른다."""
+        if criteria.max_deposit_limit is None and criteria.max_rent_limit is None:
+            return []
+        near_university_id = None
+        if criteria.university_name and criteria.is_near:
+            # 대학을 찾지 못하면 거리 조건 없이 선별한다(_filter_by_distance_observation과 동일).
+            near_university_id = self._resolve_university_id(
+                criteria.university_name
             )
-
+        if self.candidate_snapshot is not None:
+            candidates = self.candidate_snapshot.filter(
+                criteria,
+                near_university_id=near_university_id,
+                max_commute_minutes=NEAR_UNIVERSITY_MAX_MINUTES,
+            )
+            if candidates is not None:
+                return candidates
+        fetch_within_budget = getattr(
+            self.house_platform_repo, "fetch_candidates_within_budget", None
+        )
+        if fetch_within_budget:
+            try:
+                return list(
+                    fetch_within_budget(
+                        criteria,
+                        near_university_id=near_university_id,
+                        max_commute_minutes=NEAR_UNIVERSITY_MAX_MINUTES,
+                    )
+                )
+            except NotImplementedError:
+                pass
         candidates = self._fetch_candidates(criteria)
         candidates = self._filter_by_price_observations(criteria, candidates)
-        candidates = self._filter_by_distance_observation(criteria, candidates)
-        
-        # TODO: 리스크 허용 조건이 준비되면 후보를 추가 필터링한다.
-        # TODO: additional_condition 파싱 규칙이 확정되면 필터 조건에 반영한다.
-
-        return FilterCandidateResult(
-            finder_request_id=command.finder_request_id,
-            criteria=criteria,
-            candidates=candidates,
-            message=None,
-        )
+        return self._filter_by_distance_observation(criteria, candidates)
 
     def _fetch_candidates(
         self,
@@ -126,25 +271,27 @@ class FilterCandidateService(FilterCandidatePort):
             observation = self.price_observation_repo.get_by_house_platform_id(
                 candidate.house_platform_id
             )
-            
-            if not observation:
-                # 관측값 미존재 시 제외 (정책상 관측값 필수인 경우)
-                continue
-
-            if (
-                criteria.max_deposit_limit is not None
-                and observation.예상_입주비용 > criteria.max_deposit_limit
-            ):
-                continue
-            if (
-                criteria.max_rent_limit is not None
-                and observation.월_비용_추정 > criteria.max_rent_limit
-            ):
-                continue
-            
-            filtered.append(candidate)
+            if self._within_price_budget(criteria, observation):
+                filtered.append(candidate)
         return filtered
 
+    @staticmethod
+    def _within_price_budget(criteria: FilterCandidateCriteria, observation) -> bool:
+        if not observation:
+            # 관측값 미존재 시 제외 (정책상 관측값 필수인 경우)
+            return False
+        if (
+            criteria.max_deposit_limit is not None
+            and observation.예상_입주비용 > criteria.max_deposit_limit
+        ):
+            return False
+        if (
+            criteria.max_rent_limit is not None
+            and observation.월_비용_추정 > criteria.max_rent_limit
+        ):
+            return False
+        return True
+
     def _filter_by_distance_observation(
         self,
         criteria: FilterCandidateCriteria,
@@ -165,22 +312,23 @@ class FilterCandidateService(FilterCandidatePort):
             distances = self.distance_observation_repo.get_bulk_by_house_platform_id(
                 candidate.house_platform_id
             )
-            
-            matched_distance = next(
-                (d for d in distances if d.university_id == target_uni_id), 
-                None
-            )
-            
-            if not matched_distance:
-                # 해당 대학에 대한 거리 정보가 없으면 제외
-                continue
-
-            # 통학 거리 30분 이내 (임시 기준) 필터링
-            if matched_distance.학교까지_분 <= 30.0:
+            if self._is_near_university(distances, target_uni_id):
                 filtered.append(candidate)
-        
+
         return filtered
 
+    @staticmethod
+    def _is_near_university(distances, target_uni_id: int) -> bool:
+        matched_distance = next(
+            (d for d in distances if d.university_id == target_uni_id),
+            None,
+        )
+        if not matched_distance:
+            # 해당 대학에 대한 거리 정보가 없으면 제외
+            return False
+        # 통학 거리 30분 이내 (임시 기준) 필터링
+        return matched_distance.학교까지_분 <= NEAR_UNIVERSITY_MAX_MINUTES
+
     def _resolve_university_id(self, name: str) -> Optional[int]:
         # TODO: 성능 개선을 위해 캐싱 고려 가능
         locations = self.university_repo.get_university_locations()
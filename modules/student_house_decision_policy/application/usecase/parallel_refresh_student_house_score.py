@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, Sequence
+
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ParallelRefreshStudentHouseScoreCommand,
+    RefreshShardCheckpoint,
+    RefreshStudentHouseScoreCommand,
+    RefreshStudentHouseScoreResult,
+)
+from modules.student_house_decision_policy.application.port_in.parallel_refresh_student_house_score_port import (
+    ParallelRefreshStudentHouseScorePort,
+)
+from modules.student_house_decision_policy.application.port_out.house_platform_candidate_port import (
+    HousePlatformCandidateReadPort,
+)
+from modules.student_house_decision_policy.application.port_out.refresh_checkpoint_port import (
+    RefreshCheckpointPort,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+# (갱신 요청, 샤드 체크포인트, 묶음 크기)를 받아 샤드 1개를 끝까지 처리한다.
+# 프로세스 풀에서 실행하려면 모듈 최상위 함수처럼 pickle 가능해야 한다.
+ShardRunner = Callable[
+    [RefreshStudentHouseScoreCommand, RefreshShardCheckpoint, int],
+    RefreshShardCheckpoint,
+]
+
+
+class ParallelRefreshStudentHouseScoreService(ParallelRefreshStudentHouseScorePort):
+    """house_platform_id 구간 샤드로 나눠 점수를 갱신하고 결과를 합친다."""
+
+    def __init__(
+        self,
+        house_platform_repo: HousePlatformCandidateReadPort,
+        checkpoint_repo: RefreshCheckpointPort,
+        shard_runner: ShardRunner,
+        recommendation_cache: RecommendationResultCachePort | None = None,
+        worker_initializer: Callable[[], None] | None = None,
+    ):
+        self.house_platform_repo = house_platform_repo
+        self.checkpoint_repo = checkpoint_repo
+        self.shard_runner = shard_runner
+        self.recommendation_cache = recommendation_cache
+        self.worker_initializer = worker_initializer
+
+    def execute(
+        self, command: ParallelRefreshStudentHouseScoreCommand
+    ) -> RefreshStudentHouseScoreResult:
+        policies = list(command.policies or [command.policy or DecisionPolicyConfig()])
+        checkpoints = list(self.checkpoint_repo.load(command.run_id))
+        if not checkpoints:
+            checkpoints = self._plan_shards(command)
+        pending = [checkpoint for checkpoint in checkpoints if not checkpoint.completed]
+
+        refresh_command = RefreshStudentHouseScoreCommand(
+            observation_version=command.observation_version,
+            policies=policies,
+        )
+        failed_shards = {
+            shard_index: str(error)
+            for shard_index, error in self._run_shards(
+                pending, refresh_command, command
+            )
+            if error is not None
+        }
+
+        # 워커가 저장한 체크포인트가 기준이다(중단된 샤드의 부분 진행 포함).
+        checkpoints = list(self.checkpoint_repo.load(command.run_id))
+        processed = sum(checkpoint.processed_count for checkpoint in checkpoints)
+        failed = sum(checkpoint.failed_count for checkpoint in checkpoints)
+
+        if processed and self.recommendation_cache:
+            # 점수가 바뀌었으므로 기존 추천 결과 캐시를 모두 무효화한다.
+            self.recommendation_cache.bump_watermark()
+
+        if failed_shards:
+            raise RuntimeError(
+                f"샤드 갱신이 중단되었습니다: {dict(sorted(failed_shards.items()))}. "
+                f"run_id={command.run_id}로 다시 실행하면 이어서 처리합니다."
+            )
+
+        return RefreshStudentHouseScoreResult(
+            observation_version=command.observation_version,
+            policy_version=policies[0].policy_version,
+            total_observations=processed + failed,
+            processed_count=processed,
+            failed_count=failed,
+            policy_versions=[policy.policy_version for policy in policies],
+        )
+
+    def _plan_shards(
+        self, command: ParallelRefreshStudentHouseScoreCommand
+    ) -> list[RefreshShardCheckpoint]:
+        """후보 ID 범위를 shard_count개 구간으로 나누고 초기 체크포인트를 저장한다."""
+        bounds = self.house_platform_repo.fetch_candidate_id_bounds()
+        if bounds is None:
+            return []
+        min_id, max_id = bounds
+        shard_count = max(command.shard_count, 1)
+        width = -(-(max_id - min_id + 1) // shard_count)
+        checkpoints = []
+        for shard_index in range(shard_count):
+            start_id = min_id + shard_index * width
+            if start_id > max_id:
+                break
+            checkpoint = RefreshShardCheckpoint(
+                run_id=command.run_id,
+                shard_index=shard_index,
+                start_id=start_id,
+                end_id=min(start_id + width, max_id + 1),
+            )
+            self.checkpoint_repo.save(checkpoint)
+            checkpoints.append(checkpoint)
+        return checkpoints
+
+    def _run_shards(
+        self,
+        pending: Sequence[RefreshShardCheckpoint],
+        refresh_command: RefreshStudentHouseScoreCommand,
+        command: ParallelRefreshStudentHouseScoreCommand,
+    ) -> Iterator[tuple[int, Exception | None]]:
+        """샤드를 실행하고 (shard_index, 오류)를 내보낸다. 한 샤드의 실패가 다른 샤드를 막지 않는다."""
+        if not pending:
+            return
+        max_workers = command.max_workers
+        if max_workers is None:
+            max_workers = len(pending)
+        if max_workers <= 1:
+            for checkpoint in pending:
+                try:
+                    self.shard_runner(refresh_command, checkpoint, command.chunk_size)
+                    yield checkpoint.shard_index, None
+                except Exception as exc:
+                    yield checkpoint.shard_index, exc
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            initializer=self.worker_initializer,
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.shard_runner,
+                    refresh_command,
+                    checkpoint,
+                    command.chunk_size,
+                ): checkpoint.shard_index
+                for checkpoint in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    yield futures[future], None
+                except Exception as exc:
+                    yield futures[future], exc
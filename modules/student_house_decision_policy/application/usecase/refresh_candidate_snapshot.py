@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Sequence
+
+import numpy as np
+
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    RefreshCandidateSnapshotCommand,
+    RefreshCandidateSnapshotResult,
+)
+from modules.student_house_decision_policy.application.factory.candidate_snapshot import (
+    CandidateSnapshot,
+)
+from modules.student_house_decision_policy.application.port_in.refresh_candidate_snapshot_port import (
+    RefreshCandidateSnapshotPort,
+)
+from modules.student_house_decision_policy.application.port_out.candidate_snapshot_source_port import (
+    CandidateSnapshotSourcePort,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshCandidateSnapshotService(RefreshCandidateSnapshotPort):
+    """변경 워터마크 이후의 매물/관측치만 읽어 후보 스냅샷을 갱신한다.
+
+    워터마크는 적재를 시작하기 전에 읽고, 다음 갱신은 그 시각에서
+    overlap_seconds만큼 앞당겨 읽는다. 늦게 커밋된 변경을 놓치지 않기 위해
+    일부를 다시 읽지만 반영이 멱등이라 결과는 같다. 행 삭제는 워터마크로
+    잡히지 않으므로, 증분 갱신마다 DB의 매물 ID 집합과 대조해 지워진 매물을
+    스냅샷에서 뺀다.
+    """
+
+    def __init__(
+        self,
+        source: CandidateSnapshotSourcePort,
+        snapshot: CandidateSnapshot | None = None,
+        page_size: int = 5000,
+        overlap_seconds: float = 30.0,
+        max_age_seconds: float = 30.0,
+    ):
+        self.source = source
+        self.snapshot = snapshot or CandidateSnapshot()
+        self.page_size = page_size
+        self.overlap_seconds = overlap_seconds
+        self.max_age_seconds = max_age_seconds
+        self._refresh_lock = threading.Lock()
+        self._refreshed_at: float | None = None
+
+    def execute(
+        self, command: RefreshCandidateSnapshotCommand
+    ) -> RefreshCandidateSnapshotResult:
+        """변경분을 반영한다. 아직 적재하지 않았으면 전체를 적재한다."""
+        with self._refresh_lock:
+            return self._refresh(command.full_reload or not self.snapshot.is_ready)
+
+    def current_snapshot(self) -> CandidateSnapshot:
+        """스냅샷을 돌려주고, 오래됐으면 백그라운드에서 갱신을 시작한다.
+
+        요청 스레드는 갱신을 기다리지 않는다. 첫 적재가 끝나기 전에는
+        스냅샷이 None을 돌려주므로 후보 선별이 DB로 조회한다.
+        """
+        refreshed_at = self._refreshed_at
+        if (
+            refreshed_at is not None
+            and time.monotonic() - refreshed_at < self.max_age_seconds
+        ):
+            return self.snapshot
+        if self._refresh_lock.acquire(blocking=False):
+            threading.Thread(
+                target=self._refresh_in_background,
+                name="candidate-snapshot-refresh",
+                daemon=True,
+            ).start()
+        return self.snapshot
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self._refresh(not self.snapshot.is_ready)
+        except Exception as exc:
+            # 갱신 실패 시 기존 스냅샷을 유지하고 다음 요청에서 다시 시도한다.
+            logger.warning("candidate snapshot refresh failed: %s", exc)
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self, full_reload: bool) -> RefreshCandidateSnapshotResult:
+        watermark = self.source.fetch_watermark()
+        previous = None if full_reload else self.snapshot.watermark
+        if full_reload:
+            self.snapshot.reset()
+
+        upserted_count = 0
+        removed_count = 0
+        price_count = 0
+        distance_count = 0
+        after_id = None
+        house_since = self._since(previous.house_updated_at) if previous else None
+        while True:
+            houses = self.source.fetch_houses(house_since, after_id, self.page_size)
+            if not houses:
+                break
+            # 새로 들어온 매물은 관측치 변경이 없어도 최신 관측치가 필요하다.
+            house_ids = [
+                house.house_platform_id for house in houses if not house.is_banned
+            ]
+            prices = self.source.fetch_latest_prices(house_ids) if house_ids else []
+            distances = (
+                self.source.fetch_latest_distances(house_ids) if house_ids else []
+            )
+            upserted, removed = self.snapshot.apply(houses, prices, distances)
+            upserted_count += upserted
+            removed_count += removed
+            price_count += len(prices)
+            distance_count += len(distances)
+            after_id = houses[-1].house_platform_id
+            if len(houses) < self.page_size:
+                break
+
+        if previous is not None:
+            # ID 집합은 매물 페이지를 다 읽은 뒤에 조회한다. 그 사이 추가된 매물이
+            # 집합에 없어서 지워지는 일이 없다.
+            removed_count += self._remove_deleted_houses()
+            for house_ids in self._chunks(
+                self.source.fetch_price_changed_ids(
+                    self._since(previous.price_calculated_at)
+                )
+            ):
+                prices = self.source.fetch_latest_prices(house_ids)
+                self.snapshot.apply(prices=prices)
+                price_count += len(prices)
+            for house_ids in self._chunks(
+                self.source.fetch_distance_changed_ids(
+                    self._since(previous.distance_calculated_at)
+                )
+            ):
+                distances = self.source.fetch_latest_distances(house_ids)
+                self.snapshot.apply(distances=distances)
+                distance_count += len(distances)
+
+        self.snapshot.apply(watermark=watermark)
+        self._refreshed_at = time.monotonic()
+        return RefreshCandidateSnapshotResult(
+            full_reload=full_reload,
+            upserted_count=upserted_count,
+            removed_count=removed_count,
+            price_count=price_count,
+            distance_count=distance_count,
+            total_count=len(self.snapshot),
+            nbytes=self.snapshot.nbytes,
+            watermark=watermark,
+        )
+
+    def _remove_deleted_houses(self) -> int:
+        existing = np.fromiter(self.source.fetch_house_ids(), dtype=np.int64)
+        deleted = np.setdiff1d(
+            self.snapshot.house_platform_ids(), existing, assume_unique=True
+        )
+        if not deleted.size:
+            return 0
+        _, removed = self.snapshot.apply(deleted_ids=deleted.tolist())
+        return removed
+
+    def _since(self, changed_at: datetime | None) -> datetime | None:
+        if changed_at is None:
+            return None
+        return changed_at - timedelta(seconds=self.overlap_seconds)
+
+    def _chunks(self, house_platform_ids: Sequence[int]):
+        ids = sorted(set(house_platform_ids))
+        for start in range(0, len(ids), self.page_size):
+            yield ids[start : start + self.page_size]
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
     ObservationScoreSource,
+    RefreshShardCheckpoint,
     RefreshStudentHouseScoreCommand,
     RefreshStudentHouseScoreResult,
 )
 from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
     DecisionScoreCalculator,
+    ObservationScoreColumns,
 )
 from modules.student_house_decision_policy.application.port_in.refresh_student_house_score_port import (
     RefreshStudentHouseScorePort,
 )
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from modules.student_house_decision_policy.application.port_out.refresh_checkpoint_port import (
+    RefreshCheckpointPort,
+)
 from modules.student_house_decision_policy.application.port_out.student_house_score_port import (
     StudentHouseScorePort,
 )
@@ -40,6 +49,14 @@ from modules.university.application.port.university_repository_port import (
 from modules.observations.domain.model.distance_feature_observation import (
     DistanceFeatureObservation,
 )
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+
+# 관측치를 한 번에 읽고 점수를 한 번에 저장하는 매물 묶음 크기.
+DEFAULT_CHUNK_SIZE = 1000
+# student_house 테이블에서 NOT NULL인 세부 점수 항목.
+_REQUIRED_SCORE_FIELDS = ("price_score", "option_score", "risk_score", "distance_score")
 
 
 class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
@@ -54,6 +71,9 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
         university_repo: UniversityRepositoryPort,
         student_house_repo: StudentHouseScorePort,
         policy: DecisionPolicyConfig | None = None,
+        recommendation_cache: RecommendationResultCachePort | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dirty_house_repo: DirtyHousePort | None = None,
     ):
         self.house_platform_repo = house_platform_repo
         self.feature_observation_repo = feature_observation_repo
@@ -62,12 +82,15 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
         self.university_repo = university_repo
         self.student_house_repo = student_house_repo
         self.policy = policy or DecisionPolicyConfig()
+        self.recommendation_cache = recommendation_cache
+        self.chunk_size = max(chunk_size, 1)
+        self.dirty_house_repo = dirty_house_repo
 
     def execute(
         self, command: RefreshStudentHouseScoreCommand
     ) -> RefreshStudentHouseScoreResult:
-        policy = command.policy or self.policy
-        calculator = DecisionScoreCalculator(policy)
+        policies = self._resolve_policies(command)
+        calculators = [DecisionScoreCalculator(policy) for policy in policies]
 
         # TODO: 관측 버전 관리 규칙이 확정되면 매칭 규칙을 고정한다.
 
@@ -75,56 +98,235 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             self.university_repo.get_unique_university_locations()
         )
 
-        candidates = self.house_platform_repo.fetch_candidates(
-            FilterCandidateCriteria(
-                max_deposit_limit=None,
-                max_rent_limit=None,
-                budget_margin_ratio=0.0,
-            ),
-            limit=None,
+        # 갱신 시작 시점의 dirty 표시. 계산에 성공한 매물만 표시를 지운다.
+        dirty_marks = (
+            self.dirty_house_repo.fetch_dirty() if self.dirty_house_repo else None
         )
+        if command.dirty_only:
+            if dirty_marks is None:
+                raise ValueError("dirty 매물 저장소가 설정되지 않았습니다.")
+            # 변경된 매물만 다시 계산한다. 정책이 바뀌면 전체 모드를 사용한다.
+            candidates = self.house_platform_repo.fetch_candidates_by_ids(
+                list(dirty_marks)
+            )
+        else:
+            candidates = self.house_platform_repo.fetch_candidates(
+                FilterCandidateCriteria(
+                    max_deposit_limit=None,
+                    max_rent_limit=None,
+                    budget_margin_ratio=0.0,
+                ),
+                limit=None,
+            )
         # TODO: 대상 범위를 제한하는 정책이 확정되면 후보 조회 범위를 조정한다.
 
         processed = 0
         failed = 0
-        for candidate in candidates:
-            try:
-                source = self._build_score_source(
-                    candidate.house_platform_id,
-                    candidate.snapshot_id,
-                    unique_university_ids,
-                    command.observation_version,
-                )
-                record = calculator.calculate(
-                    source,
-                    observation_version=command.observation_version,
-                    policy_version=policy.policy_version,
-                )
-                self.student_house_repo.upsert_score(record)
-                processed += 1
-            except Exception as exc:  # pragma: no cover - 예외 발생 시만 실행
-                failed += 1
-                self.student_house_repo.mark_failed(
-                    candidate.house_platform_id, str(exc)
+        for offset in range(0, len(candidates), self.chunk_size):
+            processed_ids, chunk_failed = self._refresh_chunk(
+                candidates[offset : offset + self.chunk_size],
+                calculators,
+                unique_university_ids,
+                command.observation_version,
+            )
+            processed += len(processed_ids)
+            failed += chunk_failed
+            if dirty_marks:
+                # 실패한 매물은 다음 실행에서 다시 시도하도록 남겨 둔다.
+                self.dirty_house_repo.clear(
+                    {
+                        house_platform_id: dirty_marks[house_platform_id]
+                        for house_platform_id in processed_ids
+                        if house_platform_id in dirty_marks
+                    }
                 )
 
+        if dirty_marks:
+            # 삭제/차단돼 후보가 아닌 매물은 계산할 점수가 없으므로 바로 정리한다.
+            candidate_ids = {
+                candidate.house_platform_id for candidate in candidates
+            }
+            self.dirty_house_repo.clear(
+                {
+                    house_platform_id: marked_at
+                    for house_platform_id, marked_at in dirty_marks.items()
+                    if house_platform_id not in candidate_ids
+                }
+            )
+
+        if processed and self.recommendation_cache:
+            # 점수가 바뀌었으므로 기존 추천 결과 캐시를 모두 무효화한다.
+            self.recommendation_cache.bump_watermark()
+
         return RefreshStudentHouseScoreResult(
             observation_version=command.observation_version,
-            policy_version=policy.policy_version,
+            policy_version=policies[0].policy_version,
             total_observations=len(candidates),
             processed_count=processed,
             failed_count=failed,
+            policy_versions=[policy.policy_version for policy in policies],
+        )
+
+    def refresh_shard(
+        self,
+        command: RefreshStudentHouseScoreCommand,
+        checkpoint: RefreshShardCheckpoint,
+        checkpoint_repo: RefreshCheckpointPort,
+    ) -> RefreshShardCheckpoint:
+        """house_platform_id 구간 샤드 1개를 체크포인트 이후부터 갱신한다.
+
+        묶음마다 진행 상황을 저장하므로 중단되면 같은 체크포인트로 이어서 실행한다.
+        dirty set과 추천 캐시는 샤드를 모은 쪽에서 처리한다.
+        """
+        if checkpoint.completed:
+            return checkpoint
+        calculators = [
+            DecisionScoreCalculator(policy)
+            for policy in self._resolve_policies(command)
+        ]
+        unique_university_ids = set(
+            self.university_repo.get_unique_university_locations()
         )
 
+        candidates = self.house_platform_repo.fetch_candidates_in_range(
+            checkpoint.start_id,
+            checkpoint.end_id,
+            after_id=checkpoint.last_house_platform_id,
+        )
+        for offset in range(0, len(candidates), self.chunk_size):
+            chunk = candidates[offset : offset + self.chunk_size]
+            processed_ids, chunk_failed = self._refresh_chunk(
+                chunk,
+                calculators,
+                unique_university_ids,
+                command.observation_version,
+            )
+            checkpoint = replace(
+                checkpoint,
+                last_house_platform_id=chunk[-1].house_platform_id,
+                processed_count=checkpoint.processed_count + len(processed_ids),
+                failed_count=checkpoint.failed_count + chunk_failed,
+            )
+            checkpoint_repo.save(checkpoint)
+
+        checkpoint = replace(checkpoint, completed=True)
+        checkpoint_repo.save(checkpoint)
+        return checkpoint
+
+    def _resolve_policies(
+        self, command: RefreshStudentHouseScoreCommand
+    ) -> list[DecisionPolicyConfig]:
+        policies = list(command.policies or [command.policy or self.policy])
+        versions = [policy.policy_version for policy in policies]
+        if len(set(versions)) != len(versions):
+            # 같은 버전이면 한 정책의 점수가 다른 정책의 점수를 덮어쓴다.
+            raise ValueError(f"정책 버전이 중복되었습니다: {versions}")
+        return policies
+
+    def _refresh_chunk(
+        self,
+        candidates,
+        calculators: list[DecisionScoreCalculator],
+        unique_university_ids: set[int],
+        observation_version: str | None,
+    ) -> tuple[list[int], int]:
+        """후보 묶음의 관측치를 한 번에 읽고 모든 정책의 점수를 한 번에 저장한다.
+
+        관측치 조회와 열 변환은 정책 수와 관계없이 한 번만 하고, 정책마다
+        점수 계산만 추가된다. 모든 정책의 점수를 저장한 매물 ID 목록과
+        하나 이상의 정책에서 실패한 매물 수를 반환한다.
+        """
+        house_platform_ids = [
+            candidate.house_platform_id for candidate in candidates
+        ]
+        features = self._find_latest_features(house_platform_ids)
+        prices = self.price_observation_repo.get_latest_by_house_platform_ids(
+            house_platform_ids
+        )
+        distances = (
+            self.distance_observation_repo.get_bulk_by_house_platform_ids(
+                house_platform_ids
+            )
+        )
+
+        sources = []
+        source_failures: dict[int, str] = {}
+        for candidate in candidates:
+            try:
+                sources.append(
+                    self._build_score_source(
+                        candidate.house_platform_id,
+                        candidate.snapshot_id,
+                        unique_university_ids,
+                        observation_version,
+                        feature=features.get(candidate.house_platform_id),
+                        price=prices.get(candidate.house_platform_id),
+                        distances=distances.get(candidate.house_platform_id, []),
+                    )
+                )
+            except Exception as exc:  # pragma: no cover - 예외 발생 시만 실행
+                source_failures[candidate.house_platform_id] = str(exc)
+
+        columns = ObservationScoreColumns.from_sources(sources) if sources else None
+        records = []
+        failures_by_policy: dict[str, dict[int, str]] = {}
+        for calculator in calculators:
+            policy_version = calculator.policy.policy_version
+            failures = dict(source_failures)
+            if sources:
+                for record in calculator.calculate_many(
+                    sources,
+                    observation_version=observation_version,
+                    policy_version=policy_version,
+                    columns=columns,
+                ):
+                    # 한 건이라도 NOT NULL 점수가 비면 묶음 전체 저장이 실패하므로 먼저 걸러 낸다.
+                    missing = [
+                        field
+                        for field in _REQUIRED_SCORE_FIELDS
+                        if getattr(record, field) is None
+                    ]
+                    if missing:
+                        failures[record.house_platform_id] = (
+                            f"점수 항목이 비어 있습니다: {', '.join(missing)}"
+                        )
+                    else:
+                        records.append(record)
+            failures_by_policy[policy_version] = failures
+        if records:
+            try:
+                self.student_house_repo.upsert_scores(records)
+            except Exception as exc:  # pragma: no cover - 예외 발생 시만 실행
+                for record in records:
+                    failures_by_policy[record.policy_version][
+                        record.house_platform_id
+                    ] = str(exc)
+
+        failed_ids: set[int] = set()
+        for policy_version, failures in failures_by_policy.items():
+            if failures:
+                self.student_house_repo.mark_failed_many(
+                    failures, policy_version=policy_version
+                )
+                failed_ids.update(failures)
+        processed_ids = [
+            source.house_platform_id
+            for source in sources
+            if source.house_platform_id not in failed_ids
+        ]
+        return processed_ids, len(failed_ids)
+
     def _build_score_source(
         self,
         house_platform_id: int,
         snapshot_id: str | None,
         unique_university_ids: set[int],
         expected_observation_version: str | None,
+        feature,
+        price,
+        distances: list[DistanceFeatureObservation],
     ) -> ObservationScoreSource:
-        """관측 포트를 조합해 점수 산출용 관측치를 만든다."""
-        feature = self._find_latest_feature(house_platform_id)
+        """미리 읽어 둔 관측치를 조합해 점수 산출용 관측치를 만든다."""
         observation_version = expected_observation_version
         if feature:
             snapshot_id = feature.snapshot_id
@@ -139,17 +341,9 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             # TODO: feature 관측치가 없을 때 snapshot/버전 정책을 확정한다.
             observation_version = expected_observation_version
 
-        price = self.price_observation_repo.get_by_house_platform_id(
-            house_platform_id
-        )
         if not price:
             raise ValueError("price 관측치가 존재하지 않습니다.")
 
-        distances = (
-            self.distance_observation_repo.get_bulk_by_house_platform_id(
-                house_platform_id
-            )
-        )
         if unique_university_ids:
             distances = [
                 item
@@ -191,12 +385,21 @@ class RefreshStudentHouseScoreService(RefreshStudentHouseScorePort):
             distance_nonlinear_score=distance_summary[2],
         )
 
-    def _find_latest_feature(self, house_platform_id: int):
+    def _find_latest_features(self, house_platform_ids: list[int]) -> dict:
+        if hasattr(self.feature_observation_repo, "find_latest_by_house_ids"):
+            return self.feature_observation_repo.find_latest_by_house_ids(
+                house_platform_ids
+            )
         if not hasattr(self.feature_observation_repo, "find_latest_by_house_id"):
             raise AttributeError("feature 관측 저장소가 없습니다.")
-        return self.feature_observation_repo.find_latest_by_house_id(
-            house_platform_id
-        )
+        features = {}
+        for house_platform_id in house_platform_ids:
+            feature = self.feature_observation_repo.find_latest_by_house_id(
+                house_platform_id
+            )
+            if feature:
+                features[house_platform_id] = feature
+        return features
 
 
 def _average_distance(
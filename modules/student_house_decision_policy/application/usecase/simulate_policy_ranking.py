@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from modules.student_house_decision_policy.application.dto.policy_simulation_dto import (
+    PolicyVariantRanking,
+    SimulatePolicyRankingCommand,
+    SimulatePolicyRankingResult,
+)
+from modules.student_house_decision_policy.application.factory.policy_what_if_ranker import (
+    PolicyRanking,
+    PolicyWhatIfRanker,
+    pairwise_jaccard,
+    sub_score_matrix,
+)
+from modules.student_house_decision_policy.application.port_in.simulate_policy_ranking_port import (
+    SimulatePolicyRankingPort,
+)
+from modules.student_house_decision_policy.application.port_out.student_house_score_port import (
+    StudentHouseScorePort,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+class SimulatePolicyRankingService(SimulatePolicyRankingPort):
+    """저장된 세부 점수로 정책 변형을 한 번에 재랭킹한다.
+
+    점수 재계산(RefreshStudentHouseScoreService) 없이 총점 가중치와
+    임계값 변경 효과를 비교하는 용도다.
+    """
+
+    def __init__(
+        self,
+        student_house_repo: StudentHouseScorePort,
+        policy: DecisionPolicyConfig | None = None,
+        page_size: int = 10000,
+    ):
+        self.student_house_repo = student_house_repo
+        self.policy = policy or DecisionPolicyConfig()
+        self.page_size = page_size
+
+    def execute(
+        self, command: SimulatePolicyRankingCommand
+    ) -> SimulatePolicyRankingResult:
+        baseline_policy = command.baseline_policy or self.policy
+        ranker, truncated = self._load_ranker(command, baseline_policy)
+
+        policies = [baseline_policy, *command.policies]
+        rankings = ranker.rank(policies)
+        jaccard = pairwise_jaccard(rankings)
+
+        results = [
+            self._to_variant(policy, ranking, rankings[0], float(jaccard[index, 0]))
+            for index, (policy, ranking) in enumerate(zip(policies, rankings))
+        ]
+        return SimulatePolicyRankingResult(
+            candidate_count=len(ranker.house_platform_ids),
+            baseline=results[0],
+            variants=results[1:],
+            pairwise_jaccard=jaccard[1:, 1:].round(4).tolist(),
+            truncated=truncated,
+        )
+
+    def _load_ranker(
+        self,
+        command: SimulatePolicyRankingCommand,
+        baseline_policy: DecisionPolicyConfig,
+    ) -> tuple[PolicyWhatIfRanker, bool]:
+        """후보 세부 점수를 한 번만 조회해 행렬로 만든다. 실패 행은 후보가 아니다."""
+        if command.house_platform_ids is not None:
+            scores = self.student_house_repo.fetch_by_house_platform_ids(
+                list(command.house_platform_ids),
+                policy_version=baseline_policy.policy_version,
+                completed_only=True,
+            )
+            # 요청한 후보 순서를 유지해 동점 처리 기준을 고정한다.
+            order = {
+                house_platform_id: index
+                for index, house_platform_id in enumerate(command.house_platform_ids)
+            }
+            scores = sorted(
+                scores, key=lambda score: order.get(score.house_platform_id, 0)
+            )
+            return PolicyWhatIfRanker(scores), False
+        return self._load_all(baseline_policy.policy_version, command.candidate_limit)
+
+    def _load_all(
+        self, policy_version: str, candidate_limit: int | None
+    ) -> tuple[PolicyWhatIfRanker, bool]:
+        """기준 정책 버전의 완료된 점수 전체를 house_platform_id keyset 페이지로 읽는다.
+
+        페이지마다 세부 점수 행렬로 바꿔 두므로 후보당 약 40바이트만 남는다.
+        ID 내림차순으로 읽어 동점이 리더보드(fetch_top_k)와 같은 순서가 된다.
+        """
+        id_pages = []
+        score_pages = []
+        count = 0
+        after_id = None
+        truncated = False
+        while True:
+            limit = self.page_size
+            if candidate_limit is not None:
+                # 한 건을 더 읽어 잘린 후보가 있는지 판단한다.
+                limit = min(limit, candidate_limit - count + 1)
+            page = self.student_house_repo.fetch_completed_page_by_id(
+                policy_version, after_id, limit
+            )
+            if candidate_limit is not None and count + len(page) > candidate_limit:
+                page = page[: candidate_limit - count]
+                truncated = True
+            if page:
+                ids, sub_scores = sub_score_matrix(page)
+                id_pages.append(ids)
+                score_pages.append(sub_scores)
+                count += len(page)
+                after_id = page[-1].house_platform_id
+            if truncated or len(page) < limit:
+                break
+        if not id_pages:
+            return PolicyWhatIfRanker([]), truncated
+        return (
+            PolicyWhatIfRanker.from_columns(
+                np.concatenate(id_pages), np.concatenate(score_pages)
+            ),
+            truncated,
+        )
+
+    @staticmethod
+    def _to_variant(
+        policy: DecisionPolicyConfig,
+        ranking: PolicyRanking,
+        baseline: PolicyRanking,
+        jaccard_with_baseline: float,
+    ) -> PolicyVariantRanking:
+        baseline_ids = set(baseline.house_platform_ids.tolist())
+        top_ids = ranking.house_platform_ids.tolist()
+        overlap = (
+            len(baseline_ids.intersection(top_ids)) / len(baseline_ids)
+            if baseline_ids
+            else 1.0
+        )
+        return PolicyVariantRanking(
+            policy_version=policy.policy_version,
+            weights={
+                "price": policy.weight_price,
+                "risk": policy.weight_risk,
+                "option": policy.weight_option,
+                "distance": policy.weight_distance,
+            },
+            threshold_base_total=policy.threshold_base_total,
+            recommended_count=ranking.recommended_count,
+            top_k_house_platform_ids=top_ids,
+            top_k_scores=ranking.scores.tolist(),
+            overlap_with_baseline=round(overlap, 4),
+            jaccard_with_baseline=round(jaccard_with_baseline, 4),
+        )
@@ -0,0 +1,12 @@
+from infrastructure.db.postgres import Base
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+
+
+class StudentHouseDirtyORM(Base):
+    """점수 재계산이 필요한 매물 목록 테이블 매핑."""
+
+    __tablename__ = "student_house_dirty"
+
+    house_platform_id = Column(BigInteger, primary_key=True)
+    reason = Column(String(50), nullable=True)
+    marked_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
@@ -1,15 +1,30 @@
 from infrastructure.db.postgres import Base
-from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 
 
 class StudentHouseORM(Base):
-    """대학생 추천 스코어를 저장하는 테이블 매핑."""
+    """대학생 추천 스코어를 저장하는 테이블 매핑.
+
+    정책 버전별로 점수를 따로 보관해 여러 정책을 나란히 비교하고 되돌릴 수 있다.
+    """
 
     __tablename__ = "student_house"
 
     student_house_id = Column(BigInteger, primary_key=True, autoincrement=True)
     house_platform_id = Column(
-        BigInteger, ForeignKey("house_platform.house_platform_id"), unique=True, nullable=False, index=True
+        BigInteger, ForeignKey("house_platform.house_platform_id"), nullable=False, index=True
     )
 
     price_score = Column(Float, nullable=False)
@@ -24,7 +39,24 @@ class StudentHouseORM(Base):
     last_error_at = Column(DateTime, nullable=True)
 
     observation_version = Column(String(20), nullable=True)
-    policy_version = Column(String(20), nullable=True)
+    policy_version = Column(String(20), nullable=False, server_default="v1")
 
     created_at = Column(DateTime, server_default=func.now(), nullable=True)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "house_platform_id",
+            "policy_version",
+            name="uq_student_house_platform_policy",
+        ),
+        # 추천 후보/전체 순위 조회(fetch_top_k, fetch_top_k_page) 접근 경로.
+        # 등호 조건 뒤에 정렬 키를 두어 정렬 없이 인덱스 순서대로 읽고 멈춘다.
+        Index(
+            "ix_student_house_leaderboard",
+            policy_version,
+            processing_status,
+            base_total_score.desc(),
+            house_platform_id.desc(),
+        ),
+    )
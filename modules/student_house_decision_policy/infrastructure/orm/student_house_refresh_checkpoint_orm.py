@@ -0,0 +1,19 @@
+from infrastructure.db.postgres import Base
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, String, func
+
+
+class StudentHouseRefreshCheckpointORM(Base):
+    """샤드별 점수 갱신 진행 상황 테이블 매핑."""
+
+    __tablename__ = "student_house_refresh_checkpoint"
+
+    run_id = Column(String(64), primary_key=True)
+    shard_index = Column(Integer, primary_key=True)
+    start_id = Column(BigInteger, nullable=False)
+    end_id = Column(BigInteger, nullable=False)
+    last_house_platform_id = Column(BigInteger, nullable=True)
+    processed_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    completed = Column(Boolean, nullable=False, default=False)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=True)
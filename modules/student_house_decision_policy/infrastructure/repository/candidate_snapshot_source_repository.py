@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import func, select
+
+from infrastructure.db.postgres import SessionLocal
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    CandidateSnapshotDistance,
+    CandidateSnapshotHouse,
+    CandidateSnapshotPrice,
+    CandidateSnapshotWatermark,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    parse_built_in,
+)
+from modules.student_house_decision_policy.application.port_out.candidate_snapshot_source_port import (
+    CandidateSnapshotSourcePort,
+)
+
+
+class CandidateSnapshotSourceRepository(CandidateSnapshotSourcePort):
+    """house_platform과 최신 관측치에서 후보 스냅샷 원본을 읽는 저장소."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+
+    def fetch_watermark(self) -> CandidateSnapshotWatermark:
+        price = StudentRecommendationPriceObservationsORM
+        distance = StudentRecommendationDistanceObservationORM
+        session = self._session_factory()
+        try:
+            row = session.execute(
+                select(
+                    select(func.max(HousePlatformORM.updated_at)).scalar_subquery(),
+                    select(func.max(price.calculated_at)).scalar_subquery(),
+                    select(func.max(distance.calculated_at)).scalar_subquery(),
+                )
+            ).one()
+            return CandidateSnapshotWatermark(
+                house_updated_at=row[0],
+                price_calculated_at=row[1],
+                distance_calculated_at=row[2],
+            )
+        finally:
+            session.close()
+
+    def fetch_houses(
+        self,
+        changed_since: datetime | None,
+        after_id: int | None,
+        limit: int,
+    ) -> Sequence[CandidateSnapshotHouse]:
+        session = self._session_factory()
+        try:
+            query = (
+                session.query(
+                    HousePlatformORM.house_platform_id,
+                    HousePlatformORM.snapshot_id,
+                    HousePlatformORM.deposit,
+                    HousePlatformORM.monthly_rent,
+                    HousePlatformORM.manage_cost,
+                    HousePlatformORM.sales_type,
+                    HousePlatformORM.pnu_cd,
+                    HousePlatformORM.gu_nm,
+                    HousePlatformORM.dong_nm,
+                    HousePlatformORM.lat_lng,
+                    HousePlatformORM.is_banned,
+                    HousePlatformORM.has_elevator,
+                    HousePlatformORM.can_park,
+                    HousePlatformOptionORM.built_in,
+                    HousePlatformOptionORM.near_univ,
+                    HousePlatformOptionORM.near_transport,
+                    HousePlatformOptionORM.near_mart,
+                )
+                .outerjoin(
+                    HousePlatformOptionORM,
+                    HousePlatformOptionORM.house_platform_id
+                    == HousePlatformORM.house_platform_id,
+                )
+            )
+            if changed_since is not None:
+                query = query.filter(HousePlatformORM.updated_at >= changed_since)
+            if after_id is not None:
+                query = query.filter(HousePlatformORM.house_platform_id > after_id)
+            rows = (
+                query.order_by(HousePlatformORM.house_platform_id).limit(limit).all()
+            )
+            return [self._to_house(row) for row in rows]
+        finally:
+            session.close()
+
+    def fetch_house_ids(self) -> Sequence[int]:
+        session = self._session_factory()
+        try:
+            return [
+                int(row[0])
+                for row in session.execute(select(HousePlatformORM.house_platform_id))
+            ]
+        finally:
+            session.close()
+
+    def fetch_price_changed_ids(
+        self, changed_since: datetime | None
+    ) -> Sequence[int]:
+        price = StudentRecommendationPriceObservationsORM
+        return self._changed_ids(
+            select(price.house_platform_id).distinct(),
+            price.calculated_at,
+            changed_since,
+        )
+
+    def fetch_distance_changed_ids(
+        self, changed_since: datetime | None
+    ) -> Sequence[int]:
+        distance = StudentRecommendationDistanceObservationORM
+        return self._changed_ids(
+            select(distance.house_id).distinct(),
+            distance.calculated_at,
+            changed_since,
+        )
+
+    def fetch_latest_prices(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[CandidateSnapshotPrice]:
+        """매물별 (calculated_at DESC, id DESC) 첫 행. 관측 저장소의 최신 조회와 같은 정렬이다."""
+        if not house_platform_ids:
+            return []
+        price = StudentRecommendationPriceObservationsORM
+        ranked = (
+            select(
+                price.house_platform_id,
+                price.예상_입주비용,
+                price.월_비용_추정,
+                func.row_number()
+                .over(
+                    partition_by=price.house_platform_id,
+                    order_by=(price.calculated_at.desc(), price.id.desc()),
+                )
+                .label("rn"),
+            )
+            .where(price.house_platform_id.in_(list(house_platform_ids)))
+            .subquery()
+        )
+        session = self._session_factory()
+        try:
+            rows = session.execute(
+                select(
+                    ranked.c.house_platform_id,
+                    ranked.c["예상_입주비용"],
+                    ranked.c["월_비용_추정"],
+                ).where(ranked.c.rn == 1)
+            ).all()
+            return [
+                CandidateSnapshotPrice(
+                    house_platform_id=int(row[0]),
+                    estimated_move_in_cost=int(row[1]),
+                    monthly_cost_est=int(row[2]),
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def fetch_latest_distances(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[CandidateSnapshotDistance]:
+        """매물-대학별 (calculated_at DESC, id DESC) 첫 행."""
+        if not house_platform_ids:
+            return []
+        distance = StudentRecommendationDistanceObservationORM
+        ranked = (
+            select(
+                distance.house_id,
+                distance.university_id,
+                distance.학교까지_분,
+                func.row_number()
+                .over(
+                    partition_by=(distance.house_id, distance.university_id),
+                    order_by=(distance.calculated_at.desc(), distance.id.desc()),
+                )
+                .label("rn"),
+            )
+            .where(distance.house_id.in_(list(house_platform_ids)))
+            .subquery()
+        )
+        session = self._session_factory()
+        try:
+            rows = session.execute(
+                select(
+                    ranked.c.house_id,
+                    ranked.c.university_id,
+                    ranked.c["학교까지_분"],
+                ).where(ranked.c.rn == 1)
+            ).all()
+            return [
+                CandidateSnapshotDistance(
+                    house_platform_id=int(row[0]),
+                    university_id=int(row[1]),
+                    minutes_to_school=float(row[2]),
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def _changed_ids(self, query, changed_at_column, changed_since) -> list[int]:
+        if changed_since is not None:
+            query = query.where(changed_at_column >= changed_since)
+        session = self._session_factory()
+        try:
+            return [int(row[0]) for row in session.execute(query).all()]
+        finally:
+            session.close()
+
+    @staticmethod
+    def _to_house(row) -> CandidateSnapshotHouse:
+        lat_lng = row[9] or {}
+        return CandidateSnapshotHouse(
+            house_platform_id=int(row[0]),
+            snapshot_id=row[1],
+            deposit=int(row[2]) if row[2] is not None else None,
+            monthly_rent=int(row[3]) if row[3] is not None else None,
+            manage_cost=int(row[4]) if row[4] is not None else None,
+            sales_type=row[5],
+            pnu_cd=row[6],
+            gu_nm=row[7],
+            dong_nm=row[8],
+            lat=_to_float(lat_lng.get("lat")),
+            lng=_to_float(lat_lng.get("lng")),
+            built_in=parse_built_in(row[13]),
+            near_univ=row[14],
+            near_transport=row[15],
+            near_mart=row[16],
+            has_elevator=row[11],
+            can_park=row[12],
+            is_banned=row[10],
+        )
+
+
+def _to_float(value) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
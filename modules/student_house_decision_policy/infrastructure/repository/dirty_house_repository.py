@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import bindparam, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.session_helper import open_session
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from modules.student_house_decision_policy.infrastructure.orm.student_house_dirty_orm import (
+    StudentHouseDirtyORM,
+)
+
+
+class DirtyHouseRepository(DirtyHousePort):
+    """student_house_dirty 테이블 기반 dirty set 저장소."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+
+    def mark_dirty(
+        self, house_platform_ids: Sequence[int], reason: str, session: Any = None
+    ) -> None:
+        unique_ids = sorted(set(house_platform_ids))
+        if not unique_ids:
+            return
+        # 트랜잭션 시작 시각(now) 대신 실행 시각을 써서 갱신 중 재표시를 구분한다.
+        stmt = insert(StudentHouseDirtyORM).values(
+            [
+                {
+                    "house_platform_id": house_platform_id,
+                    "reason": reason,
+                    "marked_at": func.clock_timestamp(),
+                }
+                for house_platform_id in unique_ids
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StudentHouseDirtyORM.house_platform_id],
+            set_={
+                "reason": stmt.excluded.reason,
+                "marked_at": stmt.excluded.marked_at,
+            },
+        )
+        if session is not None:
+            # 호출자 트랜잭션에 태우고 커밋은 호출자에게 맡긴다.
+            session.execute(stmt)
+            return
+        self._execute_write(stmt)
+
+    def fetch_dirty(self, limit: int | None = None) -> dict[int, datetime]:
+        session, generator = open_session(self._session_factory)
+        try:
+            query = session.query(
+                StudentHouseDirtyORM.house_platform_id,
+                StudentHouseDirtyORM.marked_at,
+            ).order_by(StudentHouseDirtyORM.marked_at.asc())
+            if limit is not None:
+                query = query.limit(limit)
+            return {row[0]: row[1] for row in query.all()}
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def clear(self, marked: Mapping[int, datetime]) -> int:
+        if not marked:
+            return 0
+        # 표시 시각이 조회 당시 그대로인 행만 지워 갱신 중 재표시를 보존한다.
+        table = StudentHouseDirtyORM.__table__
+        stmt = delete(table).where(
+            table.c.house_platform_id == bindparam("target_id"),
+            table.c.marked_at <= bindparam("target_marked_at"),
+        )
+        params = [
+            {"target_id": house_platform_id, "target_marked_at": marked_at}
+            for house_platform_id, marked_at in marked.items()
+        ]
+        session, generator = open_session(self._session_factory)
+        try:
+            # 매개변수 목록 실행(executemany)은 Core 연결에서만 지원된다.
+            result = session.connection().execute(stmt, params)
+            session.commit()
+            return int(result.rowcount or 0)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def _execute_write(self, stmt) -> None:
+        session, generator = open_session(self._session_factory)
+        try:
+            session.execute(stmt)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
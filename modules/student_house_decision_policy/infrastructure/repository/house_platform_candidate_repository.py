@@ -2,20 +2,63 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from sqlalchemy import or_
+from sqlalchemy import and_, exists, func, literal_column, or_, select
 
 from infrastructure.db.postgres import SessionLocal
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
 from modules.house_platform.infrastructure.orm.house_platform_orm import (
     HousePlatformORM,
 )
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
 from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
     FilterCandidate,
     FilterCandidateCriteria,
+    RegionFilter,
+)
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    extract_region_token,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    BUILT_IN_OPTIONS,
+    option_bits,
+    parse_built_in,
 )
 from modules.student_house_decision_policy.application.port_out.house_platform_candidate_port import (
     HousePlatformCandidateReadPort,
 )
 
+# house_platform의 지역 코드 식 인덱스와 같은 식. 인자를 바인드 파라미터로 보내면
+# 인덱스 식과 일치하지 않으므로 리터럴로 렌더링한다.
+_SIGUNGU_CD = func.substr(
+    HousePlatformORM.pnu_cd, literal_column("1"), literal_column("5")
+)
+_LEGAL_DONG_CD = func.substr(
+    HousePlatformORM.pnu_cd, literal_column("1"), literal_column("10")
+)
+
+# 옵션 속성 -> house_platform_options 조건. built_in은 JSON 문자열이다.
+_OPTION_CLAUSES = {
+    **{
+        attribute: HousePlatformOptionORM.built_in.like(f'%"{name}"%')
+        for name, attribute in BUILT_IN_OPTIONS.items()
+    },
+    "near_univ": HousePlatformOptionORM.near_univ.is_(True),
+    "near_transport": HousePlatformOptionORM.near_transport.is_(True),
+    "near_mart": HousePlatformOptionORM.near_mart.is_(True),
+}
+# 옵션 속성 -> house_platform 컬럼 조건.
+_HOUSE_OPTION_CLAUSES = {
+    "elevator": HousePlatformORM.has_elevator.is_(True),
+    "parking": HousePlatformORM.can_park.is_(True),
+}
+
 
 class HousePlatformCandidateRepository(HousePlatformCandidateReadPort):
     """house_platform 후보 조회 저장소."""
@@ -64,6 +107,255 @@ class HousePlatformCandidateRepository(HousePlatformCandidateReadPort):
         finally:
             session.close()
 
+    def fetch_candidates_within_budget(
+        self,
+        criteria: FilterCandidateCriteria,
+        near_university_id: int | None = None,
+        max_commute_minutes: float | None = None,
+    ) -> Sequence[FilterCandidate]:
+        """후보 조건, 최신 가격 관측치 예산, 통학 시간 조건을 쿼리 하나로 적용한다.
+
+        매물마다 "최신 관측치 1건"을 (calculated_at DESC, id DESC) LIMIT 1 상관
+        서브쿼리로 골라 조인한다. 관측 저장소의 최신 조회와 같은 정렬이라 결과가
+        같고, (매물, 계산 시각) 인덱스로 매물당 한 행만 읽는다.
+        """
+        price = StudentRecommendationPriceObservationsORM
+        distance = StudentRecommendationDistanceObservationORM
+        session = self._session_factory()
+        try:
+            latest_price_id = (
+                select(price.id)
+                .where(price.house_platform_id == HousePlatformORM.house_platform_id)
+                .order_by(price.calculated_at.desc(), price.id.desc())
+                .limit(1)
+                .correlate(HousePlatformORM)
+                .scalar_subquery()
+            )
+            query = (
+                session.query(
+                    HousePlatformORM.house_platform_id,
+                    HousePlatformORM.snapshot_id,
+                    HousePlatformORM.deposit,
+                    HousePlatformORM.monthly_rent,
+                    HousePlatformORM.manage_cost,
+                )
+                .join(price, price.id == latest_price_id)
+                .filter(
+                    or_(
+                        HousePlatformORM.is_banned.is_(False),
+                        HousePlatformORM.is_banned.is_(None),
+                    )
+                )
+            )
+            if criteria.max_deposit_limit is not None:
+                query = query.filter(price.예상_입주비용 <= criteria.max_deposit_limit)
+            if criteria.max_rent_limit is not None:
+                query = query.filter(price.월_비용_추정 <= criteria.max_rent_limit)
+
+            if near_university_id is not None:
+                latest_distance_id = (
+                    select(distance.id)
+                    .where(
+                        distance.house_id == HousePlatformORM.house_platform_id,
+                        distance.university_id == near_university_id,
+                    )
+                    .order_by(distance.calculated_at.desc(), distance.id.desc())
+                    .limit(1)
+                    .correlate(HousePlatformORM)
+                    .scalar_subquery()
+                )
+                query = query.join(distance, distance.id == latest_distance_id)
+                if max_commute_minutes is not None:
+                    query = query.filter(distance.학교까지_분 <= max_commute_minutes)
+
+            query = self._apply_price_type_filters(query, criteria)
+            query = self._apply_request_filters(query, criteria)
+            rows = query.order_by(HousePlatformORM.house_platform_id).all()
+            return [
+                FilterCandidate(
+                    house_platform_id=row[0],
+                    snapshot_id=row[1],
+                    deposit=int(row[2]) if row[2] is not None else None,
+                    monthly_rent=int(row[3]) if row[3] is not None else None,
+                    manage_cost=int(row[4]) if row[4] is not None else None,
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def fetch_candidate_pool(
+        self, limit: int | None = None
+    ) -> Sequence[FilterCandidate]:
+        """요구서 조건 없이 노출 가능한 전체 후보를 조회한다."""
+        session = self._session_factory()
+        try:
+            query = (
+                session.query(
+                    HousePlatformORM.house_platform_id,
+                    HousePlatformORM.snapshot_id,
+                    HousePlatformORM.deposit,
+                    HousePlatformORM.monthly_rent,
+                    HousePlatformORM.manage_cost,
+                    HousePlatformORM.sales_type,
+                    HousePlatformORM.address,
+                    HousePlatformORM.pnu_cd,
+                    HousePlatformORM.gu_nm,
+                    HousePlatformORM.dong_nm,
+                    HousePlatformORM.has_elevator,
+                    HousePlatformORM.can_park,
+                    HousePlatformOptionORM.built_in,
+                    HousePlatformOptionORM.near_univ,
+                    HousePlatformOptionORM.near_transport,
+                    HousePlatformOptionORM.near_mart,
+                )
+                .outerjoin(
+                    HousePlatformOptionORM,
+                    HousePlatformOptionORM.house_platform_id
+                    == HousePlatformORM.house_platform_id,
+                )
+                .filter(
+                    or_(
+                        HousePlatformORM.is_banned.is_(False),
+                        HousePlatformORM.is_banned.is_(None),
+                    )
+                )
+                .order_by(HousePlatformORM.house_platform_id)
+            )
+            if limit is not None:
+                query = query.limit(limit)
+            return [
+                FilterCandidate(
+                    house_platform_id=row[0],
+                    snapshot_id=row[1],
+                    deposit=int(row[2]) if row[2] is not None else None,
+                    monthly_rent=int(row[3]) if row[3] is not None else None,
+                    manage_cost=int(row[4]) if row[4] is not None else None,
+                    sales_type=row[5],
+                    address=row[6],
+                    pnu_cd=row[7],
+                    gu_nm=row[8],
+                    dong_nm=row[9],
+                    option_bits=option_bits(
+                        parse_built_in(row[12]),
+                        near_univ=row[13],
+                        near_transport=row[14],
+                        near_mart=row[15],
+                        has_elevator=row[10],
+                        can_park=row[11],
+                    ),
+                )
+                for row in query.all()
+            ]
+        finally:
+            session.close()
+
+    def fetch_candidates_by_ids(
+        self, house_platform_ids: Sequence[int]
+    ) -> Sequence[FilterCandidate]:
+        """매물 ID 목록 중 노출 가능한 후보만 조회한다."""
+        if not house_platform_ids:
+            return []
+        session = self._session_factory()
+        try:
+            rows = (
+                session.query(
+                    HousePlatformORM.house_platform_id,
+                    HousePlatformORM.snapshot_id,
+                    HousePlatformORM.deposit,
+                    HousePlatformORM.monthly_rent,
+                    HousePlatformORM.manage_cost,
+                )
+                .filter(
+                    HousePlatformORM.house_platform_id.in_(list(house_platform_ids))
+                )
+                .filter(
+                    or_(
+                        HousePlatformORM.is_banned.is_(False),
+                        HousePlatformORM.is_banned.is_(None),
+                    )
+                )
+                .order_by(HousePlatformORM.house_platform_id)
+                .all()
+            )
+            return [
+                FilterCandidate(
+                    house_platform_id=row[0],
+                    snapshot_id=row[1],
+                    deposit=int(row[2]) if row[2] is not None else None,
+                    monthly_rent=int(row[3]) if row[3] is not None else None,
+                    manage_cost=int(row[4]) if row[4] is not None else None,
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def fetch_candidate_id_bounds(self) -> tuple[int, int] | None:
+        """노출 가능한 후보의 최소/최대 house_platform_id를 조회한다."""
+        session = self._session_factory()
+        try:
+            row = (
+                session.query(
+                    func.min(HousePlatformORM.house_platform_id),
+                    func.max(HousePlatformORM.house_platform_id),
+                )
+                .filter(
+                    or_(
+                        HousePlatformORM.is_banned.is_(False),
+                        HousePlatformORM.is_banned.is_(None),
+                    )
+                )
+                .one()
+            )
+            if row[0] is None:
+                return None
+            return int(row[0]), int(row[1])
+        finally:
+            session.close()
+
+    def fetch_candidates_in_range(
+        self,
+        start_id: int,
+        end_id: int,
+        after_id: int | None = None,
+    ) -> Sequence[FilterCandidate]:
+        """[start_id, end_id) 구간 후보를 ID 순으로 조회한다. after_id 이후만 반환한다."""
+        lower = start_id if after_id is None else max(start_id, after_id + 1)
+        session = self._session_factory()
+        try:
+            rows = (
+                session.query(
+                    HousePlatformORM.house_platform_id,
+                    HousePlatformORM.snapshot_id,
+                    HousePlatformORM.deposit,
+                    HousePlatformORM.monthly_rent,
+                    HousePlatformORM.manage_cost,
+                )
+                .filter(HousePlatformORM.house_platform_id >= lower)
+                .filter(HousePlatformORM.house_platform_id < end_id)
+                .filter(
+                    or_(
+                        HousePlatformORM.is_banned.is_(False),
+                        HousePlatformORM.is_banned.is_(None),
+                    )
+                )
+                .order_by(HousePlatformORM.house_platform_id)
+                .all()
+            )
+            return [
+                FilterCandidate(
+                    house_platform_id=row[0],
+                    snapshot_id=row[1],
+                    deposit=int(row[2]) if row[2] is not None else None,
+                    monthly_rent=int(row[3]) if row[3] is not None else None,
+                    manage_cost=int(row[4]) if row[4] is not None else None,
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
     @staticmethod
     def _apply_price_type_filters(query, criteria: FilterCandidateCriteria):
         """price_type 조건을 적용한다."""
@@ -97,30 +389,76 @@ class HousePlatformCandidateRepository(HousePlatformCandidateReadPort):
     @staticmethod
     def _apply_request_filters(query, criteria: FilterCandidateCriteria):
         """예산 외 입력 조건을 적용한다."""
-        if criteria.preferred_region:
-            region_token = _extract_region_token(criteria.preferred_region)
+        if criteria.region_filter is not None:
+            query = query.filter(
+                HousePlatformCandidateRepository._region_clause(
+                    criteria.region_filter
+                )
+            )
+        elif criteria.preferred_region:
+            region_token = extract_region_token(criteria.preferred_region)
             if region_token:
                 query = query.filter(
                     HousePlatformORM.address.ilike(f"%{region_token}%")
                 )
+        if criteria.required_options:
+            query = query.filter(
+                HousePlatformCandidateRepository._options_clause(
+                    criteria.required_options
+                )
+            )
         # TODO: house_type 매핑 규칙 확정 전까지 필터를 비활성화한다.
         # TODO: house_type 매핑 규칙을 정교화한다.
         # TODO: additional_condition 해석 규칙이 확정되면 필터를 추가한다.
         return query
 
+    @staticmethod
+    def _options_clause(required_options):
+        """필수 옵션 조건. 옵션 테이블 조건은 EXISTS 하나로 묶는다."""
+        unknown = set(required_options) - set(_OPTION_CLAUSES) - set(
+            _HOUSE_OPTION_CLAUSES
+        )
+        if unknown:
+            raise ValueError(f"지원하지 않는 옵션 속성입니다: {sorted(unknown)}")
+        clauses = [
+            _HOUSE_OPTION_CLAUSES[attribute]
+            for attribute in sorted(required_options)
+            if attribute in _HOUSE_OPTION_CLAUSES
+        ]
+        option_clauses = [
+            _OPTION_CLAUSES[attribute]
+            for attribute in sorted(required_options)
+            if attribute in _OPTION_CLAUSES
+        ]
+        if option_clauses:
+            clauses.append(
+                exists().where(
+                    HousePlatformOptionORM.house_platform_id
+                    == HousePlatformORM.house_platform_id,
+                    *option_clauses,
+                )
+            )
+        return and_(*clauses)
 
-def _extract_region_token(preferred_region: str) -> str | None:
-    """선호 지역 문자열에서 첫 번째 구 정보를 추출한다."""
-    if not preferred_region:
-        return None
-    tokens = [
-        token.strip()
-        for token in preferred_region.replace(",", " ").split()
-        if token.strip()
-    ]
-    if not tokens:
-        return None
-    for token in tokens:
-        if token.endswith("구"):
-            return token
-    return tokens[0]
+    @staticmethod
+    def _region_clause(region: RegionFilter):
+        """지역 코드 조건. 각 항목이 인덱스 조건이라 OR로 묶어도 인덱스로 찾는다."""
+        clauses = []
+        if region.sigungu_codes:
+            clauses.append(_SIGUNGU_CD.in_(sorted(region.sigungu_codes)))
+        if region.legal_dong_codes:
+            clauses.append(_LEGAL_DONG_CD.in_(sorted(region.legal_dong_codes)))
+        name_clauses = []
+        if region.gu_names:
+            name_clauses.append(HousePlatformORM.gu_nm.in_(sorted(region.gu_names)))
+        if region.dong_names:
+            name_clauses.append(
+                HousePlatformORM.dong_nm.in_(sorted(region.dong_names))
+            )
+        if name_clauses:
+            clauses.append(
+                and_(HousePlatformORM.pnu_cd.is_(None), or_(*name_clauses))
+            )
+        for token in region.address_tokens:
+            clauses.append(HousePlatformORM.address.ilike(f"%{token}%"))
+        return or_(*clauses)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infrastructure.db.postgres import SessionLocal
+from infrastructure.db.session_helper import open_session
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    RefreshShardCheckpoint,
+)
+from modules.student_house_decision_policy.application.port_out.refresh_checkpoint_port import (
+    RefreshCheckpointPort,
+)
+from modules.student_house_decision_policy.infrastructure.orm.student_house_refresh_checkpoint_orm import (
+    StudentHouseRefreshCheckpointORM,
+)
+
+
+class RefreshCheckpointRepository(RefreshCheckpointPort):
+    """student_house_refresh_checkpoint 테이블 저장소."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+
+    def load(self, run_id: str) -> Sequence[RefreshShardCheckpoint]:
+        session, generator = open_session(self._session_factory)
+        try:
+            rows = (
+                session.query(StudentHouseRefreshCheckpointORM)
+                .filter(StudentHouseRefreshCheckpointORM.run_id == run_id)
+                .order_by(StudentHouseRefreshCheckpointORM.shard_index)
+                .all()
+            )
+            return [self._to_checkpoint(row) for row in rows]
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def save(self, checkpoint: RefreshShardCheckpoint) -> None:
+        session, generator = open_session(self._session_factory)
+        try:
+            # 체크포인트는 샤드당 묶음마다 한 번 쓰므로 merge로 충분하다.
+            session.merge(
+                StudentHouseRefreshCheckpointORM(
+                    run_id=checkpoint.run_id,
+                    shard_index=checkpoint.shard_index,
+                    start_id=checkpoint.start_id,
+                    end_id=checkpoint.end_id,
+                    last_house_platform_id=checkpoint.last_house_platform_id,
+                    processed_count=checkpoint.processed_count,
+                    failed_count=checkpoint.failed_count,
+                    completed=checkpoint.completed,
+                )
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    @staticmethod
+    def _to_checkpoint(
+        row: StudentHouseRefreshCheckpointORM,
+    ) -> RefreshShardCheckpoint:
+        return RefreshShardCheckpoint(
+            run_id=row.run_id,
+            shard_index=row.shard_index,
+            start_id=int(row.start_id),
+            end_id=int(row.end_id),
+            last_house_platform_id=(
+                int(row.last_house_platform_id)
+                if row.last_house_platform_id is not None
+                else None
+            ),
+            processed_count=row.processed_count or 0,
+            failed_count=row.failed_count or 0,
+            completed=bool(row.completed),
+        )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Sequence
+from typing import Mapping, Sequence
 
+from sqlalchemy import func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from infrastructure.db.postgres import SessionLocal
@@ -11,6 +13,8 @@ from modules.student_house_decision_policy.infrastructure.orm.student_house_orm
     StudentHouseORM,
 )
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreCursor,
+    StudentHouseScorePage,
     StudentHouseScoreQuery,
     StudentHouseScoreRecord,
     StudentHouseScoreSummary,
@@ -18,10 +22,19 @@ from modules.student_house_decision_policy.application.dto.decision_score_dto im
 from modules.student_house_decision_policy.application.port_out.student_house_score_port import (
     StudentHouseScorePort,
 )
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+# policy_version을 지정하지 않은 조회/기록에 사용하는 정책 버전.
+DEFAULT_POLICY_VERSION = DecisionPolicyConfig().policy_version
 
 
 class StudentHouseScoreRepository(StudentHouseScorePort):
-    """student_house 점수 저장소 구현체."""
+    """student_house 점수 저장소 구현체.
+
+    (house_platform_id, policy_version)마다 한 행을 유지한다.
+    """
 
     STATUS_READY = "READY"
     STATUS_COMPLETED = "COMPLETED"
@@ -37,7 +50,9 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
                 session.query(StudentHouseORM)
                 .filter(
                     StudentHouseORM.house_platform_id
-                    == score.house_platform_id
+                    == score.house_platform_id,
+                    StudentHouseORM.policy_version
+                    == _resolve_policy_version(score.policy_version),
                 )
                 .one_or_none()
             )
@@ -54,7 +69,7 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
                     base_total_score=score.base_total_score,
                     is_student_recommended=score.is_student_recommended,
                     observation_version=score.observation_version,
-                    policy_version=score.policy_version,
+                    policy_version=_resolve_policy_version(score.policy_version),
                     processing_status=self.STATUS_COMPLETED,
                     last_error=None,
                     last_error_at=None,
@@ -74,13 +89,20 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
             else:
                 session.close()
 
-    def mark_failed(self, house_platform_id: int, reason: str) -> None:
+    def mark_failed(
+        self,
+        house_platform_id: int,
+        reason: str,
+        policy_version: str | None = None,
+    ) -> None:
+        policy_version = _resolve_policy_version(policy_version)
         session, generator = open_session(self._session_factory)
         try:
             existing = (
                 session.query(StudentHouseORM)
                 .filter(
-                    StudentHouseORM.house_platform_id == house_platform_id
+                    StudentHouseORM.house_platform_id == house_platform_id,
+                    StudentHouseORM.policy_version == policy_version,
                 )
                 .one_or_none()
             )
@@ -99,7 +121,7 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
                         base_total_score=0.0,
                         is_student_recommended=False,
                         observation_version=None,
-                        policy_version=None,
+                        policy_version=policy_version,
                         processing_status=self.STATUS_FAILED,
                         last_error=reason,
                         last_error_at=datetime.utcnow(),
@@ -115,31 +137,198 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
             else:
                 session.close()
 
+    def upsert_scores(self, scores: Sequence[StudentHouseScoreRecord]) -> int:
+        """INSERT ... ON CONFLICT (house_platform_id, policy_version) DO UPDATE 한 번으로 반영한다.
+
+        여러 정책의 점수를 한 문장에 섞어 보내도 된다.
+        """
+        # 같은 키가 한 문장에 두 번 들어가면 ON CONFLICT가 실패하므로 마지막 값만 남긴다.
+        latest = {
+            (
+                score.house_platform_id,
+                _resolve_policy_version(score.policy_version),
+            ): score
+            for score in scores
+        }
+        if not latest:
+            return 0
+        values = [
+            {
+                "house_platform_id": score.house_platform_id,
+                "price_score": score.price_score,
+                "option_score": score.option_score,
+                "risk_score": score.risk_score,
+                "distance_score": score.distance_score,
+                "base_total_score": score.base_total_score,
+                "is_student_recommended": score.is_student_recommended,
+                "observation_version": score.observation_version,
+                "policy_version": policy_version,
+                "processing_status": self.STATUS_COMPLETED,
+                "last_error": None,
+                "last_error_at": None,
+            }
+            for (_, policy_version), score in latest.items()
+        ]
+        stmt = insert(StudentHouseORM).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_CONFLICT_COLUMNS,
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in values[0]
+                    if column not in ("house_platform_id", "policy_version")
+                },
+                # ON CONFLICT 경로에서는 onupdate가 동작하지 않아 직접 갱신한다.
+                "updated_at": func.now(),
+            },
+        )
+        self._execute_write(stmt)
+        return len(values)
+
+    def mark_failed_many(
+        self,
+        failures: Mapping[int, str],
+        policy_version: str | None = None,
+    ) -> None:
+        """실패 상태를 한 번에 기록한다. 기존 점수는 유지한다."""
+        if not failures:
+            return
+        policy_version = _resolve_policy_version(policy_version)
+        failed_at = datetime.utcnow()
+        stmt = insert(StudentHouseORM).values(
+            [
+                {
+                    "house_platform_id": house_platform_id,
+                    "price_score": 0.0,
+                    "option_score": 0.0,
+                    "risk_score": 0.0,
+                    "distance_score": 0.0,
+                    "base_total_score": 0.0,
+                    "is_student_recommended": False,
+                    "observation_version": None,
+                    "policy_version": policy_version,
+                    "processing_status": self.STATUS_FAILED,
+                    "last_error": reason,
+                    "last_error_at": failed_at,
+                }
+                for house_platform_id, reason in failures.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_CONFLICT_COLUMNS,
+            set_={
+                "processing_status": stmt.excluded.processing_status,
+                "last_error": stmt.excluded.last_error,
+                "last_error_at": stmt.excluded.last_error_at,
+                "updated_at": func.now(),
+            },
+        )
+        self._execute_write(stmt)
+
+    def _execute_write(self, stmt) -> None:
+        session, generator = open_session(self._session_factory)
+        try:
+            session.execute(stmt)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
     def fetch_top_k(
         self, query: StudentHouseScoreQuery
     ) -> Sequence[StudentHouseScoreSummary]:
         session, generator = open_session(self._session_factory)
         try:
-            q = session.query(StudentHouseORM).filter(
-                StudentHouseORM.processing_status
-                == self.STATUS_COMPLETED
-            )
-            q = q.filter(
-                StudentHouseORM.base_total_score
-                >= query.threshold_base_total
-            )
-            if query.observation_version:
+            rows = self._leaderboard_query(session, query).limit(query.limit).all()
+            return [self._to_summary(row) for row in rows]
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def fetch_top_k_page(
+        self,
+        query: StudentHouseScoreQuery,
+        after: StudentHouseScoreCursor | None = None,
+    ) -> StudentHouseScorePage:
+        """ix_student_house_leaderboard 순서대로 커서 다음 행부터 한 페이지를 읽는다.
+
+        OFFSET 없이 (점수, 매물 ID) 행 비교로 시작 위치를 찾으므로 페이지가
+        뒤로 가도 읽는 행 수가 늘지 않는다.
+        """
+        session, generator = open_session(self._session_factory)
+        try:
+            q = self._leaderboard_query(session, query)
+            if after is not None:
                 q = q.filter(
-                    StudentHouseORM.observation_version
-                    == query.observation_version
+                    tuple_(
+                        StudentHouseORM.base_total_score,
+                        StudentHouseORM.house_platform_id,
+                    )
+                    < tuple_(after.base_total_score, after.house_platform_id)
                 )
-            if query.policy_version:
-                q = q.filter(
-                    StudentHouseORM.policy_version == query.policy_version
+            # 한 행을 더 읽어 다음 페이지가 있는지 판단한다.
+            rows = q.limit(query.limit + 1).all()
+            items = [self._to_summary(row) for row in rows[: query.limit]]
+            next_cursor = None
+            if len(rows) > query.limit and items:
+                next_cursor = StudentHouseScoreCursor(
+                    base_total_score=items[-1].base_total_score,
+                    house_platform_id=items[-1].house_platform_id,
+                )
+            return StudentHouseScorePage(items=items, next_cursor=next_cursor)
+        finally:
+            if generator:
+                generator.close()
+            else:
+                session.close()
+
+    def _leaderboard_query(self, session: Session, query: StudentHouseScoreQuery):
+        """완료된 점수를 점수 내림차순으로 읽는 조회. 조건과 정렬은 ix_student_house_leaderboard를 따른다."""
+        q = session.query(StudentHouseORM).filter(
+            # 매물마다 정책별 행이 있으므로 항상 한 정책의 점수만 본다.
+            StudentHouseORM.policy_version
+            == _resolve_policy_version(query.policy_version),
+            StudentHouseORM.processing_status == self.STATUS_COMPLETED,
+            StudentHouseORM.base_total_score >= query.threshold_base_total,
+        )
+        if query.observation_version:
+            q = q.filter(
+                StudentHouseORM.observation_version
+                == query.observation_version
+            )
+        return q.order_by(
+            StudentHouseORM.base_total_score.desc(),
+            StudentHouseORM.house_platform_id.desc(),
+        )
+
+    def fetch_completed_page_by_id(
+        self,
+        policy_version: str | None,
+        after_house_platform_id: int | None,
+        limit: int,
+    ) -> Sequence[StudentHouseScoreSummary]:
+        """uq_student_house_platform_policy를 house_platform_id 역순으로 훑어 한 페이지를 읽는다."""
+        session, generator = open_session(self._session_factory)
+        try:
+            query = session.query(StudentHouseORM).filter(
+                StudentHouseORM.policy_version
+                == _resolve_policy_version(policy_version),
+                StudentHouseORM.processing_status == self.STATUS_COMPLETED,
+            )
+            if after_house_platform_id is not None:
+                query = query.filter(
+                    StudentHouseORM.house_platform_id < after_house_platform_id
                 )
             rows = (
-                q.order_by(StudentHouseORM.base_total_score.desc())
-                .limit(query.limit)
+                query.order_by(StudentHouseORM.house_platform_id.desc())
+                .limit(limit)
                 .all()
             )
             return [self._to_summary(row) for row in rows]
@@ -153,6 +342,7 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
         self,
         house_platform_ids: Sequence[int],
         policy_version: str | None = None,
+        completed_only: bool = False,
     ) -> Sequence[StudentHouseScoreSummary]:
         """매물 ID 목록으로 점수 요약을 조회한다."""
         if not house_platform_ids:
@@ -160,11 +350,13 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
         session, generator = open_session(self._session_factory)
         try:
             query = session.query(StudentHouseORM).filter(
-                StudentHouseORM.house_platform_id.in_(house_platform_ids)
+                StudentHouseORM.house_platform_id.in_(house_platform_ids),
+                StudentHouseORM.policy_version
+                == _resolve_policy_version(policy_version),
             )
-            if policy_version:
+            if completed_only:
                 query = query.filter(
-                    StudentHouseORM.policy_version == policy_version
+                    StudentHouseORM.processing_status == self.STATUS_COMPLETED
                 )
             rows = query.all()
             return [self._to_summary(row) for row in rows]
@@ -185,7 +377,6 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
         target.base_total_score = score.base_total_score
         target.is_student_recommended = score.is_student_recommended
         target.observation_version = score.observation_version
-        target.policy_version = score.policy_version
         target.processing_status = StudentHouseScoreRepository.STATUS_COMPLETED
         target.last_error = None
         target.last_error_at = None
@@ -204,3 +395,13 @@ class StudentHouseScoreRepository(StudentHouseScorePort):
             observation_version=row.observation_version,
             policy_version=row.policy_version,
         )
+
+
+_CONFLICT_COLUMNS = [
+    StudentHouseORM.house_platform_id,
+    StudentHouseORM.policy_version,
+]
+
+
+def _resolve_policy_version(policy_version: str | None) -> str:
+    return policy_version or DEFAULT_POLICY_VERSION
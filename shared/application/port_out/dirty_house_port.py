@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Mapping, Sequence
+
+
+class DirtyHousePort(ABC):
+    """점수 재계산이 필요한 매물(dirty set) 추적 포트.
+
+    매물/관측치를 쓰는 모듈과 점수를 재계산하는 모듈이 함께 쓰므로 shared에 둔다.
+    """
+
+    @abstractmethod
+    def mark_dirty(
+        self, house_platform_ids: Sequence[int], reason: str, session: Any = None
+    ) -> None:
+        """매물을 재계산 대상으로 표시한다. 이미 표시된 매물은 표시 시각을 갱신한다.
+
+        session을 주면 호출자의 트랜잭션 안에서 쓰고 커밋하지 않는다. 변경과 표시가
+        함께 커밋되거나 함께 롤백되도록 저장소는 커밋 전에 자기 세션을 넘긴다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fetch_dirty(self, limit: int | None = None) -> dict[int, datetime]:
+        """재계산 대상 매물과 마지막 표시 시각을 조회한다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, marked: Mapping[int, datetime]) -> int:
+        """조회 이후 다시 표시되지 않은 매물만 재계산 대상에서 제거한다."""
+        raise NotImplementedError
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class HouseCardInvalidationPort(ABC):
+    """매물 카드 캐시 무효화 포트.
+
+    매물/관측치를 쓰는 저장소가 추천 모듈의 캐시 구현을 몰라도 되도록 shared에 둔다.
+    """
+
+    @abstractmethod
+    def invalidate_houses(self, house_platform_ids: Sequence[int]) -> None:
+        """매물 단위로 저장된 카드를 모두 무효화한다."""
+        raise NotImplementedError
@@ -0,0 +1,131 @@
+"""DecisionScoreCalculator 스칼라/배치 계산 마이크로 벤치마크 러너."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+    ObservationScoreColumns,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """러너 실행 옵션을 파싱한다."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="합성 매물 수 목록",
+    )
+    parser.add_argument(
+        "--scalar-limit",
+        type=int,
+        default=100_000,
+        help="스칼라 경로를 함께 잴 최대 매물 수",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수(최솟값 사용)")
+    return parser.parse_args()
+
+
+def build_columns(size: int, seed: int = 42) -> ObservationScoreColumns:
+    """약 10%가 누락(NaN)된 합성 관측 열을 만든다."""
+    rng = np.random.default_rng(seed)
+
+    def column(low: float, high: float) -> np.ndarray:
+        values = rng.uniform(low, high, size)
+        values[rng.random(size) < 0.1] = np.nan
+        return values
+
+    return ObservationScoreColumns(
+        house_platform_ids=np.arange(size, dtype=np.int64),
+        price_percentile=column(0.0, 1.0),
+        price_zscore=column(-4.0, 4.0),
+        price_burden_nonlinear=column(0.0, 1.0),
+        essential_option_coverage=column(0.0, 1.0),
+        convenience_score=column(0.0, 100.0),
+        risk_probability_est=column(0.0, 1.0),
+        risk_severity_score=column(0.0, 1.0),
+        risk_nonlinear_penalty=column(0.0, 1.0),
+        distance_to_school_min=rng.uniform(0.0, 60.0, size),
+        distance_percentile=column(0.0, 1.0),
+        distance_nonlinear_score=column(0.0, 1.0),
+    )
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    args = parse_args()
+    calculator = DecisionScoreCalculator(DecisionPolicyConfig())
+    print(f"{'size':>10} {'method':>6} {'seconds':>9}")
+    for size in args.sizes:
+        columns = build_columns(size)
+        seconds = measure(lambda: calculator.calculate_batch(columns), args.repeat)
+        print(f"{size:>10} {'batch':>6} {seconds:>9.3f}")
+        if size > args.scalar_limit:
+            continue
+        # 스칼라 경로는 행마다 객체를 만들어야 하므로 입력 변환 시간은 빼고 잰다.
+        from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+            ObservationScoreSource,
+        )
+
+        sources = [
+            ObservationScoreSource(
+                house_platform_id=index,
+                snapshot_id=None,
+                observation_version=None,
+                estimated_move_in_cost=0,
+                monthly_cost_est=0,
+                **{
+                    field: (None if value != value else value)
+                    for field, value in (
+                        (field, float(getattr(columns, field)[index]))
+                        for field in (
+                            "price_percentile",
+                            "price_zscore",
+                            "price_burden_nonlinear",
+                            "essential_option_coverage",
+                            "convenience_score",
+                            "risk_probability_est",
+                            "risk_severity_score",
+                            "risk_nonlinear_penalty",
+                            "distance_to_school_min",
+                            "distance_percentile",
+                            "distance_nonlinear_score",
+                        )
+                    )
+                },
+            )
+            for index in range(size)
+        ]
+        seconds = measure(
+            lambda: [calculator.calculate(source, "obs", "v1") for source in sources],
+            args.repeat,
+        )
+        print(f"{size:>10} {'scalar':>6} {seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,12 @@ from modules.house_platform.infrastructure.client.zigbang_api_client import (
 from modules.house_platform.infrastructure.repository.house_platform_repository import (
     HousePlatformRepository,
 )
+from modules.recommendations.application.factory.recommend_student_house_factory import (
+    get_house_card_cache,
+)
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import (
+    DirtyHouseRepository,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,7 +52,12 @@ def parse_args() -> argparse.Namespace:
 def build_usecase() -> MonitorHousePlatformService:
     """클라이언트/리포지토리를 엮어 유스케이스를 구성한다."""
     client = ZigbangApiClient()
-    repository = HousePlatformRepository()
+    # 새로 들어오거나 snapshot이 바뀐 매물은 증분 점수 갱신 대상으로 표시한다.
+    # 기존 매물이 바뀌면 캐시된 추천 카드도 비운다.
+    repository = HousePlatformRepository(
+        dirty_house_tracker=DirtyHouseRepository(),
+        card_cache=get_house_card_cache(),
+    )
     return MonitorHousePlatformService(client, repository)
 
 
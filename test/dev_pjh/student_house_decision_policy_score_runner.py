@@ -13,8 +13,12 @@ if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ParallelRefreshStudentHouseScoreCommand,
     RefreshStudentHouseScoreCommand,
 )
+from modules.student_house_decision_policy.application.factory.refresh_student_house_score_factory import (
+    build_parallel_refresh_student_house_score_service,
+)
 from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
     FilterCandidateCriteria,
 )
@@ -26,9 +30,6 @@ from modules.student_house_decision_policy.domain.value_object.decision_policy_c
 )
 from infrastructure.db.postgres import SessionLocal
 from infrastructure.db.session_helper import open_session
-from modules.house_platform.infrastructure.repository.house_platform_repository import (
-    HousePlatformRepository,
-)
 from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import (
     StudentRecommendationFeatureObservationRepository,
 )
@@ -44,20 +45,17 @@ from modules.student_house_decision_policy.infrastructure.repository.house_platf
 from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
     StudentHouseScoreRepository,
 )
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import (
+    DirtyHouseRepository,
+)
 from modules.university.adapter.output.university_repository import (
     UniversityRepository,
 )
-from modules.observations.application.usecase.generate_full_observation_usecase import (
-    GenerateFullObservationUseCase,
-)
-from modules.observations.application.usecase.generate_distance_observation_usecase import (
-    GenerateDistanceObservationUseCase,
+from modules.observations.application.dto.full_observation_batch_dto import (
+    GenerateFullObservationBatchCommand,
 )
-from modules.observations.application.usecase.generate_price_observation_usecase import (
-    GeneratePriceObservationUseCase,
-)
-from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import (
-    GenerateStudentRecommendationFeatureObservationUseCase,
+from modules.observations.application.factory.full_observation_factory import (
+    build_parallel_full_observation_service,
 )
 
 
@@ -87,6 +85,22 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="상위 후보 개수",
     )
+    parser.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help="지정하면 관측치 생성 없이 샤드 병렬 갱신을 실행(같은 값으로 재실행 시 이어서 처리)",
+    )
+    parser.add_argument("--shard-count", type=int, default=4, help="샤드 수")
+    parser.add_argument(
+        "--max-workers", type=int, default=None, help="워커 프로세스 수(기본: 샤드 수, 관측치 생성은 CPU 수)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000, help="묶음 크기")
+    parser.add_argument(
+        "--dirty-only",
+        action="store_true",
+        help="관측치 생성 없이 변경된(dirty) 매물만 점수를 갱신",
+    )
     return parser.parse_args()
 
 
@@ -99,22 +113,60 @@ def main() -> None:
         top_k=args.top_k,
         policy_version=args.policy_version,
     )
+    if args.run_id:
+        _print_result(
+            build_parallel_refresh_student_house_score_service().execute(
+                ParallelRefreshStudentHouseScoreCommand(
+                    run_id=args.run_id,
+                    observation_version=args.observation_version,
+                    policy=policy,
+                    shard_count=args.shard_count,
+                    chunk_size=args.chunk_size,
+                    max_workers=args.max_workers,
+                )
+            )
+        )
+        return
+
     session, generator = open_session(SessionLocal)
     try:
         house_platform_repo = HousePlatformCandidateRepository()
-        house_platform_detail_repo = HousePlatformRepository()
+        dirty_house_repo = DirtyHouseRepository()
         feature_repo = StudentRecommendationFeatureObservationRepository(
-            SessionLocal
+            SessionLocal, dirty_house_tracker=dirty_house_repo
         )
         price_repo = StudentRecommendationPriceObservationRepository(
-            session
+            session, dirty_house_tracker=dirty_house_repo
         )
         distance_repo = StudentRecommendationDistanceObservationRepository(
-            session
+            session, dirty_house_tracker=dirty_house_repo
         )
         university_repo = UniversityRepository(SessionLocal)
         student_house_repo = StudentHouseScoreRepository()
 
+        usecase = RefreshStudentHouseScoreService(
+            house_platform_repo=house_platform_repo,
+            feature_observation_repo=feature_repo,
+            price_observation_repo=price_repo,
+            distance_observation_repo=distance_repo,
+            university_repo=university_repo,
+            student_house_repo=student_house_repo,
+            policy=policy,
+            chunk_size=args.chunk_size,
+            dirty_house_repo=dirty_house_repo,
+        )
+        if args.dirty_only:
+            _print_result(
+                usecase.execute(
+                    RefreshStudentHouseScoreCommand(
+                        observation_version=args.observation_version,
+                        policy=policy,
+                        dirty_only=True,
+                    )
+                )
+            )
+            return
+
         candidates = house_platform_repo.fetch_candidates(
             FilterCandidateCriteria(
                 max_deposit_limit=None,
@@ -138,54 +190,25 @@ def main() -> None:
             # TODO: price_map 기준(보증금/월세/관리비 가중) 확정 시 수정한다.
             price_map[candidate.house_platform_id] = int(price_value)
 
-        distance_uc = GenerateDistanceObservationUseCase(
-            distance_repo=distance_repo,
-            house_repo=house_platform_detail_repo,
-            university_repo=university_repo,
-        )
-        price_uc = GeneratePriceObservationUseCase(
-            price_repo=price_repo,
-            house_prices=price_map,
-        )
-        feature_uc = GenerateStudentRecommendationFeatureObservationUseCase(
-            observation_repo=feature_repo,
-            distance_usecase=None,
-            house_repo=house_platform_detail_repo,
-        )
-        full_uc = GenerateFullObservationUseCase(
-            student_feature_uc=feature_uc,
-            price_uc=price_uc,
-            distance_uc=distance_uc,
-        )
-        
-        obs_processed = 0
-        obs_failed = 0
         total_candidates = len(candidates)
         print(f"Generating observations for {total_candidates} candidates...")
-        
-        for i, candidate in enumerate(candidates, 1):
-            try:
-                full_uc.execute(candidate.house_platform_id)
-                obs_processed += 1
-            except Exception as e:
-                obs_failed += 1
-                # print(f"[Warning] Failed to generate observation for house {candidate.house_platform_id}: {e}")
-            
-            if i % 10 == 0:
-                print(f"Progress: {i}/{total_candidates} ({(i/total_candidates)*100:.1f}%) - Processed: {obs_processed}, Failed: {obs_failed}", end='\r')
-        
-        print() # Newline after loop
-        print(f"Observation generation finished: processed={obs_processed}, failed={obs_failed}")
-
-        usecase = RefreshStudentHouseScoreService(
-            house_platform_repo=house_platform_repo,
-            feature_observation_repo=feature_repo,
-            price_observation_repo=price_repo,
-            distance_observation_repo=distance_repo,
-            university_repo=university_repo,
-            student_house_repo=student_house_repo,
-            policy=policy,
+        observation_result = build_parallel_full_observation_service().execute(
+            GenerateFullObservationBatchCommand(
+                house_platform_ids=[
+                    candidate.house_platform_id for candidate in candidates
+                ],
+                house_prices=price_map,
+                chunk_size=args.chunk_size,
+                max_workers=args.max_workers,
+            )
+        )
+        print(
+            "Observation generation finished: "
+            f"processed={observation_result.processed_count}, "
+            f"failed={observation_result.failed_count}"
         )
+        for stage, failures in observation_result.failures_by_stage().items():
+            print(f"  {stage} failures={len(failures)}")
 
         result = usecase.execute(
             RefreshStudentHouseScoreCommand(
@@ -193,13 +216,7 @@ def main() -> None:
                 policy=policy,
             )
         )
-
-        print(f"observation_version={result.observation_version}")
-        print(f"policy_version={result.policy_version}")
-        print(
-            f"observations={result.total_observations} "
-            f"processed={result.processed_count} failed={result.failed_count}"
-        )
+        _print_result(result)
     finally:
         if generator:
             generator.close()
@@ -207,5 +224,14 @@ def main() -> None:
             session.close()
 
 
+def _print_result(result) -> None:
+    print(f"observation_version={result.observation_version}")
+    print(f"policy_version={result.policy_version}")
+    print(
+        f"observations={result.total_observations} "
+        f"processed={result.processed_count} failed={result.failed_count}"
+    )
+
+
 if __name__ == "__main__":
     main()
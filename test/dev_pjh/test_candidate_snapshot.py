@@ -0,0 +1,407 @@
+"""후보 스냅샷(NumPy 열) 필터링/증분 갱신 테스트."""
+from __future__ import annotations
+
+import hashlib
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCommand,
+)
+from modules.student_house_decision_policy.application.dto.candidate_snapshot_dto import (
+    CandidateSnapshotDistance,
+    CandidateSnapshotHouse,
+    CandidateSnapshotPrice,
+    CandidateSnapshotWatermark,
+    RefreshCandidateSnapshotCommand,
+)
+from modules.student_house_decision_policy.application.factory.candidate_snapshot import (
+    CandidateSnapshot,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    OPTION_BITS,
+)
+from modules.student_house_decision_policy.application.usecase.filter_candidate import (
+    FilterCandidateService,
+)
+from modules.student_house_decision_policy.application.usecase.refresh_candidate_snapshot import (
+    RefreshCandidateSnapshotService,
+)
+from modules.student_house_decision_policy.infrastructure.repository.candidate_snapshot_source_repository import (
+    CandidateSnapshotSourceRepository,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+from modules.university.application.dto.university_location_dto import (
+    UniversityLocationDTO,
+)
+
+_UNIVERSITY_IDS = {"가까운대학교": 1, "먼대학교": 2}
+_BASE = datetime(2026, 1, 1)
+# (pnu_cd, gu_nm, dong_nm)
+_LOCATIONS = [
+    ("1162010200100010000", "관악구", "신림동"),
+    ("1162010100100020000", "관악구", "봉천동"),
+    ("1159010200100030000", "동작구", "상도동"),
+    (None, "관악구", "신림동"),
+    (None, "동작구", "노량진동"),
+]
+
+
+class _FinderRequestRepository:
+    def __init__(self, requests):
+        self._requests = {request.finder_request_id: request for request in requests}
+
+    def find_by_id(self, finder_request_id):
+        return self._requests.get(finder_request_id)
+
+
+class _UniversityRepository:
+    def get_university_locations(self):
+        return [
+            UniversityLocationDTO(
+                university_location_id=university_id,
+                university_name=name,
+                campus="본캠",
+                lat=37.0,
+                lng=127.0,
+            )
+            for name, university_id in _UNIVERSITY_IDS.items()
+        ]
+
+
+def _snapshot_id(house_platform_id: int, rng: random.Random) -> str | None:
+    roll = rng.random()
+    if roll < 0.1:
+        return None
+    if roll < 0.2:
+        return f"snap-{house_platform_id}"
+    return hashlib.sha256(str(house_platform_id).encode()).hexdigest()
+
+
+def _add_house(session, rng, house_platform_id: int, updated_at: datetime) -> None:
+    pnu_cd, gu_nm, dong_nm = rng.choice(_LOCATIONS)
+    session.add(
+        HousePlatformORM(
+            house_platform_id=house_platform_id,
+            snapshot_id=_snapshot_id(house_platform_id, rng),
+            address=f"서울 {gu_nm} {dong_nm}",
+            deposit=rng.choice([None, 100, 500, 2000]),
+            monthly_rent=rng.choice([None, 40, 55, 70]),
+            manage_cost=rng.choice([None, 5]),
+            sales_type=rng.choice(["월세", "전세", "매매", None]),
+            is_banned=rng.choice([False, False, False, None, True]),
+            pnu_cd=pnu_cd,
+            gu_nm=gu_nm,
+            dong_nm=dong_nm,
+            lat_lng={"lat": 37.47, "lng": 126.95},
+            has_elevator=rng.choice([True, False, None]),
+            can_park=rng.choice([True, None]),
+            updated_at=updated_at,
+        )
+    )
+    if rng.random() < 0.8:
+        session.add(
+            HousePlatformOptionORM(
+                house_platform_options_id=house_platform_id,
+                house_platform_id=house_platform_id,
+                built_in=rng.choice(
+                    [None, '["에어컨"]', '["에어컨", "세탁기"]', '["냉장고", "세탁기"]']
+                ),
+                near_mart=rng.choice([True, False, None]),
+            )
+        )
+
+
+def _add_price(session, house_platform_id, observation_id, move_in, monthly, at):
+    session.add(
+        StudentRecommendationPriceObservationsORM(
+            id=observation_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=observation_id,
+            가격_백분위=0.5,
+            가격_z점수=0.0,
+            예상_입주비용=move_in,
+            월_비용_추정=monthly,
+            가격_부담_비선형=0.5,
+            calculated_at=at,
+        )
+    )
+
+
+def _add_distance(session, house_platform_id, observation_id, university_id, minutes, at):
+    session.add(
+        StudentRecommendationDistanceObservationORM(
+            id=observation_id,
+            house_id=house_platform_id,
+            recommendation_observation_id=observation_id,
+            university_id=university_id,
+            학교까지_분=minutes,
+            거리_백분위=0.5,
+            거리_버킷="10_20분",
+            거리_비선형_점수=0.5,
+            calculated_at=at,
+        )
+    )
+
+
+def _seed(session, rng: random.Random) -> None:
+    price_id = 0
+    distance_id = 0
+    for house_platform_id in range(1, 121):
+        _add_house(session, rng, house_platform_id, _BASE)
+        for index in range(rng.randint(0, 3)):
+            price_id += 1
+            _add_price(
+                session,
+                house_platform_id,
+                price_id,
+                rng.randint(200, 1500),
+                rng.randint(30, 90),
+                _BASE + timedelta(days=index),
+            )
+        for university_id in _UNIVERSITY_IDS.values():
+            for _ in range(rng.randint(0, 2)):
+                distance_id += 1
+                _add_distance(
+                    session,
+                    house_platform_id,
+                    distance_id,
+                    university_id,
+                    rng.choice([10.0, 29.9, 30.0, 30.1, 55.0]),
+                    _BASE + timedelta(days=rng.randint(0, 1)),
+                )
+    session.commit()
+
+
+def _build_requests() -> list[FinderRequest]:
+    requests = []
+    finder_request_id = 0
+    for price_type in (None, "MONTHLY", "JEONSE", "MIXED"):
+        for max_deposit, max_rent in ((800, 60), (None, 50), (1200, None)):
+            for university_name, is_near in (
+                (None, False),
+                ("가까운대학교", True),
+                ("먼대학교", True),
+            ):
+                for preferred_region in (None, "관악구", "상도동, 신림동"):
+                    finder_request_id += 1
+                    option_roll = finder_request_id % 3
+                    requests.append(
+                        FinderRequest(
+                            finder_request_id=finder_request_id,
+                            abang_user_id=1,
+                            status="Y",
+                            price_type=price_type,
+                            max_deposit=max_deposit,
+                            max_rent=max_rent,
+                            preferred_region=preferred_region,
+                            university_name=university_name,
+                            is_near=is_near,
+                            aircon_yn="Y" if option_roll else "N",
+                            washer_yn="Y" if option_roll == 2 else "N",
+                        )
+                    )
+    return requests
+
+
+def _build_database():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(
+        engine,
+        tables=[
+            HousePlatformORM.__table__,
+            HousePlatformOptionORM.__table__,
+            StudentRecommendationPriceObservationsORM.__table__,
+            StudentRecommendationDistanceObservationORM.__table__,
+        ],
+    )
+    return engine, sessionmaker(bind=engine)
+
+
+def _assert_snapshot_matches_single_query(engine, session_factory, snapshot):
+    requests = _build_requests()
+    finder_repo = _FinderRequestRepository(requests)
+
+    def build_service(candidate_snapshot):
+        return FilterCandidateService(
+            finder_request_repo=finder_repo,
+            house_platform_repo=HousePlatformCandidateRepository(session_factory),
+            price_observation_repo=None,
+            distance_observation_repo=None,
+            university_repo=_UniversityRepository(),
+            candidate_snapshot=candidate_snapshot,
+        )
+
+    from_snapshot = build_service(snapshot)
+    from_query = build_service(None)
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    non_empty = 0
+    for request in requests:
+        command = FilterCandidateCommand(finder_request_id=request.finder_request_id)
+        statements.clear()
+        actual = from_snapshot.execute(command)
+        # 스냅샷으로 판정하면 DB를 읽지 않는다.
+        assert statements == []
+        expected = from_query.execute(command)
+        assert actual.criteria == expected.criteria
+        assert actual.candidates == expected.candidates
+        non_empty += bool(actual.candidates)
+    event.remove(engine, "before_cursor_execute", count)
+    assert non_empty > len(requests) // 3
+
+
+def test_snapshot_filter_matches_single_query_after_incremental_refresh():
+    engine, session_factory = _build_database()
+    session = session_factory()
+    rng = random.Random(7)
+    _seed(session, rng)
+
+    service = RefreshCandidateSnapshotService(
+        CandidateSnapshotSourceRepository(session_factory), page_size=17
+    )
+    result = service.execute(RefreshCandidateSnapshotCommand())
+    assert result.full_reload
+    assert service.snapshot.is_ready
+    _assert_snapshot_matches_single_query(engine, session_factory, service.snapshot)
+
+    # 변경: 금지 처리, 금지 해제, 신규 매물, 새 가격/거리 관측치.
+    changed_at = _BASE + timedelta(days=10)
+    houses = session.query(HousePlatformORM).order_by(
+        HousePlatformORM.house_platform_id
+    )
+    banned = next(house for house in houses if not house.is_banned)
+    unbanned = next(house for house in houses if house.is_banned)
+    banned.is_banned = True
+    banned.updated_at = changed_at
+    unbanned.is_banned = False
+    unbanned.updated_at = changed_at
+    _add_house(session, rng, 500, changed_at)
+    _add_price(session, 500, 9000, 300, 40, changed_at)
+    _add_distance(session, 500, 9000, 1, 12.0, changed_at)
+    for offset, house_platform_id in enumerate(range(10, 60, 5)):
+        _add_price(
+            session, house_platform_id, 9001 + offset, 250, 35, changed_at
+        )
+        _add_distance(
+            session, house_platform_id, 9001 + offset, 2, 5.0, changed_at
+        )
+    session.commit()
+    session.get(HousePlatformORM, 500).is_banned = False
+    session.get(HousePlatformORM, 500).updated_at = changed_at
+    session.commit()
+
+    result = service.execute(RefreshCandidateSnapshotCommand())
+    assert not result.full_reload
+    assert result.removed_count == 1
+    assert result.watermark.price_calculated_at == changed_at
+    _assert_snapshot_matches_single_query(engine, session_factory, service.snapshot)
+
+    # 같은 워터마크로 다시 갱신해도 결과가 같다.
+    before = service.snapshot.house_platform_ids().copy()
+    service.execute(RefreshCandidateSnapshotCommand())
+    assert service.snapshot.house_platform_ids().tolist() == before.tolist()
+    _assert_snapshot_matches_single_query(engine, session_factory, service.snapshot)
+
+    # 행 삭제는 워터마크에 잡히지 않으므로 ID 집합 대조로 뺀다.
+    deleted_id = int(before[0])
+    session.delete(session.get(HousePlatformORM, deleted_id))
+    session.commit()
+    result = service.execute(RefreshCandidateSnapshotCommand())
+    assert not result.full_reload
+    assert result.removed_count == 1
+    assert deleted_id not in service.snapshot.house_platform_ids().tolist()
+    _assert_snapshot_matches_single_query(engine, session_factory, service.snapshot)
+
+
+def test_snapshot_defers_to_database_when_not_servable():
+    snapshot = CandidateSnapshot()
+    service = FilterCandidateService(
+        finder_request_repo=None,
+        house_platform_repo=None,
+        price_observation_repo=None,
+        distance_observation_repo=None,
+        university_repo=None,
+        region_dictionary=None,
+    )
+    criteria = service._build_criteria(
+        FinderRequest(
+            finder_request_id=1,
+            abang_user_id=1,
+            status="Y",
+            max_deposit=1000,
+            preferred_region="어딘가",
+        )
+    )
+    # 적재 전에는 DB로 조회한다.
+    assert snapshot.filter(criteria) is None
+    snapshot.apply(watermark=CandidateSnapshotWatermark())
+    # 주소 문자열 비교가 필요한 조건은 스냅샷으로 판정하지 않는다.
+    assert snapshot.filter(criteria) is None
+    criteria.preferred_region = None
+    criteria.region_filter = None
+    assert snapshot.filter(criteria) == []
+
+
+def test_snapshot_memory_stays_under_budget_per_million_listings():
+    count = 20_000
+    snapshot = CandidateSnapshot()
+    snapshot.apply(
+        houses=[
+            CandidateSnapshotHouse(
+                house_platform_id=house_platform_id,
+                snapshot_id=hashlib.sha256(str(house_platform_id).encode()).hexdigest(),
+                deposit=1000,
+                monthly_rent=50,
+                manage_cost=5,
+                sales_type="월세",
+                pnu_cd="1162010100100020000",
+                gu_nm="관악구",
+                dong_nm="봉천동",
+                lat=37.47,
+                lng=126.95,
+                built_in=("에어컨", "세탁기"),
+                near_mart=True,
+            )
+            for house_platform_id in range(1, count + 1)
+        ],
+        prices=[
+            CandidateSnapshotPrice(house_platform_id, 300, 60)
+            for house_platform_id in range(1, count + 1)
+        ],
+        distances=[
+            CandidateSnapshotDistance(house_platform_id, 1, 20.0)
+            for house_platform_id in range(1, count + 1)
+        ],
+        watermark=CandidateSnapshotWatermark(),
+    )
+
+    columns = snapshot._state.columns
+    assert columns.options[0] == (
+        OPTION_BITS["aircon"] | OPTION_BITS["washer"] | OPTION_BITS["near_mart"]
+    )
+    # 열 폭이 고정이라 행당 바이트로 100만 건을 환산한다(대학 거리 1건 포함).
+    assert snapshot.nbytes / count * 1_000_000 < 100 * 1024 * 1024
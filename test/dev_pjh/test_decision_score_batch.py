@@ -0,0 +1,109 @@
+"""DecisionScoreCalculator 배치 계산 테스트."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ObservationScoreSource,
+)
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+    ObservationScoreColumns,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+# 반올림 경계에 걸리기 쉬운 값들.
+_BOUNDARY_VALUES = (0.0, 0.05, 0.15, 0.25, 0.35, 0.5, 0.995, 1.0, 1.005, 2.675)
+
+
+def _random_value(rng: random.Random, low: float, high: float, optional=True):
+    roll = rng.random()
+    if optional and roll < 0.15:
+        return None
+    if roll < 0.35:
+        return rng.choice(_BOUNDARY_VALUES) * (high if high > 1 else 1)
+    return rng.uniform(low, high)
+
+
+def _build_sources(count: int, seed: int = 11) -> list[ObservationScoreSource]:
+    rng = random.Random(seed)
+    sources = []
+    for house_platform_id in range(1, count + 1):
+        sources.append(
+            ObservationScoreSource(
+                house_platform_id=house_platform_id,
+                snapshot_id=f"snap-{house_platform_id}",
+                observation_version="obs-1",
+                price_percentile=_random_value(rng, -0.2, 1.2),
+                price_zscore=_random_value(rng, -4.0, 4.0),
+                price_burden_nonlinear=_random_value(rng, 0.0, 1.0),
+                estimated_move_in_cost=0,
+                monthly_cost_est=0,
+                essential_option_coverage=_random_value(rng, 0.0, 1.0),
+                convenience_score=_random_value(rng, 0.0, 100.0),
+                risk_probability_est=_random_value(rng, 0.0, 1.0),
+                risk_severity_score=_random_value(rng, 0.0, 1.0),
+                risk_nonlinear_penalty=_random_value(rng, 0.0, 1.0),
+                distance_to_school_min=_random_value(rng, 0.0, 60.0, optional=False),
+                distance_percentile=_random_value(rng, 0.0, 1.0),
+                distance_nonlinear_score=_random_value(rng, 0.0, 1.0),
+            )
+        )
+    return sources
+
+
+def test_calculate_batch_matches_scalar_path_exactly():
+    sources = _build_sources(5000)
+    policies = [
+        DecisionPolicyConfig(),
+        DecisionPolicyConfig(
+            weight_price=0.7,
+            weight_risk=0.1,
+            weight_option=0.1,
+            weight_distance=0.1,
+            price_feature_weights=(0.2, 0.5, 0.3),
+            threshold_base_total=55.0,
+        ),
+        # 세부 가중치가 0인 항목과 zscore 구간이 비어 있는 경우.
+        DecisionPolicyConfig(
+            option_feature_weights=(1.0, 0.0),
+            zscore_min=1.0,
+            zscore_max=1.0,
+        ),
+    ]
+
+    for policy in policies:
+        calculator = DecisionScoreCalculator(policy)
+        expected = [calculator.calculate(source, "obs-1", "v1") for source in sources]
+        assert calculator.calculate_many(sources, "obs-1", "v1") == expected
+
+
+def test_calculate_batch_maps_nan_to_missing_scores():
+    source = _build_sources(1)[0]
+    for field in (
+        "price_percentile",
+        "price_zscore",
+        "price_burden_nonlinear",
+        "essential_option_coverage",
+        "convenience_score",
+        "risk_probability_est",
+        "risk_severity_score",
+        "risk_nonlinear_penalty",
+    ):
+        setattr(source, field, None)
+    calculator = DecisionScoreCalculator(DecisionPolicyConfig())
+
+    batch = calculator.calculate_batch(ObservationScoreColumns.from_sources([source]))
+    scalar = calculator.calculate(source, "obs-1", "v1")
+
+    assert np.isnan(batch.price_score[0])
+    assert np.isnan(batch.option_score[0])
+    assert np.isnan(batch.risk_score[0])
+    assert scalar.price_score is None
+    assert batch.distance_score[0] == scalar.distance_score
+    assert batch.base_total_score[0] == scalar.base_total_score
+    assert bool(batch.is_student_recommended[0]) == scalar.is_student_recommended
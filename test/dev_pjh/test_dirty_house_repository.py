@@ -0,0 +1,118 @@
+"""student_house_dirty 저장소 테스트."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.student_house_decision_policy.infrastructure.orm.student_house_dirty_orm import (
+    StudentHouseDirtyORM,
+)
+from modules.student_house_decision_policy.infrastructure.repository.dirty_house_repository import (
+    DirtyHouseRepository,
+)
+from shared.application.port_out.dirty_house_port import DirtyHousePort
+
+
+def test_clear_keeps_houses_marked_again_after_fetch():
+    engine = create_engine("sqlite:///:memory:")
+    StudentHouseDirtyORM.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    session.add_all(
+        [
+            StudentHouseDirtyORM(house_platform_id=1, marked_at=datetime(2026, 1, 1)),
+            StudentHouseDirtyORM(house_platform_id=2, marked_at=datetime(2026, 1, 1)),
+        ]
+    )
+    session.commit()
+    repository = DirtyHouseRepository(session_factory)
+
+    marked = repository.fetch_dirty()
+    # 조회 이후 2번 매물이 다시 표시된다.
+    session.query(StudentHouseDirtyORM).filter_by(house_platform_id=2).update(
+        {"marked_at": datetime(2026, 1, 2)}
+    )
+    session.commit()
+    session.close()
+
+    assert repository.clear(marked) == 1
+    assert list(repository.fetch_dirty()) == [2]
+
+
+class _SessionRecordingTracker(DirtyHousePort):
+    """표시가 저장소 트랜잭션 안에서, 커밋 전에 오는지 기록한다."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.marks = []
+
+    def mark_dirty(self, house_platform_ids, reason, session=None):
+        in_transaction = session is not None and session.in_transaction()
+        self.marks.append((list(house_platform_ids), reason, in_transaction))
+        if self.fail:
+            raise RuntimeError("dirty mark failed")
+
+    def fetch_dirty(self, limit=None):
+        return {}
+
+    def clear(self, marked):
+        return 0
+
+
+def _house_platform_repository(tracker):
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(engine, tables=[HousePlatformORM.__table__])
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    session.add(
+        HousePlatformORM(
+            house_platform_id=1, rgst_no="100", title="매물", snapshot_id="old"
+        )
+    )
+    session.commit()
+    session.close()
+    return HousePlatformRepository(session_factory, dirty_house_tracker=tracker), session_factory
+
+
+def _changed_bundle():
+    return HousePlatformUpsertBundle(
+        house_platform=HousePlatformUpsertModel(rgst_no="100", snapshot_id="new")
+    )
+
+
+def test_upsert_batch_marks_dirty_inside_its_transaction():
+    tracker = _SessionRecordingTracker()
+    repository, _ = _house_platform_repository(tracker)
+
+    assert repository.upsert_batch([_changed_bundle()]) == 1
+    assert tracker.marks == [([1], "house_platform", True)]
+
+
+def test_upsert_batch_rolls_back_changes_when_dirty_mark_fails():
+    repository, session_factory = _house_platform_repository(
+        _SessionRecordingTracker(fail=True)
+    )
+
+    with pytest.raises(RuntimeError):
+        repository.upsert_batch([_changed_bundle()])
+
+    session = session_factory()
+    try:
+        assert session.get(HousePlatformORM, 1).snapshot_id == "old"
+    finally:
+        session.close()
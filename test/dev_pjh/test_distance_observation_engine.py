@@ -0,0 +1,281 @@
+"""거리 관측치 배치 엔진 테스트."""
+from __future__ import annotations
+
+import random
+from math import atan2, cos, radians, sin, sqrt
+
+import numpy as np
+
+from modules.house_platform.application.dto.house_platform_location_dto import (
+    HousePlatformLocation,
+)
+from modules.observations.application.factory.distance_observation_engine import (
+    DISTANCE_BUCKET_LABELS,
+    DistanceObservationEngine,
+)
+from modules.observations.application.port.distance_observation_repository_port import (
+    DistanceObservationRepositoryPort,
+)
+from modules.observations.application.usecase.generate_distance_observation_usecase import (
+    GenerateDistanceObservationUseCase,
+)
+from modules.university.application.dto.university_location_dto import (
+    UniversityLocationDTO,
+)
+
+
+# ---------- 건별 계산 기준(엔진 도입 전 구현) ----------
+def _reference_minutes(lat1, lon1, lat2, lon2):
+    R = 6371
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    km = R * c
+    return (km / 5) * 60
+
+
+def _reference_bucket(minutes):
+    if minutes < 10:
+        return "0_10분"
+    if minutes < 20:
+        return "10_20분"
+    if minutes < 30:
+        return "20_30분"
+    if minutes < 40:
+        return "30_40분"
+    return "40분_이상"
+
+
+def _reference_score(minutes):
+    if minutes <= 20:
+        return max(0.0, 1 - 0.01 * minutes)
+    if minutes <= 30:
+        return max(0.0, 0.8 - 0.02 * (minutes - 20))
+    if minutes <= 40:
+        return max(0.0, 0.6 - 0.03 * (minutes - 30))
+    return 0.3
+
+
+def _reference_rows(house_id, recommendation_id, lat, lng, universities):
+    all_minutes = [
+        _reference_minutes(lat, lng, university.lat, university.lng)
+        for university in universities
+    ]
+    arr = np.array(all_minutes)
+    return [
+        (
+            house_id,
+            recommendation_id,
+            university.university_location_id,
+            minutes,
+            float(np.sum(arr <= minutes) / len(arr)),
+            _reference_bucket(minutes),
+            _reference_score(minutes),
+        )
+        for university, minutes in zip(universities, all_minutes)
+    ]
+
+
+def _rows(observations):
+    return [
+        (
+            observation.house_platform_id,
+            observation.recommendation_observation_id,
+            observation.university_id,
+            observation.학교까지_분,
+            observation.거리_백분위,
+            observation.거리_버킷,
+            observation.거리_비선형_점수,
+        )
+        for observation in observations
+    ]
+
+
+def _universities(rng, count):
+    universities = [
+        UniversityLocationDTO(
+            university_location_id=index + 1,
+            university_name=f"대학{index}",
+            campus="본교",
+            lat=37.45 + rng.random() * 0.2,
+            lng=126.85 + rng.random() * 0.3,
+        )
+        for index in range(count)
+    ]
+    # 같은 좌표 캠퍼스로 백분위 동점을 만든다.
+    universities.append(
+        UniversityLocationDTO(
+            university_location_id=count + 1,
+            university_name="대학-분교",
+            campus="분교",
+            lat=universities[0].lat,
+            lng=universities[0].lng,
+        )
+    )
+    return universities
+
+
+class _FakeHouseRepo:
+    def __init__(self, locations):
+        self.locations = locations
+        self.calls = 0
+
+    def fetch_locations_by_ids(self, house_platform_ids):
+        self.calls += 1
+        return [
+            self.locations[house_platform_id]
+            for house_platform_id in house_platform_ids
+            if house_platform_id in self.locations
+        ]
+
+
+class _FakeUniversityRepo:
+    def __init__(self, universities):
+        self.universities = universities
+
+    def get_university_locations(self):
+        return self.universities
+
+
+class _FakeDistanceRepo(DistanceObservationRepositoryPort):
+    """copy_bulk는 Port 기본 구현(save_bulk 한 번)을 쓴다."""
+
+    def __init__(self):
+        self.batches = []
+
+    def save_bulk(self, distances):
+        self.batches.append(distances)
+
+    def get_bulk_by_house_platform_id(self, house_platform_id):
+        return []
+
+
+def test_exact_engine_matches_scalar_observations_bitwise():
+    rng = random.Random(21)
+    universities = _universities(rng, 60)
+    houses = [
+        (house_id, 37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4)
+        for house_id in range(1, 301)
+    ]
+    engine = DistanceObservationEngine(universities, chunk_size=64, exact=True)
+
+    actual = []
+    for block in engine.iter_blocks(
+        [house[0] for house in houses],
+        [house[1] for house in houses],
+        [house[2] for house in houses],
+    ):
+        actual.extend(
+            _rows(
+                engine.to_observations(
+                    block, [house_id * 10 for house_id in block.house_platform_ids.tolist()], None
+                )
+            )
+        )
+
+    expected = []
+    for house_id, lat, lng in houses:
+        expected.extend(_reference_rows(house_id, house_id * 10, lat, lng, universities))
+    assert actual == expected
+
+
+def test_bucket_and_score_boundaries():
+    minutes = np.array(
+        [[0.0, 9.999, 10.0, 19.5, 20.0, 20.5, 30.0, 35.0, 40.0, 40.01, 120.0]]
+    )
+    buckets = DistanceObservationEngine.bucket_index(minutes)[0].tolist()
+    scores = DistanceObservationEngine.nonlinear_score(minutes)[0].tolist()
+    assert [DISTANCE_BUCKET_LABELS[index] for index in buckets] == [
+        _reference_bucket(value) for value in minutes[0].tolist()
+    ]
+    assert scores == [_reference_score(value) for value in minutes[0].tolist()]
+
+
+def test_default_broadcast_stays_within_tolerance_of_scalar_path():
+    # 기본 브로드캐스팅 경로는 libm과 마지막 자리만 다를 수 있다. 분은 상대 오차
+    # 1e-12 이내, 백분위/버킷/점수는 경계에 걸리지 않는 한 같아야 한다.
+    rng = random.Random(3)
+    universities = _universities(rng, 40)
+    houses = [
+        (house_id, 37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4)
+        for house_id in range(1, 51)
+    ]
+    engine = DistanceObservationEngine(universities, chunk_size=16)
+    assert not engine.exact
+
+    actual = []
+    for block in engine.iter_blocks(*map(list, zip(*houses))):
+        actual.extend(
+            _rows(engine.to_observations(block, block.house_platform_ids.tolist(), None))
+        )
+    expected = []
+    for house_id, lat, lng in houses:
+        expected.extend(_reference_rows(house_id, house_id, lat, lng, universities))
+
+    assert len(actual) == len(expected)
+    np.testing.assert_allclose(
+        [row[3] for row in actual], [row[3] for row in expected], rtol=1e-12
+    )
+    assert [row[:3] + row[4:6] for row in actual] == [
+        row[:3] + row[4:6] for row in expected
+    ]
+    np.testing.assert_allclose(
+        [row[6] for row in actual], [row[6] for row in expected], rtol=1e-12
+    )
+
+
+def test_percentile_counts_ties_like_scalar_path():
+    rng = np.random.default_rng(5)
+    minutes = rng.integers(0, 6, size=(30, 9)).astype(np.float64)
+    expected = np.array(
+        [[np.sum(row <= value) / len(row) for value in row] for row in minutes]
+    )
+    assert np.array_equal(DistanceObservationEngine.percentile(minutes), expected)
+    assert DistanceObservationEngine.percentile(np.empty((3, 0))).shape == (3, 0)
+
+
+def test_execute_batch_saves_per_chunk_and_skips_missing_location():
+    rng = random.Random(8)
+    universities = _universities(rng, 12)
+    locations = {
+        house_id: HousePlatformLocation(
+            house_platform_id=house_id,
+            lat=37.4 + rng.random() * 0.3,
+            lng=126.8 + rng.random() * 0.4,
+        )
+        for house_id in range(1, 12)
+        if house_id != 5
+    }
+    house_repo = _FakeHouseRepo(locations)
+    distance_repo = _FakeDistanceRepo()
+    usecase = GenerateDistanceObservationUseCase(
+        distance_repo=distance_repo,
+        house_repo=house_repo,
+        university_repo=_FakeUniversityRepo(universities),
+        chunk_size=4,
+        exact=True,
+    )
+
+    targets = [(house_id + 100, house_id) for house_id in range(1, 12)]
+    skipped = usecase.execute_batch(targets)
+
+    assert skipped == [5]
+    assert house_repo.calls == 1
+    assert [len(batch) for batch in distance_repo.batches] == [
+        4 * len(universities),
+        4 * len(universities),
+        2 * len(universities),
+    ]
+    expected = []
+    for recommendation_id, house_id in targets:
+        if house_id == 5:
+            continue
+        location = locations[house_id]
+        expected.extend(
+            _reference_rows(
+                house_id, recommendation_id, location.lat, location.lng, universities
+            )
+        )
+    actual = [row for batch in distance_repo.batches for row in _rows(batch)]
+    assert actual == expected
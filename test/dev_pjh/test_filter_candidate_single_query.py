@@ -0,0 +1,211 @@
+"""FilterCandidateService 가격/거리 조건 단일 쿼리 테스트."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCommand,
+)
+from modules.student_house_decision_policy.application.usecase.filter_candidate import (
+    FilterCandidateService,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+from modules.university.application.dto.university_location_dto import (
+    UniversityLocationDTO,
+)
+
+_UNIVERSITY_IDS = {"가까운대학교": 1, "먼대학교": 2}
+
+
+class _FinderRequestRepository:
+    def __init__(self, requests):
+        self._requests = {request.finder_request_id: request for request in requests}
+
+    def find_by_id(self, finder_request_id):
+        return self._requests.get(finder_request_id)
+
+
+class _UniversityRepository:
+    def get_all_university_names(self):
+        return list(_UNIVERSITY_IDS)
+
+    def get_university_locations(self):
+        return [
+            UniversityLocationDTO(
+                university_location_id=university_id,
+                university_name=name,
+                campus="본캠",
+                lat=37.0,
+                lng=127.0,
+            )
+            for name, university_id in _UNIVERSITY_IDS.items()
+        ]
+
+    def get_unique_university_locations(self):
+        return list(_UNIVERSITY_IDS.values())
+
+
+class _StepwiseCandidateRepository(HousePlatformCandidateRepository):
+    """단일 쿼리를 쓰지 않아 서비스가 관측 저장소로 단계별 필터링하게 만든다."""
+
+    def fetch_candidates_within_budget(self, criteria, **kwargs):
+        raise NotImplementedError
+
+
+def _seed(session, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    price_id = 0
+    distance_id = 0
+    for house_platform_id in range(1, 81):
+        session.add(
+            HousePlatformORM(
+                house_platform_id=house_platform_id,
+                snapshot_id=f"snap-{house_platform_id}",
+                address=rng.choice(["서울시 관악구", "서울시 동작구"]),
+                deposit=rng.randint(100, 2000),
+                monthly_rent=rng.choice([None, 40, 55, 70]),
+                manage_cost=5,
+                sales_type=rng.choice(["월세", "전세"]),
+                is_banned=rng.random() < 0.05,
+            )
+        )
+        # 가격 관측치가 없는 매물도 섞는다. 최신 관측치만 예산 비교에 쓰여야 한다.
+        for index in range(rng.randint(0, 3)):
+            price_id += 1
+            session.add(
+                StudentRecommendationPriceObservationsORM(
+                    id=price_id,
+                    house_platform_id=house_platform_id,
+                    recommendation_observation_id=price_id,
+                    가격_백분위=0.5,
+                    가격_z점수=0.0,
+                    예상_입주비용=rng.randint(200, 1500),
+                    월_비용_추정=rng.randint(30, 90),
+                    가격_부담_비선형=0.5,
+                    calculated_at=base + timedelta(days=index),
+                )
+            )
+        for university_id in _UNIVERSITY_IDS.values():
+            for _ in range(rng.randint(0, 2)):
+                distance_id += 1
+                session.add(
+                    StudentRecommendationDistanceObservationORM(
+                        id=distance_id,
+                        house_id=house_platform_id,
+                        recommendation_observation_id=distance_id,
+                        university_id=university_id,
+                        학교까지_분=rng.choice([10.0, 29.9, 30.0, 30.1, 55.0]),
+                        거리_백분위=0.5,
+                        거리_버킷="10_20분",
+                        거리_비선형_점수=0.5,
+                        # 같은 시각 관측치는 id가 큰 쪽이 최신이다.
+                        calculated_at=base + timedelta(days=rng.randint(0, 1)),
+                    )
+                )
+    session.commit()
+
+
+def _build_requests() -> list[FinderRequest]:
+    requests = []
+    finder_request_id = 0
+    for price_type in (None, "MONTHLY", "JEONSE", "MIXED"):
+        for max_deposit, max_rent in ((800, 60), (None, 50), (1200, None)):
+            for university_name, is_near in (
+                (None, False),
+                ("가까운대학교", True),
+                ("먼대학교", True),
+                ("가까운대학교", False),
+                ("없는대학교", True),
+            ):
+                finder_request_id += 1
+                requests.append(
+                    FinderRequest(
+                        finder_request_id=finder_request_id,
+                        abang_user_id=1,
+                        status="Y",
+                        price_type=price_type,
+                        max_deposit=max_deposit,
+                        max_rent=max_rent,
+                        preferred_region=(
+                            "관악구" if finder_request_id % 4 == 0 else None
+                        ),
+                        university_name=university_name,
+                        is_near=is_near,
+                    )
+                )
+    return requests
+
+
+def test_single_query_filter_matches_stepwise_filters():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(engine, tables=[HousePlatformORM.__table__])
+    StudentRecommendationPriceObservationsORM.metadata.create_all(engine)
+    StudentRecommendationDistanceObservationORM.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    _seed(session)
+
+    requests = _build_requests()
+    finder_repo = _FinderRequestRepository(requests)
+
+    def build_service(candidate_repo):
+        return FilterCandidateService(
+            finder_request_repo=finder_repo,
+            house_platform_repo=candidate_repo,
+            price_observation_repo=StudentRecommendationPriceObservationRepository(
+                session
+            ),
+            distance_observation_repo=StudentRecommendationDistanceObservationRepository(
+                session
+            ),
+            university_repo=_UniversityRepository(),
+        )
+
+    single_query = build_service(HousePlatformCandidateRepository(session_factory))
+    stepwise = build_service(_StepwiseCandidateRepository(session_factory))
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    non_empty = 0
+    for request in requests:
+        command = FilterCandidateCommand(finder_request_id=request.finder_request_id)
+        statements.clear()
+        actual = single_query.execute(command)
+        assert len(statements) == 1
+        expected = stepwise.execute(command)
+
+        assert actual.criteria == expected.criteria
+        assert actual.message == expected.message
+        assert [candidate.house_platform_id for candidate in actual.candidates] == sorted(
+            candidate.house_platform_id for candidate in expected.candidates
+        )
+        non_empty += bool(actual.candidates)
+    # 조건 조합 대부분이 실제 후보를 남겨야 비교가 의미 있다.
+    assert non_empty > len(requests) // 2
@@ -0,0 +1,287 @@
+"""전체 관측치 배치/병렬 실행 테스트."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.infrastructure.orm.house_platform_management_orm import (
+    HousePlatformManagementORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.observations.application.dto.full_observation_batch_dto import (
+    FullObservationBatchResult,
+    GenerateFullObservationBatchCommand,
+)
+from modules.observations.application.usecase.generate_distance_observation_usecase import (
+    GenerateDistanceObservationUseCase,
+)
+from modules.observations.application.usecase.generate_full_observation_usecase import (
+    GenerateFullObservationUseCase,
+)
+from modules.observations.application.usecase.generate_price_observation_usecase import (
+    GeneratePriceObservationUseCase,
+)
+from modules.observations.application.usecase.generate_student_recommendation_feature_observation_usecase import (
+    GenerateStudentRecommendationFeatureObservationUseCase,
+)
+from modules.observations.application.usecase.parallel_generate_full_observation import (
+    ParallelGenerateFullObservationService,
+)
+from modules.university.application.dto.university_location_dto import (
+    UniversityLocationDTO,
+)
+
+
+def _house(house_id, lat_lng):
+    return SimpleNamespace(
+        lat_lng=lat_lng,
+        deposit=1000 * house_id,
+        monthly_rent=50,
+        manage_cost=5,
+        is_banned=False,
+        floor_no=3,
+        all_floors=10,
+        gu_nm="관악구",
+        snapshot_id=f"snapshot_{house_id}",
+    )
+
+
+class _FakeHouseRepo:
+    def __init__(self, bundles):
+        self.bundles = bundles
+        self.bundle_calls = []
+
+    def fetch_bundles_by_ids(self, house_platform_ids):
+        self.bundle_calls.append(list(house_platform_ids))
+        return {
+            house_id: self.bundles[house_id]
+            for house_id in house_platform_ids
+            if house_id in self.bundles
+        }
+
+    def fetch_bundle_by_id(self, house_platform_id):
+        raise AssertionError("batch mode must not fetch bundles one by one")
+
+    def fetch_locations_by_ids(self, house_platform_ids):
+        raise AssertionError("batch mode must reuse bundle locations")
+
+
+class _FakeFeatureRepo:
+    def __init__(self):
+        self.saved = []
+
+    def copy_bulk(self, observations):
+        for observation in observations:
+            observation.id = 1000 + len(self.saved)
+            self.saved.append(observation)
+        return len(self.saved)
+
+
+class _FakeBulkRepo:
+    def __init__(self):
+        self.saved = []
+
+    def copy_bulk(self, observations):
+        observations = list(observations)
+        self.saved.extend(observations)
+        return len(observations)
+
+
+class _FakeUniversityRepo:
+    def get_university_locations(self):
+        return [
+            UniversityLocationDTO(
+                university_location_id=university_id,
+                university_name=f"대학{university_id}",
+                campus="본교",
+                lat=37.45 + university_id * 0.01,
+                lng=126.95 + university_id * 0.01,
+            )
+            for university_id in range(1, 4)
+        ]
+
+
+def _build_usecase():
+    bundles = {
+        house_id: SimpleNamespace(
+            house_platform=_house(
+                house_id, None if house_id == 4 else {"lat": 37.48, "lng": 126.95}
+            ),
+            options=None,
+        )
+        for house_id in range(1, 8)
+        if house_id != 2
+    }
+    house_repo = _FakeHouseRepo(bundles)
+    feature_repo = _FakeFeatureRepo()
+    price_repo = _FakeBulkRepo()
+    distance_repo = _FakeBulkRepo()
+    usecase = GenerateFullObservationUseCase(
+        student_feature_uc=GenerateStudentRecommendationFeatureObservationUseCase(
+            observation_repo=feature_repo,
+            distance_usecase=None,
+            house_repo=house_repo,
+        ),
+        price_uc=GeneratePriceObservationUseCase(
+            price_repo=price_repo,
+            # 6번은 가격 코호트에 없다.
+            house_prices={house_id: house_id * 1000 for house_id in range(1, 8) if house_id != 6},
+        ),
+        distance_uc=GenerateDistanceObservationUseCase(
+            distance_repo=distance_repo,
+            house_repo=house_repo,
+            university_repo=_FakeUniversityRepo(),
+        ),
+    )
+    return usecase, house_repo, feature_repo, price_repo, distance_repo
+
+
+def test_execute_batch_reports_failures_per_stage():
+    usecase, house_repo, feature_repo, price_repo, distance_repo = _build_usecase()
+
+    result = usecase.execute_batch(range(1, 8), chunk_size=4)
+
+    assert house_repo.bundle_calls == [[1, 2, 3, 4], [5, 6, 7]]
+    assert result.processed_house_ids == [1, 3, 5, 7]
+    by_stage = {
+        stage: [failure.house_platform_id for failure in failures]
+        for stage, failures in result.failures_by_stage().items()
+    }
+    assert by_stage == {"feature": [2], "distance": [4], "price": [6]}
+    assert result.failed_count == 3
+
+    feature_ids = {feature.house_platform_id: feature.id for feature in feature_repo.saved}
+    assert sorted(feature_ids) == [1, 3, 4, 5, 6, 7]
+    assert {
+        price.house_platform_id: price.recommendation_observation_id
+        for price in price_repo.saved
+    } == {house_id: feature_ids[house_id] for house_id in (1, 3, 4, 5, 7)}
+    assert sorted(
+        {(d.house_platform_id, d.recommendation_observation_id) for d in distance_repo.saved}
+    ) == [(house_id, feature_ids[house_id]) for house_id in (1, 3, 5, 6, 7)]
+    assert len(distance_repo.saved) == 5 * 3
+
+
+def test_execute_batch_records_failed_save_without_aborting():
+    usecase, _, _, price_repo, distance_repo = _build_usecase()
+
+    def _broken(observations):
+        raise RuntimeError("copy failed")
+
+    price_repo.copy_bulk = _broken
+    result = usecase.execute_batch([1, 3], chunk_size=10)
+
+    assert result.processed_house_ids == []
+    assert [failure.stage for failure in result.failures] == ["price", "price"]
+    assert {d.house_platform_id for d in distance_repo.saved} == {1, 3}
+
+
+# ---------- 프로세스 풀 ----------
+_initialized_prices: dict[int, int] = {}
+
+
+def _init_worker(house_prices):
+    _initialized_prices.clear()
+    _initialized_prices.update(house_prices)
+
+
+def _run_chunk(house_ids):
+    if 13 in house_ids:
+        raise RuntimeError("worker crashed")
+    result = FullObservationBatchResult()
+    for house_id in house_ids:
+        if house_id in _initialized_prices:
+            result.processed_house_ids.append(house_id)
+        else:
+            result.add_failure(house_id, "price", "no price")
+    return result
+
+
+class _FakeCardCache:
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate_houses(self, house_platform_ids):
+        self.invalidated.extend(house_platform_ids)
+
+
+def test_parallel_service_merges_chunk_results():
+    for max_workers in (1, 2):
+        card_cache = _FakeCardCache()
+        service = ParallelGenerateFullObservationService(
+            chunk_runner=_run_chunk,
+            worker_initializer=_init_worker,
+            card_cache=card_cache,
+        )
+        result = service.execute(
+            GenerateFullObservationBatchCommand(
+                house_platform_ids=range(1, 21),
+                house_prices={house_id: 100 for house_id in range(1, 21) if house_id != 4},
+                chunk_size=5,
+                max_workers=max_workers,
+            )
+        )
+
+        assert sorted(result.processed_house_ids) == [
+            house_id for house_id in range(1, 21) if house_id != 4 and not 11 <= house_id <= 15
+        ]
+        by_stage = result.failures_by_stage()
+        assert [failure.house_platform_id for failure in by_stage["price"]] == [4]
+        assert sorted(failure.house_platform_id for failure in by_stage["batch"]) == [
+            11, 12, 13, 14, 15
+        ]
+        assert sorted(card_cache.invalidated) == [
+            house_id for house_id in range(1, 21) if not 11 <= house_id <= 15
+        ]
+
+
+def test_fetch_bundles_by_ids_matches_single_fetch():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(
+        engine,
+        tables=[
+            HousePlatformORM.__table__,
+            HousePlatformManagementORM.__table__,
+            HousePlatformOptionORM.__table__,
+        ],
+    )
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    for house_id in range(1, 6):
+        session.add(
+            HousePlatformORM(
+                house_platform_id=house_id,
+                title=f"매물{house_id}",
+                sales_type="월세",
+                deposit=house_id * 100,
+                lat_lng={"lat": 37.5, "lng": 127.0},
+            )
+        )
+        if house_id % 2:
+            session.add(
+                HousePlatformOptionORM(
+                    house_platform_options_id=house_id,
+                    house_platform_id=house_id,
+                    built_in='["에어컨"]',
+                    near_univ=True,
+                )
+            )
+    session.commit()
+
+    repository = HousePlatformRepository(session_factory)
+    bundles = repository.fetch_bundles_by_ids([1, 2, 3, 99, 2])
+
+    assert sorted(bundles) == [1, 2, 3]
+    for house_id, bundle in bundles.items():
+        assert bundle == repository.fetch_bundle_by_id(house_id)
+    assert bundles[1].options is not None and bundles[2].options is None
@@ -0,0 +1,112 @@
+import os
+import sys
+
+# 프로젝트 루트를 sys.path에 추가해 모듈 import를 보장한다.
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.application.dto.fetch_and_store_dto import (
+    HousePlatformUpsertBundle,
+)
+from modules.house_platform.application.dto.house_platform_dto import (
+    HousePlatformUpsertModel,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.house_platform.infrastructure.repository.house_platform_repository import (
+    HousePlatformRepository,
+)
+from modules.recommendations.adapter.output.lru_house_card_cache import (
+    LruHouseCardCache,
+)
+from modules.recommendations.application.dto.recommendation_dto import (
+    HouseCard,
+    HouseCardKey,
+)
+
+
+def _card(house_platform_id: int) -> HouseCard:
+    return HouseCard(
+        house_platform_id=house_platform_id,
+        raw={"house_platform_id": house_platform_id},
+        observation_summary=None,
+    )
+
+
+def test_lru_house_card_cache_evicts_least_recently_used():
+    cache = LruHouseCardCache(maxsize=2)
+    keys = [HouseCardKey(index, f"snap-{index}", "obs-1") for index in (1, 2, 3)]
+
+    cache.save_many({keys[0]: _card(1), keys[1]: _card(2)})
+    # 1번을 조회해 최근 사용으로 올린 뒤 3번을 넣으면 2번이 밀려난다.
+    assert set(cache.get_many([keys[0]])) == {keys[0]}
+    cache.save_many({keys[2]: _card(3)})
+
+    assert set(cache.get_many(keys)) == {keys[0], keys[2]}
+
+
+def test_lru_house_card_cache_separates_versions_and_invalidates_by_house():
+    cache = LruHouseCardCache()
+    old_key = HouseCardKey(1, "snap-1", "obs-1")
+    new_key = HouseCardKey(1, "snap-2", "obs-1")
+    other_key = HouseCardKey(2, "snap-1", "obs-1")
+    cache.save_many({old_key: _card(1), other_key: _card(2)})
+
+    # 스냅샷이 바뀌면 다른 키이므로 이전 카드가 재사용되지 않는다.
+    assert cache.get_many([new_key]) == {}
+
+    cache.invalidate_houses([1])
+    assert set(cache.get_many([old_key, other_key])) == {other_key}
+
+
+def test_lru_house_card_cache_expires_entries():
+    cache = LruHouseCardCache(ttl_seconds=0)
+    key = HouseCardKey(1, "snap-1", "obs-1")
+    cache.save_many({key: _card(1)})
+
+    assert cache.get_many([key]) == {}
+
+
+class _RecordingCardCache:
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate_houses(self, house_platform_ids):
+        self.invalidated.append(list(house_platform_ids))
+
+
+def test_upsert_batch_invalidates_cards_of_recrawled_houses():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(engine, tables=[HousePlatformORM.__table__])
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    session.add_all(
+        [
+            HousePlatformORM(house_platform_id=1, rgst_no="100", snapshot_id="a", deposit=100),
+            HousePlatformORM(house_platform_id=2, rgst_no="200", snapshot_id="b", deposit=200),
+        ]
+    )
+    session.commit()
+    session.close()
+    card_cache = _RecordingCardCache()
+    repository = HousePlatformRepository(session_factory, card_cache=card_cache)
+
+    repository.upsert_batch(
+        [
+            HousePlatformUpsertBundle(
+                house_platform=HousePlatformUpsertModel(rgst_no="100", deposit=150)
+            ),
+            HousePlatformUpsertBundle(
+                house_platform=HousePlatformUpsertModel(rgst_no="200", snapshot_id="c")
+            ),
+        ]
+    )
+
+    assert card_cache.invalidated == [[1, 2]]
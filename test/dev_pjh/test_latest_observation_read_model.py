@@ -0,0 +1,193 @@
+"""최신 관측치 포인터(read model) 테스트."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from modules.observations.adapter.output.repository.latest_observation_pointer import (
+    upsert_latest_pointers,
+)
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.observations.domain.model.price_feature_observation import (
+    PriceFeatureObservation,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+    StudentRecommendationLatestDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationLatestPriceObservationORM,
+    StudentRecommendationPriceObservationsORM,
+)
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가한다(BIGINT와 저장 방식은 같다).
+    return "INTEGER"
+
+
+T1 = datetime(2026, 1, 1)
+T2 = datetime(2026, 1, 2)
+T3 = datetime(2026, 1, 3)
+
+
+def _session():
+    engine = create_engine("sqlite:///:memory:")
+    StudentRecommendationDistanceObservationORM.metadata.create_all(engine)
+    StudentRecommendationPriceObservationsORM.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _distance(house_id, university_id, minutes, calculated_at):
+    return DistanceFeatureObservation(
+        id=None,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id * 10,
+        university_id=university_id,
+        학교까지_분=minutes,
+        거리_백분위=0.5,
+        거리_버킷="10_20분",
+        거리_비선형_점수=0.5,
+        calculated_at=calculated_at,
+    )
+
+
+def _price(house_id, percentile, calculated_at):
+    return PriceFeatureObservation(
+        id=None,
+        house_platform_id=house_id,
+        recommendation_observation_id=house_id * 10,
+        가격_백분위=percentile,
+        가격_z점수=0.0,
+        예상_입주비용=1000,
+        월_비용_추정=50,
+        가격_부담_비선형=0.1,
+        calculated_at=calculated_at,
+    )
+
+
+def test_distance_pointer_keeps_newest_and_matches_window_query():
+    session = _session()
+    repository = StudentRecommendationDistanceObservationRepository(session)
+
+    repository.save_bulk(
+        [_distance(1, 1, 10.0, T2), _distance(1, 2, 20.0, T2), _distance(2, 1, 30.0, T2)]
+    )
+    # 같은 배치 안의 중복 키와, 이미 저장된 것보다 오래된 관측치.
+    repository.save_bulk(
+        [_distance(1, 1, 11.0, T3), _distance(1, 1, 12.0, T1), _distance(1, 2, 21.0, T1)]
+    )
+    # 같은 시각이면 id가 큰 쪽이 최신이다. 결과는 이력 id 순이다.
+    repository.save_bulk([_distance(2, 1, 31.0, T2)])
+
+    latest = repository.get_bulk_by_house_platform_ids([1, 2, 3])
+    assert {
+        house_id: [(d.university_id, d.학교까지_분) for d in distances]
+        for house_id, distances in latest.items()
+    } == {1: [(2, 20.0), (1, 11.0)], 2: [(1, 31.0)], 3: []}
+    assert session.query(StudentRecommendationLatestDistanceObservationORM).count() == 3
+
+    by_window = repository._latest_by_window([1, 2])
+    assert sorted(o.id for o in by_window) == sorted(
+        d.id for distances in latest.values() for d in distances
+    )
+    assert repository.get_bulk_by_house_platform_id(1) == latest[1]
+
+
+def test_price_pointer_updates_on_save_and_falls_back_without_pointer():
+    session = _session()
+    repository = StudentRecommendationPriceObservationRepository(session)
+
+    repository.save_bulk([_price(1, 0.1, T1), _price(2, 0.2, T2)])
+    saved = repository.save(_price(1, 0.3, T2))
+    repository.save(_price(2, 0.4, T1))
+    # 포인터 도입 전에 쌓인 이력은 포인터 없이 window 쿼리로 찾는다.
+    session.add_all(
+        [
+            StudentRecommendationPriceObservationsORM(
+                house_platform_id=3,
+                recommendation_observation_id=30,
+                가격_백분위=value,
+                가격_z점수=0.0,
+                예상_입주비용=1000,
+                월_비용_추정=50,
+                가격_부담_비선형=0.1,
+                calculated_at=calculated_at,
+            )
+            for value, calculated_at in ((0.5, T2), (0.6, T1))
+        ]
+    )
+    session.commit()
+
+    latest = repository.get_latest_by_house_platform_ids([1, 2, 3, 4])
+    assert {house_id: o.가격_백분위 for house_id, o in latest.items()} == {
+        1: 0.3, 2: 0.2, 3: 0.5
+    }
+    assert latest[1].id == saved.id
+    assert repository.get_by_house_platform_id(3).가격_백분위 == 0.5
+    assert repository.get_by_house_platform_id(4) is None
+
+
+def test_upsert_treats_null_calculated_at_as_newest():
+    session = _session()
+    pointer = StudentRecommendationLatestPriceObservationORM
+    key = ("house_platform_id",)
+
+    upsert_latest_pointers(
+        session, pointer, key,
+        [{"house_platform_id": 1, "observation_id": 1, "calculated_at": T3}],
+    )
+    upsert_latest_pointers(
+        session, pointer, key,
+        [
+            {"house_platform_id": 1, "observation_id": 2, "calculated_at": None},
+            {"house_platform_id": 1, "observation_id": 3, "calculated_at": T1},
+        ],
+    )
+    upsert_latest_pointers(
+        session, pointer, key,
+        [{"house_platform_id": 1, "observation_id": 4, "calculated_at": T3}],
+    )
+    session.commit()
+
+    assert session.get(pointer, 1).observation_id == 2
+
+
+class _RecordingCardCache:
+    def __init__(self, session):
+        self.session = session
+        self.invalidated = []
+
+    def invalidate_houses(self, house_platform_ids):
+        # 무효화는 커밋 뒤에 와야 다른 요청이 옛 관측치로 카드를 다시 채우지 않는다.
+        assert not self.session.in_transaction()
+        self.invalidated.append(list(house_platform_ids))
+
+
+def test_observation_writes_invalidate_house_cards_after_commit():
+    session = _session()
+    card_cache = _RecordingCardCache(session)
+    price_repo = StudentRecommendationPriceObservationRepository(
+        session, card_cache=card_cache
+    )
+    distance_repo = StudentRecommendationDistanceObservationRepository(
+        session, card_cache=card_cache
+    )
+
+    price_repo.save_bulk([_price(2, 0.1, T1), _price(1, 0.2, T1), _price(2, 0.3, T2)])
+    price_repo.save(_price(3, 0.4, T1))
+    distance_repo.save_bulk([_distance(4, 1, 10.0, T1), _distance(4, 2, 20.0, T1)])
+
+    assert card_cache.invalidated == [[1, 2], [3], [4]]
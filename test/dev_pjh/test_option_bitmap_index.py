@@ -0,0 +1,117 @@
+"""옵션 비트맵 인덱스와 필수 옵션 필터 테스트."""
+from __future__ import annotations
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCriteria,
+)
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    matches_base_criteria,
+)
+from modules.student_house_decision_policy.application.factory.option_bitmap_index import (
+    OPTION_ATTRIBUTES,
+    OPTION_BITS,
+    OptionBitmapIndex,
+    required_options_from_request,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+
+
+def test_bitmap_mask_matches_row_wise_check():
+    rng = np.random.default_rng(5)
+    # 8의 배수가 아닌 길이로 패딩 비트가 새지 않는지 본다.
+    options = rng.integers(0, 256, size=1003, dtype=np.uint8)
+    index = OptionBitmapIndex.from_option_bits(options)
+
+    assert index.nbytes == len(OPTION_ATTRIBUTES) * 126
+    assert index.mask([]).all()
+    for size in (1, 2, 3):
+        for attributes in itertools.combinations(OPTION_ATTRIBUTES, size):
+            required = sum(OPTION_BITS[attribute] for attribute in attributes)
+            expected = (options & required) == required
+            assert index.mask(attributes).tolist() == expected.tolist()
+    with pytest.raises(ValueError):
+        index.mask(["sauna"])
+
+
+def test_required_options_from_request():
+    request = FinderRequest(
+        abang_user_id=1, status="Y", aircon_yn="Y", washer_yn="N", fridge_yn="Y"
+    )
+    assert required_options_from_request(request) == {"aircon", "fridge"}
+
+
+def test_sql_option_filter_matches_candidate_pool_matcher():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(
+        engine, tables=[HousePlatformORM.__table__, HousePlatformOptionORM.__table__]
+    )
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    rng = random.Random(13)
+    for house_platform_id in range(1, 201):
+        session.add(
+            HousePlatformORM(
+                house_platform_id=house_platform_id,
+                sales_type="월세",
+                monthly_rent=50,
+                has_elevator=rng.choice([True, False, None]),
+                can_park=rng.choice([True, False, None]),
+            )
+        )
+        if rng.random() < 0.7:
+            session.add(
+                HousePlatformOptionORM(
+                    house_platform_options_id=house_platform_id,
+                    house_platform_id=house_platform_id,
+                    built_in=rng.choice(
+                        [None, "[]", '["에어컨"]', '["에어컨", "냉장고", "세탁기"]']
+                    ),
+                    near_univ=rng.choice([True, None]),
+                    near_mart=rng.choice([True, False]),
+                )
+            )
+    session.commit()
+
+    repository = HousePlatformCandidateRepository(session_factory)
+    pool = repository.fetch_candidate_pool()
+    for required in (
+        {"aircon"},
+        {"aircon", "washer"},
+        {"fridge", "elevator"},
+        {"parking", "near_mart", "near_univ"},
+        {"elevator", "parking"},
+    ):
+        criteria = FilterCandidateCriteria(
+            max_deposit_limit=None,
+            max_rent_limit=None,
+            budget_margin_ratio=0.0,
+            required_options=frozenset(required),
+        )
+        expected = [
+            candidate.house_platform_id
+            for candidate in pool
+            if matches_base_criteria(candidate, criteria)
+        ]
+        actual = sorted(
+            candidate.house_platform_id
+            for candidate in repository.fetch_candidates(criteria)
+        )
+        assert actual == expected
+        assert 0 < len(actual) < len(pool)
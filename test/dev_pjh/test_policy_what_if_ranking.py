@@ -0,0 +1,280 @@
+"""student_house_decision_policy what-if 재랭킹 테스트."""
+from __future__ import annotations
+
+import random
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreSummary,
+)
+from modules.student_house_decision_policy.application.dto.policy_simulation_dto import (
+    SimulatePolicyRankingCommand,
+)
+from modules.student_house_decision_policy.application.factory.decision_score_calculator import (
+    DecisionScoreCalculator,
+)
+from modules.student_house_decision_policy.application.factory.policy_what_if_ranker import (
+    PolicyWhatIfRanker,
+)
+from modules.student_house_decision_policy.application.usecase.simulate_policy_ranking import (
+    SimulatePolicyRankingService,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+from modules.student_house_decision_policy.infrastructure.orm.student_house_orm import (
+    StudentHouseORM,
+)
+from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
+    StudentHouseScoreRepository,
+)
+
+
+class _FakeStudentHouseScoreRepository:
+    def __init__(self, scores: list[StudentHouseScoreSummary]):
+        self._scores = scores
+        self.calls = 0
+
+    def fetch_by_house_platform_ids(
+        self, house_platform_ids, policy_version=None, completed_only=False
+    ):
+        self.calls += 1
+        ids = set(house_platform_ids)
+        return [score for score in self._scores if score.house_platform_id in ids]
+
+    def fetch_completed_page_by_id(self, policy_version, after_house_platform_id, limit):
+        self.calls += 1
+        ordered = sorted(
+            self._scores, key=lambda score: score.house_platform_id, reverse=True
+        )
+        if after_house_platform_id is not None:
+            ordered = [
+                score
+                for score in ordered
+                if score.house_platform_id < after_house_platform_id
+            ]
+        return ordered[:limit]
+
+
+def _build_scores(count: int) -> list[StudentHouseScoreSummary]:
+    rng = random.Random(7)
+    scores = []
+    for house_platform_id in range(1, count + 1):
+        price, option, risk, distance = (
+            round(rng.uniform(0, 100), 1) for _ in range(4)
+        )
+        scores.append(
+            StudentHouseScoreSummary(
+                house_platform_id=house_platform_id,
+                base_total_score=0.0,
+                price_score=price,
+                option_score=option,
+                risk_score=risk,
+                distance_score=distance,
+                observation_version="obs-1",
+                policy_version="v1",
+            )
+        )
+    return scores
+
+
+def _reference_top_k(scores, policy: DecisionPolicyConfig) -> list[int]:
+    """기존 계산기와 추천 유스케이스 정렬 규칙으로 상위 K를 만든다."""
+    calculator = DecisionScoreCalculator(policy)
+    ranked = [
+        (
+            score.house_platform_id,
+            calculator._combine_total_score(
+                score.price_score,
+                score.risk_score,
+                score.option_score,
+                score.distance_score,
+            ),
+        )
+        for score in scores
+    ]
+    recommended = [item for item in ranked if item[1] >= policy.threshold_base_total]
+    recommended.sort(key=lambda item: item[1], reverse=True)
+    return [item[0] for item in recommended[: policy.top_k]]
+
+
+def test_simulate_policy_ranking_matches_reference_calculator() -> None:
+    scores = _build_scores(300)
+    repo = _FakeStudentHouseScoreRepository(scores)
+    rng = random.Random(11)
+    variants = [
+        DecisionPolicyConfig(
+            weight_price=rng.random(),
+            weight_risk=rng.random(),
+            weight_option=rng.random(),
+            weight_distance=rng.random(),
+            threshold_base_total=rng.choice([40.0, 50.0, 60.0]),
+            top_k=rng.choice([5, 10, 20]),
+            policy_version=f"what-if-{index}",
+        )
+        for index in range(50)
+    ]
+
+    result = SimulatePolicyRankingService(repo).execute(
+        SimulatePolicyRankingCommand(
+            policies=variants,
+            house_platform_ids=[score.house_platform_id for score in scores],
+        )
+    )
+
+    # 후보 점수는 한 번만 조회한다.
+    assert repo.calls == 1
+    assert result.candidate_count == 300
+    assert len(result.variants) == 50
+    assert result.baseline.top_k_house_platform_ids == _reference_top_k(
+        scores, DecisionPolicyConfig()
+    )
+    for policy, variant in zip(variants, result.variants):
+        assert variant.top_k_house_platform_ids == _reference_top_k(scores, policy)
+        assert 0.0 <= variant.jaccard_with_baseline <= 1.0
+
+    assert len(result.pairwise_jaccard) == 50
+    assert all(result.pairwise_jaccard[i][i] == 1.0 for i in range(50))
+
+
+def test_simulate_policy_ranking_identical_policy_overlaps_fully() -> None:
+    scores = _build_scores(30)
+    repo = _FakeStudentHouseScoreRepository(scores)
+
+    result = SimulatePolicyRankingService(repo).execute(
+        SimulatePolicyRankingCommand(policies=[DecisionPolicyConfig()])
+    )
+
+    variant = result.variants[0]
+    assert variant.top_k_house_platform_ids == result.baseline.top_k_house_platform_ids
+    assert variant.overlap_with_baseline == 1.0
+    assert variant.jaccard_with_baseline == 1.0
+
+
+def test_total_scores_round_like_scalar_calculator() -> None:
+    # (0.0 + 3.7) / 2 = 1.85는 np.round로 1.8, round()로 1.9가 된다.
+    scores = _build_scores(200)
+    scores[0].price_score, scores[0].risk_score = 0.0, 3.7
+    scores[0].option_score = scores[0].distance_score = None
+    policies = [
+        DecisionPolicyConfig(
+            weight_price=1.0, weight_risk=1.0, weight_option=0.0, weight_distance=0.0
+        ),
+        DecisionPolicyConfig(),
+        DecisionPolicyConfig(
+            weight_price=0.0, weight_risk=0.0, weight_option=0.0, weight_distance=0.0
+        ),
+    ]
+
+    totals = PolicyWhatIfRanker(scores).total_scores(policies)
+
+    assert totals[0, 0] == 1.9
+    for index, policy in enumerate(policies):
+        calculator = DecisionScoreCalculator(policy)
+        assert totals[:, index].tolist() == [
+            calculator._combine_total_score(
+                score.price_score,
+                score.risk_score,
+                score.option_score,
+                score.distance_score,
+            )
+            for score in scores
+        ]
+
+
+def _build_score_repository() -> StudentHouseScoreRepository:
+    """기준 점수가 가장 낮은 1번 매물만 거리 점수가 높고, 13번은 실패 행이다."""
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(
+        engine, tables=[HousePlatformORM.__table__, StudentHouseORM.__table__]
+    )
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    for house_platform_id in range(1, 41):
+        for offset, policy_version in enumerate(("v1", "v2")):
+            session.add(
+                StudentHouseORM(
+                    # SQLite는 BIGINT 기본 키를 자동 증가시키지 않는다.
+                    student_house_id=house_platform_id * 2 + offset,
+                    house_platform_id=house_platform_id,
+                    price_score=float(house_platform_id),
+                    option_score=float(house_platform_id),
+                    risk_score=float(house_platform_id),
+                    distance_score=100.0 if house_platform_id == 1 else 0.0,
+                    base_total_score=float(house_platform_id),
+                    processing_status=(
+                        "FAILED" if house_platform_id == 13 else "COMPLETED"
+                    ),
+                    policy_version=policy_version,
+                    observation_version="obs-1",
+                )
+            )
+    session.commit()
+    session.close()
+    return StudentHouseScoreRepository(session_factory)
+
+
+_DISTANCE_ONLY = DecisionPolicyConfig(
+    weight_price=0.0,
+    weight_risk=0.0,
+    weight_option=0.0,
+    weight_distance=1.0,
+    threshold_base_total=0.0,
+    top_k=1,
+    policy_version="distance-only",
+)
+
+
+def test_simulate_policy_ranking_reads_every_completed_score_in_pages() -> None:
+    service = SimulatePolicyRankingService(_build_score_repository(), page_size=7)
+
+    result = service.execute(
+        SimulatePolicyRankingCommand(
+            policies=[_DISTANCE_ONLY],
+            baseline_policy=DecisionPolicyConfig(threshold_base_total=0.0, top_k=5),
+        )
+    )
+
+    # 실패 행(13번)은 후보가 아니고, 기준 순위 꼴찌인 1번도 변형에서 1위가 된다.
+    assert result.candidate_count == 39
+    assert not result.truncated
+    assert result.baseline.recommended_count == 39
+    assert result.baseline.top_k_house_platform_ids == [40, 39, 38, 37, 36]
+    assert result.variants[0].top_k_house_platform_ids == [1]
+    assert result.variants[0].recommended_count == 39
+
+
+def test_simulate_policy_ranking_caps_candidates_by_id_and_reports_it() -> None:
+    service = SimulatePolicyRankingService(_build_score_repository(), page_size=4)
+
+    result = service.execute(
+        SimulatePolicyRankingCommand(policies=[_DISTANCE_ONLY], candidate_limit=10)
+    )
+
+    assert result.candidate_count == 10
+    assert result.truncated
+    assert result.variants[0].recommended_count == 10
+
+    result = service.execute(
+        SimulatePolicyRankingCommand(policies=[_DISTANCE_ONLY], candidate_limit=39)
+    )
+    assert result.candidate_count == 39
+    assert not result.truncated
+
+
+def test_simulate_policy_ranking_skips_failed_rows_for_explicit_ids() -> None:
+    service = SimulatePolicyRankingService(_build_score_repository())
+
+    result = service.execute(
+        SimulatePolicyRankingCommand(
+            policies=[_DISTANCE_ONLY], house_platform_ids=[12, 13, 14]
+        )
+    )
+
+    assert result.candidate_count == 2
+    assert result.variants[0].recommended_count == 2
@@ -0,0 +1,317 @@
+"""COPY FROM STDIN 관측치 writer 테스트.
+
+직렬화는 항상 검사하고, ORM 경로와의 행 단위 동등성(최신 포인터 포함)은 POSTGRES_*
+환경 변수의 로컬 Postgres에 접속될 때만 임시 스키마에서 검사한다.
+"""
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import psycopg2
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from infrastructure.db.postgres_copy import PostgresCopyWriter, format_copy_value
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendation_feature_observation_repository_impl import (
+    StudentRecommendationFeatureObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.domain.model.distance_feature_observation import (
+    DistanceFeatureObservation,
+)
+from modules.observations.domain.model.price_feature_observation import (
+    PriceFeatureObservation,
+)
+from modules.observations.domain.model.student_recommendation_feature_observation import (
+    StudentRecommendationFeatureObservation,
+)
+from modules.observations.domain.value_objects.convenience_observation_features import (
+    ConvenienceObservationFeatures,
+)
+from modules.observations.domain.value_objects.observation_metadata import (
+    ObservationMetadata,
+)
+from modules.observations.domain.value_objects.observation_notes import (
+    ObservationNotes,
+)
+from modules.observations.domain.value_objects.risk_observation_features import (
+    RiskObservationFeatures,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_feature_observations_orm import (
+    StudentRecommendationFeatureObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+
+_TABLES = (
+    StudentRecommendationDistanceObservationORM,
+    StudentRecommendationPriceObservationsORM,
+    StudentRecommendationFeatureObservationORM,
+)
+
+
+def test_format_copy_value_escapes_text_format():
+    writer = PostgresCopyWriter(
+        StudentRecommendationFeatureObservationORM.__table__,
+        ["snapshot_id", "risk_event_types", "observation_notes", "risk_event_count"],
+    )
+    row = writer.format_row(
+        ["a\tb\nc\\d", ['x,"y"', "z\\w", "{}"], {"메모": ["a\tb"]}, np.int64(3)]
+    )
+    assert row == (
+        "a\\tb\\nc\\\\d\t"
+        '{"x,\\\\"y\\\\"","z\\\\\\\\w","{}"}\t'
+        '{"\\\\uba54\\\\ubaa8": ["a\\\\tb"]}\t'
+        "3\n"
+    )
+    assert format_copy_value(None) == "\\N"
+    assert format_copy_value(True) == "t"
+    assert format_copy_value(0.1) == "0.1"
+    assert format_copy_value(np.float64(1 / 3)) == repr(1 / 3)
+    assert format_copy_value(float("inf")) == "Infinity"
+    assert format_copy_value(float("nan")) == "NaN"
+    assert (
+        format_copy_value(datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc))
+        == "2025-01-02 03:04:05.000006"
+    )
+
+
+def test_copy_sql_quotes_korean_columns():
+    session = Session(bind=create_engine("postgresql+psycopg2://"))
+    writer = PostgresCopyWriter(
+        StudentRecommendationDistanceObservationORM.__table__,
+        StudentRecommendationDistanceObservationRepository._COLUMNS,
+    )
+    assert writer.copy_sql(session) == (
+        "COPY student_recommendation_distance_observations "
+        '(house_id, recommendation_observation_id, university_id, "학교까지_분", '
+        '"거리_백분위", "거리_버킷", "거리_비선형_점수", calculated_at) FROM STDIN'
+    )
+
+
+# ---------- 로컬 Postgres 동등성 ----------
+@pytest.fixture
+def pg_session_factory():
+    url = (
+        f"postgresql+psycopg2://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}"
+        f"@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DATABASE')}"
+    )
+    schema = f"copy_writer_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(url)
+    try:
+        with admin.begin() as connection:
+            connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    except OperationalError:
+        admin.dispose()
+        pytest.skip("local Postgres is not reachable")
+    # aware datetime 변환을 검사하도록 세션 TimeZone을 UTC가 아닌 값으로 둔다.
+    engine = create_engine(
+        url, connect_args={"options": f"-csearch_path={schema} -ctimezone=Asia/Seoul"}
+    )
+    for orm in _TABLES:
+        # 같은 파일의 최신 관측치 포인터 테이블도 함께 만든다.
+        orm.metadata.create_all(engine)
+    try:
+        yield sessionmaker(bind=engine)
+    finally:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin.dispose()
+
+
+def _table_rows(session_factory, orm):
+    columns = [column for column in orm.__table__.columns if column.name != "id"]
+    session = session_factory()
+    try:
+        rows = session.query(*columns).order_by(orm.id).all()
+        return [tuple(row) for row in rows]
+    finally:
+        session.close()
+
+
+def _truncate(session_factory, orm):
+    session = session_factory()
+    try:
+        tables = ", ".join(table.name for table in orm.metadata.sorted_tables)
+        session.execute(text(f"TRUNCATE {tables}"))
+        session.commit()
+    finally:
+        session.close()
+
+
+def _without_ids(observations):
+    return [
+        {key: value for key, value in vars(o).items() if key != "id"}
+        for o in observations
+    ]
+
+
+def test_copy_bulk_matches_orm_rows(pg_session_factory):
+    aware = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    naive = datetime(2025, 3, 1, 21, 0, 0)
+
+    distances = [
+        DistanceFeatureObservation(
+            id=None,
+            house_platform_id=house_id,
+            recommendation_observation_id=house_id * 10,
+            university_id=university_id,
+            학교까지_분=house_id * 1.1 + university_id / 3,
+            거리_백분위=university_id / 7,
+            거리_버킷="40분_이상",
+            거리_비선형_점수=1e-300 if university_id == 1 else 0.3,
+            calculated_at=aware if house_id % 2 else naive,
+        )
+        for house_id in range(1, 8)
+        for university_id in range(1, 6)
+    ]
+    prices = [
+        PriceFeatureObservation(
+            id=None,
+            house_platform_id=house_id,
+            recommendation_observation_id=house_id * 10,
+            가격_백분위=0.0 if house_id == 3 else house_id / 10,
+            가격_z점수=-house_id / 3,
+            예상_입주비용=house_id * 1000,
+            월_비용_추정=house_id * 7,
+            가격_부담_비선형=0.1,
+            calculated_at=aware,
+        )
+        for house_id in range(1, 8)
+    ]
+    features = [
+        StudentRecommendationFeatureObservation(
+            id=None,
+            house_platform_id=house_id,
+            snapshot_id=f"snap\t{house_id}\\n",
+            위험_관측치=RiskObservationFeatures(
+                위험_사건_개수=house_id,
+                위험_사건_유형=["위반", 'quote"d', "back\\slash", "a,b"],
+                위험_확률_추정=0.25,
+                위험_심각도_점수=1 / 3,
+                위험_비선형_패널티=0.0,
+            ),
+            편의_관측치=ConvenienceObservationFeatures(
+                필수_옵션_커버리지=0.5,
+                편의_점수=0.75,
+            ),
+            관측_메모=ObservationNotes(
+                notes=None if house_id == 2 else {"메모": ["줄\n바꿈"], "n": house_id}
+            ),
+            메타데이터=ObservationMetadata(관측치_버전="v1", 원본_데이터_버전="house_v1"),
+            calculated_at=naive,
+        )
+        for house_id in range(1, 5)
+    ]
+
+    session = pg_session_factory()
+    try:
+        distance_repo = StudentRecommendationDistanceObservationRepository(
+            session, copy_chunk_size=4
+        )
+        price_repo = StudentRecommendationPriceObservationRepository(
+            session, copy_chunk_size=3
+        )
+
+        house_ids = list(range(1, 8))
+
+        distance_repo.save_bulk(distances)
+        price_repo.save_bulk(prices)
+        orm_distances = _table_rows(pg_session_factory, StudentRecommendationDistanceObservationORM)
+        orm_prices = _table_rows(pg_session_factory, StudentRecommendationPriceObservationsORM)
+        orm_latest_distances = {
+            house_id: _without_ids(rows)
+            for house_id, rows in distance_repo.get_bulk_by_house_platform_ids(house_ids).items()
+        }
+        orm_latest_prices = _without_ids(
+            price_repo.get_latest_by_house_platform_ids(house_ids).values()
+        )
+        # 조회 트랜잭션의 잠금이 TRUNCATE를 막지 않게 끝낸다.
+        session.rollback()
+        _truncate(pg_session_factory, StudentRecommendationDistanceObservationORM)
+        _truncate(pg_session_factory, StudentRecommendationPriceObservationsORM)
+
+        assert distance_repo.copy_bulk(iter(distances)) == len(distances)
+        assert price_repo.copy_bulk(prices) == len(prices)
+
+        # COPY 경로도 같은 트랜잭션에서 최신 포인터를 갱신한다.
+        assert {
+            house_id: _without_ids(rows)
+            for house_id, rows in distance_repo.get_bulk_by_house_platform_ids(house_ids).items()
+        } == orm_latest_distances
+        assert _without_ids(
+            price_repo.get_latest_by_house_platform_ids(house_ids).values()
+        ) == orm_latest_prices
+    finally:
+        session.close()
+
+    assert _table_rows(pg_session_factory, StudentRecommendationDistanceObservationORM) == orm_distances
+    assert _table_rows(pg_session_factory, StudentRecommendationPriceObservationsORM) == orm_prices
+
+    feature_repo = StudentRecommendationFeatureObservationRepository(
+        pg_session_factory, copy_chunk_size=3
+    )
+    for feature in features:
+        feature_repo.save(feature)
+    orm_features = _table_rows(pg_session_factory, StudentRecommendationFeatureObservationORM)
+    _truncate(pg_session_factory, StudentRecommendationFeatureObservationORM)
+    for feature in features:
+        feature.id = None
+
+    assert feature_repo.copy_bulk(features) == len(features)
+    assert _table_rows(pg_session_factory, StudentRecommendationFeatureObservationORM) == orm_features
+    assert all(feature.id is not None for feature in features)
+    assert feature_repo.find_latest_by_house_id(4).id == features[-1].id
+    assert {
+        house_id: observation.id
+        for house_id, observation in feature_repo.find_latest_by_house_ids(range(1, 5)).items()
+    } == {feature.house_platform_id: feature.id for feature in features}
+
+
+def test_copy_bulk_rolls_back_only_failed_chunk(pg_session_factory):
+    distances = [
+        DistanceFeatureObservation(
+            id=None,
+            house_platform_id=house_id,
+            recommendation_observation_id=house_id * 10,
+            university_id=1,
+            학교까지_분=10.0,
+            거리_백분위=0.5,
+            # 두 번째 청크의 마지막 행은 String(20)을 넘어 COPY가 실패한다.
+            거리_버킷="x" * 21 if house_id == 4 else "10_20분",
+            거리_비선형_점수=0.5,
+            calculated_at=datetime(2025, 3, 1),
+        )
+        for house_id in range(1, 5)
+    ]
+    session = pg_session_factory()
+    try:
+        repository = StudentRecommendationDistanceObservationRepository(
+            session, copy_chunk_size=2
+        )
+        with pytest.raises(psycopg2.DataError):
+            repository.copy_bulk(distances)
+
+        latest = repository.get_bulk_by_house_platform_ids(range(1, 5))
+    finally:
+        session.close()
+
+    assert {house_id: len(rows) for house_id, rows in latest.items()} == {
+        1: 1, 2: 1, 3: 0, 4: 0
+    }
+    assert len(_table_rows(pg_session_factory, StudentRecommendationDistanceObservationORM)) == 2
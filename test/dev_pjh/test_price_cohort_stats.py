@@ -0,0 +1,121 @@
+"""가격 코호트 통계 테스트."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from modules.observations.application.factory.price_cohort_stats import (
+    PriceCohortStats,
+    WelfordMoments,
+)
+from modules.observations.application.usecase.generate_price_observation_usecase import (
+    GeneratePriceObservationUseCase,
+)
+
+
+def _reference(price, house_prices):
+    # 코호트 통계 도입 전 매물별 계산.
+    all_prices = np.array(list(house_prices.values()))
+    percentile = float(np.sum(all_prices <= price) / len(all_prices))
+    mean = float(np.mean(all_prices))
+    std = float(np.std(all_prices))
+    zscore = float((price - mean) / std) if std > 0 else 0.0
+    return percentile, zscore
+
+
+class _FakePriceRepo:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, observation):
+        self.saved.append(observation)
+        return observation
+
+
+def _house_prices(rng, count):
+    return {
+        house_id: rng.choice([rng.randint(100, 50000), 5000, 10000])
+        for house_id in range(1, count + 1)
+    }
+
+
+def test_execute_matches_per_house_recomputation():
+    rng = random.Random(23)
+    house_prices = _house_prices(rng, 500)
+    usecase = GeneratePriceObservationUseCase(_FakePriceRepo(), dict(house_prices))
+
+    for house_id, price in house_prices.items():
+        observation = usecase.execute(house_id * 10, house_id)
+        percentile, zscore = _reference(price, house_prices)
+        assert observation.가격_백분위 == percentile
+        assert observation.가격_z점수 == zscore
+
+
+def test_incremental_updates_match_rebuild():
+    rng = random.Random(4)
+    house_prices = _house_prices(rng, 300)
+    stats = PriceCohortStats.from_prices(house_prices)
+
+    for step in range(200):
+        house_id = rng.randint(1, 400)
+        if step % 5 == 0:
+            stats.remove(house_id)
+            house_prices.pop(house_id, None)
+        else:
+            price = rng.randint(100, 50000)
+            stats.upsert(house_id, price)
+            house_prices[house_id] = price
+
+    rebuilt = PriceCohortStats.from_prices(house_prices)
+    assert len(stats) == len(rebuilt) == len(house_prices)
+    assert stats.mean == pytest.approx(rebuilt.mean, rel=1e-12)
+    assert stats.std == pytest.approx(rebuilt.std, rel=1e-9)
+    for price in list(house_prices.values()) + [0, 99, 10000, 10**6]:
+        assert stats.percentile(price) == rebuilt.percentile(price)
+
+
+def test_merge_matches_single_cohort():
+    rng = random.Random(9)
+    house_prices = _house_prices(rng, 400)
+    left = PriceCohortStats.from_prices(
+        {house_id: price for house_id, price in house_prices.items() if house_id % 3}
+    )
+    right = PriceCohortStats.from_prices(
+        {house_id: price for house_id, price in house_prices.items() if not house_id % 3}
+    )
+    merged = left.merge(right)
+    whole = PriceCohortStats.from_prices(house_prices)
+
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert merged.std == pytest.approx(whole.std, rel=1e-9)
+    assert [merged.percentile(price) for price in house_prices.values()] == [
+        whole.percentile(price) for price in house_prices.values()
+    ]
+    with pytest.raises(ValueError):
+        merged.merge(left)
+
+
+def test_update_prices_feeds_next_execute():
+    house_prices = {1: 1000, 2: 1100, 3: 1200}
+    usecase = GeneratePriceObservationUseCase(_FakePriceRepo(), house_prices)
+    usecase.execute(10, 1)
+
+    usecase.update_prices({4: 5000, 2: 900}, removed=[3])
+    observation = usecase.execute(40, 4)
+
+    percentile, zscore = _reference(5000, {1: 1000, 2: 900, 4: 5000})
+    assert observation.가격_백분위 == percentile
+    assert observation.가격_z점수 == pytest.approx(zscore, rel=1e-12)
+    assert 3 not in usecase.cohort_stats
+
+
+def test_welford_remove_to_empty():
+    moments = WelfordMoments()
+    for value in (3.0, 5.0):
+        moments.add(value)
+    moments.remove(3.0)
+    assert (moments.count, moments.mean, moments.std) == (1, 5.0, 0.0)
+    moments.remove(5.0)
+    assert (moments.count, moments.mean, moments.m2) == (0, 0.0, 0.0)
@@ -0,0 +1,256 @@
+import os
+import sys
+import threading
+
+# 프로젝트 루트를 sys.path에 추가해 모듈 import를 보장한다.
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.finder_request.application.usecase.edit_finder_request_usecase import (
+    EditFinderRequestUseCase,
+)
+from modules.finder_request.domain.finder_request import FinderRequest
+from modules.recommendations.application.dto.recommendation_dto import (
+    RecommendStudentHouseBatchCommand,
+    RecommendStudentHouseCommand,
+    RecommendStudentHouseResult,
+)
+from modules.recommendations.application.port_in.recommend_student_house_port import (
+    RecommendStudentHousePort,
+)
+from modules.recommendations.application.port_out.recommendation_result_cache_port import (
+    RecommendationResultCachePort,
+)
+from modules.recommendations.application.usecase.cached_recommend_student_house import (
+    CachedRecommendStudentHouseUseCase,
+)
+from modules.student_house_decision_policy.domain.value_object.decision_policy_config import (
+    DecisionPolicyConfig,
+)
+
+
+class InMemoryRecommendationResultCache(RecommendationResultCachePort):
+    def __init__(self):
+        self.watermark = 0
+        self.generations: dict[int, int] = {}
+        self.results: dict[str, dict] = {}
+        self.locks: set[str] = set()
+        self._mutex = threading.Lock()
+
+    def get_versions(self, finder_request_id):
+        return str(self.watermark), str(self.generations.get(finder_request_id, 0))
+
+    def get_result(self, cache_key):
+        return self.results.get(cache_key)
+
+    def save_result(self, cache_key, payload, ttl_seconds):
+        self.results[cache_key] = payload
+
+    def acquire_lock(self, cache_key, ttl_seconds):
+        with self._mutex:
+            if cache_key in self.locks:
+                return False
+            self.locks.add(cache_key)
+            return True
+
+    def release_lock(self, cache_key):
+        with self._mutex:
+            self.locks.discard(cache_key)
+
+    def invalidate_finder_request(self, finder_request_id):
+        self.generations[finder_request_id] = (
+            self.generations.get(finder_request_id, 0) + 1
+        )
+
+    def bump_watermark(self):
+        self.watermark += 1
+
+
+class FakeFinderRequestRepository:
+    def __init__(self, request: FinderRequest):
+        self.request = request
+
+    def find_by_id(self, finder_request_id):
+        if self.request.finder_request_id != finder_request_id:
+            return None
+        return self.request
+
+    def find_by_ids(self, finder_request_ids):
+        return [
+            request
+            for request in map(self.find_by_id, finder_request_ids)
+            if request
+        ]
+
+    def update(self, finder_request):
+        self.request = finder_request
+        return finder_request
+
+
+class CountingRecommendUseCase(RecommendStudentHousePort):
+    def __init__(
+        self,
+        status="SUCCESS",
+        gate: threading.Event | None = None,
+        summary: dict | None = None,
+    ):
+        self.calls = 0
+        self.status = status
+        self.gate = gate
+        self.summary = summary or {"recommended_count": 0}
+        self.policy = DecisionPolicyConfig()
+
+    def execute(self, command):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(timeout=5)
+        return RecommendStudentHouseResult(
+            finder_request_id=command.finder_request_id,
+            generated_at="2026-01-01T00:00:00+00:00",
+            status=self.status,
+            detail=None,
+            query_context={"call": self.calls},
+            summary=dict(self.summary),
+            recommended_top_k=[],
+            rejected_top_k=[],
+        )
+
+
+def _build_request(**overrides) -> FinderRequest:
+    values = {
+        "finder_request_id": 1,
+        "abang_user_id": 10,
+        "status": "Y",
+        "price_type": "MONTHLY",
+        "max_deposit": 1000,
+        "max_rent": 60,
+        "university_name": "서울대학교",
+    }
+    values.update(overrides)
+    return FinderRequest(**values)
+
+
+def test_cached_recommend_returns_hit_and_respects_invalidation():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    inner = CountingRecommendUseCase()
+    usecase = CachedRecommendStudentHouseUseCase(inner, cache, finder_repo)
+    command = RecommendStudentHouseCommand(finder_request_id=1)
+
+    first = usecase.execute(command)
+    second = usecase.execute(command)
+    assert inner.calls == 1
+    assert second == first
+
+    # 요구서 수정 시 세대가 올라가 캐시를 다시 계산한다.
+    EditFinderRequestUseCase(
+        finder_repo, recommendation_cache=cache
+    ).execute(finder_request_id=1, abang_user_id=10, max_rent=70)
+    usecase.execute(command)
+    assert inner.calls == 2
+
+    # 점수 갱신 워터마크가 올라가도 캐시를 다시 계산한다.
+    cache.bump_watermark()
+    usecase.execute(command)
+    usecase.execute(command)
+    assert inner.calls == 3
+
+    # 다른 정책 파라미터는 다른 캐시 키를 사용한다.
+    other_policy = CachedRecommendStudentHouseUseCase(
+        inner, cache, finder_repo, policy=DecisionPolicyConfig(top_k=3)
+    )
+    other_policy.execute(command)
+    assert inner.calls == 4
+
+
+def test_cached_recommend_does_not_store_failed_results():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    inner = CountingRecommendUseCase(status="FAILED")
+    usecase = CachedRecommendStudentHouseUseCase(inner, cache, finder_repo)
+    command = RecommendStudentHouseCommand(finder_request_id=1)
+
+    usecase.execute(command)
+    usecase.execute(command)
+    assert inner.calls == 2
+    assert cache.results == {}
+    assert cache.locks == set()
+
+
+def test_cached_recommend_does_not_store_deadline_exceeded_results():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    inner = CountingRecommendUseCase(
+        summary={"recommended_count": 0, "deadline_exceeded": True}
+    )
+    usecase = CachedRecommendStudentHouseUseCase(inner, cache, finder_repo)
+    command = RecommendStudentHouseCommand(finder_request_id=1)
+
+    usecase.execute(command)
+    list(usecase.execute_stream(command))
+    assert inner.calls == 2
+    assert cache.results == {}
+    assert cache.locks == set()
+
+
+def test_cached_recommend_single_flight_for_concurrent_requests():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    gate = threading.Event()
+    inner = CountingRecommendUseCase(gate=gate)
+    usecase = CachedRecommendStudentHouseUseCase(
+        inner, cache, finder_repo, poll_interval_seconds=0.01
+    )
+    command = RecommendStudentHouseCommand(finder_request_id=1)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(usecase.execute(command)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert inner.calls == 1
+    assert len(results) == 4
+    assert all(item == results[0] for item in results)
+
+
+def test_cached_recommend_stream_replays_cached_result():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    inner = CountingRecommendUseCase()
+    usecase = CachedRecommendStudentHouseUseCase(inner, cache, finder_repo)
+    command = RecommendStudentHouseCommand(finder_request_id=1)
+
+    first = list(usecase.execute_stream(command))
+    second = list(usecase.execute_stream(command))
+
+    assert inner.calls == 1
+    assert [event.event for event in first] == ["summary"]
+    assert second == first
+    assert cache.locks == set()
+
+
+def test_cached_recommend_batch_warms_cache_for_single_requests():
+    cache = InMemoryRecommendationResultCache()
+    finder_repo = FakeFinderRequestRepository(_build_request())
+    inner = CountingRecommendUseCase()
+    usecase = CachedRecommendStudentHouseUseCase(inner, cache, finder_repo)
+
+    batch = usecase.execute_batch(
+        RecommendStudentHouseBatchCommand(finder_request_ids=[1])
+    )
+    assert inner.calls == 1
+    assert len(batch.results) == 1
+
+    # 예열된 결과는 단건 요청과 다음 배치에서 그대로 재사용된다.
+    assert usecase.execute(RecommendStudentHouseCommand(finder_request_id=1)) == batch.results[0]
+    usecase.execute_batch(RecommendStudentHouseBatchCommand(finder_request_ids=[1]))
+    assert inner.calls == 1
@@ -1,4 +1,6 @@
+from dataclasses import asdict
 from datetime import datetime, timezone
+import json
 import os
 import sys
 
@@ -34,6 +36,7 @@ from modules.observations.domain.model.distance_feature_observation import (
 )
 from modules.recommendations.application.dto.recommendation_dto import (
     RecommendStudentHouseCommand,
+    RecommendStudentHouseResult,
 )
 from modules.recommendations.application.usecase.recommend_student_house import (
     RecommendStudentHouseUseCase,
@@ -358,3 +361,489 @@ def test_recommend_student_house_mock_response():
     assert result.recommended_top_k
     assert result.rejected_top_k is not None
     assert result.summary["total_candidates"] == len(candidates)
+
+
+class _CountingBulkHousePlatformRepository(FakeHousePlatformRepository):
+    def __init__(self):
+        self.bulk_calls = 0
+
+    def find_by_ids(self, house_platform_ids):
+        self.bulk_calls += 1
+        return [self.find_by_id(house_platform_id) for house_platform_id in house_platform_ids]
+
+
+class _CountingBulkObservationRepository(FakeObservationRepository):
+    def __init__(self, observations):
+        super().__init__(observations)
+        self.bulk_calls = 0
+
+    def find_latest_by_house_ids(self, house_ids):
+        self.bulk_calls += 1
+        return {
+            house_id: self._observations[house_id]
+            for house_id in house_ids
+            if house_id in self._observations
+        }
+
+
+class _CountingBulkPriceObservationRepository(FakePriceObservationRepository):
+    def __init__(self, observations):
+        super().__init__(observations)
+        self.bulk_calls = 0
+
+    def get_latest_by_house_platform_ids(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {
+            house_platform_id: self._observations[house_platform_id]
+            for house_platform_id in house_platform_ids
+            if house_platform_id in self._observations
+        }
+
+
+class _CountingBulkDistanceObservationRepository(FakeDistanceObservationRepository):
+    def __init__(self, observations):
+        super().__init__(observations)
+        self.bulk_calls = 0
+
+    def get_bulk_by_house_platform_ids(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {
+            house_platform_id: self._observations.get(house_platform_id, [])
+            for house_platform_id in house_platform_ids
+        }
+
+
+def test_recommend_student_house_bulk_hydration_matches_per_item():
+    finder_request = FinderRequest(
+        abang_user_id=1,
+        status="Y",
+        finder_request_id=10,
+        max_deposit=1000,
+        max_rent=80,
+    )
+    candidate_ids = [1, 2, 3, 4]
+    calculated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    observations = {
+        house_platform_id: _build_observation(
+            house_platform_id, f"snap-{house_platform_id}"
+        )
+        for house_platform_id in candidate_ids
+        if house_platform_id != 4
+    }
+    price_observations = {
+        house_platform_id: PriceFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=1,
+            가격_백분위=0.1 * house_platform_id,
+            가격_z점수=0.0,
+            예상_입주비용=500 * house_platform_id,
+            월_비용_추정=40 + house_platform_id,
+            가격_부담_비선형=0.5,
+            calculated_at=calculated_at,
+        )
+        for house_platform_id in candidate_ids
+    }
+    distance_observations = {
+        house_platform_id: [
+            DistanceFeatureObservation(
+                id=house_platform_id * 10 + university_id,
+                house_platform_id=house_platform_id,
+                recommendation_observation_id=1,
+                university_id=university_id,
+                학교까지_분=5.0 * house_platform_id + university_id,
+                거리_백분위=0.3,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.7,
+                calculated_at=calculated_at,
+            )
+            for university_id in (1, 2)
+        ]
+        for house_platform_id in candidate_ids
+        if house_platform_id != 3
+    }
+    scores = [
+        StudentHouseScoreSummary(
+            house_platform_id=house_platform_id,
+            base_total_score=score,
+            price_score=score,
+            option_score=score,
+            risk_score=score,
+            distance_score=score,
+            observation_version="obs-1",
+            policy_version="v1",
+        )
+        for house_platform_id, score in ((1, 80.0), (2, 40.0), (3, 65.0), (4, 20.0))
+    ]
+
+    class FakeFinderRequestRepository:
+        def find_by_id(self, _finder_request_id):
+            return finder_request
+
+    def run(bulk: bool):
+        repos = (
+            (
+                _CountingBulkHousePlatformRepository(),
+                _CountingBulkObservationRepository(observations),
+                _CountingBulkPriceObservationRepository(price_observations),
+                _CountingBulkDistanceObservationRepository(distance_observations),
+            )
+            if bulk
+            else (
+                FakeHousePlatformRepository(),
+                FakeObservationRepository(observations),
+                FakePriceObservationRepository(price_observations),
+                FakeDistanceObservationRepository(distance_observations),
+            )
+        )
+        service = RecommendStudentHouseUseCase(
+            finder_request_repo=FakeFinderRequestRepository(),
+            house_platform_repo=repos[0],
+            observation_repo=repos[1],
+            score_repo=FakeScoreRepository(scores),
+            price_observation_repo=repos[2],
+            distance_observation_repo=repos[3],
+            policy=DecisionPolicyConfig(),
+        )
+        result = service.execute(
+            RecommendStudentHouseCommand(
+                finder_request_id=10,
+                candidate_house_platform_ids=candidate_ids,
+            )
+        )
+        payload = asdict(result)
+        payload.pop("generated_at")
+        return payload, repos
+
+    per_item, _ = run(bulk=False)
+    bulk, repos = run(bulk=True)
+
+    assert bulk == per_item
+    assert json.dumps(bulk, default=str) == json.dumps(per_item, default=str)
+    # 추천/제외 목록 전체를 종류별 1회 조회로 조립한다.
+    assert [repo.bulk_calls for repo in repos] == [1, 1, 1, 1]
+
+
+def _build_two_request_service():
+    """요구서 2건(10, 20)과 후보 2건으로 추천 유스케이스를 만든다."""
+    requests = {
+        finder_request_id: FinderRequest(
+            abang_user_id=1,
+            status="Y",
+            finder_request_id=finder_request_id,
+            max_deposit=1000,
+            max_rent=max_rent,
+        )
+        for finder_request_id, max_rent in ((10, 40), (20, 90))
+    }
+    candidate_ids = [1, 2]
+    calculated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    observations = {
+        house_platform_id: _build_observation(
+            house_platform_id, f"snap-{house_platform_id}"
+        )
+        for house_platform_id in candidate_ids
+    }
+    price_observations = {
+        house_platform_id: PriceFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=1,
+            가격_백분위=0.2,
+            가격_z점수=0.0,
+            예상_입주비용=500,
+            월_비용_추정=50,
+            가격_부담_비선형=0.5,
+            calculated_at=calculated_at,
+        )
+        for house_platform_id in candidate_ids
+    }
+    distance_observations = {
+        house_platform_id: [
+            DistanceFeatureObservation(
+                id=house_platform_id,
+                house_platform_id=house_platform_id,
+                recommendation_observation_id=1,
+                university_id=1,
+                학교까지_분=15.0,
+                거리_백분위=0.3,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.7,
+                calculated_at=calculated_at,
+            )
+        ]
+        for house_platform_id in candidate_ids
+    }
+    scores = [
+        StudentHouseScoreSummary(
+            house_platform_id=house_platform_id,
+            base_total_score=score,
+            price_score=score,
+            option_score=score,
+            risk_score=score,
+            distance_score=score,
+            observation_version="obs-1",
+            policy_version="v1",
+        )
+        for house_platform_id, score in ((1, 80.0), (2, 40.0))
+    ]
+
+    class FakeFinderRequestRepository:
+        def find_by_id(self, finder_request_id):
+            return requests.get(finder_request_id)
+
+    return RecommendStudentHouseUseCase(
+        finder_request_repo=FakeFinderRequestRepository(),
+        house_platform_repo=FakeHousePlatformRepository(),
+        observation_repo=FakeObservationRepository(observations),
+        score_repo=FakeScoreRepository(scores),
+        price_observation_repo=FakePriceObservationRepository(price_observations),
+        distance_observation_repo=FakeDistanceObservationRepository(distance_observations),
+        policy=DecisionPolicyConfig(),
+    ), candidate_ids
+
+
+def test_recommend_student_house_shared_instance_is_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+
+    service, candidate_ids = _build_two_request_service()
+    finder_repo = service.finder_request_repo
+
+    def run(finder_request_id: int):
+        result = service.execute(
+            RecommendStudentHouseCommand(
+                finder_request_id=finder_request_id,
+                candidate_house_platform_ids=candidate_ids,
+            )
+        )
+        payload = asdict(result)
+        payload.pop("generated_at")
+        return finder_request_id, payload
+
+    expected = dict(run(finder_request_id) for finder_request_id in (10, 20))
+    # 하나의 인스턴스를 여러 스레드가 동시에 사용해도 결과가 섞이지 않는다.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, [10, 20] * 16))
+
+    assert all(payload == expected[key] for key, payload in results)
+    assert service.finder_request_repo is finder_repo
+
+
+def test_recommend_student_house_stream_matches_execute():
+    service, candidate_ids = _build_two_request_service()
+    service.stream_chunk_size = 1
+    command = RecommendStudentHouseCommand(
+        finder_request_id=10,
+        candidate_house_platform_ids=candidate_ids,
+    )
+
+    events = list(service.execute_stream(command))
+    # summary가 먼저 나가고 이후 카드가 한 건씩 이어진다.
+    assert [event.event for event in events] == ["summary", "item", "item"]
+    assert events[0].data["summary"]["recommended_count"] == 1
+
+    streamed = asdict(RecommendStudentHouseResult.from_stream_events(events))
+    executed = asdict(service.execute(command))
+    streamed.pop("generated_at")
+    executed.pop("generated_at")
+    assert streamed == executed
+
+
+def test_recommend_student_house_deadline_returns_partial_result():
+    service, candidate_ids = _build_two_request_service()
+    service.stream_chunk_size = 1
+    command = RecommendStudentHouseCommand(
+        finder_request_id=10,
+        candidate_house_platform_ids=candidate_ids,
+        deadline_seconds=0,
+    )
+
+    result = service.execute(command)
+    # 필수 단계(필터/점수)는 유지하고 제외 목록 조립은 건너뛴다.
+    assert result.status == "SUCCESS"
+    assert len(result.recommended_top_k) == 1
+    assert result.rejected_top_k == []
+    assert result.summary["rejected_count"] == 1
+    assert result.summary["deadline_exceeded"] is True
+    assert "rejected_top_k" in result.summary["skipped_stages"]
+
+    events = list(service.execute_stream(command))
+    # 스트림은 건너뛴 단계를 반영한 summary를 마지막에 다시 보낸다.
+    assert [event.event for event in events] == ["summary", "item", "summary"]
+    assert "rejected_top_k" not in events[0].data["summary"]["skipped_stages"]
+    assert "rejected_top_k" in events[-1].data["summary"]["skipped_stages"]
+    streamed = RecommendStudentHouseResult.from_stream_events(events)
+    assert streamed.rejected_top_k == []
+    assert streamed.summary["deadline_exceeded"] is True
+
+    unlimited = service.execute(
+        RecommendStudentHouseCommand(
+            finder_request_id=10,
+            candidate_house_platform_ids=candidate_ids,
+        )
+    )
+    assert len(unlimited.rejected_top_k) == 1
+    assert "deadline_exceeded" not in unlimited.summary
+
+
+def test_recommend_student_house_reuses_cached_house_cards():
+    from modules.recommendations.adapter.output.lru_house_card_cache import (
+        LruHouseCardCache,
+    )
+    from modules.recommendations.adapter.output.tiered_house_card_cache import (
+        TieredHouseCardCache,
+    )
+
+    service, candidate_ids = _build_two_request_service()
+    expected = asdict(
+        service.execute(
+            RecommendStudentHouseCommand(
+                finder_request_id=10,
+                candidate_house_platform_ids=candidate_ids,
+            )
+        )
+    )
+    expected.pop("generated_at")
+
+    calls = []
+    house_repo = service.house_platform_repo
+    original_find_by_id = house_repo.find_by_id
+
+    def counting_find_by_id(house_platform_id):
+        calls.append(house_platform_id)
+        return original_find_by_id(house_platform_id)
+
+    house_repo.find_by_id = counting_find_by_id
+    remote = LruHouseCardCache()
+    service.card_cache = TieredHouseCardCache(local=LruHouseCardCache(), remote=remote)
+
+    def run():
+        payload = asdict(
+            service.execute(
+                RecommendStudentHouseCommand(
+                    finder_request_id=10,
+                    candidate_house_platform_ids=candidate_ids,
+                )
+            )
+        )
+        payload.pop("generated_at")
+        return payload
+
+    # 첫 실행은 카드를 만들고, 이후 실행은 캐시된 카드를 그대로 쓴다.
+    assert run() == expected
+    assert sorted(calls) == [1, 2]
+    assert run() == expected
+    assert sorted(calls) == [1, 2]
+
+    # 매물 단위 무효화 후에는 해당 매물만 다시 조회한다.
+    service.card_cache.invalidate_houses([1])
+    assert run() == expected
+    assert sorted(calls) == [1, 1, 2]
+
+    # 1차 캐시가 비어도 2차 캐시에서 찾아 올린다.
+    service.card_cache = TieredHouseCardCache(local=LruHouseCardCache(), remote=remote)
+    assert run() == expected
+    assert sorted(calls) == [1, 1, 2]
+
+
+def test_recommend_student_house_batch_matches_per_request_execute():
+    from types import SimpleNamespace
+
+    from modules.recommendations.application.dto.recommendation_dto import (
+        RecommendStudentHouseBatchCommand,
+    )
+    from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+        FilterCandidate,
+    )
+    from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+        matches_base_criteria,
+    )
+    from modules.student_house_decision_policy.application.usecase.filter_candidate import (
+        FilterCandidateService,
+    )
+
+    service, candidate_ids = _build_two_request_service()
+    finder_repo = service.finder_request_repo
+    near_request = finder_repo.find_by_id(20)
+    near_request.university_name = "서울대학교"
+    near_request.is_near = True
+    pool = [
+        FilterCandidate(
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            deposit=500,
+            monthly_rent=40,
+            manage_cost=10,
+            sales_type="월세",
+            address="서울 관악구",
+        )
+        for house_platform_id in candidate_ids
+    ]
+    calls = {"pool": 0, "scores": 0}
+
+    class FakeCandidateRepository:
+        def fetch_candidates(self, criteria, limit=None):
+            return [
+                candidate
+                for candidate in pool
+                if matches_base_criteria(candidate, criteria)
+            ]
+
+        def fetch_candidate_pool(self, limit=None):
+            calls["pool"] += 1
+            return list(pool)
+
+    class FakeUniversityRepository:
+        def get_university_locations(self):
+            return [
+                SimpleNamespace(university_location_id=1, university_name="서울대학교")
+            ]
+
+    price_repo = service.price_observation_repo
+    price_repo.get_latest_by_house_platform_ids = lambda ids: {
+        house_platform_id: price_repo.get_by_house_platform_id(house_platform_id)
+        for house_platform_id in ids
+    }
+    distance_repo = service.distance_observation_repo
+    distance_repo.get_bulk_by_house_platform_ids = lambda ids: {
+        house_platform_id: distance_repo.get_bulk_by_house_platform_id(house_platform_id)
+        for house_platform_id in ids
+    }
+    score_repo = service.score_repo
+    original_fetch_scores = score_repo.fetch_by_house_platform_ids
+
+    def counting_fetch_scores(house_platform_ids, policy_version=None):
+        calls["scores"] += 1
+        return original_fetch_scores(house_platform_ids, policy_version)
+
+    score_repo.fetch_by_house_platform_ids = counting_fetch_scores
+    service.university_repo = FakeUniversityRepository()
+    service.filter_usecase = FilterCandidateService(
+        finder_request_repo=finder_repo,
+        house_platform_repo=FakeCandidateRepository(),
+        price_observation_repo=price_repo,
+        distance_observation_repo=distance_repo,
+        university_repo=service.university_repo,
+    )
+
+    def normalize(result):
+        payload = asdict(result)
+        payload.pop("generated_at")
+        return payload
+
+    expected = [
+        normalize(service.execute(RecommendStudentHouseCommand(finder_request_id=finder_request_id)))
+        for finder_request_id in (20, 10)
+    ]
+    calls["scores"] = 0
+
+    batch = service.execute_batch(
+        RecommendStudentHouseBatchCommand(finder_request_ids=[20, 10, 99, 20])
+    )
+
+    # 후보 풀과 점수는 요구서 수와 상관없이 한 번만 조회한다.
+    assert calls == {"pool": 1, "scores": 1}
+    assert batch.missing_finder_request_ids == [99]
+    assert [normalize(result) for result in batch.results] == expected
+    assert batch.results[0].summary["total_candidates"] == 2
+    assert batch.results[1].summary["total_candidates"] == 0
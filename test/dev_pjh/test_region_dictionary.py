@@ -0,0 +1,128 @@
+"""legal_dong.csv 기반 선호 지역 필터 테스트."""
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.infrastructure.orm.house_platform_options_orm import (
+    HousePlatformOptionORM,
+)
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.student_house_decision_policy.application.dto.candidate_filter_dto import (
+    FilterCandidateCriteria,
+)
+from modules.student_house_decision_policy.application.factory.candidate_criteria_matcher import (
+    matches_base_criteria,
+)
+from modules.student_house_decision_policy.application.factory.region_dictionary import (
+    load_region_dictionary,
+)
+from modules.student_house_decision_policy.infrastructure.repository.house_platform_candidate_repository import (
+    HousePlatformCandidateRepository,
+)
+
+# (pnu_cd, gu_nm, dong_nm, address)
+_HOUSES = [
+    ("1162010200100010000", "관악구", "신림동", "서울 관악구 신림동 1"),
+    ("1162010100100020000", "관악구", "봉천동", "서울 관악구 봉천동 2"),
+    ("1159010800100030000", "동작구", "상도동", "서울 동작구 상도동 3"),
+    ("1144011000100040000", "마포구", "노고산동", "서울 마포구 노고산동 4"),
+    ("1114010100100050000", "중구", "무교동", "서울 중구 무교동 5"),
+    ("2611010100100060000", "중구", "중앙동1가", "부산 중구 중앙동1가 6"),
+    ("4111112900100070000", "수원시 장안구", "파장동", "경기 수원시 장안구 파장동 7"),
+    # pnu가 없는 매물은 구/동 이름으로 판정한다.
+    (None, "관악구", "신림동", "관악구 어딘가"),
+    (None, "동작구", "노량진동", None),
+    # 주소 문자열에 다른 구 이름이 섞여 있어도 코드로 판정한다.
+    ("1165010100100080000", "서초구", "방배동", "서울 서초구 방배동 (관악구청 인근)"),
+]
+
+
+def _build_repository():
+    engine = create_engine("sqlite:///:memory:")
+    HousePlatformORM.metadata.create_all(
+        engine, tables=[HousePlatformORM.__table__, HousePlatformOptionORM.__table__]
+    )
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    for index, (pnu_cd, gu_nm, dong_nm, address) in enumerate(_HOUSES, start=1):
+        session.add(
+            HousePlatformORM(
+                house_platform_id=index,
+                pnu_cd=pnu_cd,
+                gu_nm=gu_nm,
+                dong_nm=dong_nm,
+                address=address,
+                sales_type="월세",
+                monthly_rent=50,
+                is_banned=False,
+            )
+        )
+    session.commit()
+    session.close()
+    return engine, HousePlatformCandidateRepository(session_factory)
+
+
+def _criteria(preferred_region: str) -> FilterCandidateCriteria:
+    return FilterCandidateCriteria(
+        max_deposit_limit=1000,
+        max_rent_limit=60,
+        budget_margin_ratio=0.0,
+        preferred_region=preferred_region,
+        region_filter=load_region_dictionary().resolve(preferred_region),
+    )
+
+
+def test_region_filter_matches_codes_in_sql_and_memory():
+    _, repository = _build_repository()
+    pool = repository.fetch_candidate_pool()
+    cases = {
+        "관악구": [1, 2, 8],
+        # 여러 구를 쉼표로 나열하면 모두 포함한다.
+        "관악구, 동작구": [1, 2, 3, 8, 9],
+        "마포구 노고산동": [4],
+        "서울 중구": [5],
+        "중구": [5, 6],
+        "수원시": [7],
+        "신림동": [1, 8],
+        # 사전에 없는 항목은 주소 문자열로 비교한다.
+        "관악구청": [10],
+    }
+    for preferred_region, expected in cases.items():
+        criteria = _criteria(preferred_region)
+        fetched = [
+            candidate.house_platform_id
+            for candidate in repository.fetch_candidates(criteria)
+        ]
+        in_memory = [
+            candidate.house_platform_id
+            for candidate in pool
+            if matches_base_criteria(candidate, criteria)
+        ]
+        assert sorted(fetched) == expected, preferred_region
+        assert in_memory == expected, preferred_region
+
+
+def test_region_filter_uses_region_indexes():
+    engine, repository = _build_repository()
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    repository.fetch_candidates(_criteria("관악구, 마포구 노고산동"))
+
+    statement, parameters = statements[-1]
+    with engine.connect() as connection:
+        plan = " ".join(
+            str(row[-1])
+            for row in connection.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )
+        )
+    assert "ix_house_platform_sigungu_cd" in plan, plan
+    assert "ix_house_platform_legal_dong_cd" in plan, plan
+    assert "SCAN house_platform" not in plan, plan
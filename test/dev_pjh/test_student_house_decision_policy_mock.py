@@ -39,13 +39,23 @@ from modules.student_house_decision_policy.application.dto.candidate_filter_dto
     ObservationPriceFeatures,
 )
 from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    ParallelRefreshStudentHouseScoreCommand,
     RefreshStudentHouseScoreCommand,
     StudentHouseScoreQuery,
     StudentHouseScoreSummary,
 )
+from shared.application.port_out.dirty_house_port import (
+    DirtyHousePort,
+)
+from modules.student_house_decision_policy.application.port_out.house_platform_candidate_port import (
+    HousePlatformCandidateReadPort,
+)
 from modules.student_house_decision_policy.application.usecase.filter_candidate import (
     FilterCandidateService,
 )
+from modules.student_house_decision_policy.application.usecase.parallel_refresh_student_house_score import (
+    ParallelRefreshStudentHouseScoreService,
+)
 from modules.student_house_decision_policy.application.usecase.refresh_student_house_score import (
     RefreshStudentHouseScoreService,
 )
@@ -90,7 +100,7 @@ class _FakeFinderRequestRepository:
         )
 
 
-class _FakeCandidateRepository:
+class _FakeCandidateRepository(HousePlatformCandidateReadPort):
     """house_platform 후보 mock 저장소."""
 
     def __init__(self, rows: List[_CandidateRow]):
@@ -349,26 +359,51 @@ class _FakeFeatureObservationRepository:
 
 
 class _FakeStudentHouseScoreRepository:
-    """student_house 점수 mock 저장소."""
+    """student_house 점수 mock 저장소. (매물, 정책 버전)별로 보관한다."""
 
     def __init__(self):
-        self._items: Dict[int, StudentHouseScoreSummary] = {}
+        self._items: Dict[tuple, StudentHouseScoreSummary] = {}
+        self.failures: Dict[tuple, str] = {}
+        self.write_calls = 0
+
+    def upsert_scores(self, scores) -> int:
+        self.write_calls += 1
+        for score in scores:
+            self.upsert_score(score)
+        return len(scores)
+
+    def mark_failed_many(self, failures: Dict[int, str], policy_version=None) -> None:
+        self.write_calls += 1
+        for house_platform_id, reason in failures.items():
+            self.mark_failed(house_platform_id, reason, policy_version)
 
     def upsert_score(self, score):
-        self._items[score.house_platform_id] = StudentHouseScoreSummary(
-            house_platform_id=score.house_platform_id,
-            base_total_score=score.base_total_score,
-            price_score=score.price_score,
-            option_score=score.option_score,
-            risk_score=score.risk_score,
-            distance_score=score.distance_score,
-            observation_version=score.observation_version,
-            policy_version=score.policy_version,
+        self._items[(score.house_platform_id, score.policy_version)] = (
+            StudentHouseScoreSummary(
+                house_platform_id=score.house_platform_id,
+                base_total_score=score.base_total_score,
+                price_score=score.price_score,
+                option_score=score.option_score,
+                risk_score=score.risk_score,
+                distance_score=score.distance_score,
+                observation_version=score.observation_version,
+                policy_version=score.policy_version,
+            )
         )
         return score.house_platform_id
 
-    def mark_failed(self, house_platform_id: int, reason: str) -> None:
-        self._items.pop(house_platform_id, None)
+    def mark_failed(
+        self, house_platform_id: int, reason: str, policy_version=None
+    ) -> None:
+        self.failures[(house_platform_id, policy_version)] = reason
+        self._items.pop((house_platform_id, policy_version), None)
+
+    def house_ids(self, policy_version: str) -> list[int]:
+        return sorted(
+            house_platform_id
+            for house_platform_id, version in self._items
+            if version == policy_version
+        )
 
     def fetch_top_k(self, query: StudentHouseScoreQuery):
         items = [
@@ -545,3 +580,460 @@ def test_refresh_student_house_score_with_mock_observation() -> None:
             f"risk_score={item.risk_score} "
             f"distance_score={item.distance_score}"
         )
+
+
+class _CountingPriceObservationRepository(_FakePriceObservationRepository):
+    def __init__(self, data: Dict[int, PriceFeatureObservation]):
+        super().__init__(data)
+        self.bulk_calls = 0
+
+    def get_by_house_platform_id(self, house_platform_id: int):
+        raise AssertionError("매물 단건 조회를 사용하지 않아야 한다.")
+
+    def get_latest_by_house_platform_ids(self, house_platform_ids):
+        self.bulk_calls += 1
+        return {
+            house_platform_id: self._data[house_platform_id]
+            for house_platform_id in house_platform_ids
+            if house_platform_id in self._data
+        }
+
+
+def test_refresh_student_house_score_prefetches_and_writes_per_chunk() -> None:
+    """묶음 단위로 관측치를 한 번에 읽고 점수/실패를 한 번에 기록한다."""
+    policy = DecisionPolicyConfig(policy_version="v-test")
+    candidates = [
+        _CandidateRow(
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            deposit=100,
+            monthly_rent=50,
+            manage_cost=5,
+            sales_type="월세",
+            address="서울시",
+        )
+        for house_platform_id in range(1, 6)
+    ]
+    # 3번 매물은 가격 관측치가 없어 실패로 기록된다.
+    price_observations = {
+        house_platform_id: PriceFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=house_platform_id,
+            가격_백분위=house_platform_id / 10,
+            가격_z점수=0.0,
+            예상_입주비용=1000,
+            월_비용_추정=60,
+            가격_부담_비선형=0.2,
+        )
+        for house_platform_id in (1, 2, 4, 5)
+    }
+    distance_observations = {
+        house_platform_id: [
+            DistanceFeatureObservation(
+                id=house_platform_id,
+                house_platform_id=house_platform_id,
+                recommendation_observation_id=house_platform_id,
+                university_id=999,
+                학교까지_분=10.0 * house_platform_id,
+                거리_백분위=0.5,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.5,
+            )
+        ]
+        for house_platform_id in range(1, 6)
+    }
+    feature_observations = {
+        house_platform_id: StudentRecommendationFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            위험_관측치=RiskObservationFeatures(
+                위험_사건_개수=0,
+                위험_사건_유형=[],
+                위험_확률_추정=0.1,
+                위험_심각도_점수=0.1,
+                위험_비선형_패널티=0.1,
+            ),
+            편의_관측치=ConvenienceObservationFeatures(
+                필수_옵션_커버리지=0.5,
+                편의_점수=0.5,
+            ),
+            관측_메모=ObservationNotes.empty(),
+            메타데이터=ObservationMetadata(
+                관측치_버전="20240901",
+                원본_데이터_버전="v1",
+            ),
+        )
+        # 5번 매물은 feature 관측치가 없어 옵션/리스크 점수가 비고 실패로 기록된다.
+        for house_platform_id in range(1, 5)
+    }
+    price_repo = _CountingPriceObservationRepository(price_observations)
+    score_repo = _FakeStudentHouseScoreRepository()
+    service = RefreshStudentHouseScoreService(
+        house_platform_repo=_FakeCandidateRepository(candidates),
+        feature_observation_repo=_FakeFeatureObservationRepository(
+            feature_observations
+        ),
+        price_observation_repo=price_repo,
+        distance_observation_repo=_FakeDistanceObservationRepository(
+            distance_observations
+        ),
+        university_repo=_FakeUniversityRepository(),
+        student_house_repo=score_repo,
+        policy=policy,
+        chunk_size=2,
+    )
+
+    result = service.execute(RefreshStudentHouseScoreCommand(policy=policy))
+
+    assert result.processed_count == 3
+    assert result.failed_count == 2
+    assert score_repo.house_ids("v-test") == [1, 2, 4]
+    assert sorted(score_repo.failures) == [(3, "v-test"), (5, "v-test")]
+    # 3개 묶음: 가격 조회 3번, 점수 저장 2번 + 실패 기록 2번.
+    assert price_repo.bulk_calls == 3
+    assert score_repo.write_calls == 4
+
+
+class _InMemoryDirtyHouseRepository(DirtyHousePort):
+    def __init__(self):
+        self.marks: Dict[int, int] = {}
+        self._clock = 0
+
+    def mark_dirty(self, house_platform_ids, reason: str, session=None) -> None:
+        for house_platform_id in house_platform_ids:
+            self._clock += 1
+            self.marks[house_platform_id] = self._clock
+
+    def fetch_dirty(self, limit=None):
+        return dict(self.marks)
+
+    def clear(self, marked) -> int:
+        cleared = 0
+        for house_platform_id, marked_at in marked.items():
+            if self.marks.get(house_platform_id, marked_at + 1) <= marked_at:
+                del self.marks[house_platform_id]
+                cleared += 1
+        return cleared
+
+
+class _RemarkingScoreRepository(_FakeStudentHouseScoreRepository):
+    """점수 저장 도중 다른 작업이 매물을 다시 표시하는 상황을 흉내 낸다."""
+
+    def __init__(self, dirty_repo, remark_ids):
+        super().__init__()
+        self._dirty_repo = dirty_repo
+        self._remark_ids = remark_ids
+
+    def upsert_scores(self, scores) -> int:
+        self._dirty_repo.mark_dirty(self._remark_ids, "price_observation")
+        return super().upsert_scores(scores)
+
+
+def test_refresh_student_house_score_dirty_only_rescores_changed_houses() -> None:
+    """dirty 모드는 표시된 매물만 계산하고 성공한 매물의 표시만 지운다."""
+    policy = DecisionPolicyConfig(policy_version="v-test")
+    candidates = [
+        _CandidateRow(
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            deposit=100,
+            monthly_rent=50,
+            manage_cost=5,
+            sales_type="월세",
+            address="서울시",
+        )
+        for house_platform_id in range(1, 6)
+    ]
+    features = {
+        house_platform_id: StudentRecommendationFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            위험_관측치=RiskObservationFeatures(
+                위험_사건_개수=0,
+                위험_사건_유형=[],
+                위험_확률_추정=0.2,
+                위험_심각도_점수=0.2,
+                위험_비선형_패널티=0.2,
+            ),
+            편의_관측치=ConvenienceObservationFeatures(
+                필수_옵션_커버리지=0.5,
+                편의_점수=0.5,
+            ),
+            관측_메모=ObservationNotes.empty(),
+            메타데이터=ObservationMetadata(
+                관측치_버전="20240901",
+                원본_데이터_버전="v1",
+            ),
+        )
+        for house_platform_id in range(1, 6)
+    }
+    # 4번 매물은 가격 관측치가 없어 실패한다.
+    prices = {
+        house_platform_id: PriceFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=house_platform_id,
+            가격_백분위=0.5,
+            가격_z점수=0.0,
+            예상_입주비용=1000,
+            월_비용_추정=60,
+            가격_부담_비선형=0.5,
+        )
+        for house_platform_id in (1, 2, 3, 5)
+    }
+    distances = {
+        house_platform_id: [
+            DistanceFeatureObservation(
+                id=house_platform_id,
+                house_platform_id=house_platform_id,
+                recommendation_observation_id=house_platform_id,
+                university_id=999,
+                학교까지_분=15.0,
+                거리_백분위=0.5,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.5,
+            )
+        ]
+        for house_platform_id in range(1, 6)
+    }
+    dirty_repo = _InMemoryDirtyHouseRepository()
+    # 99번은 삭제돼 후보가 아닌 매물이다.
+    dirty_repo.mark_dirty([2, 3, 4, 99], "house_platform")
+    # 3번은 점수 계산 도중 새 관측치가 들어와 다시 표시된다.
+    score_repo = _RemarkingScoreRepository(dirty_repo, remark_ids=[3])
+    service = RefreshStudentHouseScoreService(
+        house_platform_repo=_FakeCandidateRepository(candidates),
+        feature_observation_repo=_FakeFeatureObservationRepository(features),
+        price_observation_repo=_FakePriceObservationRepository(prices),
+        distance_observation_repo=_FakeDistanceObservationRepository(distances),
+        university_repo=_FakeUniversityRepository(),
+        student_house_repo=score_repo,
+        policy=policy,
+        dirty_house_repo=dirty_repo,
+    )
+
+    result = service.execute(
+        RefreshStudentHouseScoreCommand(policy=policy, dirty_only=True)
+    )
+
+    assert result.total_observations == 3
+    assert result.processed_count == 2
+    assert result.failed_count == 1
+    assert score_repo.house_ids("v-test") == [2, 3]
+    # 실패한 4번과 도중에 다시 표시된 3번만 남는다.
+    assert sorted(dirty_repo.marks) == [3, 4]
+
+
+class _InMemoryCheckpointRepository:
+    def __init__(self, fail_on_progress_of: int | None = None):
+        self.rows = {}
+        self._fail_on_progress_of = fail_on_progress_of
+
+    def load(self, run_id):
+        return [
+            checkpoint
+            for (row_run_id, _), checkpoint in sorted(self.rows.items())
+            if row_run_id == run_id
+        ]
+
+    def save(self, checkpoint) -> None:
+        if (
+            checkpoint.shard_index == self._fail_on_progress_of
+            and checkpoint.last_house_platform_id is not None
+        ):
+            # 첫 진행 저장 시점에 워커가 죽은 상황을 한 번만 흉내 낸다.
+            self._fail_on_progress_of = None
+            raise RuntimeError("worker crashed")
+        self.rows[(checkpoint.run_id, checkpoint.shard_index)] = checkpoint
+
+
+def _build_refresh_service(house_platform_ids, missing_price_ids, score_repo, **kwargs):
+    candidates = [
+        _CandidateRow(
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            deposit=100,
+            monthly_rent=50,
+            manage_cost=5,
+            sales_type="월세",
+            address="서울시",
+        )
+        for house_platform_id in house_platform_ids
+    ]
+    features = {
+        house_platform_id: StudentRecommendationFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            snapshot_id=f"snap-{house_platform_id}",
+            위험_관측치=RiskObservationFeatures(
+                위험_사건_개수=0,
+                위험_사건_유형=[],
+                위험_확률_추정=0.1 * (house_platform_id % 5),
+                위험_심각도_점수=0.2,
+                위험_비선형_패널티=0.2,
+            ),
+            편의_관측치=ConvenienceObservationFeatures(
+                필수_옵션_커버리지=0.5,
+                편의_점수=0.5,
+            ),
+            관측_메모=ObservationNotes.empty(),
+            메타데이터=ObservationMetadata(
+                관측치_버전="20240901",
+                원본_데이터_버전="v1",
+            ),
+        )
+        for house_platform_id in house_platform_ids
+    }
+    prices = {
+        house_platform_id: PriceFeatureObservation(
+            id=house_platform_id,
+            house_platform_id=house_platform_id,
+            recommendation_observation_id=house_platform_id,
+            가격_백분위=0.05 * (house_platform_id % 20),
+            가격_z점수=0.0,
+            예상_입주비용=1000,
+            월_비용_추정=60,
+            가격_부담_비선형=0.5,
+        )
+        for house_platform_id in house_platform_ids
+        if house_platform_id not in missing_price_ids
+    }
+    distances = {
+        house_platform_id: [
+            DistanceFeatureObservation(
+                id=house_platform_id,
+                house_platform_id=house_platform_id,
+                recommendation_observation_id=house_platform_id,
+                university_id=999,
+                학교까지_분=float(house_platform_id),
+                거리_백분위=0.5,
+                거리_버킷="10_20분",
+                거리_비선형_점수=0.5,
+            )
+        ]
+        for house_platform_id in house_platform_ids
+    }
+    return RefreshStudentHouseScoreService(
+        house_platform_repo=_FakeCandidateRepository(candidates),
+        feature_observation_repo=_FakeFeatureObservationRepository(features),
+        price_observation_repo=_FakePriceObservationRepository(prices),
+        distance_observation_repo=_FakeDistanceObservationRepository(distances),
+        university_repo=_FakeUniversityRepository(),
+        student_house_repo=score_repo,
+        **kwargs,
+    )
+
+
+def test_parallel_refresh_resumes_from_checkpoint_and_matches_full_refresh() -> None:
+    """중단된 샤드는 체크포인트부터 이어서 처리하고 결과는 전체 갱신과 같다."""
+    policy = DecisionPolicyConfig(policy_version="v-test")
+    house_platform_ids = list(range(1, 11))
+
+    full_repo = _FakeStudentHouseScoreRepository()
+    full_result = _build_refresh_service(
+        house_platform_ids, {7}, full_repo, policy=policy
+    ).execute(RefreshStudentHouseScoreCommand(policy=policy))
+
+    score_repo = _FakeStudentHouseScoreRepository()
+    checkpoint_repo = _InMemoryCheckpointRepository(fail_on_progress_of=1)
+    shard_calls = []
+
+    def shard_runner(command, checkpoint, chunk_size):
+        shard_calls.append(checkpoint.shard_index)
+        service = _build_refresh_service(
+            house_platform_ids, {7}, score_repo, policy=policy, chunk_size=chunk_size
+        )
+        return service.refresh_shard(command, checkpoint, checkpoint_repo)
+
+    parallel = ParallelRefreshStudentHouseScoreService(
+        house_platform_repo=_build_refresh_service(
+            house_platform_ids, {7}, score_repo
+        ).house_platform_repo,
+        checkpoint_repo=checkpoint_repo,
+        shard_runner=shard_runner,
+    )
+    command = ParallelRefreshStudentHouseScoreCommand(
+        run_id="run-1", policy=policy, shard_count=3, chunk_size=2, max_workers=1
+    )
+
+    try:
+        parallel.execute(command)
+        raise AssertionError("중단된 샤드가 있으면 예외가 발생해야 한다.")
+    except RuntimeError as exc:
+        assert "run-1" in str(exc)
+    assert [
+        (checkpoint.start_id, checkpoint.end_id, checkpoint.completed)
+        for checkpoint in checkpoint_repo.load("run-1")
+    ] == [(1, 5, True), (5, 9, False), (9, 11, True)]
+
+    # 같은 run_id로 다시 실행하면 남은 샤드만 처리한다.
+    shard_calls.clear()
+    result = parallel.execute(command)
+
+    assert shard_calls == [1]
+    assert result.processed_count == full_result.processed_count == 9
+    assert result.failed_count == full_result.failed_count == 1
+    assert result.total_observations == full_result.total_observations
+    assert score_repo._items == full_repo._items
+
+
+def test_refresh_multiple_policies_share_one_observation_load() -> None:
+    """여러 정책을 한 번의 관측치 조회로 계산하고 정책 버전별로 따로 저장한다."""
+    baseline = DecisionPolicyConfig(policy_version="v1")
+    candidate = DecisionPolicyConfig(
+        policy_version="v2", weight_price=0.7, weight_risk=0.1
+    )
+    house_platform_ids = list(range(1, 7))
+
+    single_results = {}
+    for policy in (baseline, candidate):
+        single_repo = _FakeStudentHouseScoreRepository()
+        _build_refresh_service(house_platform_ids, {4}, single_repo).execute(
+            RefreshStudentHouseScoreCommand(policy=policy)
+        )
+        single_results[policy.policy_version] = single_repo._items
+
+    score_repo = _FakeStudentHouseScoreRepository()
+    service = _build_refresh_service(
+        house_platform_ids, {4}, score_repo, chunk_size=3
+    )
+    price_repo = _CountingPriceObservationRepository(
+        service.price_observation_repo._data
+    )
+    service.price_observation_repo = price_repo
+
+    result = service.execute(
+        RefreshStudentHouseScoreCommand(policies=[baseline, candidate])
+    )
+
+    assert result.policy_versions == ["v1", "v2"]
+    assert result.processed_count == 5
+    assert result.failed_count == 1
+    # 정책 수와 관계없이 묶음마다 한 번만 읽는다.
+    assert price_repo.bulk_calls == 2
+    assert score_repo._items == {**single_results["v1"], **single_results["v2"]}
+    assert sorted(score_repo.failures) == [(4, "v1"), (4, "v2")]
+
+    # v2 점수를 다시 계산해도 v1 점수는 그대로 남는다.
+    service.execute(RefreshStudentHouseScoreCommand(policy=candidate))
+    assert score_repo.house_ids("v1") == [1, 2, 3, 5, 6]
+    top_v1 = score_repo.fetch_top_k(
+        StudentHouseScoreQuery(
+            observation_version=None,
+            policy_version="v1",
+            threshold_base_total=0.0,
+            limit=10,
+        )
+    )
+    assert {item.policy_version for item in top_v1} == {"v1"}
+
+    try:
+        service.execute(
+            RefreshStudentHouseScoreCommand(policies=[baseline, baseline])
+        )
+        raise AssertionError("중복된 정책 버전은 거부해야 한다.")
+    except ValueError:
+        pass
@@ -0,0 +1,115 @@
+"""student_house 점수 순위 keyset 페이지 조회 테스트."""
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.house_platform.infrastructure.orm.house_platform_orm import (
+    HousePlatformORM,
+)
+from modules.student_house_decision_policy.application.dto.decision_score_dto import (
+    StudentHouseScoreQuery,
+)
+from modules.student_house_decision_policy.infrastructure.orm.student_house_orm import (
+    StudentHouseORM,
+)
+from modules.student_house_decision_policy.infrastructure.repository.student_house_score_repository import (
+    StudentHouseScoreRepository,
+)
+
+
+def _build_repository():
+    engine = create_engine("sqlite:///:memory:")
+    # student_house의 외래 키 대상 테이블도 함께 만든다.
+    HousePlatformORM.metadata.create_all(
+        engine, tables=[HousePlatformORM.__table__, StudentHouseORM.__table__]
+    )
+    session_factory = sessionmaker(bind=engine)
+    session = session_factory()
+    for house_platform_id in range(1, 41):
+        for offset, policy_version in enumerate(("v1", "v2")):
+            session.add(
+                StudentHouseORM(
+                    # SQLite는 BIGINT 기본 키를 자동 증가시키지 않는다.
+                    student_house_id=house_platform_id * 2 + offset,
+                    house_platform_id=house_platform_id,
+                    price_score=0.0,
+                    option_score=0.0,
+                    risk_score=0.0,
+                    distance_score=0.0,
+                    # 동점이 많도록 점수를 5단계로만 둔다.
+                    base_total_score=float(house_platform_id % 5) * 20,
+                    processing_status=(
+                        "FAILED" if house_platform_id == 13 else "COMPLETED"
+                    ),
+                    policy_version=policy_version,
+                    observation_version="obs-1",
+                )
+            )
+    session.commit()
+    session.close()
+    return engine, StudentHouseScoreRepository(session_factory)
+
+
+def _query(limit: int) -> StudentHouseScoreQuery:
+    return StudentHouseScoreQuery(
+        observation_version="obs-1",
+        policy_version="v1",
+        threshold_base_total=20.0,
+        limit=limit,
+    )
+
+
+def test_fetch_top_k_page_walks_whole_leaderboard_without_gaps():
+    _, repository = _build_repository()
+
+    pages = []
+    cursor = None
+    while True:
+        page = repository.fetch_top_k_page(_query(7), after=cursor)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    walked = [item for items in pages for item in items]
+    expected = sorted(
+        (
+            house_platform_id
+            for house_platform_id in range(1, 41)
+            if house_platform_id % 5 and house_platform_id != 13
+        ),
+        key=lambda house_platform_id: (house_platform_id % 5, house_platform_id),
+        reverse=True,
+    )
+    assert [item.house_platform_id for item in walked] == expected
+    assert {item.policy_version for item in walked} == {"v1"}
+    assert all(len(items) == 7 for items in pages[:-1])
+    assert [item.house_platform_id for item in repository.fetch_top_k(_query(7))] == (
+        expected[:7]
+    )
+
+
+def test_fetch_top_k_page_reads_leaderboard_index_without_sorting():
+    engine, repository = _build_repository()
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    first = repository.fetch_top_k_page(_query(5))
+    repository.fetch_top_k_page(_query(5), after=first.next_cursor)
+    assert len(statements) == 2
+
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = " ".join(
+                str(row[-1])
+                for row in connection.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                )
+            )
+            assert "ix_student_house_leaderboard" in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
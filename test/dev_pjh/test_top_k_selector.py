@@ -0,0 +1,46 @@
+import os
+import random
+import sys
+
+# 프로젝트 루트를 sys.path에 추가해 모듈 import를 보장한다.
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.recommendations.application.factory.top_k_selector import (
+    split_top_k,
+)
+
+
+def _sort_based_split(ranked, threshold, top_k):
+    """기존 추천 유스케이스의 전체 정렬 방식."""
+    recommended = [item for item in ranked if item[2] >= threshold]
+    rejected = [item for item in ranked if item[2] < threshold]
+    recommended.sort(key=lambda item: item[2], reverse=True)
+    rejected.sort(key=lambda item: item[2], reverse=True)
+    return (
+        recommended[:top_k],
+        rejected[:top_k],
+        len(recommended),
+        len(rejected),
+    )
+
+
+def test_split_top_k_matches_full_sort_including_ties():
+    rng = random.Random(7)
+    for size in (0, 1, 5, 200):
+        # 소수 첫째 자리 점수라 동점이 많다.
+        ranked = [
+            (house_platform_id, None, round(rng.uniform(0, 100), 1) // 5 * 5)
+            for house_platform_id in range(size)
+        ]
+        for top_k in (0, 1, 3, 10, 500):
+            split = split_top_k(iter(ranked), threshold=50.0, top_k=top_k)
+            assert (
+                split.recommended_top,
+                split.rejected_top,
+                split.recommended_count,
+                split.rejected_count,
+            ) == _sort_based_split(ranked, 50.0, top_k)
@@ -0,0 +1,94 @@
+"""추천 상위 K 선택 방식(전체 정렬 vs 힙) 마이크로 벤치마크 러너."""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from modules.recommendations.application.factory.top_k_selector import (
+    split_top_k,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """러너 실행 옵션을 파싱한다."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="합성 후보 수 목록",
+    )
+    parser.add_argument("--top-k", type=int, default=10, help="상위 K")
+    parser.add_argument("--threshold", type=float, default=60.0, help="추천 기준 점수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수(최솟값 사용)")
+    return parser.parse_args()
+
+
+def iter_candidates(size: int, seed: int = 42):
+    """(매물 ID, 점수 객체, 총점) 합성 후보를 하나씩 만든다."""
+    rng = random.Random(seed)
+    for house_platform_id in range(size):
+        yield house_platform_id, None, round(rng.uniform(0, 100), 1)
+
+
+def sort_based(ranked, threshold: float, top_k: int):
+    """기존 방식: 전체 목록을 만들고 나눈 뒤 정렬해서 자른다."""
+    ranked = list(ranked)
+    recommended = [item for item in ranked if item[2] >= threshold]
+    rejected = [item for item in ranked if item[2] < threshold]
+    recommended.sort(key=lambda item: item[2], reverse=True)
+    rejected.sort(key=lambda item: item[2], reverse=True)
+    return recommended[:top_k], rejected[:top_k], len(recommended), len(rejected)
+
+
+def heap_based(ranked, threshold: float, top_k: int):
+    split = split_top_k(ranked, threshold=threshold, top_k=top_k)
+    return (
+        split.recommended_top,
+        split.rejected_top,
+        split.recommended_count,
+        split.rejected_count,
+    )
+
+
+def measure(func, size: int, threshold: float, top_k: int, repeat: int):
+    """최소 실행 시간(초)과 최대 추가 메모리(MB)를 잰다."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(iter_candidates(size), threshold, top_k)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    func(iter_candidates(size), threshold, top_k)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / (1024 * 1024), result
+
+
+def main() -> None:
+    args = parse_args()
+    print(f"{'size':>10} {'method':>6} {'seconds':>9} {'peak_mb':>9}")
+    for size in args.sizes:
+        results = []
+        for name, func in (("sort", sort_based), ("heap", heap_based)):
+            seconds, peak_mb, result = measure(
+                func, size, args.threshold, args.top_k, args.repeat
+            )
+            results.append(result)
+            print(f"{size:>10} {name:>6} {seconds:>9.3f} {peak_mb:>9.1f}")
+        # 두 방식의 결과가 같아야 비교가 의미 있다.
+        assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from infrastructure.metrics.recommendation_metrics import (
+    STAGE_HYDRATION,
+    instrument_engine,
+    observe_stage,
+    record_pipeline_counts,
+    track_job_queries,
+)
+
+
+def _sample(name: str, labels: dict | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_observe_stage_records_histogram():
+    before = _sample(
+        "recommend_stage_duration_seconds_count", {"stage": STAGE_HYDRATION}
+    )
+    with observe_stage(STAGE_HYDRATION):
+        pass
+    after = _sample(
+        "recommend_stage_duration_seconds_count", {"stage": STAGE_HYDRATION}
+    )
+    assert after == before + 1
+
+
+def test_record_pipeline_counts():
+    candidates_before = _sample("recommend_candidates_in_total")
+    recommended_before = _sample("recommend_recommended_out_total")
+    record_pipeline_counts(candidates_in=12, recommended_out=3)
+    assert _sample("recommend_candidates_in_total") == candidates_before + 12
+    assert _sample("recommend_recommended_out_total") == recommended_before + 3
+
+
+def test_track_job_queries_counts_only_inside_job():
+    engine = create_engine("sqlite:///:memory:")
+    instrument_engine(engine)
+    instrument_engine(engine)  # 중복 등록되지 않아야 한다.
+
+    jobs_before = _sample("recommend_job_db_queries_count")
+    queries_before = _sample("recommend_job_db_queries_sum")
+    with engine.connect() as conn:
+        conn.execute(text("select 1"))
+        with track_job_queries():
+            conn.execute(text("select 1"))
+            conn.execute(text("select 2"))
+
+    assert _sample("recommend_job_db_queries_count") == jobs_before + 1
+    assert _sample("recommend_job_db_queries_sum") == queries_before + 2
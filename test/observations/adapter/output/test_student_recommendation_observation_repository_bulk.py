@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.observations.adapter.output.repository.student_recommendation_distance_observation_repository_impl import (
+    StudentRecommendationDistanceObservationRepository,
+)
+from modules.observations.adapter.output.repository.student_recommendtation_price_observation_repository_impl import (
+    StudentRecommendationPriceObservationRepository,
+)
+from modules.observations.infrastructure.orm.student_recommendation_distance_feature_observations_orm import (
+    StudentRecommendationDistanceObservationORM,
+)
+from modules.observations.infrastructure.orm.student_recommendation_price_observations_orm import (
+    StudentRecommendationPriceObservationsORM,
+)
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _distance_row(id, house_id, university_id, minutes, offset):
+    return StudentRecommendationDistanceObservationORM(
+        id=id,
+        house_id=house_id,
+        recommendation_observation_id=id,
+        university_id=university_id,
+        학교까지_분=minutes,
+        거리_백분위=0.5,
+        거리_버킷="10_20분",
+        거리_비선형_점수=0.7,
+        calculated_at=BASE_TIME + timedelta(minutes=offset),
+    )
+
+
+def _price_row(id, house_platform_id, monthly_cost, offset):
+    return StudentRecommendationPriceObservationsORM(
+        id=id,
+        house_platform_id=house_platform_id,
+        recommendation_observation_id=id,
+        가격_백분위=0.5,
+        가격_z점수=0.0,
+        예상_입주비용=1000,
+        월_비용_추정=monthly_cost,
+        가격_부담_비선형=0.5,
+        calculated_at=BASE_TIME + timedelta(minutes=offset),
+    )
+
+
+def test_get_bulk_by_house_platform_ids_matches_single_lookup():
+    """bulk 조회 결과가 매물별 단건 조회 결과와 같은지 확인한다."""
+    engine = create_engine("sqlite:///:memory:")
+    StudentRecommendationDistanceObservationORM.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        session.add_all(
+            [
+                _distance_row(1, 1, 1, 12.0, 0),
+                _distance_row(2, 1, 1, 15.0, 5),
+                _distance_row(3, 1, 2, 25.0, 10),
+                _distance_row(4, 2, 1, 40.0, 20),
+                _distance_row(5, 2, 1, 35.0, 0),
+                _distance_row(6, 3, 2, 18.0, 0),
+            ]
+        )
+        session.commit()
+
+        repo = StudentRecommendationDistanceObservationRepository(session)
+        results = repo.get_bulk_by_house_platform_ids([1, 2, 4])
+
+        assert set(results) == {1, 2, 4}
+        assert results[4] == []
+        for house_id in (1, 2):
+            assert results[house_id] == repo.get_bulk_by_house_platform_id(house_id)
+        assert [item.학교까지_분 for item in results[1]] == [15.0, 25.0]
+        assert [item.학교까지_분 for item in results[2]] == [40.0]
+    finally:
+        session.close()
+
+
+def test_get_latest_by_house_platform_ids_matches_single_lookup():
+    """가격 관측치 bulk 조회가 매물별 최신 값을 반환하는지 확인한다."""
+    engine = create_engine("sqlite:///:memory:")
+    StudentRecommendationPriceObservationsORM.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        session.add_all(
+            [
+                _price_row(1, 1, 50, 0),
+                _price_row(2, 1, 55, 5),
+                _price_row(3, 2, 70, 10),
+                _price_row(4, 2, 60, 0),
+            ]
+        )
+        session.commit()
+
+        repo = StudentRecommendationPriceObservationRepository(session)
+        results = repo.get_latest_by_house_platform_ids([1, 2, 3])
+
+        assert set(results) == {1, 2}
+        assert results[1] == repo.get_by_house_platform_id(1)
+        assert results[2] == repo.get_by_house_platform_id(2)
+        assert results[1].월_비용_추정 == 55
+        assert results[2].월_비용_추정 == 70
+    finally:
+        session.close()